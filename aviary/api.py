@@ -34,17 +34,39 @@ from aviary.utils.named_values import NamedValues
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.csv_data_file import read_data_file, write_data_file
 from aviary.utils.data_interpolator_builder import build_data_interpolator
+from aviary.utils.structured_table import StructuredTable, load_structured_table
 from aviary.variable_info.enums import *
 from aviary.models.missions.two_dof_default import phase_info as default_2DOF_phase_info
 from aviary.models.missions.energy_state_default import (
     phase_info as default_energy_state_phase_info,
 )
-from aviary.interface.run_aviary import run_aviary
+from aviary.interface.run_aviary import load_phase_info, run_aviary
 from aviary.core.aviary_problem import AviaryProblem, reload_aviary_problem
+from aviary.interface.recording import (
+    CheckpointRecorder,
+    StreamingRecorder,
+    read_checkpoint,
+    read_timeseries_snapshots,
+    restore_checkpoint,
+)
+from aviary.interface.sparsity_check import check_partial_sparsity
+from aviary.interface.results_snapshot import (
+    ResultsSnapshot,
+    results_snapshot_from_recorder,
+    take_results_snapshot,
+    write_snapshot_reports,
+)
+from aviary.interface.columnar_results import (
+    export_columnar_results,
+    get_mission_timeseries_tables,
+    get_timeseries_table,
+    read_columnar_aviary_inputs,
+    read_columnar_timeseries,
+)
 
 # Converters
-from aviary.utils.engine_deck_conversion import convert_engine_deck
-from aviary.utils.fortran_to_aviary import fortran_to_aviary
+from aviary.utils.engine_deck_conversion import convert_engine_deck, convert_engine_decks
+from aviary.utils.fortran_to_aviary import fortran_to_aviary, fortran_to_aviary_batch
 from aviary.utils.aero_table_conversion import convert_aero_table
 
 from aviary.utils.functions import (
@@ -78,8 +100,9 @@ from aviary.variable_info.functions import (
 
 # Miscellaneous
 from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.premission_batch import evaluate_premission_batch
 from aviary.subsystems.subsystem_builder import SubsystemBuilder
-from aviary.utils.process_input_decks import create_vehicle
+from aviary.utils.process_input_decks import clear_input_deck_cache, create_vehicle
 
 # Preprocessors
 from aviary.utils.preprocessors import (
@@ -112,6 +135,11 @@ from aviary.mission.two_dof.ode.taxi_ode import TaxiSegment as AnalyticTaxi
 
 # Phase builders
 from aviary.mission.phase_builder import PhaseBuilder
+from aviary.mission.parallel_phases import (
+    balance_phase_procs,
+    estimate_phase_cost,
+    profile_phase_costs,
+)
 
 # note that this is only for simplified right now
 from aviary.mission.energy_state.phases.energy_phase import (
@@ -5,6 +5,7 @@ from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 
 import dymos as dm
+import numpy as np
 import openmdao.api as om
 from dymos.utils.misc import _unspecified
 from openmdao.utils.mpi import MPI
@@ -12,10 +13,13 @@ from openmdao.utils.mpi import MPI
 from aviary.core.static_group import StaticGroup
 from aviary.interface.utils import set_warning_format
 from aviary.mission.energy_state_problem_configurator import EnergyStateProblemConfigurator
+from aviary.mission.parallel_phases import balance_phase_procs, estimate_phase_cost
+from aviary.mission.quick_sizing import QuickSizingMission
 from aviary.mission.solved_two_dof_problem_configurator import SolvedTwoDOFProblemConfigurator
 from aviary.mission.two_dof_problem_configurator import TwoDOFProblemConfigurator
 from aviary.mission.utils import get_phase_mission_bus_lengths, process_guess_var
 from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
+from aviary.subsystems.aerodynamics.flops_based.surrogate_aero import get_surrogate_grid
 from aviary.subsystems.geometry.geometry_builder import CoreGeometryBuilder
 from aviary.subsystems.mass.mass_builder import CoreMassBuilder
 from aviary.subsystems.performance.performance_builder import CorePerformanceBuilder
@@ -53,6 +57,33 @@ FLOPS = LegacyCode.FLOPS
 GASP = LegacyCode.GASP
 
 
+# AviaryGroup attributes set by load_inputs and check_and_preprocess_inputs
+_preprocessed_attributes = (
+    'verbosity',
+    'aviary_inputs',
+    'mission_info',
+    'pre_mission_info',
+    'post_mission_info',
+    'mission_method',
+    'mass_method',
+    'aero_method',
+    'configurator',
+    'engine_models',
+    'external_subsystems',
+    'initialization_guesses',
+)
+
+# AviaryGroup attributes that may be set by the problem configurator's initial_guesses
+_configurator_attributes = (
+    'cruise_alt',
+    'cruise_mach',
+    'cruise_mass_final',
+    'mass_defect',
+    'require_range_residual',
+    'target_range',
+)
+
+
 class AviaryGroup(om.Group):
     """
     A standard OpenMDAO group where all elements of a given aviary aircraft design and mission are
@@ -107,6 +138,8 @@ class AviaryGroup(om.Group):
             # Under MPI, promotion info only lives on rank 0, so broadcast.
             all_prom_inputs = self.comm.bcast(all_prom_inputs, root=0)
 
+        all_prom_inputs = set(all_prom_inputs)
+
         # Find all variables that are shape_by_conn so we don't set their shape with a stale value
         # from the default metadata. We can only find these on the next level down because
         # aviary_group's setup is not complete until after configure.
@@ -455,6 +488,13 @@ class AviaryGroup(om.Group):
         # Other specific self.*** are defined in here as well that are specific to each builder
         self.configurator.initial_guesses(self)
 
+        self._setup_core_subsystems(aviary_inputs)
+
+        # self._update_metadata_from_subsystems()
+        self._check_reserve_phase_separation()
+
+    def _setup_core_subsystems(self, aviary_inputs):
+        """Create the core subsystem builders and the arguments shared by all mission ODEs."""
         # TODO this seems like the wrong place to define the core subsystems. Maybe move to
         # load_inputs?
         ## Set Up Core Subsystems ##
@@ -475,8 +515,36 @@ class AviaryGroup(om.Group):
                 except KeyError:
                     tabular = False
 
+        # Surrogate aero needs its drag polars trained in pre-mission. The training grid and
+        # tolerance are read from the same phase options as the method.
+        surrogate_options = None
+        for phase_name, phase_info in self.mission_info.items():
+            aero_options = phase_info.get('subsystem_options', {}).get('aerodynamics', {})
+            if aero_options.get('method') != 'surrogate':
+                continue
+
+            options = {
+                'surrogate_grid': get_surrogate_grid(aero_options.get('surrogate_grid')),
+                'retrain_tolerance': aero_options.get('retrain_tolerance', 1e-6),
+            }
+
+            if surrogate_options is None:
+                surrogate_options = options
+            elif options['retrain_tolerance'] != surrogate_options['retrain_tolerance'] or any(
+                not np.array_equal(val, surrogate_options['surrogate_grid'][key])
+                for key, val in options['surrogate_grid'].items()
+            ):
+                raise ValueError(
+                    f'Phase "{phase_name}" uses a different surrogate_grid or retrain_tolerance '
+                    'than other phases. All phases with surrogate aero share the same tables.'
+                )
+
         aero = CoreAerodynamicsBuilder(
-            'aerodynamics', code_origin=self.aero_method, tabular=tabular
+            'aerodynamics',
+            code_origin=self.aero_method,
+            tabular=tabular,
+            surrogate=surrogate_options is not None,
+            **(surrogate_options or {}),
         )
 
         # which geometry methods should be used?
@@ -506,7 +574,49 @@ class AviaryGroup(om.Group):
             'subsystems': subsystems,
         }
 
-        # self._update_metadata_from_subsystems()
+    def get_preprocessed_state(self):
+        """
+        Return the state of this group after its inputs have been loaded and preprocessed.
+
+        The returned dictionary can be passed to ``load_preprocessed_state`` on a new AviaryGroup
+        to skip loading and preprocessing the inputs again.
+
+        Returns
+        -------
+        dict
+            The preprocessed inputs, phase info, engine models, and initial guesses of this group.
+        """
+        state = {name: getattr(self, name) for name in _preprocessed_attributes}
+        state['configurator_attributes'] = {
+            name: getattr(self, name) for name in _configurator_attributes if hasattr(self, name)
+        }
+        return state
+
+    def load_preprocessed_state(self, state, verbosity=None):
+        """
+        Restore a state returned by ``get_preprocessed_state``.
+
+        This replaces both ``load_inputs`` and ``check_and_preprocess_inputs``.
+
+        Parameters
+        ----------
+        state : dict
+            The preprocessed state of an AviaryGroup.
+        verbosity : int, Verbosity (optional)
+            Verbosity level for this API call.
+        """
+        for name in _preprocessed_attributes:
+            setattr(self, name, state[name])
+        for name, val in state['configurator_attributes'].items():
+            setattr(self, name, val)
+
+        if verbosity is not None:
+            self.verbosity = verbosity
+
+        # phase_info modifications were already applied before the state was saved
+        self.phase_info_modifier = None
+
+        self._setup_core_subsystems(self.aviary_inputs)
         self._check_reserve_phase_separation()
 
     def _check_reserve_phase_separation(self):
@@ -702,16 +812,25 @@ class AviaryGroup(om.Group):
 
         return phase, phase_object
 
-    def add_phases(self, parallel_phases=True, verbosity=None, comm=None):
+    def add_phases(self, parallel_phases=True, verbosity=None, comm=None, phase_costs=None):
         """
         Add the mission phases to the problem trajectory based on the user-specified
         phase_info dictionary.
 
+        When the phases run in parallel on more than one process, the processes are assigned to
+        the phases so that each process has a similar share of the work (see
+        balance_phase_procs).
+
         Parameters
         ----------
         parallel_phases (bool, optional): If True, the top-level container of all phases
             will be a ParallelGroup, otherwise it will be a standard OpenMDAO Group.
             Defaults to True.
+        comm (MPI.Comm, optional): Communicator of the problem, used to balance the
+            parallel phases.
+        phase_costs (dict, optional): Relative cost of each phase, keyed by phase name, such
+            as measured by profile_phase_costs. Phases that are not listed have their cost
+            estimated from their number of nodes and subsystems.
 
         Returns
         -------
@@ -743,11 +862,12 @@ class AviaryGroup(om.Group):
 
         # Process all subsystems for all phases.
         external_parameters = {}
+        phases = {}
         for phase_idx, phase_name in enumerate(mission_info):
-            # Create and add phases.
+            # Create phases.
             # This also expands mission_info to include all keys.
             phase, builder = self._get_phase(phase_name, phase_idx, comm)
-            traj.add_phase(phase_name, phase)
+            phases[phase_name] = phase
 
             phase_info = mission_info[phase_name]
             external_parameters[phase_name] = builder.get_parameters()
@@ -787,6 +907,26 @@ class AviaryGroup(om.Group):
                     for timeseries in mbvars_this_phase:
                         phase.add_timeseries_output(timeseries, timeseries='mission_bus_variables')
 
+        proc_kwargs = {}
+        if parallel_phases and comm is not None and comm.size > 1:
+            costs = {}
+            for phase_name, phase in phases.items():
+                if phase_costs is not None and phase_name in phase_costs:
+                    costs[phase_name] = phase_costs[phase_name]
+                else:
+                    costs[phase_name] = estimate_phase_cost(
+                        phase, mission_info[phase_name], all_subsystems, self.aviary_inputs
+                    )
+
+            proc_kwargs = balance_phase_procs(costs, comm.size)
+
+            if verbosity >= Verbosity.VERBOSE:
+                for phase_name, kwargs in proc_kwargs.items():
+                    print(f'Phase {phase_name}: cost {costs[phase_name]:.4g}, {kwargs}')
+
+        for phase_name, phase in phases.items():
+            traj.add_phase(phase_name, phase, **proc_kwargs.get(phase_name, {}))
+
         traj = setup_trajectory_params(
             self,
             traj,
@@ -931,22 +1071,7 @@ class AviaryGroup(om.Group):
 
         # Ensure that the usable fuel loaded onto the aircraft is greater or equal to the mission fuel + reserve fuel
         # The aircraft will naturally try to mimize 'total_fuel_mass_constraint' so it's not carrying extra unnecessary fuel
-        post_mission.add_subsystem(
-            'total_fuel_mass_con',
-            om.ExecComp(
-                'total_fuel_mass_constraint = total_fuel_mass - mission_fuel_burned - reserve_fuel_mass',
-                total_fuel_mass_constraint={'units': 'lbm'},
-                total_fuel_mass={'units': 'lbm'},
-                mission_fuel_burned={'units': 'lbm'},
-                reserve_fuel_mass={'units': 'lbm'},
-            ),
-            promotes_inputs=[
-                ('total_fuel_mass', Mission.TOTAL_FUEL_MASS),
-                ('mission_fuel_burned', Mission.FUEL_MASS),
-                ('reserve_fuel_mass', Mission.TOTAL_RESERVE_FUEL_MASS),
-            ],
-            promotes_outputs=[('total_fuel_mass_constraint', Mission.Constraints.MASS_RESIDUAL)],
-        )
+        self.add_fuel_mass_residual_component()
         # Users can set the below constraint to lower=0.0, which will allow for more fuel on the aircraft than the mission
         # requires. however, caution will need to be taken to ensure the ref is of the right magnitude otherwise the optimizer
         # may not try as hard as needed to minimize this.
@@ -1094,6 +1219,120 @@ class AviaryGroup(om.Group):
             promotes_outputs=[('block_fuel', Mission.BLOCK_FUEL_MASS)],
         )
 
+    def add_quick_sizing_mission(
+        self,
+        cruise_mach=None,
+        cruise_altitude=None,
+        climb_fuel_fraction=0.02,
+        descent_fuel_fraction=0.01,
+        climb_range=(0.0, 'NM'),
+        descent_range=(0.0, 'NM'),
+        num_nodes=5,
+        subsystem_options=None,
+        verbosity=None,
+    ):
+        """
+        Add an analytic sizing mission in place of the phases and post-mission systems.
+
+        The mission is a fixed-fraction climb and descent around a Breguet cruise evaluated with the
+        propulsion and aerodynamics subsystems (see QuickSizingMission). A Newton solver varies the
+        design gross mass until the fuel capacity equals the mission fuel plus reserves, so the
+        aircraft is sized by a single call to run_model.
+
+        Parameters
+        ----------
+        cruise_mach : float, optional
+            Cruise Mach number. Defaults to Aircraft.Design.CRUISE_MACH.
+        cruise_altitude : tuple, optional
+            Cruise altitude as a (value, units) tuple. Defaults to Aircraft.Design.CRUISE_ALTITUDE.
+        climb_fuel_fraction : float, optional
+            Fraction of the gross mass burned in taxi, takeoff and climb.
+        descent_fuel_fraction : float, optional
+            Fraction of the mass at the end of cruise burned in descent and landing.
+        climb_range : tuple, optional
+            Distance covered in climb, as a (value, units) tuple.
+        descent_range : tuple, optional
+            Distance covered in descent, as a (value, units) tuple.
+        num_nodes : int, optional
+            Number of mass nodes at which the cruise is evaluated.
+        subsystem_options : dict, optional
+            Options of the subsystems in the cruise ODE. Defaults to the 'computed' aerodynamics
+            method for FLOPS-based aerodynamics, and the 'cruise' method for GASP-based.
+        verbosity : Verbosity or int, optional
+            Controls the level of terminal output for this method.
+        """
+        verbosity = self._override_verbosity(verbosity)
+        aviary_inputs = self.aviary_inputs
+
+        if cruise_mach is None:
+            cruise_mach = aviary_inputs.get_val(Aircraft.Design.CRUISE_MACH, 'unitless')
+        if cruise_altitude is None:
+            cruise_altitude = (aviary_inputs.get_val(Aircraft.Design.CRUISE_ALTITUDE, 'ft'), 'ft')
+
+        if subsystem_options is None:
+            method = 'computed' if self.aero_method is FLOPS else 'cruise'
+            subsystem_options = {'aerodynamics': {'method': method}}
+
+        self.add_subsystem(
+            'mission',
+            QuickSizingMission(
+                num_nodes=num_nodes,
+                aviary_options=aviary_inputs,
+                subsystems=self.subsystems,
+                subsystem_options=subsystem_options,
+                meta_data=self.meta_data,
+                cruise_mach=float(cruise_mach),
+                cruise_altitude=cruise_altitude,
+                climb_fuel_fraction=climb_fuel_fraction,
+                descent_fuel_fraction=descent_fuel_fraction,
+                climb_range=climb_range,
+                descent_range=descent_range,
+            ),
+            promotes_inputs=['aircraft:*', 'mission:*'],
+            promotes_outputs=['mission:*'],
+        )
+
+        self.add_fuel_mass_residual_component(post_mission=False)
+
+        # size the vehicle (via design GTOW) so that the mission uses all fuel capacity
+        self.add_subsystem(
+            'gtow_balance',
+            om.BalanceComp(
+                name=Aircraft.Design.GROSS_MASS,
+                val=aviary_inputs.get_val(Aircraft.Design.GROSS_MASS, 'lbm'),
+                units='lbm',
+                lhs_name=Mission.Constraints.MASS_RESIDUAL,
+                rhs_val=0.0,
+                eq_units='lbm',
+                lower=10.0,
+            ),
+            promotes_inputs=[Mission.Constraints.MASS_RESIDUAL],
+            promotes_outputs=[Aircraft.Design.GROSS_MASS],
+        )
+
+        self.add_subsystem(
+            'gross_mass',
+            om.ExecComp(
+                'gross_mass = design_gross_mass',
+                gross_mass={'units': 'lbm'},
+                design_gross_mass={'units': 'lbm'},
+                has_diag_partials=True,
+            ),
+            promotes_inputs=[('design_gross_mass', Aircraft.Design.GROSS_MASS)],
+            promotes_outputs=[('gross_mass', Mission.GROSS_MASS)],
+        )
+
+        self.nonlinear_solver = om.NewtonSolver(
+            solve_subsystems=True,
+            maxiter=30,
+            atol=1e-8,
+            rtol=1e-10,
+            err_on_non_converge=True,
+            iprint=2 if verbosity >= Verbosity.VERBOSE else -1,
+        )
+        self.nonlinear_solver.linesearch = om.BoundsEnforceLS()
+        self.linear_solver = om.DirectSolver()
+
     def link_phases(self, verbosity=None, comm=None):
         """
         Link phases together after they've been added.
@@ -1764,6 +2003,39 @@ class AviaryGroup(om.Group):
             promotes_outputs=[('reserve_fuel_mass', reserves_name)],
         )
 
+    def add_fuel_mass_residual_component(self, post_mission=True):
+        """
+        Add the residual between the fuel loaded and the mission plus reserve fuel.
+
+        Parameters
+        ----------
+        post_mission : bool, optional
+            If True, the component is added to the post-mission group, otherwise to this group.
+            Defaults to True.
+        """
+        if post_mission:
+            location = self.post_mission
+        else:
+            location = self
+
+        location.add_subsystem(
+            'total_fuel_mass_con',
+            om.ExecComp(
+                'total_fuel_mass_constraint = total_fuel_mass - mission_fuel_burned'
+                ' - reserve_fuel_mass',
+                total_fuel_mass_constraint={'units': 'lbm'},
+                total_fuel_mass={'units': 'lbm'},
+                mission_fuel_burned={'units': 'lbm'},
+                reserve_fuel_mass={'units': 'lbm'},
+            ),
+            promotes_inputs=[
+                ('total_fuel_mass', Mission.TOTAL_FUEL_MASS),
+                ('mission_fuel_burned', Mission.FUEL_MASS),
+                ('reserve_fuel_mass', Mission.TOTAL_RESERVE_FUEL_MASS),
+            ],
+            promotes_outputs=[('total_fuel_mass_constraint', Mission.Constraints.MASS_RESIDUAL)],
+        )
+
     def _validate_phase_info_modifier(self, phase_info_modifier):
         """Check function for required arguments (phase_info, post_mission_info, aviary_inputs)"""
 
@@ -3,7 +3,7 @@ import json
 import os
 import subprocess
 import warnings
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from itertools import count
@@ -19,16 +19,31 @@ from openmdao.utils.units import convert_units
 from packaging import version
 
 from aviary.core.aviary_group import AviaryGroup
+from aviary.interface.problem_snapshot import (
+    is_problem_snapshot,
+    read_problem_snapshot,
+    write_problem_snapshot,
+)
+from aviary.interface.recording import CheckpointRecorder, StreamingRecorder, restore_checkpoint
 from aviary.interface.utils import set_warning_format
+from aviary.mission.build_cache import mission_build_cache
+from aviary.mission.flight_phase_builder import FlightPhaseBase
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.csv_data_file import write_data_file
 from aviary.utils.functions import convert_strings_to_data, get_path
 from aviary.utils.merge_variable_metadata import merge_meta_data
 from aviary.utils.named_values import NamedValues
-from aviary.variable_info.enums import EquationsOfMotion, LegacyCode, ProblemType, Verbosity
+from aviary.variable_info.enums import (
+    EquationsOfMotion,
+    LegacyCode,
+    ProblemType,
+    Transcription,
+    Verbosity,
+)
 from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variable_meta_data import CoreMetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
+from aviary.visualization.live_feed import LIVE_FEED_FILENAME, LiveFeedPublisher
 
 FLOPS = LegacyCode.FLOPS
 GASP = LegacyCode.GASP
@@ -71,6 +86,8 @@ class AviaryProblem(om.Problem):
         Variable metadata used throughout the problem.
     generate_payload_range : bool
         Flag indicating whether a payload-range diagram should be generated after a sizing run.
+    live_feed : LiveFeedPublisher or None
+        Publisher sending per-iteration data to a live dashboard, if requested at setup.
     """
 
     def __init__(
@@ -122,6 +139,15 @@ class AviaryProblem(om.Problem):
         #      problems don't have a consistent variable path to check the inputs later on
         self.generate_payload_range = False
 
+        self.live_feed = None
+
+        self._report_mode = 'serial'
+        self._report_executor = None
+        self._report_futures = {}
+
+        # keyword arguments of the last call to setup, reused when grid refinement sets up again
+        self._setup_kwargs = {}
+
     def _override_verbosity(self, verbosity):
         """
         Overrides verbosity setting for this method.
@@ -381,6 +407,7 @@ class AviaryProblem(om.Problem):
         self,
         parallel_phases=True,
         verbosity=None,
+        phase_costs=None,
     ):
         """
         Add mission phases to the problem trajectory.
@@ -392,10 +419,16 @@ class AviaryProblem(om.Problem):
         ----------
         parallel_phases : bool, optional
             If True, the top-level container of all phases will be a ParallelGroup; otherwise it
-            will be a standard OpenMDAO Group. Defaults to True.
+            will be a standard OpenMDAO Group. Defaults to True. When running under MPI, the
+            processes are assigned to the phases so that each process has a similar amount of work.
         verbosity : Verbosity or int, optional
             Controls the level of terminal output for this method. If None, uses the problem-level
             verbosity.
+        phase_costs : dict, optional
+            Relative cost of each phase, keyed by phase name, used to balance parallel phases, for
+            example as measured by ``profile_phase_costs`` on a serial run. For multi-mission
+            problems, a dictionary of these keyed by mission name. Phases that are not listed
+            have their cost estimated from their number of nodes and subsystems.
 
         Returns
         -------
@@ -410,12 +443,14 @@ class AviaryProblem(om.Problem):
                     parallel_phases=parallel_phases,
                     verbosity=verbosity,
                     comm=self.comm,
+                    phase_costs=None if phase_costs is None else phase_costs.get(name),
                 )
         else:
             Traj = self.model.add_phases(
                 parallel_phases=parallel_phases,
                 verbosity=verbosity,
                 comm=self.comm,
+                phase_costs=phase_costs,
             )
 
         return Traj
@@ -458,6 +493,69 @@ class AviaryProblem(om.Problem):
         else:
             self.model.add_post_mission_systems(verbosity=verbosity)
 
+    def add_quick_sizing_mission(
+        self,
+        cruise_mach=None,
+        cruise_altitude=None,
+        climb_fuel_fraction=0.02,
+        descent_fuel_fraction=0.01,
+        climb_range=(0.0, 'NM'),
+        descent_range=(0.0, 'NM'),
+        num_nodes=5,
+        subsystem_options=None,
+        verbosity=None,
+    ):
+        """
+        Add an analytic sizing mission in place of the phases and post-mission systems.
+
+        Call this after ``add_pre_mission_systems`` instead of ``add_phases``,
+        ``add_post_mission_systems`` and ``link_phases``. After ``setup``, a single
+        ``run_model`` closes the design gross mass on a fixed-fraction climb and descent around a
+        Breguet cruise that flies Aircraft.Design.RANGE, using fuel flow and drag from the
+        aircraft's propulsion and aerodynamics subsystems. This takes a fraction of the time of a
+        trajectory optimization, and is intended for early design studies; the full mission
+        remains the reference for validation.
+
+        Parameters
+        ----------
+        cruise_mach : float, optional
+            Cruise Mach number. Defaults to Aircraft.Design.CRUISE_MACH.
+        cruise_altitude : tuple, optional
+            Cruise altitude as a (value, units) tuple. Defaults to Aircraft.Design.CRUISE_ALTITUDE.
+        climb_fuel_fraction : float, optional
+            Fraction of the gross mass burned in taxi, takeoff and climb. Defaults to 0.02.
+        descent_fuel_fraction : float, optional
+            Fraction of the mass at the end of cruise burned in descent and landing. Defaults to
+            0.01.
+        climb_range : tuple, optional
+            Distance covered in climb, as a (value, units) tuple. Defaults to zero.
+        descent_range : tuple, optional
+            Distance covered in descent, as a (value, units) tuple. Defaults to zero.
+        num_nodes : int, optional
+            Number of mass nodes at which the cruise is evaluated. Defaults to 5.
+        subsystem_options : dict, optional
+            Options of the subsystems in the cruise ODE, keyed by subsystem name.
+        verbosity : Verbosity or int, optional
+            Controls the level of terminal output for this method. If None, uses the problem-level
+            verbosity.
+        """
+        verbosity = self._override_verbosity(verbosity)
+
+        if self.problem_type == ProblemType.MULTI_MISSION:
+            raise ValueError('Quick sizing is not available for multi-mission problems.')
+
+        self.model.add_quick_sizing_mission(
+            cruise_mach=cruise_mach,
+            cruise_altitude=cruise_altitude,
+            climb_fuel_fraction=climb_fuel_fraction,
+            descent_fuel_fraction=descent_fuel_fraction,
+            climb_range=climb_range,
+            descent_range=descent_range,
+            num_nodes=num_nodes,
+            subsystem_options=subsystem_options,
+            verbosity=verbosity,
+        )
+
     def link_phases(self, verbosity=None):
         """
         Add an optimization driver to the Aviary problem.
@@ -1142,7 +1240,7 @@ class AviaryProblem(om.Problem):
                     # print("var_pairs",var_pairs)
                     self.model.promotes(mission_name, inputs=var_pairs)
 
-    def setup(self, **kwargs):
+    def setup(self, live_feed=None, **kwargs):
         """
         Set up the Aviary problem.
 
@@ -1151,6 +1249,11 @@ class AviaryProblem(om.Problem):
 
         Parameters
         ----------
+        live_feed : bool, dict, or LiveFeedPublisher, optional
+            If provided, a LiveFeedPublisher is attached to the driver so that a running dashboard
+            (``aviary dashboard --live``) receives per-iteration updates. A dict is passed as
+            keyword arguments to ``LiveFeedPublisher``. The connection details are written to
+            ``live_feed.json`` in the reports directory. Defaults to None.
         **kwargs : dict
             Additional keyword arguments passed to ``om.Problem.setup()``. Note: a ``verbosity``
             keyword, if present, will be ignored, as this method does not require it.
@@ -1160,6 +1263,8 @@ class AviaryProblem(om.Problem):
         if 'verbosity' in kwargs:
             kwargs.pop('verbosity')
 
+        self._setup_kwargs = kwargs
+
         # Use OpenMDAO's model options to pass all options through the system hierarchy.
         if self.problem_type == ProblemType.MULTI_MISSION:
             for name, group in self.aviary_groups_dict.items():
@@ -1185,10 +1290,40 @@ class AviaryProblem(om.Problem):
             warnings.simplefilter('ignore', om.OpenMDAOWarning)
             warnings.simplefilter('ignore', om.PromotionWarning)
 
-            super().setup(**kwargs)
+            # phases and missions that share subsystems reuse each other's mission systems
+            with mission_build_cache():
+                super().setup(**kwargs)
+
+        if live_feed:
+            self._add_live_feed(live_feed)
 
         self.set_initial_guesses(verbosity=None)
 
+    def _add_live_feed(self, live_feed):
+        """
+        Attach a LiveFeedPublisher to the driver.
+
+        Parameters
+        ----------
+        live_feed : bool, dict, or LiveFeedPublisher
+            The publisher, keyword arguments for a new publisher, or True to use the defaults.
+        """
+        if not self.driver:
+            raise RuntimeError('Unable to set up the live feed because no Driver was added.')
+
+        if isinstance(live_feed, LiveFeedPublisher):
+            publisher = live_feed
+        elif isinstance(live_feed, dict):
+            publisher = LiveFeedPublisher(**live_feed)
+        else:
+            publisher = LiveFeedPublisher()
+
+        if publisher.connection_file is None:
+            publisher.connection_file = Path(self.get_reports_dir(force=True)) / LIVE_FEED_FILENAME
+
+        self.driver.add_recorder(publisher)
+        self.live_feed = publisher
+
     def set_initial_guesses(self, parent_prob=None, parent_prefix='', verbosity=None):
         """
         Set initial guesses for trajectory states and controls.
@@ -1235,6 +1370,15 @@ class AviaryProblem(om.Problem):
         make_plots=True,
         verbosity=None,
         real_time_plotting=False,
+        recording_mode='full',
+        timeseries_record_interval=10,
+        async_recording=False,
+        report_mode='serial',
+        grid_refinement_levels=1,
+        grid_refinement_tol=1e-3,
+        checkpoint_interval=None,
+        checkpoint_file='aviary_checkpoint.npz',
+        resume=False,
     ):
         """
         Run the Aviary problem.
@@ -1261,88 +1405,501 @@ class AviaryProblem(om.Problem):
             verbosity.
         real_time_plotting : bool, optional
             If True, enables real-time plotting of the optimization progress.
+        recording_mode : str, optional
+            How the driver history is recorded. ``'full'`` attaches a standard SqliteRecorder to
+            the driver when verbosity is VERBOSE or above, or when real-time plotting is requested.
+            ``'streaming'`` always attaches a StreamingRecorder, which stores driver-level values
+            every iteration but full timeseries only every ``timeseries_record_interval``
+            iterations and at the final iteration, in compressed form. Defaults to ``'full'``.
+        timeseries_record_interval : int, optional
+            Number of driver iterations between timeseries snapshots when ``recording_mode`` is
+            ``'streaming'``. Defaults to 10.
+        async_recording : bool, optional
+            If True and ``recording_mode`` is ``'streaming'``, timeseries snapshots are compressed
+            and written on a background thread. Defaults to False.
+        report_mode : str, optional
+            How the reports that only read a snapshot of the results (mission summary, timeseries
+            CSV and run status) are generated. ``'serial'`` writes them after the driver finishes,
+            before this method returns. ``'background'`` takes the snapshot, then writes them on a
+            thread pool so this method can return right away; call ``wait_for_reports`` before
+            reading them. ``'deferred'`` skips them, so they can be generated later with
+            ``write_snapshot_reports(results_snapshot_from_recorder('problem_history.db'), ...)``;
+            it requires ``run_driver``, since that file is only written by the driver run.
+            Defaults to ``'serial'``.
+        grid_refinement_levels : int, optional
+            Number of grids used to solve collocation flight phases, from coarse to fine. The finest
+            grid is the one given by 'num_segments' in phase_info, and each coarser grid has half as
+            many segments as the next. Each grid is solved starting from the solution of the
+            previous one, interpolated onto the new grid. Refinement stops early once fuel burn and
+            range change by less than ``grid_refinement_tol`` between two grids, and the final
+            optimization is run on that grid. Only used when ``run_driver`` is True. Defaults to 1,
+            which solves directly on the phase_info grid.
+        grid_refinement_tol : float, optional
+            Relative change in fuel burn and range between two grids below which grid refinement
+            stops. Defaults to 1e-3.
+        checkpoint_interval : int, optional
+            If given, the design variables and the state of the model are saved to
+            ``checkpoint_file`` every ``checkpoint_interval`` driver iterations. With a
+            ``pyOptSparseDriver``, every function evaluation is also stored in a pyoptsparse
+            history file next to it, with the ``.hst`` extension. Only the final optimization is
+            checkpointed when grid refinement is used. Defaults to None, which disables
+            checkpoints.
+        checkpoint_file : str or Path, optional
+            Path to the checkpoint file. Defaults to ``'aviary_checkpoint.npz'``.
+        resume : bool, optional
+            If True, continue an interrupted optimization from its checkpoint. With a
+            ``pyOptSparseDriver`` and a history file, the optimization restarts from the same
+            initial point and pyoptsparse replays the stored function evaluations instead of
+            recomputing them. Otherwise, the design variables and model state are loaded from
+            ``checkpoint_file`` and ``restart_filename`` is ignored. If there is nothing to resume
+            from, the optimization starts from scratch. Defaults to False.
         """
         verbosity = self._override_verbosity(verbosity)
 
-        if (
-            verbosity >= Verbosity.VERBOSE or real_time_plotting
-        ):  # If real_time_plotting needs a driver recorder file to run the realtime plot server
-            recorder = om.SqliteRecorder('optimization_history.db')
-            self.driver.add_recorder(recorder)
-            self.final_setup()
+        if grid_refinement_levels < 1:
+            raise ValueError(
+                f'Invalid grid_refinement_levels "{grid_refinement_levels}". Must be at least 1.'
+            )
 
-        if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
-            with open(self.get_reports_dir() / 'input_list.txt', 'w') as outfile:
-                self.model.list_inputs(out_stream=outfile)
+        if recording_mode not in ('full', 'streaming'):
+            raise ValueError(
+                f'Invalid recording_mode "{recording_mode}". Must be "full" or "streaming".'
+            )
 
-        def _view_realtime_plot_hook(driver):
-            case_recorder_file = str(driver._rec_mgr._recorders[0]._filepath)
+        if report_mode not in ('serial', 'background', 'deferred'):
+            raise ValueError(
+                f'Invalid report_mode "{report_mode}". Must be "serial", "background" or '
+                '"deferred".'
+            )
 
-            cmd = ['openmdao', 'realtime_plot', '--pid', str(os.getpid()), case_recorder_file]
-            cp = subprocess.Popen(cmd)  # nosec: trusted input
+        if report_mode == 'deferred' and not run_driver:
+            raise ValueError(
+                'report_mode "deferred" requires run_driver=True. The deferred reports are '
+                'generated from problem_history.db, which is only written when the driver runs.'
+            )
 
-            # Do a quick non-blocking check to see if it immediately failed
-            # This will catch immediate failures but won't wait for the process to finish
-            quick_check = cp.poll()
-            if quick_check is not None and quick_check != 0:
-                # Process already terminated with an error
-                stderr = cp.stderr.read().decode()
-                raise RuntimeError(
-                    f'Failed to start up the realtime plot server with code {quick_check}: {stderr}.'
+        if run_driver and grid_refinement_levels > 1:
+            self._run_grid_refinement(
+                grid_refinement_levels,
+                grid_refinement_tol,
+                restart_filename,
+                suppress_solver_print,
+                verbosity,
+            )
+            # the restart file was used to start the coarsest grid
+            restart_filename = None
+
+        self._report_mode = report_mode
+        if report_mode == 'background':
+            self._report_executor = ThreadPoolExecutor()
+
+        try:
+            recorder = None
+            if recording_mode == 'streaming':
+                recorder = StreamingRecorder(
+                    'optimization_history.db',
+                    timeseries_interval=timeseries_record_interval,
+                    async_writer=async_recording,
+                )
+                # the timeseries must reach the recorder to be stored as snapshots, on top of
+                # whatever the user already asked the driver to record
+                recording_options = self.driver.recording_options
+                includes = list(recording_options['includes'])
+                if '*' not in includes:
+                    includes += [
+                        name for name in recorder.timeseries_includes if name not in includes
+                    ]
+                recording_options['includes'] = includes
+                self.driver.add_recorder(recorder)
+                self.final_setup()
+
+            elif (
+                verbosity >= Verbosity.VERBOSE or real_time_plotting
+            ):  # If real_time_plotting needs a driver recorder file to run the realtime plot server
+                recorder = om.SqliteRecorder('optimization_history.db')
+                self.driver.add_recorder(recorder)
+                self.final_setup()
+
+            if run_driver and (checkpoint_interval is not None or resume):
+                restart_filename = self._setup_checkpoints(
+                    checkpoint_file, checkpoint_interval, resume, restart_filename, verbosity
                 )
 
-        # register the hook to stat up the real-time plot server
-        if real_time_plotting:
-            if not self.driver:
-                raise RuntimeError(
-                    'Unable to run realtime optimization progress plot because no Driver'
+            if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
+                with open(self.get_reports_dir() / 'input_list.txt', 'w') as outfile:
+                    self.model.list_inputs(out_stream=outfile)
+
+            def _view_realtime_plot_hook(driver):
+                # the live feed and checkpoint recorders may be attached before the SQLite recorder
+                sqlite_recorder = next(
+                    rec for rec in driver._rec_mgr._recorders if isinstance(rec, om.SqliteRecorder)
                 )
+                case_recorder_file = str(sqlite_recorder._filepath)
+
+                cmd = ['openmdao', 'realtime_plot', '--pid', str(os.getpid()), case_recorder_file]
+                cp = subprocess.Popen(cmd)  # nosec: trusted input
+
+                # Do a quick non-blocking check to see if it immediately failed
+                # This will catch immediate failures but won't wait for the process to finish
+                quick_check = cp.poll()
+                if quick_check is not None and quick_check != 0:
+                    # Process already terminated with an error
+                    stderr = cp.stderr.read().decode()
+                    raise RuntimeError(
+                        'Failed to start up the realtime plot server with code '
+                        f'{quick_check}: {stderr}.'
+                    )
 
-            hooks._register_hook(
-                '_setup_recording', 'Driver', post=_view_realtime_plot_hook, ncalls=1
-            )
-            hooks._setup_hooks(self.driver)
+            # register the hook to stat up the real-time plot server
+            if real_time_plotting:
+                if not self.driver:
+                    raise RuntimeError(
+                        'Unable to run realtime optimization progress plot because no Driver'
+                    )
 
-        if suppress_solver_print:
-            self.set_solver_print(level=0)
+                hooks._register_hook(
+                    '_setup_recording', 'Driver', post=_view_realtime_plot_hook, ncalls=1
+                )
+                hooks._setup_hooks(self.driver)
+
+            if suppress_solver_print:
+                self.set_solver_print(level=0)
+
+            # and run mission, and dynamics
+            if run_driver:
+                self.result = dm.run_problem(
+                    self,
+                    run_driver=run_driver,
+                    simulate=simulate,
+                    make_plots=make_plots,
+                    solution_record_file='problem_history.db',
+                    restart=restart_filename,
+                )
+
+                # Manually print out a failure message for low verbosity modes that suppress
+                # optimizer printouts, which may include the results message. Assumes success,
+                # alerts user on a failure
+                if (
+                    not self.result.success and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
+                ):
+                    warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
+            else:
+                self.run_model()
+                self.result = self.driver.result
+
+            if isinstance(recorder, StreamingRecorder):
+                # Make sure the final timeseries snapshot is on disk before reports read it.
+                recorder.finalize_snapshots()
 
-        # and run mission, and dynamics
-        if run_driver:
-            self.result = dm.run_problem(
+            # update n2 diagram after run.
+            outdir = Path(self.get_reports_dir(force=True))
+            outfile = os.path.join(outdir, 'n2.html')
+            om.n2(
                 self,
-                run_driver=run_driver,
-                simulate=simulate,
-                make_plots=make_plots,
-                solution_record_file='problem_history.db',
-                restart=restart_filename,
+                outfile=outfile,
+                show_browser=False,
             )
 
-            # Manually print out a failure message for low verbosity modes that suppress
-            # optimizer printouts, which may include the results message. Assumes success,
-            # alerts user on a failure
-            if (
-                not self.result.success and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
-            ):
-                warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
+            if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
+                with open(Path(self.get_reports_dir()) / 'output_list.txt', 'w') as outfile:
+                    self.model.list_outputs(out_stream=outfile)
+
+            if self.generate_payload_range and self.problem_type == ProblemType.SIZING:
+                self.run_payload_range()
+        finally:
+            if self._report_executor is not None:
+                # pending reports keep running, but no new ones can be submitted
+                self._report_executor.shutdown(wait=False)
+                self._report_executor = None
+            self._report_mode = 'serial'
+
+    def _setup_checkpoints(
+        self, checkpoint_file, checkpoint_interval, resume, restart_filename, verbosity
+    ):
+        """
+        Attach checkpointing to the driver and, when resuming, load the previous run.
+
+        Parameters
+        ----------
+        checkpoint_file : str or Path
+            Path to the checkpoint file.
+        checkpoint_interval : int or None
+            Number of driver iterations between checkpoints. If None, no checkpoints are written.
+        resume : bool
+            If True, resume from the checkpoint or pyoptsparse history of a previous run.
+        restart_filename : str or None
+            Case recorder file used to start the optimization.
+        verbosity : Verbosity
+            Controls the level of terminal output.
+
+        Returns
+        -------
+        str or None
+            The case recorder file that should still be used to start the optimization.
+        """
+        checkpoint_file = Path(checkpoint_file)
+        history_file = checkpoint_file.with_suffix('.hst')
+        hot_start = isinstance(self.driver, om.pyOptSparseDriver)
+
+        if resume:
+            if hot_start and history_file.is_file():
+                # The stored evaluations are only replayed while the optimizer retraces the same
+                # path, so the run must start from the original point rather than the checkpoint.
+                hot_start_file = checkpoint_file.with_name(checkpoint_file.stem + '_hotstart.hst')
+                os.replace(history_file, hot_start_file)
+                self.driver.options['hotstart_file'] = str(hot_start_file)
+
+                if verbosity >= Verbosity.BRIEF:
+                    print(f'Resuming optimization by replaying the history in {hot_start_file}.')
+
+            elif checkpoint_file.is_file():
+                self.final_setup()
+                iteration = restore_checkpoint(self, checkpoint_file)
+                restart_filename = None
+
+                if verbosity >= Verbosity.BRIEF:
+                    print(
+                        f'Resuming optimization from iteration {iteration} saved in '
+                        f'{checkpoint_file}.'
+                    )
+
+            else:
+                warnings.warn(
+                    f'No checkpoint found at {checkpoint_file}, starting the optimization from '
+                    'the beginning.'
+                )
+
+        if checkpoint_interval is not None:
+            if hot_start:
+                self.driver.options['hist_file'] = str(history_file)
+
+            self.driver.add_recorder(CheckpointRecorder(checkpoint_file, checkpoint_interval))
+            self.final_setup()
+
+        return restart_filename
+
+    def _get_refinable_phases(self):
+        """
+        Return the collocation flight phases whose grid can be changed for grid refinement.
+
+        Returns
+        -------
+        list of tuple
+            Dymos phase and the FlightPhaseBase builder of every refinable phase.
+        """
+        if self.problem_type == ProblemType.MULTI_MISSION:
+            groups = self.aviary_groups_dict.values()
         else:
-            self.run_model()
-            self.result = self.driver.result
-
-        # update n2 diagram after run.
-        outdir = Path(self.get_reports_dir(force=True))
-        outfile = os.path.join(outdir, 'n2.html')
-        om.n2(
-            self,
-            outfile=outfile,
-            show_browser=False,
-        )
+            groups = [self.model]
+
+        phases = []
+        for group in groups:
+            if not hasattr(group, 'traj'):
+                continue
+
+            for phase_object in group.phase_objects:
+                # phase builders with their own transcription may not support a different grid
+                if (
+                    isinstance(phase_object, FlightPhaseBase)
+                    and type(phase_object).make_default_transcription
+                    is FlightPhaseBase.make_default_transcription
+                    and phase_object.user_options['transcription'] is Transcription.COLLOCATION
+                ):
+                    phases.append((group.traj._phases[phase_object.name], phase_object))
+
+        return phases
+
+    def _get_grid_refinement_metrics(self):
+        """
+        Return the fuel burn and range of every mission, used to judge grid convergence.
+
+        Returns
+        -------
+        ndarray
+            Fuel burn and range of each mission.
+        """
+        if self.problem_type == ProblemType.MULTI_MISSION:
+            prefixes = [f'{name}.' for name in self.aviary_groups_dict]
+        else:
+            prefixes = ['']
 
-        if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
-            with open(Path(self.get_reports_dir()) / 'output_list.txt', 'w') as outfile:
-                self.model.list_outputs(out_stream=outfile)
+        metrics = []
+        for prefix in prefixes:
+            metrics.append(self.get_val(prefix + Mission.FUEL_MASS, units='lbm')[0])
+            metrics.append(self.get_val(prefix + Mission.RANGE, units='NM')[0])
 
-        if self.generate_payload_range and self.problem_type == ProblemType.SIZING:
-            self.run_payload_range()
+        return np.array(metrics)
+
+    def _setup_grid(self, phases, num_segments, suppress_solver_print, restart_case=None):
+        """
+        Set up the problem again with a new grid in each refinable phase, keeping the current
+        solution.
+
+        Design variables and other independent values that do not depend on the grid are copied
+        over directly. States and controls of the refinable phases are interpolated from their
+        current timeseries onto the new grid.
+
+        Parameters
+        ----------
+        phases : list of tuple
+            Dymos phase and phase builder of every refinable phase.
+        num_segments : list of int
+            New number of segments of each phase.
+        suppress_solver_print : bool
+            If True, all solver print statements are suppressed.
+        restart_case : Case, optional
+            Previously computed solution loaded after the new grid is set up.
+        """
+        independent_names = set()
+        for meta in self.model.list_inputs(
+            is_indep_var=True, prom_name=True, val=False, return_format='dict', out_stream=None
+        ).values():
+            independent_names.add(meta['prom_name'])
+        for meta in self.model.list_outputs(
+            is_indep_var=True, prom_name=True, val=False, return_format='dict', out_stream=None
+        ).values():
+            independent_names.add(meta['prom_name'])
+
+        independent_values = {}
+        for name in independent_names:
+            try:
+                independent_values[name] = self.get_val(name)
+            except RuntimeError:
+                # promoted inputs with ambiguous units can't be read by promoted name
+                continue
+
+        # timeseries are only available once the model has been run
+        trajectories = []
+        if self.model.iter_count > 0:
+            for phase, _ in phases:
+                time = phase.get_val('timeseries.time', units='s')
+                states = {
+                    name: phase.get_val(f'timeseries.{name}', units=options['units'])
+                    for name, options in phase.state_options.items()
+                }
+                controls = {
+                    name: phase.get_val(f'timeseries.{name}', units=options['units'])
+                    for name, options in phase.control_options.items()
+                    if options['control_type'] != 'polynomial'
+                }
+                trajectories.append((time, states, controls))
+
+        for (phase, phase_object), segments in zip(phases, num_segments):
+            phase.options['transcription'] = phase_object.make_default_transcription(segments)
+
+        self.setup(**self._setup_kwargs)
+
+        for name, val in independent_values.items():
+            try:
+                current = self.get_val(name)
+            except KeyError:
+                continue
+
+            # values sized by the grid are interpolated below instead
+            if np.shape(current) == np.shape(val):
+                self.set_val(name, val)
+
+        for (phase, _), (time, states, controls) in zip(phases, trajectories):
+            phase.set_time_val(initial=time[0, 0], duration=time[-1, 0] - time[0, 0], units='s')
+
+            for name, vals in states.items():
+                phase.set_state_val(
+                    name, vals, time_vals=time, units=phase.state_options[name]['units']
+                )
+
+            for name, vals in controls.items():
+                phase.set_control_val(
+                    name, vals, time_vals=time, units=phase.control_options[name]['units']
+                )
+
+        if restart_case is not None:
+            dm.load_case(self, restart_case)
+
+        if suppress_solver_print:
+            self.set_solver_print(level=0)
+
+    def _run_grid_refinement(self, levels, tol, restart_filename, suppress_solver_print, verbosity):
+        """
+        Optimize the problem on a sequence of coarse grids before the final optimization.
+
+        Each grid is warm started from the solution on the previous one. When fuel burn and range
+        change by less than tol between two grids, the problem is left on the finer of them.
+        Otherwise it is left on the phase_info grid, warm started from the finest coarse solution.
+
+        Parameters
+        ----------
+        levels : int
+            Number of grids, including the phase_info grid.
+        tol : float
+            Relative change in fuel burn and range below which refinement stops.
+        restart_filename : str or None
+            Path to a file containing a previously computed solution used to start the coarsest
+            grid.
+        suppress_solver_print : bool
+            If True, all solver print statements are suppressed.
+        verbosity : Verbosity
+            Controls the level of terminal output.
+        """
+        phases = self._get_refinable_phases()
+        if not phases:
+            return
+
+        full_segments = [phase_object.user_options['num_segments'] for _, phase_object in phases]
+
+        previous_metrics = None
+        for level in range(levels - 1):
+            scale = 2 ** (levels - 1 - level)
+            num_segments = [max(1, int(np.ceil(n / scale))) for n in full_segments]
+
+            restart_case = None
+            if level == 0 and restart_filename is not None:
+                restart_case = om.CaseReader(restart_filename).get_case('final')
+
+            self._setup_grid(phases, num_segments, suppress_solver_print, restart_case)
+            self.run_driver()
+
+            metrics = self._get_grid_refinement_metrics()
+
+            if verbosity >= Verbosity.BRIEF:
+                print(
+                    f'Grid refinement level {level} ({sum(num_segments)} segments): fuel burn and '
+                    f'range {metrics}'
+                )
+
+            if previous_metrics is not None:
+                change = np.abs(metrics - previous_metrics) / np.maximum(
+                    np.abs(previous_metrics), 1e-12
+                )
+                if np.all(change < tol):
+                    if verbosity >= Verbosity.BRIEF:
+                        print(f'Grid refinement converged at level {level}.')
+                    return
+
+            previous_metrics = metrics
+
+        self._setup_grid(phases, full_segments, suppress_solver_print)
+
+    def wait_for_reports(self):
+        """
+        Wait for reports written in the background by ``run_aviary_problem`` to finish.
+
+        Returns
+        -------
+        list of str
+            Names of the reports that were written.
+
+        Raises
+        ------
+        Exception
+            The first error raised while writing a report, if any.
+        """
+        futures = self._report_futures
+        self._report_futures = {}
+
+        for future in futures.values():
+            future.result()
+
+        return list(futures)
 
     def run_off_design_mission(
         self,
@@ -1457,7 +2014,8 @@ class AviaryProblem(om.Problem):
         off_design_prob = AviaryProblem(name=name)
 
         # Set up problem for mission, such as equations of motion, configurators, etc.
-        inputs = deepcopy(self.aviary_inputs)
+        # The copy shares values with the sized aircraft and only stores the changes made below.
+        inputs = self.aviary_inputs.copy()
 
         design_gross_mass = self.get_val(Aircraft.Design.GROSS_MASS, units='lbm')[0]
         inputs.set_val(Aircraft.Design.GROSS_MASS, design_gross_mass, units='lbm')
@@ -1936,6 +2494,45 @@ class AviaryProblem(om.Problem):
 
             jsonfile.close()
 
+    def save_snapshot(self, filename='sizing_snapshot.avsnap'):
+        """
+        Save a binary snapshot of this problem for fast reloading.
+
+        The snapshot contains the preprocessed aviary_inputs, the phase info, the engine models and
+        the final values of all design variables. It can be loaded with ``reload_aviary_problem``,
+        which skips input preprocessing and starts from the converged design.
+
+        Parameters
+        ----------
+        filename : str or Path, optional
+            File name (and relative path) for the snapshot file. Defaults to
+            ``'sizing_snapshot.avsnap'``.
+
+        Raises
+        ------
+        ValueError
+            If this is a multi-mission problem.
+        """
+        if self.problem_type is ProblemType.MULTI_MISSION:
+            raise ValueError('Problem snapshots are not supported for multi-mission problems.')
+
+        design_vars = self.model.get_design_vars(recurse=True, get_sizes=False, use_prom_ivc=True)
+        design_vector = {}
+        for meta in design_vars.values():
+            source = meta['source']
+            if source not in design_vector:
+                design_vector[source] = np.array(self.get_val(source, get_remote=True), copy=True)
+
+        write_problem_snapshot(
+            filename,
+            {
+                'problem_type': self.problem_type,
+                'generate_payload_range': self.generate_payload_range,
+                'group': self.model.get_preprocessed_state(),
+                'design_vector': design_vector,
+            },
+        )
+
     def _add_hybrid_objective(self, phase_info):
         """
         Add a hybrid objective that combines final mass and final time.
@@ -2065,10 +2662,12 @@ def reload_aviary_problem(
     Parameters
     ----------
     filename : str, Path
-        User specified name and relative path of json file containing the sized aircraft data
+        User specified name and relative path of json file containing the sized aircraft data, or
+        of a snapshot file written by ``AviaryProblem.save_snapshot``
 
     phase_info : dict, Path
-        phase_info dictionary used by the original problem
+        phase_info dictionary used by the original problem. Not used when loading a snapshot,
+        which already contains the phase_info.
 
     metadata : dict (optional)
         Custom metadata if needed to read all variables present in the json output file
@@ -2082,12 +2681,15 @@ def reload_aviary_problem(
     running off-design missions, then the full level 2 interface should be used. "load_inputs()"
     can be skipped as the "aviary_inputs" attribute is prefilled here.
     """
+    filename = get_path(filename, verbosity)
+
+    if is_problem_snapshot(filename):
+        return _reload_from_snapshot(filename, metadata, verbosity)
+
     # warning if default is used
     # Initialize a new aviary problem and aviary_input data structure
     prob = AviaryProblem()
 
-    filename = get_path(filename, verbosity)
-
     aviary_inputs = _read_sizing_json(filename, metadata, verbosity)
 
     prob.load_inputs(aviary_inputs, phase_info, verbosity=verbosity)
@@ -2120,3 +2722,46 @@ def reload_aviary_problem(
     prob.set_val(Mission.GROSS_MASS, aviary_inputs.get_val(Mission.GROSS_MASS, 'lbm'), 'lbm')
 
     return prob
+
+
+def _reload_from_snapshot(filename, metadata, verbosity):
+    """
+    Rebuild an AviaryProblem from a snapshot written by ``AviaryProblem.save_snapshot``.
+
+    Input loading and preprocessing are skipped, and the design variables are set to their values
+    from the snapshot after setup.
+    """
+    snapshot = read_problem_snapshot(filename)
+
+    prob = AviaryProblem(problem_type=snapshot['problem_type'], meta_data=metadata)
+    prob.model.meta_data = prob.meta_data
+    prob.model.load_preprocessed_state(snapshot['group'], verbosity=verbosity)
+
+    prob.aviary_inputs = prob.model.aviary_inputs
+    prob.verbosity = prob.model.verbosity
+    prob.generate_payload_range = snapshot['generate_payload_range']
+
+    external_subsystems = prob.model.external_subsystems
+    if external_subsystems:
+        prob.meta_data = merge_meta_data(
+            [prob.meta_data] + [subsystem.meta_data for subsystem in external_subsystems]
+        )
+        prob.model.meta_data = prob.meta_data
+
+    prob.build_model(verbosity=verbosity)
+
+    prob.add_driver(verbosity=verbosity)
+
+    prob.add_design_variables(verbosity=verbosity)
+
+    prob.add_objective(verbosity=verbosity)
+
+    prob.setup(verbosity=verbosity)
+
+    prob.final_setup()
+
+    # start from the converged design
+    for source, val in snapshot['design_vector'].items():
+        prob.set_val(source, val)
+
+    return prob
@@ -1,7 +1,7 @@
 import openmdao.api as om
 
 from aviary.utils.functions import promote_aircraft_and_mission_vars
-from aviary.variable_info.functions import override_aviary_vars
+from aviary.variable_info.functions import VariableIndex, override_aviary_vars
 
 
 class StaticGroup(om.Group):
@@ -19,7 +19,7 @@ class StaticGroup(om.Group):
         Promote aircraft and mission variables.
         Override output aviary variables.
         """
-        external_outputs = promote_aircraft_and_mission_vars(self)
+        external_outputs = promote_aircraft_and_mission_vars(self, var_index=VariableIndex(self))
 
         if not hasattr(self, 'core_subsystems'):
             # TODO Post mission doesn't support core subsystems yet.
@@ -31,4 +31,5 @@ class StaticGroup(om.Group):
             core_subs.options['aviary_options'],
             external_overrides=external_outputs,
             code_origin_overrides=core_subs.code_origin_overrides,
+            var_index=core_subs.var_index,
         )
@@ -1,17 +1,76 @@
 import argparse
+import importlib
 import os
 import sys
 
-from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight_profile_parser
-from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
-from aviary.interface.run_aviary import _exec_run_aviary, _setup_run_aviary_parser
-from aviary.interface.installation_test import _exec_installation_test, _setup_installation_test
-from aviary.utils.aero_table_conversion_cmd import _exec_ATC, _setup_ATC_parser
-from aviary.utils.engine_deck_conversion_cmd import _exec_EDC, _setup_EDC_parser
-from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
-from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
-from aviary.visualization.dashboard_cmd import _dashboard_cmd, _dashboard_setup_parser
-from aviary.visualization.realtime_plot import _rtplot_cmd, _rtplot_setup_parser
+
+def _lazy(module_name, func_name):
+    """
+    Return a function that imports its module only when it is called.
+
+    Subcommand modules can pull in heavy dependencies (plotting, GUI and dashboard packages), so
+    they are not imported until the subcommand that needs them is actually run.
+
+    Parameters
+    ----------
+    module_name : str
+        The module that defines the function.
+    func_name : str
+        The name of the function in that module.
+
+    Returns
+    -------
+    function
+        Wrapper that imports the module and calls the function with the given arguments.
+    """
+
+    def func(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), func_name)(*args, **kwargs)
+
+    func.__name__ = func_name
+    func.__qualname__ = func_name
+    func.__module__ = module_name
+
+    return func
+
+
+def _selected_command(command_map, argv):
+    """
+    Return the command selected in argv, if any.
+
+    As for argparse subparsers, the command is the first positional argument in argv. None is
+    returned if there is none, or if it does not name a command in command_map.
+    """
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg if arg in command_map else None
+
+    return None
+
+
+def _args_after_command(argv):
+    """Return the arguments that follow the command, the first positional argument, in argv."""
+    for i, arg in enumerate(argv):
+        if not arg.startswith('-'):
+            return argv[i + 1 :]
+
+    return []
+
+
+def _add_command_parsers(subparsers, command_map, argv):
+    """
+    Add a subparser for every command in command_map.
+
+    Only the command selected in argv gets its full argument setup, since that requires importing
+    the module that implements it. The other commands only need their help string.
+    """
+    selected = _selected_command(command_map, argv)
+
+    for name, (parser_setup_func, executor, help_str) in sorted(command_map.items()):
+        subparser = subparsers.add_parser(name, help=help_str)
+        if name == selected:
+            parser_setup_func(subparser)
+            subparser.set_defaults(executor=executor)
 
 
 def _load_and_exec(script_name, user_args):
@@ -45,38 +104,61 @@ def _load_and_exec(script_name, user_args):
 # Conversion subcommands map (for 'aviary convert' sub-sub-commands)
 _convert_command_map = {
     'aero_table': (
-        _setup_ATC_parser,
-        _exec_ATC,
+        _lazy('aviary.utils.aero_table_conversion_cmd', '_setup_ATC_parser'),
+        _lazy('aviary.utils.aero_table_conversion_cmd', '_exec_ATC'),
         'Convert FLOPS- or GASP-formatted aero data files into Aviary csv format.',
     ),
     'engine_deck': (
-        _setup_EDC_parser,
-        _exec_EDC,
+        _lazy('aviary.utils.engine_deck_conversion_cmd', '_setup_EDC_parser'),
+        _lazy('aviary.utils.engine_deck_conversion_cmd', '_exec_EDC'),
         'Convert FLOPS- or GASP-formatted engine decks into Aviary csv format.',
     ),
     'fortran_to_aviary': (
-        _setup_F2A_parser,
-        _exec_F2A,
+        _lazy('aviary.utils.fortran_to_aviary', '_setup_F2A_parser'),
+        _lazy('aviary.utils.fortran_to_aviary', '_exec_F2A'),
         'Convert legacy Fortran (FLOPS or GASP) input file to Aviary input file.',
     ),
     'propeller_table': (
-        _setup_PMC_parser,
-        _exec_PMC,
+        _lazy('aviary.utils.propeller_map_conversion', '_setup_PMC_parser'),
+        _lazy('aviary.utils.propeller_map_conversion', '_exec_PMC'),
         'Convert GASP-formatted propeller map file into Aviary csv format.',
     ),
 }
 
 
+# Check subcommands map (for 'aviary check' sub-sub-commands)
+_check_command_map = {
+    'sparsity': (
+        _lazy('aviary.interface.sparsity_check', '_setup_sparsity_check_parser'),
+        _lazy('aviary.interface.sparsity_check', '_exec_sparsity_check'),
+        'Rank the components of a model by their declared partial derivatives that are zero.',
+    ),
+}
+
+
+def _setup_check_parser(parser):
+    """Set up parser for the 'check' subcommand, which runs the installation test by default."""
+    _lazy('aviary.interface.installation_test', '_setup_installation_test')(parser)
+
+    subparsers = parser.add_subparsers(
+        title='Check Types', metavar='', dest='check_type', help='Type of check to run'
+    )
+
+    _add_command_parsers(subparsers, _check_command_map, _args_after_command(sys.argv[1:]))
+
+
+def _exec_check(options, user_args):
+    """Run the installation test, unless a sub-sub-command was selected."""
+    _lazy('aviary.interface.installation_test', '_exec_installation_test')(options, user_args)
+
+
 def _setup_convert_parser(parser):
     """Set up parser for the 'convert' subcommand with sub-sub-commands."""
     subparsers = parser.add_subparsers(
         title='Conversion Types', metavar='', dest='convert_type', help='Type of data to convert'
     )
 
-    for name, (parser_setup_func, executor, help_str) in sorted(_convert_command_map.items()):
-        subparser = subparsers.add_parser(name, help=help_str)
-        parser_setup_func(subparser)
-        subparser.set_defaults(executor=executor)
+    _add_command_parsers(subparsers, _convert_command_map, _args_after_command(sys.argv[1:]))
 
 
 def _exec_convert(options, user_args):
@@ -95,9 +177,9 @@ def _exec_convert(options, user_args):
 
 _command_map = {
     'check': (
-        _setup_installation_test,
-        _exec_installation_test,
-        'Verify Aviary installation',
+        _setup_check_parser,
+        _exec_check,
+        'Verify Aviary installation, or check a model (sparsity).',
     ),
     'convert': (
         _setup_convert_parser,
@@ -105,28 +187,28 @@ _command_map = {
         'Convert legacy formatted data files (aero_table, engine_deck, fortran_to_aviary, propeller_table) to Aviary format.',
     ),
     'run_mission': (
-        _setup_run_aviary_parser,
-        _exec_run_aviary,
+        _lazy('aviary.interface.run_aviary', '_setup_run_aviary_parser'),
+        _lazy('aviary.interface.run_aviary', '_exec_run_aviary'),
         'Run Aviary using a provided input deck.',
     ),
     'draw_mission': (
-        _setup_flight_profile_parser,
-        _exec_flight_profile,
+        _lazy('aviary.interface.graphical_input', '_setup_flight_profile_parser'),
+        _lazy('aviary.interface.graphical_input', '_exec_flight_profile'),
         'Open the mission profile drawing GUI.',
     ),
     'dashboard': (
-        _dashboard_setup_parser,
-        _dashboard_cmd,
+        _lazy('aviary.visualization.dashboard_cmd', '_dashboard_setup_parser'),
+        _lazy('aviary.visualization.dashboard_cmd', '_dashboard_cmd'),
         'Open the results dashboard for a provided Aviary run.',
     ),
     'plot_drag_polar': (
-        _setup_plot_drag_polar_parser,
-        _exec_plot_drag_polar,
+        _lazy('aviary.interface.plot_drag_polar', '_setup_plot_drag_polar_parser'),
+        _lazy('aviary.interface.plot_drag_polar', '_exec_plot_drag_polar'),
         'Plot a Drag Polar Graph using a provided polar data csv input.',
     ),
     'rtplot': (
-        _rtplot_setup_parser,
-        _rtplot_cmd,
+        _lazy('aviary.visualization.realtime_plot', '_rtplot_setup_parser'),
+        _lazy('aviary.visualization.realtime_plot', '_rtplot_cmd'),
         'Run a script and show a real-time plot of the optimization progress.',
     ),
 }
@@ -157,10 +239,7 @@ def aviary_cmd():
     parser.add_argument('--version', action='store_true', help='show version and exit')
 
     subs = parser.add_subparsers(title='Tools', metavar='', dest='subparser_name')
-    for p, (parser_setup_func, executor, help_str) in sorted(_command_map.items()):
-        subp = subs.add_parser(p, help=help_str)
-        parser_setup_func(subp)
-        subp.set_defaults(executor=executor)
+    _add_command_parsers(subs, _command_map, sys.argv[1:])
 
     args = [a for a in sys.argv[1:] if not a.startswith('-')]
     # '--version', '--dependency_versions')]
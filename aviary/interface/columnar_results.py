@@ -0,0 +1,552 @@
+"""
+Columnar (Parquet/Feather) export of Aviary results.
+
+The mission timeseries of every mission in a problem are collected from a single ``list_outputs``
+call and assembled into one table, with unit conversion done on whole arrays. Aviary inputs are
+stored as a typed table (one row per variable) that can be turned back into AviaryValues without
+re-parsing any strings.
+
+Writing and reading Parquet or Feather files requires the optional ``pyarrow`` package.
+"""
+
+import importlib
+import json
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openmdao.utils.units import unit_conversion
+
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.enums import ProblemType
+from aviary.variable_info.variables import Aircraft, Mission
+
+_file_formats = ('parquet', 'feather')
+
+_UNITS_METADATA_KEY = b'aviary_units'
+
+_aviary_values_columns = ('name', 'units', 'kind', 'dtype', 'enum_type', 'shape', 'numeric', 'text')
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            'pyarrow package not found. It is required for Parquet and Feather files. You can '
+            "install it by running 'pip install pyarrow'."
+        )
+    return pyarrow
+
+
+def _split_timeseries_name(prom_name, default_mission):
+    """
+    Split the promoted name of a timeseries output into (mission, phase, variable).
+
+    Returns None if the name does not belong to a trajectory timeseries.
+    """
+    parts = prom_name.split('.')
+    for idx in range(len(parts) - 3):
+        if parts[idx] == 'traj' and parts[idx + 2] == 'timeseries':
+            mission = '.'.join(parts[:idx]) or default_mission
+            return mission, parts[idx + 1], '.'.join(parts[idx + 3 :])
+    return None
+
+
+def _list_timeseries_outputs(prob):
+    """
+    Return the timeseries outputs of the whole model from a single ``list_outputs`` call.
+
+    This is a collective call under MPI; values are only gathered on rank 0.
+    """
+    return prob.model.list_outputs(
+        includes='*timeseries*',
+        out_stream=None,
+        return_format='dict',
+        units=True,
+        prom_name=True,
+    )
+
+
+def get_timeseries_table(prob):
+    """
+    Collect the timeseries of all missions in a problem into a single table.
+
+    Each row is one node of one phase. The ``mission``, ``phase`` and ``node`` columns identify the
+    row, and every timeseries variable gets its own column. Variables with more than one value per
+    node are split into one column per entry, named ``'<variable>[<index>]'``. Each variable uses
+    the units of the first phase in which it appears; phases that do not have a variable are
+    filled with NaN.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The problem containing the timeseries results.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The timeseries table.
+    dict
+        Units of each variable column.
+    """
+    return _build_timeseries_table(_list_timeseries_outputs(prob), prob._name)
+
+
+def _build_timeseries_table(timeseries_outputs, default_mission):
+    """Assemble the output of ``_list_timeseries_outputs`` into a timeseries table."""
+    # Group the outputs by (mission, phase), keeping the model's execution order.
+    blocks = {}
+    for meta in timeseries_outputs.values():
+        split_name = _split_timeseries_name(meta['prom_name'], default_mission)
+        if split_name is None:
+            continue
+        mission, phase, var_name = split_name
+        if var_name.endswith('_phase'):
+            continue
+        blocks.setdefault((mission, phase), {})[var_name] = (
+            np.asarray(meta['val']),
+            meta['units'],
+        )
+
+    block_keys = list(blocks)
+    num_nodes = []
+    for key in block_keys:
+        block = blocks[key]
+        if 'time' in block:
+            num_nodes.append(block['time'][0].shape[0])
+        else:
+            num_nodes.append(next(iter(block.values()))[0].shape[0])
+
+    offsets = np.concatenate(([0], np.cumsum(num_nodes, dtype=int)))
+    total_nodes = int(offsets[-1])
+
+    columns = {
+        'mission': pd.Categorical(np.repeat([key[0] for key in block_keys], num_nodes)),
+        'phase': pd.Categorical(np.repeat([key[1] for key in block_keys], num_nodes)),
+        'node': np.concatenate([np.arange(n) for n in num_nodes]) if num_nodes else np.array([]),
+    }
+
+    # Units are taken from the first phase that has the variable.
+    var_units = {}
+    var_width = {}
+    for key in block_keys:
+        for var_name, (val, units) in blocks[key].items():
+            if var_name not in var_units:
+                var_units[var_name] = units
+                var_width[var_name] = int(np.prod(val.shape[1:], dtype=int))
+
+    # time first, everything else sorted
+    var_names = sorted(var_units, key=lambda name: (name != 'time', name))
+
+    units_by_column = {}
+    for var_name in var_names:
+        units = var_units[var_name]
+        width = var_width[var_name]
+        data = np.full((total_nodes, width), np.nan)
+
+        for idx, key in enumerate(block_keys):
+            item = blocks[key].get(var_name)
+            if item is None:
+                continue
+            val, val_units = item
+            val = val.reshape(num_nodes[idx], -1)
+            if val.shape[1] != width:
+                continue
+
+            if val_units != units and val_units is not None and units is not None:
+                factor, offset = unit_conversion(val_units, units)
+                val = (val + offset) * factor
+
+            data[offsets[idx] : offsets[idx + 1]] = val
+
+        if width == 1:
+            columns[var_name] = data[:, 0]
+            units_by_column[var_name] = units
+        else:
+            for j in range(width):
+                column_name = f'{var_name}[{j}]'
+                columns[column_name] = data[:, j]
+                units_by_column[column_name] = units
+
+    return pd.DataFrame(columns), units_by_column
+
+
+def _split_timeseries_table(table, units):
+    """Split a timeseries table into one table per mission, keeping only that mission's columns."""
+    tables = {}
+    for mission in table['mission'].unique():
+        mission_table = table[table['mission'] == mission].drop(columns='mission')
+        mission_table = mission_table.dropna(axis=1, how='all').reset_index(drop=True)
+        mission_table['phase'] = mission_table['phase'].cat.remove_unused_categories()
+
+        mission_units = {name: units[name] for name in mission_table.columns if name in units}
+        tables[mission] = (mission_table, mission_units)
+
+    return tables
+
+
+def get_mission_timeseries_tables(prob):
+    """
+    Collect the timeseries of each mission in a problem into its own table.
+
+    All missions are read from a single ``list_outputs`` call. Each table has ``phase`` and
+    ``node`` columns followed by the timeseries variables of that mission, as described in
+    ``get_timeseries_table``.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The problem containing the timeseries results.
+
+    Returns
+    -------
+    dict
+        Tuples of (pandas.DataFrame, dict of column units), keyed by mission name.
+    """
+    return _split_timeseries_table(*get_timeseries_table(prob))
+
+
+def _get_models(prob):
+    if prob.problem_type is ProblemType.MULTI_MISSION:
+        return prob.aviary_groups_dict
+    return {prob._name: prob.model}
+
+
+def get_aviary_inputs_table(prob):
+    """
+    Collect the aviary inputs of all missions in a problem into a single typed table.
+
+    The design and mission gross masses are replaced with the values computed by the problem,
+    the same way ``AviaryProblem.save_results`` does.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The problem containing the aviary inputs.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The aviary inputs table, with a ``mission`` column identifying the source mission.
+    """
+    multi_mission = prob.problem_type is ProblemType.MULTI_MISSION
+
+    tables = []
+    for name, model in _get_models(prob).items():
+        prefix = f'{name}.' if multi_mission else ''
+
+        # shallow copy, only the gross mass entries are replaced
+        aviary_inputs = AviaryValues(model.aviary_inputs)
+        gross_mass = float(prob.get_val(f'{prefix}{Mission.GROSS_MASS}', units='lbm')[0])
+        for var_name in (Mission.GROSS_MASS, Aircraft.Design.GROSS_MASS):
+            if var_name in aviary_inputs:
+                NamedValues.set_val(aviary_inputs, var_name, gross_mass, 'lbm')
+
+        if Aircraft.Design.GROSS_MASS not in aviary_inputs:
+            design_gross_mass = prob.get_val(f'{prefix}{Aircraft.Design.GROSS_MASS}', units='lbm')
+            NamedValues.set_val(
+                aviary_inputs, Aircraft.Design.GROSS_MASS, float(design_gross_mass[0]), 'lbm'
+            )
+
+        table = aviary_values_to_table(aviary_inputs)
+        table.insert(0, 'mission', name)
+        tables.append(table)
+
+    return pd.concat(tables, ignore_index=True)
+
+
+def _encode_element(name, val):
+    """Return the (type code, enum type, numeric value, text value) of a scalar."""
+    if isinstance(val, Enum):
+        enum_cls = type(val)
+        return 'enum', f'{enum_cls.__module__}:{enum_cls.__qualname__}', None, val.name
+    if isinstance(val, (bool, np.bool_)):
+        return 'bool', None, float(val), None
+    if isinstance(val, (int, np.integer)):
+        return 'int', None, float(val), None
+    if isinstance(val, (float, np.floating)):
+        return 'float', None, float(val), None
+    if isinstance(val, str):
+        return 'str', None, None, val
+    if isinstance(val, Path):
+        return 'path', None, None, str(val)
+
+    raise TypeError(f'Cannot store {name} of type {type(val).__name__} in a columnar table.')
+
+
+def _encode_value(name, val):
+    """Return the table row entries for one value."""
+    if isinstance(val, np.ndarray) and val.dtype.kind in 'biuf':
+        return 'array', val.dtype.str, None, list(val.shape), val.ravel().astype(float), []
+
+    if isinstance(val, (list, tuple, np.ndarray)):
+        kind = 'array' if isinstance(val, np.ndarray) else type(val).__name__
+        shape = list(np.shape(val)) if kind == 'array' else [len(val)]
+        elements = np.ravel(val) if kind == 'array' else val
+
+        dtype = enum_type = None
+        numeric = []
+        text = []
+        for element in elements:
+            code, element_enum, number, string = _encode_element(name, element)
+            if dtype is None:
+                dtype, enum_type = code, element_enum
+            elif code != dtype:
+                raise TypeError(f'Cannot store {name}: it contains values of mixed types.')
+            if number is None:
+                text.append(string)
+            else:
+                numeric.append(number)
+
+        # empty sequences are stored as floats
+        return kind, dtype or 'float', enum_type, shape, np.array(numeric, dtype=float), text
+
+    dtype, enum_type, number, string = _encode_element(name, val)
+    if number is None:
+        return 'scalar', dtype, enum_type, [], np.array([]), [string]
+    return 'scalar', dtype, enum_type, [], np.array([number]), []
+
+
+def aviary_values_to_table(aviary_values):
+    """
+    Convert AviaryValues to a typed table with one row per variable.
+
+    Numbers (including booleans and integers) are stored in the float ``numeric`` column and
+    strings, paths and enum member names in the ``text`` column. The ``kind``, ``dtype``,
+    ``enum_type`` and ``shape`` columns hold what is needed to rebuild each value exactly.
+
+    Parameters
+    ----------
+    aviary_values : AviaryValues or NamedValues
+        The values to convert.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The typed table.
+    """
+    rows = {column: [] for column in _aviary_values_columns}
+
+    for name, (val, units) in aviary_values:
+        kind, dtype, enum_type, shape, numeric, text = _encode_value(name, val)
+        rows['name'].append(name)
+        rows['units'].append(units)
+        rows['kind'].append(kind)
+        rows['dtype'].append(dtype)
+        rows['enum_type'].append(enum_type)
+        rows['shape'].append(shape)
+        rows['numeric'].append(numeric)
+        rows['text'].append(list(text))
+
+    return pd.DataFrame(rows)
+
+
+@lru_cache(maxsize=None)
+def _get_enum_class(enum_type):
+    module_name, qualname = enum_type.split(':')
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _decode_elements(dtype, enum_type, numeric, text):
+    if dtype == 'bool':
+        return [bool(val) for val in numeric]
+    if dtype == 'int':
+        return [int(val) for val in numeric]
+    if dtype == 'float':
+        return [float(val) for val in numeric]
+    if dtype == 'str':
+        return [str(val) for val in text]
+    if dtype == 'path':
+        return [Path(val) for val in text]
+    if dtype == 'enum':
+        enum_cls = _get_enum_class(enum_type)
+        return [enum_cls[val] for val in text]
+
+    raise ValueError(f'Unknown value type "{dtype}" in columnar table.')
+
+
+def aviary_values_from_table(table, aviary_values=None):
+    """
+    Rebuild AviaryValues from a table created by ``aviary_values_to_table``.
+
+    The values are already typed, so they are stored directly without the type casting and unit
+    checks done by ``AviaryValues.set_val``.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        The typed table.
+    aviary_values : AviaryValues, optional
+        Collection to fill. If None, a new AviaryValues is created.
+
+    Returns
+    -------
+    AviaryValues
+        The rebuilt values.
+    """
+    if aviary_values is None:
+        aviary_values = AviaryValues()
+
+    columns = [table[column].to_numpy() for column in _aviary_values_columns]
+
+    for name, units, kind, dtype, enum_type, shape, numeric, text in zip(*columns):
+        if kind == 'array' and dtype not in ('bool', 'int', 'float', 'str', 'path', 'enum'):
+            # numeric numpy array, restore its original dtype and shape
+            val = np.asarray(numeric, dtype=float).astype(np.dtype(dtype))
+            val = val.reshape([int(dim) for dim in shape])
+        else:
+            elements = _decode_elements(dtype, enum_type, numeric, text)
+            if kind == 'scalar':
+                val = elements[0]
+            elif kind == 'tuple':
+                val = tuple(elements)
+            elif kind == 'list':
+                val = elements
+            else:
+                val = np.array(elements, dtype=object).reshape([int(dim) for dim in shape])
+
+        NamedValues.set_val(aviary_values, name, val, units)
+
+    return aviary_values
+
+
+def _write_table(df, filepath, file_format, units=None):
+    pyarrow = _import_pyarrow()
+
+    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+    if units is not None:
+        metadata = dict(table.schema.metadata or {})
+        metadata[_UNITS_METADATA_KEY] = json.dumps(units).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, filepath)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(table, filepath)
+
+
+def _read_table(filepath):
+    _import_pyarrow()
+
+    filepath = Path(filepath)
+    if filepath.suffix == '.feather':
+        import pyarrow.feather as feather
+
+        table = feather.read_table(filepath)
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filepath)
+
+    metadata = table.schema.metadata or {}
+    units = metadata.get(_UNITS_METADATA_KEY)
+    if units is not None:
+        units = json.loads(units)
+
+    return table.to_pandas(), units
+
+
+def export_columnar_results(prob, out_dir=None, file_format='parquet'):
+    """
+    Write the timeseries and aviary inputs of every mission in a problem to columnar files.
+
+    Two files are written: ``mission_timeseries_data.<ext>`` and ``aviary_inputs.<ext>``. The
+    units of the timeseries columns are stored in the file metadata.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The problem containing the results.
+    out_dir : str or Path, optional
+        Directory where the files are written. Defaults to the problem's reports directory.
+    file_format : str, optional
+        Either ``'parquet'`` or ``'feather'``. Defaults to ``'parquet'``.
+
+    Returns
+    -------
+    tuple of Path
+        Paths of the timeseries file and the aviary inputs file.
+    """
+    if file_format not in _file_formats:
+        raise ValueError(
+            f'Invalid file format "{file_format}". Must be one of {", ".join(_file_formats)}.'
+        )
+    _import_pyarrow()
+
+    if out_dir is None:
+        out_dir = prob.get_reports_dir(force=True)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    timeseries, units = get_timeseries_table(prob)
+    aviary_inputs = get_aviary_inputs_table(prob)
+
+    timeseries_file = out_dir / f'mission_timeseries_data.{file_format}'
+    inputs_file = out_dir / f'aviary_inputs.{file_format}'
+
+    _write_table(timeseries, timeseries_file, file_format, units=units)
+    _write_table(aviary_inputs, inputs_file, file_format)
+
+    return timeseries_file, inputs_file
+
+
+def read_columnar_timeseries(filepath):
+    """
+    Read a timeseries table written by ``export_columnar_results``.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the Parquet or Feather file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The timeseries table.
+    dict
+        Units of each variable column.
+    """
+    df, units = _read_table(filepath)
+    return df, units or {}
+
+
+def read_columnar_aviary_inputs(filepath, mission=None):
+    """
+    Read aviary inputs written by ``export_columnar_results``.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the Parquet or Feather file.
+    mission : str, optional
+        Name of the mission to read. If None, all missions are read.
+
+    Returns
+    -------
+    AviaryValues or dict
+        The AviaryValues of the requested mission, or a dictionary of AviaryValues keyed by
+        mission name if ``mission`` is None.
+    """
+    df, _ = _read_table(filepath)
+
+    if mission is not None:
+        selected = df[df['mission'] == mission]
+        if selected.empty:
+            raise KeyError(f'Mission "{mission}" not found in {filepath}.')
+        return aviary_values_from_table(selected)
+
+    return {
+        name: aviary_values_from_table(group)
+        for name, group in df.groupby('mission', sort=False, observed=True)
+    }
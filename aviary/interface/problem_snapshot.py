@@ -0,0 +1,112 @@
+"""
+Versioned binary snapshots of sized Aviary problems.
+
+A snapshot holds the fully preprocessed state of an AviaryGroup (aviary_inputs, phase info, engine
+models and initial guesses) together with the final values of the design variables. Reloading a
+snapshot skips reading, type-casting and preprocessing the inputs, so a sized aircraft can be
+brought back for off-design analysis much faster than from a sizing results JSON file.
+
+The file starts with a short header (a magic string and the format version) followed by a pickled
+payload. Snapshots are meant to be read back by the same (or a compatible) version of Aviary, and
+like any pickle they should only be loaded from trusted sources.
+"""
+
+import pickle
+import struct
+import warnings
+from pathlib import Path
+
+import aviary
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MAGIC = b'AVIARYSNAP'
+_VERSION_FORMAT = '<I'
+_HEADER_SIZE = len(_MAGIC) + struct.calcsize(_VERSION_FORMAT)
+
+
+def is_problem_snapshot(filepath):
+    """
+    Return whether a file is an Aviary problem snapshot.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the file to check.
+
+    Returns
+    -------
+    bool
+        True if the file starts with the snapshot header.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def write_problem_snapshot(filepath, snapshot):
+    """
+    Write a problem snapshot to a file.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path of the snapshot file.
+    snapshot : dict
+        Snapshot data, as assembled by ``AviaryProblem.save_snapshot``.
+    """
+    payload = dict(snapshot)
+    payload['aviary_version'] = aviary.__version__
+
+    try:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as err:
+        raise TypeError(
+            f'Could not create a problem snapshot: {err}. All engine models, external subsystems '
+            'and phase_info entries must be picklable.'
+        ) from err
+
+    filepath = Path(filepath)
+    with open(filepath, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(struct.pack(_VERSION_FORMAT, SNAPSHOT_FORMAT_VERSION))
+        f.write(data)
+
+
+def read_problem_snapshot(filepath):
+    """
+    Read a problem snapshot from a file.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path of the snapshot file.
+
+    Returns
+    -------
+    dict
+        Snapshot data.
+    """
+    with open(filepath, 'rb') as f:
+        header = f.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE or not header.startswith(_MAGIC):
+            raise ValueError(f'"{filepath}" is not an Aviary problem snapshot.')
+
+        (version,) = struct.unpack(_VERSION_FORMAT, header[len(_MAGIC) :])
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f'Problem snapshot "{filepath}" uses format version {version}, but this version of '
+                f'Aviary only reads version {SNAPSHOT_FORMAT_VERSION}.'
+            )
+
+        snapshot = pickle.load(f)
+
+    if snapshot['aviary_version'] != aviary.__version__:
+        warnings.warn(
+            f'Problem snapshot "{filepath}" was created with Aviary '
+            f'{snapshot["aviary_version"]}, but Aviary {aviary.__version__} is installed.'
+        )
+
+    return snapshot
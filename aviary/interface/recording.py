@@ -0,0 +1,557 @@
+"""
+Case recording utilities for long-running Aviary optimizations.
+
+StreamingRecorder is a drop-in replacement for OpenMDAO's SqliteRecorder on the driver. It records
+the driver-level values (design variables, objectives and constraints) every iteration in the
+standard OpenMDAO format, so the file can still be opened with ``om.CaseReader`` by the dashboard
+and the real-time plotter. Timeseries outputs are removed from the per-iteration record and are
+instead stored every N iterations, and at the final iteration, as zlib-compressed arrays in a
+companion snapshot database.
+
+CheckpointRecorder periodically writes the design variables and the state of the model to a compact
+file, so that an optimization that was interrupted can be resumed with ``restore_checkpoint``.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import warnings
+import zlib
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+
+_SNAPSHOT_SUFFIX = '_timeseries'
+
+
+def get_snapshot_filepath(filepath):
+    """
+    Return the path of the timeseries snapshot database that accompanies a recorder file.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path of the driver case recorder file.
+
+    Returns
+    -------
+    Path
+        Path of the companion snapshot database.
+    """
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.stem + _SNAPSHOT_SUFFIX + filepath.suffix)
+
+
+class _SnapshotWriter:
+    """
+    Write compressed timeseries snapshots to a SQLite database.
+
+    When ``asynchronous`` is True, compression and database writes happen on a background thread
+    that owns its own connection. The queue between the recorder and the thread is bounded, so a
+    writer that falls behind applies back-pressure to the optimizer instead of growing memory.
+    Unless ``overwrite`` is True, snapshots are added to those already in the database.
+    """
+
+    def __init__(
+        self, filepath, compression_level=6, asynchronous=False, max_pending=4, overwrite=True
+    ):
+        self.filepath = Path(filepath)
+        self.compression_level = compression_level
+        self.asynchronous = asynchronous
+
+        if overwrite and self.filepath.exists():
+            self.filepath.unlink()
+
+        self._connection = None
+        self._queue = None
+        self._thread = None
+        self._error = None
+
+        if asynchronous:
+            self._queue = queue.Queue(maxsize=max_pending)
+            self._thread = threading.Thread(
+                target=self._run, name='aviary-snapshot-writer', daemon=True
+            )
+            self._thread.start()
+        else:
+            self._connection = self._connect()
+
+    def _connect(self):
+        connection = sqlite3.connect(str(self.filepath))
+        with connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots('
+                'counter INTEGER, iteration_coordinate TEXT, is_final INTEGER, '
+                'name TEXT, dtype TEXT, shape TEXT, data BLOB)'
+            )
+        return connection
+
+    def _run(self):
+        connection = self._connect()
+        try:
+            while True:
+                task = self._queue.get()
+                try:
+                    if task is None:
+                        break
+                    self._execute(connection, *task)
+                except Exception as err:
+                    # Keep draining the queue so the optimizer never blocks on a dead writer.
+                    self._error = err
+                finally:
+                    self._queue.task_done()
+        finally:
+            connection.close()
+
+    def _execute(self, connection, action, counter, coord=None, arrays=None, is_final=False):
+        with connection:
+            if is_final or action == 'mark_final':
+                # Only the last iteration of the most recent run is final.
+                connection.execute('UPDATE snapshots SET is_final=0 WHERE is_final=1')
+
+            if action == 'write':
+                rows = [
+                    (
+                        counter,
+                        coord,
+                        int(is_final),
+                        name,
+                        val.dtype.str,
+                        json.dumps(val.shape),
+                        zlib.compress(val.tobytes(), self.compression_level),
+                    )
+                    for name, val in arrays.items()
+                ]
+                connection.executemany(
+                    'INSERT INTO snapshots VALUES(?,?,?,?,?,?,?)',
+                    rows,
+                )
+            else:  # 'mark_final'
+                connection.execute('UPDATE snapshots SET is_final=1 WHERE counter=?', (counter,))
+
+    def _submit(self, *task):
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise RuntimeError(f'Timeseries snapshot writer failed: {err}') from err
+
+        if self.asynchronous:
+            self._queue.put(task)
+        else:
+            self._execute(self._connection, *task)
+
+    def write(self, counter, coord, arrays, is_final=False):
+        """Store one snapshot of the given {name: array} dictionary."""
+        self._submit('write', counter, coord, arrays, is_final)
+
+    def mark_final(self, counter):
+        """Flag an already written snapshot as the final iteration."""
+        self._submit('mark_final', counter)
+
+    def close(self):
+        """Flush all pending snapshots and release the database."""
+        if self.asynchronous:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+        elif self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise RuntimeError(f'Timeseries snapshot writer failed: {err}') from err
+
+
+class StreamingRecorder(om.SqliteRecorder):
+    """
+    Driver case recorder with bounded storage for long optimizations.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the recorder file. Timeseries snapshots are written next to it in a file with the
+        same name and a ``_timeseries`` suffix.
+    timeseries_interval : int, optional
+        Full timeseries are stored every ``timeseries_interval`` driver iterations, as well as for
+        the first and final iterations. Defaults to 10.
+    timeseries_includes : list of str, optional
+        Glob patterns identifying the variables that are treated as timeseries. Defaults to
+        ``['*timeseries*']``.
+    compression_level : int, optional
+        zlib compression level (0-9) used for the timeseries arrays. Defaults to 6.
+    async_writer : bool, optional
+        If True, compressing and writing the timeseries snapshots happens on a background thread,
+        so the optimizer only pays for copying the arrays. Defaults to False.
+    **kwargs : dict
+        Additional keyword arguments passed to ``om.SqliteRecorder``.
+    """
+
+    def __init__(
+        self,
+        filepath,
+        timeseries_interval=10,
+        timeseries_includes=None,
+        compression_level=6,
+        async_writer=False,
+        **kwargs,
+    ):
+        if timeseries_interval < 1:
+            raise ValueError('timeseries_interval must be a positive integer.')
+
+        super().__init__(str(filepath), **kwargs)
+
+        self.timeseries_interval = timeseries_interval
+        if timeseries_includes is None:
+            timeseries_includes = ['*timeseries*']
+        self.timeseries_includes = timeseries_includes
+        self.compression_level = compression_level
+        self.async_writer = async_writer
+        self.snapshot_filepath = get_snapshot_filepath(filepath)
+
+        self._snapshot_writer = None
+        self._snapshots_started = False
+        self._num_driver_records = 0
+        self._last_written_counter = None
+        # Most recent timeseries that have not been written yet, so the final iteration can always
+        # be stored. Only one snapshot is held at a time.
+        self._pending_snapshot = None
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare the recorder and the snapshot database for recording.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or None
+            The MPI communicator for the recorder.
+        """
+        super().startup(recording_requester, comm)
+
+        # Only the process that owns the case database writes snapshots.
+        if self.connection is not None and self._snapshot_writer is None:
+            self._open_snapshot_writer()
+
+    def _open_snapshot_writer(self):
+        # Snapshots of later runs are added to those of the first one, like the driver cases.
+        self._snapshot_writer = _SnapshotWriter(
+            self.snapshot_filepath,
+            compression_level=self.compression_level,
+            asynchronous=self.async_writer,
+            overwrite=not self._snapshots_started,
+        )
+        self._snapshots_started = True
+
+        # Each run stores its own first iteration.
+        self._num_driver_records = 0
+        self._last_written_counter = None
+        self._pending_snapshot = None
+
+    def _is_timeseries(self, name):
+        return any(fnmatchcase(name, pattern) for pattern in self.timeseries_includes)
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Record driver-level values and, every few iterations, the full timeseries.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and system vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection is None:
+            return
+
+        # The data is shared with the other recorders of the driver, so it is filtered into a
+        # copy instead of being modified.
+        data = dict(data)
+        timeseries = {}
+        for io in ('output', 'input'):
+            values = data.get(io)
+            if not values:
+                continue
+            kept = {}
+            for name, val in values.items():
+                if not self._is_timeseries(name):
+                    kept[name] = val
+                elif io == 'output' or name not in timeseries:
+                    # Copy, since the driver may hand us views into the model vectors.
+                    timeseries[name] = np.array(val, copy=True)
+            data[io] = kept
+
+        super().record_iteration_driver(driver, data, metadata)
+
+        if not timeseries:
+            return
+
+        if self._snapshot_writer is None:
+            # The snapshots were finalized, and the driver is being run again.
+            self._open_snapshot_writer()
+
+        num_records = self._num_driver_records
+        self._num_driver_records += 1
+
+        if num_records % self.timeseries_interval == 0:
+            self._snapshot_writer.write(self._counter, self._iteration_coordinate, timeseries)
+            self._last_written_counter = self._counter
+            self._pending_snapshot = None
+        else:
+            self._pending_snapshot = (self._counter, self._iteration_coordinate, timeseries)
+
+    def finalize_snapshots(self):
+        """
+        Store the timeseries of the final recorded iteration and flush the snapshot writer.
+
+        This is called automatically on shutdown, but can be called directly once the driver has
+        finished so that the snapshots are complete before results are post-processed.
+        """
+        writer = self._snapshot_writer
+        if writer is None:
+            return
+
+        if self._pending_snapshot is not None:
+            counter, coord, timeseries = self._pending_snapshot
+            writer.write(counter, coord, timeseries, is_final=True)
+            self._pending_snapshot = None
+        elif self._last_written_counter is not None:
+            writer.mark_final(self._last_written_counter)
+
+        self._snapshot_writer = None
+        writer.close()
+
+    def shutdown(self):
+        """Flush the timeseries snapshots and shut down the recorder."""
+        self.finalize_snapshots()
+        super().shutdown()
+
+
+def read_timeseries_snapshots(filepath, final_only=False):
+    """
+    Read the timeseries snapshots written by a StreamingRecorder.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the driver recorder file, or directly to its ``_timeseries`` snapshot database.
+    final_only : bool, optional
+        If True, only the snapshot of the final iteration is returned. Defaults to False.
+
+    Returns
+    -------
+    dict
+        Dictionary keyed by recorder counter (in increasing order). Each entry is a dictionary
+        with the keys ``'iteration_coordinate'``, ``'is_final'`` and ``'values'``, where
+        ``'values'`` maps variable names to their arrays.
+    """
+    filepath = Path(filepath)
+    if not filepath.stem.endswith(_SNAPSHOT_SUFFIX):
+        filepath = get_snapshot_filepath(filepath)
+
+    if not filepath.is_file():
+        raise FileNotFoundError(f'Timeseries snapshot file "{filepath}" not found.')
+
+    query = (
+        'SELECT counter, iteration_coordinate, is_final, name, dtype, shape, data FROM snapshots'
+    )
+    if final_only:
+        query += ' WHERE is_final=1'
+    query += ' ORDER BY counter'
+
+    snapshots = {}
+    connection = sqlite3.connect(str(filepath))
+    try:
+        for counter, coord, is_final, name, dtype, shape, blob in connection.execute(query):
+            snapshot = snapshots.setdefault(
+                counter, {'iteration_coordinate': coord, 'is_final': bool(is_final), 'values': {}}
+            )
+            val = np.frombuffer(bytearray(zlib.decompress(blob)), dtype=np.dtype(dtype))
+            snapshot['values'][name] = val.reshape(json.loads(shape))
+    finally:
+        connection.close()
+
+    return snapshots
+
+
+class CheckpointRecorder(om.CaseRecorder):
+    """
+    Driver case recorder that periodically saves a checkpoint of the optimization.
+
+    Every ``interval`` driver iterations, the design variables and all outputs of the model are
+    written to a compressed NumPy file. The file is replaced atomically, so it always holds a
+    complete checkpoint even if the process is killed while writing. Checkpoints are only written
+    for serial runs.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the checkpoint file.
+    interval : int, optional
+        Number of driver iterations between checkpoints. Defaults to 10.
+    """
+
+    def __init__(self, filepath, interval=10):
+        if interval < 1:
+            raise ValueError('interval must be a positive integer.')
+
+        super().__init__(record_viewer_data=False)
+
+        self.filepath = Path(filepath)
+        self.interval = interval
+
+        self._enabled = True
+        self._iteration = 0
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare the recorder for recording.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or None
+            The MPI communicator for the recorder.
+        """
+        super().startup(recording_requester, comm)
+
+        if comm is not None and comm.size > 1:
+            warnings.warn('Optimization checkpoints are only written for serial runs.')
+            self._enabled = False
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Save a checkpoint every ``interval`` driver iterations.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and system vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._iteration += 1
+
+        if self._enabled and self._iteration % self.interval == 0:
+            self.save(driver)
+
+    def save(self, driver):
+        """
+        Write a checkpoint of the current state of the driver and its model.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver whose design variables and model are saved.
+        """
+        model = driver._problem().model
+        design_vars = driver.get_design_var_values()
+
+        arrays = {
+            'iteration': np.array(self._iteration),
+            'design_var_names': np.array(list(design_vars), dtype=str),
+            'outputs': model._outputs.asarray().copy(),
+        }
+        for i, val in enumerate(design_vars.values()):
+            arrays[f'design_var_{i}'] = np.atleast_1d(val)
+
+        tmp_filepath = self.filepath.with_name(self.filepath.name + '.tmp')
+        with open(tmp_filepath, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_filepath, self.filepath)
+
+    def record_metadata_system(self, system, run_number=None):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_iteration_system(self, system, data, metadata):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        """Do nothing; checkpoints only follow driver iterations."""
+        pass
+
+
+def read_checkpoint(filepath):
+    """
+    Read a checkpoint written by a CheckpointRecorder.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the checkpoint file.
+
+    Returns
+    -------
+    dict
+        Dictionary with the keys ``'iteration'`` (driver iteration at which the checkpoint was
+        written), ``'design_vars'`` (design variable values in driver scaling, keyed by name) and
+        ``'outputs'`` (array of all model outputs).
+    """
+    with np.load(filepath) as data:
+        names = data['design_var_names']
+        return {
+            'iteration': int(data['iteration']),
+            'design_vars': {str(name): data[f'design_var_{i}'] for i, name in enumerate(names)},
+            'outputs': data['outputs'],
+        }
+
+
+def restore_checkpoint(prob, filepath):
+    """
+    Load a checkpoint written by a CheckpointRecorder into a problem.
+
+    The problem must be set up the same way as the one that wrote the checkpoint, and its final
+    setup must be done. The outputs of the model, which include the solver states, are only
+    restored when the model has the same size; the design variables are always restored.
+
+    Parameters
+    ----------
+    prob : Problem
+        Problem that receives the checkpoint.
+    filepath : str or Path
+        Path to the checkpoint file.
+
+    Returns
+    -------
+    int
+        Driver iteration at which the checkpoint was written.
+    """
+    checkpoint = read_checkpoint(filepath)
+
+    outputs = prob.model._outputs
+    if prob.model.comm.size == 1 and checkpoint['outputs'].size == outputs.asarray().size:
+        outputs.set_val(checkpoint['outputs'])
+
+    for name, val in checkpoint['design_vars'].items():
+        prob.driver.set_design_var(name, val)
+
+    return checkpoint['iteration']
@@ -1,18 +1,11 @@
-import datetime
-import json
-import sys
-import time
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 from openmdao.utils.mpi import MPI
 from openmdao.utils.reports_system import register_report
 
 from aviary.core.aviary_problem import AviaryProblem
-from aviary.interface.utils import write_markdown_variable_table
-from aviary.utils.named_values import NamedValues
-from aviary.utils.utils import wrapped_convert_units
+from aviary.interface.results_snapshot import snapshot_reports, take_results_snapshot
 from aviary.variable_info.enums import ProblemType
 
 
@@ -105,45 +98,60 @@ def register_custom_reports():
     )
 
 
-def run_status(prob: AviaryProblem):
+def _get_results_snapshot(prob):
     """
-    Creates a JSON file that contains high level overview of the run.
+    Return a snapshot of the results of the last run, taking it on the first call after each run.
 
-    Parameters
-    ----------
-    prob : AviaryProblem
-        The AviaryProblem used to generate this report
+    The snapshot is shared by all snapshot reports, so the results are only read once per run.
+    """
+    key = (prob.model.iter_count, prob.driver.iter_count)
+    cached = getattr(prob, '_results_snapshot', None)
+    if cached is None or cached[0] != key:
+        prob._results_snapshot = (key, take_results_snapshot(prob))
+
+    return prob._results_snapshot[1]
+
+
+def _write_snapshot_report(prob, report):
+    """
+    Write one of the reports that only read a results snapshot.
+
+    Depending on the report mode requested in ``run_aviary_problem``, the report is written right
+    away, submitted to the problem's background report pool, or skipped so it can be generated
+    later from the recorder file.
     """
+    report_mode = getattr(prob, '_report_mode', 'serial')
+    if report_mode == 'deferred':
+        return
+
+    snapshot = _get_results_snapshot(prob)
+
+    # There are no more collective calls, so we can exit.
     if MPI and prob.comm.rank != 0:
         return
 
     reports_folder = Path(prob.get_reports_dir())
-    report_file = reports_folder / 'status.json'
+    writer = snapshot_reports[report]
 
-    runtime = prob.driver.result.runtime
-    runtime_ms = (runtime * 1000.0) % 1000.0
-    runtime_formatted = (
-        f'{time.strftime("%H hours %M minutes %S seconds", time.gmtime(runtime))} '
-        f'{runtime_ms:.1f} milliseconds'
-    )
+    if report_mode == 'background':
+        prob._report_futures[report] = prob._report_executor.submit(
+            writer, snapshot, reports_folder
+        )
+        return
+
+    return writer(snapshot, reports_folder)
 
-    t = datetime.datetime.now()
-    time_stamp = t.strftime('%Y-%m-%d %H:%M:%S %Z')
 
-    status = {}
-    status['Problem'] = prob._name
-    status['Script'] = sys.argv[0]
-    status['Optimizer'] = prob.driver._get_name()
-    status['Number of driver iterations'] = prob.driver.result.iter_count
-    status['Number of model evals'] = prob.driver.result.model_evals
-    status['Number of deriv evals'] = prob.driver.result.deriv_evals
-    status['Wall clock run time'] = runtime_formatted
-    status['Exit status'] = prob.driver.result.exit_status
-    status['Report generation date and time'] = time_stamp
+def run_status(prob: AviaryProblem):
+    """
+    Creates a JSON file that contains high level overview of the run.
 
-    with open(report_file, 'w') as f:
-        json.dump(status, f, indent=1, ensure_ascii=False)
-        print(file=f)  # avoid 'no newline at end of file' message
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem used to generate this report
+    """
+    _write_snapshot_report(prob, 'run_status')
 
 
 def sizing_results(prob: AviaryProblem):
@@ -203,160 +211,7 @@ def mission_report(prob: AviaryProblem, **kwargs):
     prob : AviaryProblem
         The AviaryProblem used to generate this report
     """
-
-    def _get_phase_value(model, traj, phase, var_name, units, indices=None):
-        try:
-            vals = model.get_val(
-                f'{traj}.{phase}.timeseries.{var_name}',
-                units=units,
-                indices=indices,
-                get_remote=True,
-            )
-        except KeyError:
-            try:
-                vals = model.get_val(
-                    f'{traj}.{phase}.{var_name}',
-                    units=units,
-                    indices=indices,
-                    get_remote=True,
-                )
-            # 2DOF breguet range cruise uses time integration to track mass
-            except TypeError:
-                vals = model.get_val(
-                    f'{traj}.{phase}.timeseries.time',
-                    units=units,
-                    indices=indices,
-                    get_remote=True,
-                )
-            except KeyError:
-                vals = None
-
-        return vals
-
-    def _get_phase_diff(model, traj, phase, var_name, units, indices=[0, -1]):
-        vals = _get_phase_value(model, traj, phase, var_name, units, indices)
-
-        if vals is not None:
-            diff = vals[-1] - vals[0]
-            if isinstance(diff, np.ndarray):
-                diff = diff[0]
-            return diff
-        else:
-            return None
-
-    reports_folder = Path(prob.get_reports_dir())
-    report_file = reports_folder / 'mission_summary.md'
-
-    multi_mission = prob.problem_type == ProblemType.MULTI_MISSION
-    if multi_mission:
-        models = prob.aviary_groups_dict
-    else:
-        models = {prob._name: prob.model}
-
-    all_data = {}
-    all_totals = {}
-    for name, model in models.items():
-        # read per-phase data from trajectory
-        data = {}
-        for idx, phase in enumerate(model.mission_info):  # See issue #1186. redo for multimissions
-            # TODO for traj in trajectories, currently assuming single one named "traj"
-            # TODO delta mass and fuel consumption need to be tracked separately
-            fuel_burn = _get_phase_diff(model, 'traj', phase, 'mass', 'lbm', [-1, 0])
-            time = _get_phase_diff(model, 'traj', phase, 'time', 'min')
-            range = _get_phase_diff(model, 'traj', phase, 'distance', 'nmi')
-
-            # get initial values, first in traj
-            if idx == 0:
-                initial_time = _get_phase_value(model, 'traj', phase, 'time', 'min', 0)
-                initial_range = _get_phase_value(model, 'traj', phase, 'distance', 'nmi', 0)[0]
-
-            outputs = NamedValues()
-            # Fuel burn is negative of delta mass
-            outputs.set_val('Fuel Burn', fuel_burn, 'lbm')
-            outputs.set_val('Elapsed Time', time, 'min')
-            outputs.set_val('Ground Distance', range, 'nmi')
-            data[phase] = outputs
-
-            # get final values, last in traj
-            final_time = _get_phase_value(model, 'traj', phase, 'time', 'min', -1)
-            final_range = _get_phase_value(model, 'traj', phase, 'distance', 'nmi', -1)[0]
-
-            totals = NamedValues()
-
-            if multi_mission:
-                var_name = f'{name}.'
-            else:
-                var_name = ''
-
-            totals.set_val(
-                'Total Fuel Burn',
-                prob.get_val(f'{var_name}mission:fuel_mass', units='lbm')[0],
-                units='lbm',
-            )
-
-            totals.set_val(
-                'Total Fuel Capacity',
-                prob.get_val(f'{var_name}aircraft:fuel:total_capacity', units='lbm')[0],
-                units='lbm',
-            )
-            totals.set_val(
-                'Excess Fuel Capacity',
-                prob.get_val(
-                    f'{var_name}mission:constraints:excess_fuel_mass_capacity', units='lbm'
-                )[0],
-                units='lbm',
-            )
-            totals.set_val('Total Time', final_time - initial_time, 'min')
-            totals.set_val('Total Ground Distance', final_range - initial_range, 'nmi')
-
-        all_data[name] = data
-        all_totals[name] = totals
-
-    if MPI and prob.comm.rank != 0:
-        # All collective calls are completed. We only output on rank 0.
-        return
-
-    with open(report_file, mode='w') as f:
-        for name, model in models.items():
-            data = all_data[name]
-            totals = all_totals[name]
-
-            if multi_mission:
-                f.write(f'\n\n\n# MULTIMISSION: {name}\n\n')
-
-            f.write('# MISSION SUMMARY')
-            write_markdown_variable_table(
-                f,
-                totals,
-                [
-                    'Total Fuel Burn',
-                    'Total Fuel Capacity',
-                    'Excess Fuel Capacity',
-                    'Total Time',
-                    'Total Ground Distance',
-                ],
-                {
-                    'Total Fuel Burn': {'units': 'lbm'},
-                    'Total Fuel Capacity': {'units': 'lbm'},
-                    'Excess Fuel Capacity': {'units': 'lbm'},
-                    'Total Time': {'units': 'min'},
-                    'Total Ground Distance': {'units': 'nmi'},
-                },
-            )
-
-            f.write('\n# MISSION SEGMENTS')
-            for phase in data:
-                f.write(f'\n## {phase}')
-                write_markdown_variable_table(
-                    f,
-                    data[phase],
-                    ['Fuel Burn', 'Elapsed Time', 'Ground Distance'],
-                    {
-                        'Fuel Burn': {'units': 'lbm'},
-                        'Elapsed Time': {'units': 'min'},
-                        'Ground Distance': {'units': 'nmi'},
-                    },
-                )
+    _write_snapshot_report(prob, 'mission')
 
 
 def input_check_report(prob: AviaryProblem, **kwargs):
@@ -494,12 +349,12 @@ def input_check_report(prob: AviaryProblem, **kwargs):
 
 def timeseries_csv(prob: AviaryProblem, **kwargs):
     """
-    Generates a CSV file containing timeseries data for variables from an Aviary mission.
+    Generates CSV files containing timeseries data for variables from each Aviary mission.
 
-    This function extracts timeseries data from the provided problem object, processes the data
-    to unify units across different phases of the mission, and then outputs the result to a CSV file.
-    The 'time' variable is moved to the beginning of the dataset so it's always the leftmost column.
-    Duplicate consecutive rows are eliminated.
+    Timeseries data for every mission is read from the results snapshot of the run and
+    assembled into one columnar table per mission, with units unified across phases using the
+    units of the first phase that has each variable. The 'time' variable is always the leftmost
+    column.
 
     Parameters
     ----------
@@ -508,111 +363,20 @@ def timeseries_csv(prob: AviaryProblem, **kwargs):
     kwargs : dict
         Additional keyword arguments (unused)
 
-    The output CSV file is named 'mission_timeseries_data.csv' and is saved in the reports directory.
-    The first row of the CSV file contains headers with variable names and units.
-    Each subsequent row represents the mission outputs at a different time step.
+    Returns
+    -------
+    dict or None
+        Tuples of (pandas.DataFrame, dict of column units) keyed by mission name, as returned by
+        ``get_mission_timeseries_tables``. None on MPI ranks other than 0, or if the report is
+        written in the background or deferred.
+
+    The output CSV file is named 'mission_timeseries_data.csv' and is saved in the reports
+    directory. Multi-mission problems write one file per mission, named
+    'mission_timeseries_data_<mission>.csv'. The first row of each CSV file contains headers with
+    variable names and units. Each subsequent row represents the mission outputs at a different
+    time step.
     """
-    multi_mission = prob.problem_type == ProblemType.MULTI_MISSION
-    if multi_mission:
-        for _, model in prob.aviary_groups_dict.items():
-            # See issue #1186. We need to rewrite this report to support multimission
-            # For now, just write the first mission's csv file.
-            break
-    else:
-        model = prob.model
-
-    timeseries_outputs = model.list_outputs(
-        includes='*timeseries*', out_stream=None, return_format='dict', units=True
-    )
-    phase_names = model.traj._phases.keys()
-
-    # There are no more collective calls, so we can exit.
-    if MPI and prob.comm.rank != 0:
-        return
-
-    timeseries_outputs = {value['prom_name']: value for key, value in timeseries_outputs.items()}
-
-    timeseries_outputs = {
-        key: value for key, value in timeseries_outputs.items() if not key.endswith('_phase')
-    }
-
-    unique_variable_names = set(
-        [timeseries_output.split('.')[-1] for timeseries_output in timeseries_outputs]
-    )
-
-    timeseries_data = {}
-    for variable_name in unique_variable_names:
-        timeseries_data[variable_name] = {}
-        first = True  # flag to check if this is first iteration in for loop
-        units = None
-        for idx_phase, phase_name in enumerate(phase_names):
-            variable_str = f'traj.{phase_name}.timeseries.{variable_name}'
-            time_str = f'traj.{phase_name}.timeseries.time'
-
-            if variable_str not in timeseries_outputs:
-                Warning(
-                    f'Variable {variable_str} not found in timeseries_outputs for phase '
-                    f'{phase_name}.'
-                )
-                val = np.zeros_like(timeseries_outputs[time_str]['val'])
-                val[:] = np.nan
-                if first:
-                    val_full_traj = val
-                    first = False
-                else:
-                    val_full_traj = np.vstack((val_full_traj, val))
-
-            else:
-                val = timeseries_outputs[variable_str]['val']
-
-                # grab the units from the first phase that uses this variable; use these units for all others
-                if units is None:
-                    units = timeseries_outputs[variable_str]['units']
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
-                else:
-                    original_units = timeseries_outputs[variable_str]['units']
-
-                    if original_units != units:
-                        val = wrapped_convert_units((val, original_units), units)
-
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
-
-        timeseries_data[variable_name]['val'] = val_full_traj
-        timeseries_data[variable_name]['units'] = units
-        timeseries_data[variable_name]['shape'] = val_full_traj.shape
-
-    # Create a DataFrame from timeseries_data
-    df_data = {
-        variable_name: pd.Series(timeseries_data[variable_name]['val'].flatten())
-        for variable_name in timeseries_data
-    }
-    df = pd.DataFrame(df_data)
-
-    time_column = ['time']  # Isolate the 'time' column
-    # Sort the rest of the columns
-    other_columns = sorted([col for col in df.columns if col != 'time'])
-    columns = time_column + other_columns  # Combine them, keeping 'time' first
-    df = df[columns]
-
-    # Add units to column names
-    df.columns = [f'{col} ({timeseries_data[col]["units"]})' for col in df.columns]
-
-    df.drop_duplicates()
-
-    # The path where you want to save the CSV file
-    reports_folder = Path(prob.get_reports_dir())
-    report_file = reports_folder / 'mission_timeseries_data.csv'
-
-    # Write the DataFrame to a CSV file
-    df.to_csv(report_file, index=False)
+    return _write_snapshot_report(prob, 'timeseries_csv')
 
 
 def overridden_variables_report(prob: AviaryProblem, **kwargs):
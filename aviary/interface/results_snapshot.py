@@ -0,0 +1,552 @@
+"""
+Frozen snapshots of run results, and the reports that are generated from them.
+
+A results snapshot copies everything the mission summary, timeseries CSV and run status reports
+need out of a problem (or out of the final case of a recorder file) in one pass. Once taken, the
+snapshot does not reference the problem, so these reports can be written concurrently in a thread
+or process pool while the problem moves on, or later, offline, from the recorder file of a
+finished run.
+"""
+
+import datetime
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.units import unit_conversion
+
+from aviary.interface.columnar_results import (
+    _build_timeseries_table,
+    _list_timeseries_outputs,
+    _split_timeseries_name,
+    _split_timeseries_table,
+)
+from aviary.interface.utils import write_markdown_variable_table
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.enums import ProblemType
+
+# phase variables summarized in the mission report, with the units they are reported in
+_phase_vars = {'mass': 'lbm', 'time': 'min', 'distance': 'nmi'}
+
+# mission totals read directly from the model, in lbm
+_mission_totals = {
+    'Total Fuel Burn': 'mission:fuel_mass',
+    'Total Fuel Capacity': 'aircraft:fuel:total_capacity',
+    'Excess Fuel Capacity': 'mission:constraints:excess_fuel_mass_capacity',
+}
+
+
+class ResultsSnapshot:
+    """
+    Copy of the results read by the snapshot reports.
+
+    Parameters
+    ----------
+    name : str
+        Name of the problem. Used as the mission name of single-mission problems.
+    missions : dict
+        Phase names of each mission in execution order, keyed by mission name.
+    multi_mission : bool
+        True if the results belong to a multi-mission problem.
+    timeseries_outputs : dict
+        Timeseries outputs of the whole model, in the format returned by ``list_outputs``.
+    phase_values : dict
+        First and last values of phase variables that are not in the timeseries, keyed by
+        (mission, phase, variable).
+    totals : dict
+        Mission totals, keyed by mission name.
+    run_status : dict, optional
+        Summary of the driver run. Not available for snapshots read from a recorder.
+
+    Attributes
+    ----------
+    name : str
+        Name of the problem.
+    missions : dict
+        Phase names of each mission.
+    multi_mission : bool
+        True if the results belong to a multi-mission problem.
+    timeseries_outputs : dict
+        Timeseries outputs of the whole model.
+    phase_values : dict
+        First and last values of phase variables that are not in the timeseries.
+    totals : dict
+        Mission totals, keyed by mission name.
+    run_status : dict or None
+        Summary of the driver run.
+    """
+
+    def __init__(
+        self,
+        name,
+        missions,
+        multi_mission,
+        timeseries_outputs,
+        phase_values,
+        totals,
+        run_status=None,
+    ):
+        self.name = name
+        self.missions = missions
+        self.multi_mission = multi_mission
+        self.timeseries_outputs = timeseries_outputs
+        self.phase_values = phase_values
+        self.totals = totals
+        self.run_status = run_status
+
+    def get_mission_tables(self):
+        """
+        Return the timeseries of each mission as a columnar table.
+
+        Returns
+        -------
+        dict
+            Tuples of (pandas.DataFrame, dict of column units), keyed by mission name.
+        """
+        return _split_timeseries_table(*_build_timeseries_table(self.timeseries_outputs, self.name))
+
+
+def _copy_timeseries_outputs(timeseries_outputs):
+    # keep only what the reports use, and make sure no array is shared with the model
+    return {
+        abs_name: {
+            'val': None if meta['val'] is None else np.array(meta['val']),
+            'units': meta['units'],
+            'prom_name': meta['prom_name'],
+        }
+        for abs_name, meta in timeseries_outputs.items()
+    }
+
+
+def _get_phase_value(get_val, phase, var_name, units):
+    """Read the first and last values of a phase variable that is not in the timeseries."""
+    try:
+        vals = get_val(f'traj.{phase}.{var_name}', units, [0, -1])
+    # 2DOF breguet range cruise uses time integration to track mass
+    except TypeError:
+        vals = get_val(f'traj.{phase}.timeseries.time', units, [0, -1])
+    except KeyError:
+        vals = None
+
+    return vals
+
+
+def _get_totals(source, prefix):
+    totals = {}
+    for label, var_name in _mission_totals.items():
+        try:
+            totals[label] = source.get_val(f'{prefix}{var_name}', units='lbm')[0]
+        except KeyError:
+            totals[label] = None
+
+    return totals
+
+
+def _get_run_status(prob):
+    runtime = prob.driver.result.runtime
+    runtime_ms = (runtime * 1000.0) % 1000.0
+    runtime_formatted = (
+        f'{time.strftime("%H hours %M minutes %S seconds", time.gmtime(runtime))} '
+        f'{runtime_ms:.1f} milliseconds'
+    )
+
+    t = datetime.datetime.now()
+    time_stamp = t.strftime('%Y-%m-%d %H:%M:%S %Z')
+
+    status = {}
+    status['Problem'] = prob._name
+    status['Script'] = sys.argv[0]
+    status['Optimizer'] = prob.driver._get_name()
+    status['Number of driver iterations'] = prob.driver.result.iter_count
+    status['Number of model evals'] = prob.driver.result.model_evals
+    status['Number of deriv evals'] = prob.driver.result.deriv_evals
+    status['Wall clock run time'] = runtime_formatted
+    status['Exit status'] = prob.driver.result.exit_status
+    status['Report generation date and time'] = time_stamp
+
+    return status
+
+
+def take_results_snapshot(prob):
+    """
+    Copy the results of a problem needed by the snapshot reports.
+
+    Timeseries values of all missions come from a single bulk ``list_outputs`` call. This is a
+    collective call under MPI and must be made on every rank; values are only complete on rank 0.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The problem containing the results.
+
+    Returns
+    -------
+    ResultsSnapshot
+        The snapshot.
+    """
+    multi_mission = prob.problem_type == ProblemType.MULTI_MISSION
+    if multi_mission:
+        models = prob.aviary_groups_dict
+    else:
+        models = {prob._name: prob.model}
+
+    timeseries_outputs = _list_timeseries_outputs(prob)
+    timeseries_names = {meta['prom_name'] for meta in timeseries_outputs.values()}
+
+    missions = {}
+    phase_values = {}
+    totals = {}
+    for name, model in models.items():
+        prefix = f'{name}.' if multi_mission else ''
+
+        def get_val(var_name, units, indices, model=model):
+            return model.get_val(var_name, units=units, indices=indices, get_remote=True)
+
+        # TODO for traj in trajectories, currently assuming single one named "traj"
+        missions[name] = list(model.mission_info)
+        for phase in model.mission_info:
+            for var_name, units in _phase_vars.items():
+                if f'{prefix}traj.{phase}.timeseries.{var_name}' not in timeseries_names:
+                    vals = _get_phase_value(get_val, phase, var_name, units)
+                    phase_values[name, phase, var_name] = vals
+
+        totals[name] = _get_totals(prob, prefix)
+
+    run_status = None
+    if prob.driver.result is not None:
+        run_status = _get_run_status(prob)
+
+    return ResultsSnapshot(
+        prob._name,
+        missions,
+        multi_mission,
+        _copy_timeseries_outputs(timeseries_outputs),
+        phase_values,
+        totals,
+        run_status,
+    )
+
+
+def results_snapshot_from_recorder(filename, case_name='final', name='problem'):
+    """
+    Build a results snapshot from a case recorded during a run.
+
+    By default, the final case written by ``run_aviary_problem`` to ``problem_history.db`` is used,
+    so reports of a finished run can be generated offline.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path to the recorder file.
+    case_name : str, optional
+        Name of the case to read. Defaults to ``'final'``.
+    name : str, optional
+        Name given to the mission of single-mission problems. Defaults to ``'problem'``.
+
+    Returns
+    -------
+    ResultsSnapshot
+        The snapshot. It has no run status, which is not stored in recorder files.
+    """
+    if not Path(filename).is_file():
+        raise FileNotFoundError(
+            f'Recorder file "{filename}" not found. The final case is only recorded when '
+            'run_aviary_problem runs the driver.'
+        )
+
+    case = om.CaseReader(str(filename)).get_case(case_name)
+
+    timeseries_outputs = case.list_outputs(
+        includes='*timeseries*',
+        out_stream=None,
+        return_format='dict',
+        units=True,
+        prom_name=True,
+    )
+    timeseries_names = {meta['prom_name'] for meta in timeseries_outputs.values()}
+
+    # missions and phases are recovered from the timeseries names, which are in execution order
+    missions = {}
+    for meta in timeseries_outputs.values():
+        split_name = _split_timeseries_name(meta['prom_name'], '')
+        if split_name is None:
+            continue
+        mission, phase, _ = split_name
+        phases = missions.setdefault(mission, [])
+        if phase not in phases:
+            phases.append(phase)
+
+    multi_mission = bool(missions) and '' not in missions
+    if not multi_mission:
+        missions = {name: missions.get('', [])}
+
+    phase_values = {}
+    totals = {}
+    for mission, phases in missions.items():
+        prefix = f'{mission}.' if multi_mission else ''
+
+        def get_val(var_name, units, indices, prefix=prefix):
+            return case.get_val(f'{prefix}{var_name}', units=units, indices=indices)
+
+        for phase in phases:
+            for var_name, units in _phase_vars.items():
+                if f'{prefix}traj.{phase}.timeseries.{var_name}' not in timeseries_names:
+                    vals = _get_phase_value(get_val, phase, var_name, units)
+                    phase_values[mission, phase, var_name] = vals
+
+        totals[mission] = _get_totals(case, prefix)
+
+    return ResultsSnapshot(
+        name,
+        missions,
+        multi_mission,
+        _copy_timeseries_outputs(timeseries_outputs),
+        phase_values,
+        totals,
+    )
+
+
+def write_timeseries_csv(snapshot, reports_folder):
+    """
+    Write the timeseries of each mission in a snapshot to a CSV file.
+
+    The file is named 'mission_timeseries_data.csv'. Multi-mission results write one file per
+    mission, named 'mission_timeseries_data_<mission>.csv'. The first row of each file contains
+    headers with variable names and units, and each following row is one node of the mission.
+
+    Parameters
+    ----------
+    snapshot : ResultsSnapshot
+        The results to report.
+    reports_folder : str or Path
+        Directory the files are written to.
+
+    Returns
+    -------
+    dict
+        Tuples of (pandas.DataFrame, dict of column units), keyed by mission name.
+    """
+    reports_folder = Path(reports_folder)
+    tables = snapshot.get_mission_tables()
+
+    for name, (table, units) in tables.items():
+        df = table.drop(columns=['phase', 'node'])
+        df.columns = [f'{col} ({units[col]})' for col in df.columns]
+
+        if snapshot.multi_mission:
+            report_file = reports_folder / f'mission_timeseries_data_{name}.csv'
+        else:
+            report_file = reports_folder / 'mission_timeseries_data.csv'
+
+        df.to_csv(report_file, index=False)
+
+    return tables
+
+
+def _get_phase_diff(vals):
+    if vals is None:
+        return None
+
+    vals = np.ravel(vals)
+    return vals[-1] - vals[0]
+
+
+def write_mission_summary(snapshot, reports_folder):
+    """
+    Write a basic mission summary of a snapshot to 'mission_summary.md'.
+
+    Parameters
+    ----------
+    snapshot : ResultsSnapshot
+        The results to report.
+    reports_folder : str or Path
+        Directory the file is written to.
+    """
+    report_file = Path(reports_folder) / 'mission_summary.md'
+    tables = snapshot.get_mission_tables()
+
+    phase_values = dict(snapshot.phase_values)
+    all_data = {}
+    all_totals = {}
+    for name, phases in snapshot.missions.items():
+        if not phases:
+            continue
+
+        table, table_units = tables.get(name, (None, {}))
+        if table is not None:
+            phase_rows = table.groupby('phase', observed=True, sort=False)
+        elif any(
+            (name, phase, var_name) not in phase_values
+            for phase in phases
+            for var_name in _phase_vars
+        ):
+            # without a timeseries, this mission cannot be summarized
+            continue
+
+        # read first and last values of each phase
+        for phase in phases:
+            for var_name, units in _phase_vars.items():
+                if (name, phase, var_name) in phase_values:
+                    continue
+
+                vals = phase_rows.get_group(phase)[var_name].to_numpy()[[0, -1]]
+                factor, offset = unit_conversion(table_units[var_name], units)
+                phase_values[name, phase, var_name] = (vals + offset) * factor
+
+        # TODO delta mass and fuel consumption need to be tracked separately
+        data = {}
+        for phase in phases:
+            mass, elapsed_time, distance = [
+                _get_phase_diff(phase_values[name, phase, var_name]) for var_name in _phase_vars
+            ]
+
+            outputs = NamedValues()
+            # Fuel burn is negative of delta mass
+            outputs.set_val('Fuel Burn', None if mass is None else -mass, 'lbm')
+            outputs.set_val('Elapsed Time', elapsed_time, 'min')
+            outputs.set_val('Ground Distance', distance, 'nmi')
+            data[phase] = outputs
+
+        totals = NamedValues()
+        for label, val in snapshot.totals[name].items():
+            totals.set_val(label, val, units='lbm')
+
+        # initial values are first in traj, final values are last in traj
+        first = [np.ravel(phase_values[name, phases[0], var]) for var in ('time', 'distance')]
+        last = [np.ravel(phase_values[name, phases[-1], var]) for var in ('time', 'distance')]
+
+        totals.set_val('Total Time', last[0][-1] - first[0][0], 'min')
+        totals.set_val('Total Ground Distance', last[1][-1] - first[1][0], 'nmi')
+
+        all_data[name] = data
+        all_totals[name] = totals
+
+    with open(report_file, mode='w') as f:
+        for name in all_data:
+            data = all_data[name]
+            totals = all_totals[name]
+
+            if snapshot.multi_mission:
+                f.write(f'\n\n\n# MULTIMISSION: {name}\n\n')
+
+            f.write('# MISSION SUMMARY')
+            write_markdown_variable_table(
+                f,
+                totals,
+                [
+                    'Total Fuel Burn',
+                    'Total Fuel Capacity',
+                    'Excess Fuel Capacity',
+                    'Total Time',
+                    'Total Ground Distance',
+                ],
+                {
+                    'Total Fuel Burn': {'units': 'lbm'},
+                    'Total Fuel Capacity': {'units': 'lbm'},
+                    'Excess Fuel Capacity': {'units': 'lbm'},
+                    'Total Time': {'units': 'min'},
+                    'Total Ground Distance': {'units': 'nmi'},
+                },
+            )
+
+            f.write('\n# MISSION SEGMENTS')
+            for phase in data:
+                f.write(f'\n## {phase}')
+                write_markdown_variable_table(
+                    f,
+                    data[phase],
+                    ['Fuel Burn', 'Elapsed Time', 'Ground Distance'],
+                    {
+                        'Fuel Burn': {'units': 'lbm'},
+                        'Elapsed Time': {'units': 'min'},
+                        'Ground Distance': {'units': 'nmi'},
+                    },
+                )
+
+
+def write_run_status(snapshot, reports_folder):
+    """
+    Write the run status of a snapshot to 'status.json'. Nothing is written if the snapshot has no
+    run status.
+
+    Parameters
+    ----------
+    snapshot : ResultsSnapshot
+        The results to report.
+    reports_folder : str or Path
+        Directory the file is written to.
+    """
+    if snapshot.run_status is None:
+        return
+
+    report_file = Path(reports_folder) / 'status.json'
+
+    with open(report_file, 'w') as f:
+        json.dump(snapshot.run_status, f, indent=1, ensure_ascii=False)
+        print(file=f)  # avoid 'no newline at end of file' message
+
+
+# reports that only need a results snapshot, keyed by their OpenMDAO report name
+snapshot_reports = {
+    'mission': write_mission_summary,
+    'timeseries_csv': write_timeseries_csv,
+    'run_status': write_run_status,
+}
+
+
+def write_snapshot_reports(snapshot, reports_folder, reports=None, executor=None):
+    """
+    Write reports from a results snapshot concurrently.
+
+    Parameters
+    ----------
+    snapshot : ResultsSnapshot
+        The results to report.
+    reports_folder : str or Path
+        Directory the reports are written to. It is created if needed.
+    reports : list of str, optional
+        Names of the reports to write, out of 'mission', 'timeseries_csv' and 'run_status'.
+        Defaults to all of them.
+    executor : concurrent.futures.Executor, optional
+        Executor the reports are submitted to. A ProcessPoolExecutor may be used, since snapshots
+        are picklable. If not given, the reports are written on a temporary thread pool and this
+        function returns once they are done.
+
+    Returns
+    -------
+    dict
+        concurrent.futures.Future of each report, keyed by report name.
+    """
+    if reports is None:
+        reports = list(snapshot_reports)
+
+    for report in reports:
+        if report not in snapshot_reports:
+            raise ValueError(
+                f'Unknown snapshot report "{report}". Must be one of {", ".join(snapshot_reports)}.'
+            )
+
+    reports_folder = Path(reports_folder)
+    reports_folder.mkdir(parents=True, exist_ok=True)
+
+    if executor is not None:
+        return {
+            report: executor.submit(snapshot_reports[report], snapshot, reports_folder)
+            for report in reports
+        }
+
+    with ThreadPoolExecutor(max_workers=len(reports) or None) as pool:
+        futures = {
+            report: pool.submit(snapshot_reports[report], snapshot, reports_folder)
+            for report in reports
+        }
+
+    # surface any errors raised while writing
+    for future in futures.values():
+        future.result()
+
+    return futures
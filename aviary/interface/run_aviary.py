@@ -143,6 +143,29 @@ def run_aviary_cmd(
         'real_time_plotting': real_time_plotting,
     }
 
+    phase_info = load_phase_info(phase_info, verbosity)
+
+    prob = run_aviary(input_deck, phase_info, **kwargs)
+
+    return prob
+
+
+def load_phase_info(phase_info, verbosity=Verbosity.BRIEF):
+    """
+    Return the phase_info dictionary defined in a Python file.
+
+    Parameters
+    ----------
+    phase_info : str, dict, or None
+        Path to a Python file that defines ``phase_info``. Anything else is returned unchanged.
+    verbosity : Verbosity or int, optional
+        Verbosity used when searching for the file.
+
+    Returns
+    -------
+    dict or None
+        The phase_info dictionary.
+    """
     if isinstance(phase_info, str):
         phase_info_path = get_path(phase_info, verbosity)
         spec = spec_from_file_location('phase_info_file', str(phase_info_path))
@@ -152,9 +175,7 @@ def run_aviary_cmd(
 
         phase_info = getattr(phase_info_file, 'phase_info')
 
-    prob = run_aviary(input_deck, phase_info, **kwargs)
-
-    return prob
+    return phase_info
 
 
 def _setup_run_aviary_parser(parser):
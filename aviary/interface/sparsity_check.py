@@ -0,0 +1,330 @@
+"""
+Audit of the partial derivative sparsity declared by the components of a model.
+
+Components that declare dense partials, for example with ``declare_partials('*', '*')``, where
+most of the entries are always zero make coloring and linear solves more expensive than they need
+to be. Here, the partials declared by each component are compared to the nonzero entries found by
+finite difference or complex step, and the components are ranked by the number of declared entries
+that are zero times the number of times their Jacobian is computed.
+"""
+
+import sys
+from fnmatch import fnmatchcase
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.variable_info.enums import Verbosity
+
+
+def check_partial_sparsity(
+    prob,
+    method='fd',
+    includes=None,
+    excludes=None,
+    tol=0.0,
+    out_stream=sys.stdout,
+    max_rows=20,
+):
+    """
+    Compare the declared partials of each component of a problem to their nonzero entries.
+
+    The model is run and its total derivatives computed once, counting the number of times the
+    Jacobian of each component is computed. The partials of each component are then checked at
+    the converged point. An entry counts as nonzero if the checked or the computed value of it is
+    nonzero, so entries that only vanish at the converged point are reported as wasted.
+
+    Parameters
+    ----------
+    prob : om.Problem
+        A problem on which setup has been called. For complex step, setup must be called with
+        ``force_alloc_complex=True``.
+    method : str, optional
+        Method used to find the nonzero entries, 'fd' or 'cs'. Defaults to 'fd'.
+    includes : list of str, optional
+        Glob patterns of the pathnames of the components to check. Defaults to all components.
+    excludes : list of str, optional
+        Glob patterns of the pathnames of components not to check.
+    tol : float, optional
+        Absolute value above which a checked entry counts as nonzero. Defaults to 0.0.
+    out_stream : file-like, optional
+        Where the report is written, None to not write it. Defaults to sys.stdout.
+    max_rows : int, optional
+        Maximum number of components listed in the written report. Defaults to 20.
+
+    Returns
+    -------
+    list of dict
+        For each checked component, most wasteful first: its 'pathname' and 'class', the number
+        of 'declared' and 'nonzero' entries, the number of declared entries that are zero
+        ('wasted'), the number of nonzero entries that are not declared ('undeclared'), the number
+        of Jacobian evaluations ('calls'), the 'score' (wasted times calls), the 'pairs' of
+        ``(of, wrt, declared, nonzero)`` with wasted entries, and the 'error' raised while
+        checking, if any.
+    """
+    if method not in ('fd', 'cs'):
+        raise ValueError(f"method must be 'fd' or 'cs', not '{method}'.")
+
+    components = [
+        comp
+        for comp in prob.model.system_iter(recurse=True, typ=om.Component)
+        if _matches(comp.pathname, includes, excludes)
+    ]
+
+    calls = _count_linearizations(prob, components)
+
+    report = []
+    for comp in components:
+        entry = {
+            'pathname': comp.pathname,
+            'class': type(comp).__name__,
+            'declared': 0,
+            'nonzero': 0,
+            'wasted': 0,
+            'undeclared': 0,
+            'calls': calls[comp.pathname],
+            'score': 0,
+            'pairs': [],
+            'error': None,
+        }
+
+        try:
+            partials = prob.check_partials(out_stream=None, includes=[comp.pathname], method=method)
+        except Exception as err:
+            entry['error'] = f'{type(err).__name__}: {err}'
+            report.append(entry)
+            continue
+
+        declared_patterns = _declared_patterns(comp)
+
+        for (of, wrt), data in partials.get(comp.pathname, {}).items():
+            checked = _first(data['J_fd'])
+            nonzero = np.abs(checked) > tol
+            if 'J_fwd' in data:
+                nonzero |= _first(data['J_fwd']) != 0.0
+
+            declared = _declared_mask(declared_patterns, of, wrt, checked.shape)
+            num_declared = int(np.count_nonzero(declared))
+            num_nonzero = int(np.count_nonzero(nonzero & declared))
+            num_wasted = num_declared - num_nonzero
+
+            entry['declared'] += num_declared
+            entry['nonzero'] += num_nonzero
+            entry['wasted'] += num_wasted
+            entry['undeclared'] += int(np.count_nonzero(nonzero & ~declared))
+
+            if num_wasted > 0:
+                entry['pairs'].append((of, wrt, num_declared, num_nonzero))
+
+        entry['score'] = entry['wasted'] * entry['calls']
+        entry['pairs'].sort(key=lambda pair: pair[3] - pair[2])
+        report.append(entry)
+
+    report.sort(key=lambda entry: (-entry['score'], -entry['wasted'], entry['pathname']))
+
+    if out_stream is not None:
+        _write_report(report, out_stream, max_rows)
+
+    return report
+
+
+def _matches(pathname, includes, excludes):
+    """Return whether a pathname matches any of includes and none of excludes."""
+    if includes and not any(fnmatchcase(pathname, pattern) for pattern in includes):
+        return False
+
+    if excludes and any(fnmatchcase(pathname, pattern) for pattern in excludes):
+        return False
+
+    return True
+
+
+def _count_linearizations(prob, components):
+    """
+    Return the number of times the Jacobian of each component is computed in one run of the model
+    followed by one computation of the total derivatives.
+    """
+    counts = {comp.pathname: 0 for comp in components}
+
+    def counted(linearize, pathname):
+        def wrapper(*args, **kwargs):
+            counts[pathname] += 1
+            return linearize(*args, **kwargs)
+
+        return wrapper
+
+    # wrap the instances only, so the classes are left untouched
+    for comp in components:
+        comp._linearize = counted(comp._linearize, comp.pathname)
+
+    try:
+        prob.run_model()
+
+        if prob.model.get_design_vars() and prob.model.get_responses():
+            prob.compute_totals()
+        else:
+            prob.model.run_linearize()
+
+    finally:
+        for comp in components:
+            del comp._linearize
+
+    return counts
+
+
+def _declared_patterns(comp):
+    """Return the declared rows and columns of each partial of a component, keyed by (of, wrt)."""
+    prefix = comp.pathname + '.'
+    patterns = {}
+
+    for (of, wrt), meta in comp._subjacs_info.items():
+        key = (of.removeprefix(prefix), wrt.removeprefix(prefix))
+        rows = meta.get('rows')
+        patterns[key] = None if rows is None else (np.asarray(rows), np.asarray(meta['cols']))
+
+    return patterns
+
+
+def _declared_mask(patterns, of, wrt, shape):
+    """Return the mask of the declared entries of one partial, all False if not declared."""
+    if (of, wrt) not in patterns:
+        return np.zeros(shape, dtype=bool)
+
+    pattern = patterns[of, wrt]
+    if pattern is None:
+        return np.ones(shape, dtype=bool)
+
+    mask = np.zeros(shape, dtype=bool)
+    mask[pattern] = True
+
+    return mask
+
+
+def _first(value):
+    """Return a Jacobian as an array, taking the first one when one is given per step size."""
+    if isinstance(value, dict):
+        value = next(iter(value.values()))
+
+    if isinstance(value, (list, tuple)):
+        value = value[0]
+
+    return np.atleast_2d(np.asarray(value).real)
+
+
+def _write_report(report, out_stream, max_rows):
+    """Write the components with the most wasted Jacobian entries."""
+    total_declared = sum(entry['declared'] for entry in report)
+    total_wasted = sum(entry['wasted'] for entry in report)
+
+    print('Partial Derivative Sparsity', file=out_stream)
+    print('---------------------------', file=out_stream)
+    print(
+        f'{len(report)} components, {total_wasted} of {total_declared} declared entries are zero',
+        file=out_stream,
+    )
+
+    header = f'{"score":>10} {"wasted":>8} {"declared":>9} {"calls":>6}  component'
+    print(f'\n{header}', file=out_stream)
+
+    for entry in report[:max_rows]:
+        if entry['error'] is not None:
+            print(f'{"-":>10} {"-":>8} {"-":>9} {entry["calls"]:>6}  ', end='', file=out_stream)
+            print(f'{entry["pathname"]} ({entry["error"]})', file=out_stream)
+            continue
+
+        if entry['wasted'] == 0 and entry['undeclared'] == 0:
+            continue
+
+        print(
+            f'{entry["score"]:>10} {entry["wasted"]:>8} {entry["declared"]:>9} '
+            f'{entry["calls"]:>6}  {entry["pathname"]} ({entry["class"]})',
+            file=out_stream,
+        )
+
+        for of, wrt, num_declared, num_nonzero in entry['pairs'][:3]:
+            print(
+                f'{"":>37}  {of}, {wrt}: {num_nonzero} of {num_declared} nonzero',
+                file=out_stream,
+            )
+
+        if entry['undeclared']:
+            print(
+                f'{"":>37}  {entry["undeclared"]} nonzero entries are not declared',
+                file=out_stream,
+            )
+
+
+def _setup_sparsity_check_parser(parser):
+    """
+    Set up the subparser for the partial derivative sparsity check.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('input_deck', type=str, help='Name of vehicle input deck file')
+    parser.add_argument('--phase_info', type=str, default=None, help='Path to phase info file')
+    parser.add_argument(
+        '--method',
+        type=str,
+        default='fd',
+        choices=('fd', 'cs'),
+        help='Method used to find the nonzero partial derivative entries',
+    )
+    parser.add_argument(
+        '--include',
+        type=str,
+        action='append',
+        help='Glob pattern of the pathnames of the components to check, may be repeated',
+    )
+    parser.add_argument(
+        '--exclude',
+        type=str,
+        action='append',
+        help='Glob pattern of the pathnames of components not to check, may be repeated',
+    )
+    parser.add_argument(
+        '--tol',
+        type=float,
+        default=0.0,
+        help='Absolute value above which a checked entry counts as nonzero',
+    )
+    parser.add_argument(
+        '--max_rows', type=int, default=20, help='Maximum number of components listed'
+    )
+    parser.add_argument(
+        '--verbosity',
+        type=int,
+        default=0,
+        help='verbosity settings: 0=quiet, 1=brief, 2=verbose, 3=debug',
+        choices=(0, 1, 2, 3),
+    )
+
+
+def _exec_sparsity_check(args, user_args):
+    from aviary.core.aviary_problem import AviaryProblem
+    from aviary.interface.run_aviary import load_phase_info
+
+    verbosity = Verbosity(args.verbosity)
+    phase_info = load_phase_info(args.phase_info, verbosity)
+
+    prob = AviaryProblem(verbosity=verbosity)
+    prob.load_inputs(args.input_deck, phase_info, verbosity=verbosity)
+    prob.check_and_preprocess_inputs(verbosity=verbosity)
+    prob.build_model(verbosity=verbosity)
+
+    # without coloring, the total derivatives are computed once, as in an optimizer iteration
+    prob.add_driver('SLSQP', use_coloring=False, max_iter=0, verbosity=verbosity)
+    prob.add_design_variables(verbosity=verbosity)
+    prob.add_objective(verbosity=verbosity)
+    prob.setup(force_alloc_complex=args.method == 'cs')
+
+    check_partial_sparsity(
+        prob,
+        method=args.method,
+        includes=args.include,
+        excludes=args.exclude,
+        tol=args.tol,
+        max_rows=args.max_rows,
+    )
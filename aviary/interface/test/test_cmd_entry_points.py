@@ -1,9 +1,17 @@
 import subprocess
+import sys
+import time
 import unittest
 from pathlib import Path
 
 from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
 
+from aviary.interface.cmd_entry_points import (
+    _args_after_command,
+    _command_map,
+    _convert_command_map,
+    _selected_command,
+)
 from aviary.utils.functions import get_aviary_resource_path
 
 
@@ -31,6 +39,15 @@ class InstallationTest(CommandEntryPointsTestCases):
         self.run_and_test_cmd(cmd)
 
 
+class check_sparsityTestCases(CommandEntryPointsTestCases):
+    def bench_test_sparsity_cmd(self):
+        cmd = (
+            'aviary check sparsity validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv'
+            ' --include pre_mission.*'
+        )
+        self.run_and_test_cmd(cmd)
+
+
 class run_missionTestCases(CommandEntryPointsTestCases):
     @require_pyoptsparse(optimizer='SNOPT')
     def bench_test_SNOPT_cmd(self):
@@ -136,5 +153,80 @@ class convert_propeller_tableTestCases(CommandEntryPointsTestCases):
         self.run_and_test_cmd(cmd)
 
 
+class StartupTestCases(unittest.TestCase):
+    """The CLI should only import the modules of the subcommand that is run."""
+
+    # modules that pull in the plotting, GUI and dashboard packages
+    heavy_modules = (
+        'aviary.interface.graphical_input',
+        'aviary.interface.plot_drag_polar',
+        'aviary.interface.run_aviary',
+        'aviary.utils.fortran_to_aviary',
+        'aviary.visualization.dashboard_cmd',
+        'aviary.visualization.realtime_plot',
+    )
+
+    def get_loaded_modules(self, *args):
+        code = (
+            'import sys\n'
+            'from aviary.interface.cmd_entry_points import aviary_cmd\n'
+            f'sys.argv = ["aviary", {", ".join(repr(arg) for arg in args)}]\n'
+            'try:\n'
+            '    aviary_cmd()\n'
+            'except SystemExit:\n'
+            '    pass\n'
+            'print("\\n".join(sys.modules), file=sys.stderr)\n'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True
+        )
+        return set(result.stderr.split())
+
+    def test_help(self):
+        modules = self.get_loaded_modules('-h')
+        for name in self.heavy_modules:
+            self.assertNotIn(name, modules)
+
+    def test_subcommand_help(self):
+        modules = self.get_loaded_modules('convert', 'engine_deck', '-h')
+        self.assertIn('aviary.utils.engine_deck_conversion_cmd', modules)
+        for name in self.heavy_modules:
+            self.assertNotIn(name, modules)
+
+    def test_selected_command(self):
+        argv = ['convert', 'engine_deck', 'check', '-h']
+        self.assertEqual(_selected_command(_command_map, argv), 'convert')
+        self.assertEqual(
+            _selected_command(_convert_command_map, _args_after_command(argv)), 'engine_deck'
+        )
+
+        # file names that match a command name are not the selected command
+        argv = ['run_mission', 'convert']
+        self.assertEqual(_selected_command(_command_map, argv), 'run_mission')
+        self.assertIsNone(_selected_command(_convert_command_map, ['aero_table.txt', 'aero_table']))
+
+        self.assertEqual(_selected_command(_command_map, ['--version', 'check']), 'check')
+        self.assertIsNone(_selected_command(_command_map, ['-h']))
+
+    def get_startup_time(self, *args):
+        """Return the shortest of a few wall times of running the interpreter with args."""
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *args], capture_output=True, check=True)
+            times.append(time.perf_counter() - start)
+
+        return min(times)
+
+    def bench_test_startup_time(self):
+        # Printing the help only needs the standard library, so it is compared to the startup
+        # of a bare interpreter on the same machine. This is a loose bound that catches a heavy
+        # import creeping back into the CLI startup.
+        baseline = self.get_startup_time('-c', 'import argparse')
+        elapsed = self.get_startup_time('-m', 'aviary.interface.cmd_entry_points', '-h')
+
+        self.assertLess(elapsed, baseline + 2.0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.columnar_results import (
+    _write_table,
+    aviary_values_from_table,
+    aviary_values_to_table,
+    get_mission_timeseries_tables,
+    get_timeseries_table,
+    read_columnar_aviary_inputs,
+    read_columnar_timeseries,
+)
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.enums import EquationsOfMotion, Verbosity
+from aviary.variable_info.variables import Aircraft, Mission, Settings
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def _build_aviary_values():
+    aviary_values = AviaryValues()
+    aviary_values.set_val(Aircraft.Wing.AREA, 1370.0, 'ft**2')
+    aviary_values.set_val(Aircraft.Engine.NUM_ENGINES, np.array([2]))
+    aviary_values.set_val(Aircraft.Wing.HAS_STRUT, False)
+    aviary_values.set_val(Mission.Design.RANGE, 3500.0, 'NM')
+    aviary_values.set_val(Settings.EQUATIONS_OF_MOTION, EquationsOfMotion.ENERGY_STATE)
+    aviary_values.set_val(Settings.VERBOSITY, Verbosity.BRIEF)
+    aviary_values.set_val(Settings.AIRCRAFT_NAME, 'test_aircraft')
+    aviary_values.set_val(Aircraft.Engine.DATA_FILE, [Path('models/engines/turbofan_28k.csv')])
+    aviary_values.set_val(Aircraft.Wing.INPUT_STATION_DIST, [0.0, 0.2759, 0.9367], units='unitless')
+    return aviary_values
+
+
+def _build_problem():
+    prob = om.Problem()
+    traj = prob.model.add_subsystem('traj', om.Group())
+
+    for phase, num_nodes, alt_units in (('climb', 3, 'ft'), ('cruise', 2, 'm')):
+        ts = traj.add_subsystem(phase, om.Group()).add_subsystem('timeseries', om.IndepVarComp())
+        ts.add_output('time', np.arange(num_nodes, dtype=float), units='s')
+        ts.add_output('altitude', np.full(num_nodes, 1000.0), units=alt_units)
+        if phase == 'climb':
+            ts.add_output('thrust', np.ones((num_nodes, 2)), units='lbf')
+
+    prob.setup()
+    prob.final_setup()
+    return prob
+
+
+class AviaryValuesTableTest(unittest.TestCase):
+    def test_round_trip(self):
+        aviary_values = _build_aviary_values()
+
+        table = aviary_values_to_table(aviary_values)
+        self.assertEqual(len(table), len(aviary_values))
+
+        result = aviary_values_from_table(table)
+
+        for name, (val, units) in aviary_values:
+            new_val, new_units = result.get_item(name)
+            self.assertEqual(new_units, units)
+            self.assertIs(type(new_val), type(val))
+            if isinstance(val, np.ndarray):
+                self.assertEqual(new_val.dtype, val.dtype)
+                np.testing.assert_array_equal(new_val, val)
+            else:
+                self.assertEqual(new_val, val)
+
+    def test_unsupported_type(self):
+        aviary_values = AviaryValues()
+        aviary_values._mapping['bad'] = ({'a': 1}, 'unitless')
+
+        with self.assertRaises(TypeError):
+            aviary_values_to_table(aviary_values)
+
+
+class TimeseriesTableTest(unittest.TestCase):
+    def test_timeseries_table(self):
+        prob = _build_problem()
+        df, units = get_timeseries_table(prob)
+
+        self.assertEqual(len(df), 5)
+        self.assertEqual(list(df['phase']), ['climb'] * 3 + ['cruise'] * 2)
+        self.assertEqual(list(df['node']), [0, 1, 2, 0, 1])
+
+        # units of the first phase are used for the whole column
+        self.assertEqual(units['altitude'], 'ft')
+        assert_near_equal(df['altitude'].to_numpy()[3:], np.full(2, 3280.839895), tolerance=1e-8)
+
+        # missing data is filled with NaN
+        self.assertEqual(units['thrust[1]'], 'lbf')
+        self.assertTrue(np.all(np.isnan(df['thrust[0]'].to_numpy()[3:])))
+
+    def test_mission_tables(self):
+        prob = om.Problem()
+        for mission, phases in (('mission1', ('climb', 'cruise')), ('mission2', ('cruise',))):
+            traj = prob.model.add_subsystem(mission, om.Group()).add_subsystem('traj', om.Group())
+            for phase in phases:
+                ts = traj.add_subsystem(phase, om.Group())
+                ts = ts.add_subsystem('timeseries', om.IndepVarComp())
+                ts.add_output('time', np.arange(2.0), units='s')
+                if mission == 'mission1':
+                    ts.add_output('altitude', np.full(2, 1000.0), units='ft')
+        prob.setup()
+        prob.final_setup()
+
+        tables = get_mission_timeseries_tables(prob)
+        self.assertEqual(list(tables), ['mission1', 'mission2'])
+
+        df, units = tables['mission1']
+        self.assertEqual(list(df.columns), ['phase', 'node', 'time', 'altitude'])
+        self.assertEqual(list(df['phase']), ['climb', 'climb', 'cruise', 'cruise'])
+        self.assertEqual(units, {'time': 's', 'altitude': 'ft'})
+
+        # variables that only exist in other missions are dropped
+        df, units = tables['mission2']
+        self.assertEqual(list(df.columns), ['phase', 'node', 'time'])
+        self.assertEqual(list(df['phase'].cat.categories), ['cruise'])
+        self.assertEqual(units, {'time': 's'})
+
+
+@use_tempdirs
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class ColumnarFileTest(unittest.TestCase):
+    def test_file_round_trip(self):
+        for file_format in ('parquet', 'feather'):
+            with self.subTest(file_format=file_format):
+                prob = _build_problem()
+                df, units = get_timeseries_table(prob)
+                timeseries_file = f'timeseries.{file_format}'
+                _write_table(df, timeseries_file, file_format, units=units)
+
+                new_df, new_units = read_columnar_timeseries(timeseries_file)
+                self.assertEqual(new_units, units)
+                np.testing.assert_array_equal(new_df['altitude'], df['altitude'])
+
+                aviary_values = _build_aviary_values()
+                table = aviary_values_to_table(aviary_values)
+                table.insert(0, 'mission', 'mission1')
+                inputs_file = f'aviary_inputs.{file_format}'
+                _write_table(table, inputs_file, file_format)
+
+                result = read_columnar_aviary_inputs(inputs_file, mission='mission1')
+                self.assertEqual(
+                    result.get_val(Settings.EQUATIONS_OF_MOTION), EquationsOfMotion.ENERGY_STATE
+                )
+                self.assertEqual(
+                    result.get_val(Aircraft.Wing.INPUT_STATION_DIST), [0.0, 0.2759, 0.9367]
+                )
+
+                self.assertIn('mission1', read_columnar_aviary_inputs(inputs_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
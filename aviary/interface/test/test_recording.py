@@ -0,0 +1,217 @@
+import unittest
+from contextlib import redirect_stdout
+from copy import deepcopy
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.interface.recording import (
+    CheckpointRecorder,
+    StreamingRecorder,
+    read_checkpoint,
+    read_timeseries_snapshots,
+    restore_checkpoint,
+)
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.variable_info.enums import Verbosity
+
+
+def _build_problem(recorder):
+    prob = om.Problem()
+    model = prob.model
+
+    model.add_subsystem('ivc', om.IndepVarComp('x', np.zeros(5)), promotes=['*'])
+    model.add_subsystem(
+        'obj_comp', om.ExecComp('f = sum((x - 3.0)**2)', x=np.zeros(5)), promotes=['*']
+    )
+    model.add_subsystem(
+        'timeseries',
+        om.ExecComp('y = 2.0 * x', x=np.zeros(5), y=np.zeros(5)),
+        promotes_inputs=['x'],
+    )
+
+    model.add_design_var('x', lower=-10.0, upper=10.0)
+    model.add_objective('f')
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+    prob.driver.recording_options['record_inputs'] = False
+    prob.driver.recording_options['includes'] = ['*timeseries*']
+    prob.driver.add_recorder(recorder)
+
+    prob.setup()
+    return prob
+
+
+@use_tempdirs
+class StreamingRecorderTest(unittest.TestCase):
+    def test_bounded_recording(self):
+        for async_writer in (False, True):
+            with self.subTest(async_writer=async_writer):
+                filename = f'history_{async_writer}.db'
+                recorder = StreamingRecorder(
+                    filename, timeseries_interval=3, async_writer=async_writer
+                )
+                prob = _build_problem(recorder)
+                # A second recorder on the same driver still gets the timeseries.
+                prob.driver.add_recorder(om.SqliteRecorder(f'full_{async_writer}.db'))
+                prob.run_driver()
+                prob.cleanup()
+
+                # Driver-level values are recorded every iteration, without the timeseries.
+                cr = om.CaseReader(filename)
+                driver_cases = cr.list_cases('driver', out_stream=None)
+                self.assertGreater(len(driver_cases), 3)
+                for case_name in driver_cases:
+                    outputs = cr.get_case(case_name).outputs
+                    self.assertIn('x', outputs)
+                    self.assertNotIn('timeseries.y', outputs)
+
+                full_cr = om.CaseReader(f'full_{async_writer}.db')
+                for case_name in full_cr.list_cases('driver', out_stream=None):
+                    self.assertIn('timeseries.y', full_cr.get_case(case_name).outputs)
+
+                snapshots = read_timeseries_snapshots(filename)
+
+                # First iteration, every third one after that, and the final one.
+                case_counters = [cr.get_case(case_name).counter for case_name in driver_cases]
+                expected = case_counters[::3]
+                if expected[-1] != case_counters[-1]:
+                    expected.append(case_counters[-1])
+                self.assertEqual(list(snapshots), expected)
+
+                final = read_timeseries_snapshots(filename, final_only=True)
+                self.assertEqual(len(final), 1)
+                final_snapshot = next(iter(final.values()))
+                self.assertTrue(final_snapshot['is_final'])
+                assert_near_equal(
+                    final_snapshot['values']['timeseries.y'],
+                    prob.get_val('timeseries.y'),
+                    tolerance=1e-12,
+                )
+
+    def test_rerun(self):
+        recorder = StreamingRecorder('history.db', timeseries_interval=3)
+        prob = _build_problem(recorder)
+
+        prob.run_driver()
+        recorder.finalize_snapshots()
+        num_snapshots = len(read_timeseries_snapshots('history.db'))
+
+        prob.set_val('x', np.zeros(5))
+        prob.run_driver()
+        prob.cleanup()
+
+        # The second run adds its own snapshots, and only its last one is final.
+        self.assertGreater(len(read_timeseries_snapshots('history.db')), num_snapshots)
+        final = read_timeseries_snapshots('history.db', final_only=True)
+        self.assertEqual(len(final), 1)
+        assert_near_equal(
+            next(iter(final.values()))['values']['timeseries.y'],
+            prob.get_val('timeseries.y'),
+            tolerance=1e-12,
+        )
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            StreamingRecorder('history.db', timeseries_interval=0)
+
+
+@use_tempdirs
+class CheckpointRecorderTest(unittest.TestCase):
+    def test_checkpoint(self):
+        prob = _build_problem(CheckpointRecorder('checkpoint.npz', interval=2))
+        prob.run_driver()
+        prob.cleanup()
+
+        checkpoint = read_checkpoint('checkpoint.npz')
+        self.assertGreater(checkpoint['iteration'], 0)
+        self.assertEqual(checkpoint['iteration'] % 2, 0)
+        self.assertEqual(list(checkpoint['design_vars']), ['x'])
+
+        # a new problem picks up the design and the model outputs of the checkpoint
+        resumed = _build_problem(CheckpointRecorder('resumed.npz'))
+        resumed.final_setup()
+        iteration = restore_checkpoint(resumed, 'checkpoint.npz')
+
+        self.assertEqual(iteration, checkpoint['iteration'])
+        assert_near_equal(resumed.get_val('x'), checkpoint['design_vars']['x'], tolerance=1e-12)
+        assert_near_equal(resumed.model._outputs.asarray(), checkpoint['outputs'], tolerance=1e-12)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            CheckpointRecorder('checkpoint.npz', interval=0)
+
+
+def _build_aviary_problem(optimizer='SLSQP', max_iter=3):
+    prob = AviaryProblem()
+    prob.load_inputs(
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        deepcopy(phase_info),
+    )
+    prob.check_and_preprocess_inputs()
+    prob.build_model()
+    prob.add_driver(optimizer, max_iter=max_iter)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+    return prob
+
+
+@use_tempdirs
+class ResumeAviaryProblemTest(unittest.TestCase):
+    def test_resume(self):
+        prob = _build_aviary_problem()
+        prob.run_aviary_problem(checkpoint_interval=1, make_plots=False)
+
+        checkpoint = read_checkpoint('aviary_checkpoint.npz')
+        self.assertGreater(checkpoint['iteration'], 0)
+
+        # The restart file is ignored when resuming from a checkpoint, otherwise the missing
+        # file would fail the run.
+        resumed = _build_aviary_problem()
+        stream = StringIO()
+        with redirect_stdout(stream):
+            resumed.run_aviary_problem(
+                restart_filename='missing_history.db',
+                checkpoint_interval=1,
+                resume=True,
+                make_plots=False,
+                verbosity=Verbosity.BRIEF,
+            )
+
+        self.assertIn(
+            f'Resuming optimization from iteration {checkpoint["iteration"]} saved in '
+            'aviary_checkpoint.npz.',
+            stream.getvalue(),
+        )
+
+    def test_resume_without_checkpoint(self):
+        prob = _build_aviary_problem(max_iter=0)
+
+        with self.assertWarnsRegex(UserWarning, 'No checkpoint found at aviary_checkpoint.npz'):
+            prob.run_aviary_problem(resume=True, make_plots=False, verbosity=Verbosity.QUIET)
+
+    @require_pyoptsparse(optimizer='IPOPT')
+    def test_resume_hot_start(self):
+        prob = _build_aviary_problem('IPOPT')
+        prob.run_aviary_problem(checkpoint_interval=1, make_plots=False)
+        self.assertTrue(Path('aviary_checkpoint.hst').is_file())
+
+        # The history of the first run is moved aside and replayed, and the resumed run writes a
+        # new history in its place.
+        resumed = _build_aviary_problem('IPOPT')
+        resumed.run_aviary_problem(checkpoint_interval=1, resume=True, make_plots=False)
+
+        self.assertEqual(resumed.driver.options['hotstart_file'], 'aviary_checkpoint_hotstart.hst')
+        self.assertTrue(Path('aviary_checkpoint_hotstart.hst').is_file())
+        self.assertTrue(Path('aviary_checkpoint.hst').is_file())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import csv
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.results_snapshot import (
+    results_snapshot_from_recorder,
+    take_results_snapshot,
+    write_mission_summary,
+    write_snapshot_reports,
+)
+
+
+def _build_problem():
+    prob = om.Problem()
+    model = prob.model
+    model.mission_info = {'climb': {}, 'cruise': {}}
+    prob.problem_type = None
+
+    totals = model.add_subsystem('totals', om.IndepVarComp(), promotes=['*'])
+    totals.add_output('mission:fuel_mass', 10000.0, units='lbm')
+    totals.add_output('aircraft:fuel:total_capacity', 25000.0, units='lbm')
+    totals.add_output('mission:constraints:excess_fuel_mass_capacity', 0.0, units='lbm')
+
+    traj = model.add_subsystem('traj', om.Group())
+    for phase, t0, m0 in (('climb', 0.0, 80000.0), ('cruise', 600.0, 79000.0)):
+        ts = traj.add_subsystem(phase, om.Group()).add_subsystem('timeseries', om.IndepVarComp())
+        ts.add_output('time', t0 + np.array([0.0, 300.0, 600.0]), units='s')
+        ts.add_output('mass', m0 - np.array([0.0, 500.0, 1000.0]), units='lbm')
+        ts.add_output('distance', t0 * 100.0 + np.array([0.0, 3e4, 6e4]), units='m')
+
+    recorder = om.SqliteRecorder('problem_history.db')
+    prob.add_recorder(recorder)
+
+    prob.setup()
+    prob.run_driver()
+    prob.record('final')
+    prob.cleanup()
+
+    return prob
+
+
+@use_tempdirs
+class ResultsSnapshotTest(unittest.TestCase):
+    def _check_reports(self, snapshot, reports_dir, executor=None):
+        futures = write_snapshot_reports(snapshot, reports_dir, executor=executor)
+        for future in futures.values():
+            future.result()
+
+        with open(f'{reports_dir}/mission_timeseries_data.csv') as f:
+            header = next(csv.reader(f))
+        self.assertEqual(header, ['time (s)', 'distance (m)', 'mass (lbm)'])
+
+        with open(f'{reports_dir}/mission_summary.md') as f:
+            summary = f.read()
+        self.assertIn('| Total Fuel Burn | 10000.0 | lbm |', summary)
+        self.assertIn('## cruise', summary)
+        self.assertIn('| Total Time | 20.0 | min |', summary)
+
+    def test_snapshot_reports(self):
+        prob = _build_problem()
+        snapshot = take_results_snapshot(prob)
+
+        self.assertEqual(snapshot.missions, {prob._name: ['climb', 'cruise']})
+        self.assertIsNotNone(snapshot.run_status)
+
+        # the snapshot does not share data with the model
+        prob.set_val('traj.climb.timeseries.mass', np.zeros(3))
+        table, _ = snapshot.get_mission_tables()[prob._name]
+        assert_near_equal(table['mass'].to_numpy()[:3], [80000.0, 79500.0, 79000.0])
+
+        with ThreadPoolExecutor() as executor:
+            self._check_reports(snapshot, 'live_reports', executor=executor)
+
+    def test_recorder_snapshot(self):
+        prob = _build_problem()
+        snapshot = results_snapshot_from_recorder('problem_history.db', name=prob._name)
+
+        self.assertEqual(snapshot.missions, {prob._name: ['climb', 'cruise']})
+        self.assertIsNone(snapshot.run_status)
+
+        self._check_reports(snapshot, 'offline_reports')
+
+        live_table, _ = take_results_snapshot(prob).get_mission_tables()[prob._name]
+        table, units = snapshot.get_mission_tables()[prob._name]
+        self.assertEqual(units, {'time': 's', 'distance': 'm', 'mass': 'lbm'})
+        np.testing.assert_array_equal(table['distance'], live_table['distance'])
+
+        with self.assertRaises(FileNotFoundError):
+            results_snapshot_from_recorder('missing_history.db')
+
+    def test_mission_without_timeseries(self):
+        prob = _build_problem()
+        snapshot = take_results_snapshot(prob)
+        snapshot.missions['other'] = ['climb']
+
+        # the mission without a timeseries is left out of the summary
+        write_mission_summary(snapshot, '.')
+
+        with open('mission_summary.md') as f:
+            summary = f.read()
+        self.assertIn('| Total Fuel Burn | 10000.0 | lbm |', summary)
+        self.assertEqual(summary.count('# MISSION SUMMARY'), 1)
+
+    def test_unknown_report(self):
+        snapshot = take_results_snapshot(_build_problem())
+
+        with self.assertRaises(ValueError):
+            write_snapshot_reports(snapshot, 'reports', reports=['n2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,6 +59,37 @@ class TestSizingResults(unittest.TestCase):
             'interface/test/sizing_results_for_test.json',
         )
 
+    @require_pyoptsparse(optimizer='SLSQP')
+    def test_save_snapshot(self):
+        local_phase_info = deepcopy(phase_info)
+
+        prob = av.AviaryProblem()
+        prob.load_inputs(
+            'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+            local_phase_info,
+        )
+        prob.check_and_preprocess_inputs()
+        prob.build_model()
+        prob.add_driver('SLSQP', max_iter=0)
+        prob.add_design_variables()
+        prob.add_objective()
+        prob.setup()
+        prob.set_initial_guesses()
+        prob.run_aviary_problem()
+        prob.save_snapshot('sizing_snapshot.avsnap')
+
+        new_prob = reload_aviary_problem('sizing_snapshot.avsnap')
+
+        self.assertEqual(len(new_prob.aviary_inputs), len(prob.aviary_inputs))
+        for name, (val, units) in prob.aviary_inputs:
+            self.assertEqual(repr(new_prob.aviary_inputs.get_val(name, units)), repr(val))
+
+        design_vars = prob.model.get_design_vars(get_sizes=False, use_prom_ivc=True)
+        for meta in design_vars.values():
+            assert_near_equal(
+                new_prob.get_val(meta['source']), prob.get_val(meta['source']), tolerance=1e-12
+            )
+
     @require_pyoptsparse(optimizer='IPOPT')
     def test_off_design_min_fuel(self):
         local_phase_info = deepcopy(phase_info)
@@ -75,6 +106,21 @@ class TestSizingResults(unittest.TestCase):
             problem_type='off_design_max_range', phase_info=local_phase_info
         )
 
+    @require_pyoptsparse(optimizer='IPOPT')
+    def test_off_design_keeps_design_inputs(self):
+        local_phase_info = deepcopy(phase_info)
+
+        prob = reload_aviary_problem('interface/test/sizing_results_for_test.json')
+        design_inputs = prob.aviary_inputs.deepcopy()
+
+        # the off-design inputs share values with the sized aircraft, so overriding and
+        # preprocessing them must not change the sized aircraft's inputs
+        prob.run_off_design_mission(problem_type='off_design_min_fuel', phase_info=local_phase_info)
+
+        self.assertEqual(len(prob.aviary_inputs), len(design_inputs))
+        for name, (val, units) in design_inputs:
+            self.assertEqual(repr(prob.aviary_inputs.get_val(name, units)), repr(val))
+
     def compare_files(self, test_file, validation_file):
         """
         Compares the specified file with a validation file.
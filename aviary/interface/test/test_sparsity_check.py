@@ -0,0 +1,120 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.sparsity_check import check_partial_sparsity
+
+
+class DenseDiagonalComp(om.ExplicitComponent):
+    """Elementwise function that declares dense partials."""
+
+    def setup(self):
+        self.add_input('x', np.ones(4))
+        self.add_output('y', np.ones(4))
+
+        self.declare_partials('y', 'x')
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = inputs['x'] ** 2
+
+    def compute_partials(self, inputs, partials):
+        partials['y', 'x'] = np.diag(2.0 * inputs['x'])
+
+
+class SparseDiagonalComp(om.ExplicitComponent):
+    """Elementwise function that declares only the diagonal."""
+
+    def setup(self):
+        self.add_input('x', np.ones(4))
+        self.add_output('y', np.ones(4))
+
+        ar = np.arange(4)
+        self.declare_partials('y', 'x', rows=ar, cols=ar)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 3.0 * inputs['x']
+
+    def compute_partials(self, inputs, partials):
+        partials['y', 'x'] = 3.0
+
+
+class UndeclaredComp(om.ExplicitComponent):
+    """Sum that depends on an input without declaring it."""
+
+    def setup(self):
+        self.add_input('a', 1.0)
+        self.add_input('b', 1.0)
+        self.add_output('c', 1.0)
+
+        self.declare_partials('c', 'a', val=1.0)
+
+    def compute(self, inputs, outputs):
+        outputs['c'] = inputs['a'] + inputs['b']
+
+
+@use_tempdirs
+class SparsityCheckTest(unittest.TestCase):
+    def setUp(self):
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output('x', np.arange(1.0, 5.0))
+        ivc.add_output('b', 2.0)
+
+        model.add_subsystem('dense', DenseDiagonalComp())
+        model.add_subsystem('sparse', SparseDiagonalComp())
+        model.add_subsystem('undeclared', UndeclaredComp())
+        model.connect('x', ['dense.x', 'sparse.x'])
+        model.connect('dense.y', 'undeclared.a', src_indices=[0])
+        model.connect('b', 'undeclared.b')
+
+        prob.setup(force_alloc_complex=True)
+
+        self.prob = prob
+
+    def test_report(self):
+        for method in ('fd', 'cs'):
+            with self.subTest(method=method):
+                stream = StringIO()
+                report = check_partial_sparsity(
+                    self.prob, method=method, excludes=['ivc'], out_stream=stream
+                )
+
+                entries = {entry['pathname']: entry for entry in report}
+                self.assertEqual(set(entries), {'dense', 'sparse', 'undeclared'})
+
+                # the dense diagonal wastes the off-diagonal entries and is ranked first
+                dense = entries['dense']
+                self.assertEqual(report[0]['pathname'], 'dense')
+                self.assertEqual(dense['declared'], 16)
+                self.assertEqual(dense['nonzero'], 4)
+                self.assertEqual(dense['wasted'], 12)
+                self.assertEqual(dense['calls'], 1)
+                self.assertEqual(dense['score'], 12)
+                self.assertEqual(dense['pairs'], [('y', 'x', 16, 4)])
+
+                sparse = entries['sparse']
+                self.assertEqual(sparse['declared'], 4)
+                self.assertEqual(sparse['wasted'], 0)
+
+                undeclared = entries['undeclared']
+                self.assertEqual(undeclared['wasted'], 0)
+                self.assertEqual(undeclared['undeclared'], 1)
+
+                self.assertIn('12 of 21 declared entries are zero', stream.getvalue())
+
+    def test_includes(self):
+        report = check_partial_sparsity(self.prob, includes=['sp*'], out_stream=None)
+
+        self.assertEqual([entry['pathname'] for entry in report], ['sparse'])
+
+        with self.assertRaises(ValueError):
+            check_partial_sparsity(self.prob, method='exact', out_stream=None)
+
+
+if __name__ == '__main__':
+    unittest.main()
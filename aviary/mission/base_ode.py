@@ -1,5 +1,6 @@
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import promote_aircraft_and_mission_vars
@@ -98,7 +99,8 @@ class BaseODE(om.Group):
             else:
                 subsystem_options = {}
 
-            subsystem_mission = subsystem.build_mission(
+            subsystem_mission = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
@@ -0,0 +1,269 @@
+"""
+Setup-time memoization of the mission systems built by subsystem builders.
+
+Every ODE asks each of its subsystem builders for a mission system, so a model with many phases,
+or several missions, builds the same system over and over. While a MissionBuildCache is active,
+the first system built for a given builder, num_nodes, set of options and aviary inputs is kept as
+an un-setup template, and later requests receive a copy of that template instead of repeating the
+builder's construction work.
+"""
+
+import copy
+import inspect
+from contextlib import contextmanager
+from enum import Enum
+
+import numpy as np
+
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.variable_meta_data import CoreMetaData
+
+# cache used by build_mission_system, set by the mission_build_cache context manager
+_ACTIVE_CACHE = None
+
+# marks cache entries whose system could not be copied, so the builder is always called
+_NOT_COPYABLE = object()
+
+
+class _Unhashable(Exception):
+    """Raised when a value cannot be converted into a cache key."""
+
+
+def _freeze(value):
+    """
+    Convert a value into a hashable key that compares equal for equal contents.
+
+    Parameters
+    ----------
+    value : object
+        Value to convert. Containers, NamedValues, numpy arrays, enums, types, functions and
+        scalars are supported.
+
+    Returns
+    -------
+    object
+        Hashable representation of value.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, Enum)):
+        return value
+
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, NamedValues):
+        return (
+            'NamedValues',
+            tuple(sorted((key, _freeze(val), units) for key, (val, units) in value)),
+        )
+
+    if isinstance(value, dict):
+        items = ((_freeze(key), _freeze(val)) for key, val in value.items())
+        return ('dict', tuple(sorted(items, key=repr)))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(val) for val in value))
+
+    if isinstance(value, (set, frozenset)):
+        return ('set', frozenset(_freeze(val) for val in value))
+
+    if isinstance(value, type) or inspect.isroutine(value):
+        # classes and functions compare by identity, which is what the builder would see
+        return value
+
+    raise _Unhashable(type(value).__name__)
+
+
+def _shared_memo(subsystem, aviary_inputs):
+    """Return a deepcopy memo that shares the objects common to every copy of a system."""
+    shared = (subsystem, subsystem.meta_data, CoreMetaData, aviary_inputs)
+    return {id(obj): obj for obj in shared}
+
+
+class MissionBuildCache:
+    """
+    Memo of the mission systems built by subsystem builders during setup.
+
+    Systems are keyed by builder class, name and state, num_nodes, user_options,
+    subsystem_options and the contents of aviary_inputs. Builders and aviary inputs are assumed
+    not to change while the cache is active, so their keys are computed once per object.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requests served by copying a cached system.
+    misses : int
+        Number of requests that called the builder.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = {}
+        # object keys by id; the object is kept so its id cannot be reused while cached
+        self._object_keys = {}
+
+    def _object_key(self, obj, key_func):
+        if id(obj) not in self._object_keys:
+            try:
+                key = key_func(obj)
+            except _Unhashable:
+                key = ('id', id(obj))
+
+            self._object_keys[id(obj)] = (obj, key)
+
+        return self._object_keys[id(obj)][1]
+
+    def _builder_key(self, builder):
+        state = dict(getattr(builder, '__dict__', {}))
+        for cls in type(builder).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if name not in ('meta_data', '__dict__', '__weakref__') and hasattr(builder, name):
+                    state[name] = getattr(builder, name)
+        state.pop('meta_data', None)
+
+        # metadata is large and never modified by builders, so it is compared by identity
+        return (type(builder), builder.name, _freeze(state), id(builder.meta_data))
+
+    def build(self, subsystem, num_nodes, aviary_inputs, user_options, subsystem_options):
+        """
+        Return the mission system for a subsystem, copying a cached system when possible.
+
+        Parameters
+        ----------
+        subsystem : SubsystemBuilder
+            Builder of the mission system.
+        num_nodes : int
+            Number of nodes in the ODE.
+        aviary_inputs : AviaryValues
+            Aircraft and mission options passed to the builder.
+        user_options : dict
+            Phase options passed to the builder.
+        subsystem_options : dict
+            Options specific to this subsystem passed to the builder.
+
+        Returns
+        -------
+        System or None
+            The mission system, or None if the builder does not add one to the mission.
+        """
+        try:
+            key = (
+                self._object_key(subsystem, self._builder_key),
+                num_nodes,
+                _freeze(user_options),
+                _freeze(subsystem_options),
+                self._object_key(aviary_inputs, _freeze),
+            )
+        except _Unhashable:
+            key = None
+
+        entry = self._entries.get(key) if key is not None else None
+
+        if entry is not None and entry[0] is not _NOT_COPYABLE:
+            template, template_builder, template_inputs = entry
+            if template is None:
+                self.hits += 1
+                return None
+
+            # share the builder and aviary inputs of this request rather than copying the ones
+            # the template was built with
+            memo = _shared_memo(subsystem, aviary_inputs)
+            memo[id(template_builder)] = subsystem
+            memo[id(template_inputs)] = aviary_inputs
+
+            try:
+                system = copy.deepcopy(template, memo)
+            except Exception:
+                self._entries[key] = (_NOT_COPYABLE, None, None)
+            else:
+                self.hits += 1
+                return system
+
+        self.misses += 1
+
+        system = subsystem.build_mission(
+            num_nodes=num_nodes,
+            aviary_inputs=aviary_inputs,
+            user_options=user_options,
+            subsystem_options=subsystem_options,
+        )
+
+        if key is not None and key not in self._entries:
+            # keep a pristine copy as the template, since the returned system is about to be set up
+            template = system
+            if system is not None:
+                memo = _shared_memo(subsystem, aviary_inputs)
+                try:
+                    template = copy.deepcopy(system, memo)
+                except Exception:
+                    template = _NOT_COPYABLE
+
+            self._entries[key] = (template, subsystem, aviary_inputs)
+
+        return system
+
+
+@contextmanager
+def mission_build_cache(cache=None):
+    """
+    Activate a MissionBuildCache for the mission systems built inside this context.
+
+    Parameters
+    ----------
+    cache : MissionBuildCache, optional
+        Cache to activate. A new, empty cache is used if not provided.
+
+    Yields
+    ------
+    MissionBuildCache
+        The active cache.
+    """
+    global _ACTIVE_CACHE
+
+    if cache is None:
+        cache = MissionBuildCache()
+
+    previous = _ACTIVE_CACHE
+    _ACTIVE_CACHE = cache
+
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE = previous
+
+
+def build_mission_system(subsystem, num_nodes, aviary_inputs, user_options, subsystem_options):
+    """
+    Build the mission system of a subsystem, using the active MissionBuildCache if there is one.
+
+    Parameters
+    ----------
+    subsystem : SubsystemBuilder
+        Builder of the mission system.
+    num_nodes : int
+        Number of nodes in the ODE.
+    aviary_inputs : AviaryValues
+        Aircraft and mission options passed to the builder.
+    user_options : dict
+        Phase options passed to the builder.
+    subsystem_options : dict
+        Options specific to this subsystem passed to the builder.
+
+    Returns
+    -------
+    System or None
+        The mission system, or None if the builder does not add one to the mission.
+    """
+    if _ACTIVE_CACHE is None:
+        return subsystem.build_mission(
+            num_nodes=num_nodes,
+            aviary_inputs=aviary_inputs,
+            user_options=user_options,
+            subsystem_options=subsystem_options,
+        )
+
+    return _ACTIVE_CACHE.build(subsystem, num_nodes, aviary_inputs, user_options, subsystem_options)
@@ -394,11 +394,25 @@ class FlightPhaseBase(PhaseBuilder):
 
         return phase
 
-    def make_default_transcription(self):
-        """Return a transcription object to be used by default in build_phase."""
+    def make_default_transcription(self, num_segments=None):
+        """
+        Return a transcription object to be used by default in build_phase.
+
+        Parameters
+        ----------
+        num_segments : int, optional
+            Number of segments in the transcription. Defaults to the 'num_segments' user option.
+            Used to rebuild the phase on a coarser grid during grid refinement.
+
+        Returns
+        -------
+        TranscriptionBase
+            The dymos transcription for this phase.
+        """
         user_options = self.user_options
 
-        num_segments = user_options['num_segments']
+        if num_segments is None:
+            num_segments = user_options['num_segments']
         order = user_options['order']
 
         transcription_type = user_options['transcription']
@@ -0,0 +1,171 @@
+"""
+Assignment of MPI processes to the phases of a trajectory that runs its phases in parallel.
+
+Without guidance, OpenMDAO splits the processes of a ParallelGroup between its subsystems by count,
+so a rank that holds a long cruise phase with many nodes can keep the ranks holding short takeoff
+phases waiting. Here, each phase is given a cost, either estimated from the phase and its
+subsystems or measured in a profiling run, and the phases are spread over the processes so that
+every process has a similar amount of work.
+"""
+
+import heapq
+from time import perf_counter
+
+from aviary.variable_info.enums import ProblemType
+
+# relative cost of a subsystem that has to be converged by a solver inside the ODE
+_SOLVER_SUBSYSTEM_COST = 3.0
+
+
+def _get_num_nodes(phase, user_options):
+    """Return the number of nodes of a phase, from its transcription if possible."""
+    transcription = phase.options['transcription']
+    grid_data = getattr(transcription, 'grid_data', None)
+    if grid_data is not None:
+        return grid_data.num_nodes
+
+    num_segments = user_options.get('num_segments')
+    order = user_options.get('order')
+    if num_segments and order:
+        return num_segments * order
+
+    return 1
+
+
+def estimate_phase_cost(phase, phase_info, subsystems, aviary_inputs):
+    """
+    Estimate the relative cost of evaluating one phase of the mission.
+
+    The cost grows with the number of nodes and the number of subsystems in the ODE. Subsystems
+    that need a solver in the mission count more, and so do phases that converge their distance
+    with solve segments.
+
+    Parameters
+    ----------
+    phase : dymos.Phase
+        The phase, with its transcription set.
+    phase_info : dict
+        Entry of the phase in the mission info, with its 'user_options' and 'subsystem_options'.
+    subsystems : list of SubsystemBuilder
+        Subsystems added to the ODE of the phase.
+    aviary_inputs : AviaryValues
+        Aircraft and mission inputs.
+
+    Returns
+    -------
+    float
+        Estimated cost, only meaningful relative to the cost of other phases.
+    """
+    user_options = phase_info.get('user_options', {})
+    all_subsystem_options = phase_info.get('subsystem_options', {})
+
+    subsystem_cost = 1.0
+    for subsystem in subsystems:
+        needs_solver = subsystem.needs_mission_solver(
+            aviary_inputs=aviary_inputs,
+            user_options=user_options,
+            subsystem_options=all_subsystem_options.get(subsystem.name, {}),
+        )
+        subsystem_cost += _SOLVER_SUBSYSTEM_COST if needs_solver else 1.0
+
+    cost = _get_num_nodes(phase, user_options) * subsystem_cost
+
+    if user_options.get('distance_solve_segments'):
+        cost *= 2.0
+
+    return cost
+
+
+def balance_phase_procs(phase_costs, num_procs):
+    """
+    Return the arguments that spread the phases of a ParallelGroup evenly over the processes.
+
+    When there are at least as many processes as phases, every phase gets its own processes and
+    the spare processes go to the most expensive phases. Otherwise, the phases are packed onto the
+    processes longest first, each phase going to the least loaded process, and the phases that
+    share a process are put in the same OpenMDAO processor group.
+
+    Parameters
+    ----------
+    phase_costs : dict
+        Relative cost of each phase, keyed by phase name.
+    num_procs : int
+        Number of processes available to the phases.
+
+    Returns
+    -------
+    dict
+        Keyword arguments of ``add_subsystem`` (``min_procs``, ``max_procs``, ``proc_weight`` and
+        ``proc_group``) for each phase, keyed by phase name. Empty when running on one process.
+    """
+    if num_procs <= 1 or not phase_costs:
+        return {}
+
+    if num_procs >= len(phase_costs):
+        return {
+            name: {'min_procs': 1, 'max_procs': None, 'proc_weight': float(cost)}
+            for name, cost in phase_costs.items()
+        }
+
+    loads = [(0.0, i, []) for i in range(num_procs)]
+    for name in sorted(phase_costs, key=lambda name: -phase_costs[name]):
+        load, i, names = heapq.heappop(loads)
+        names.append(name)
+        heapq.heappush(loads, (load + phase_costs[name], i, names))
+
+    # every system in a processor group must request the same processes
+    proc_kwargs = {}
+    for load, i, names in loads:
+        for name in names:
+            proc_kwargs[name] = {
+                'min_procs': 1,
+                'max_procs': 1,
+                'proc_weight': float(load),
+                'proc_group': f'phase_procs_{i}',
+            }
+
+    return proc_kwargs
+
+
+def profile_phase_costs(prob, repeats=3):
+    """
+    Measure the cost of each phase of a problem that has been set up in serial.
+
+    Each phase is evaluated and linearized ``repeats`` times after a first run of the model, and
+    the mean wall time is returned. The result can be passed as ``phase_costs`` to
+    ``AviaryProblem.add_phases`` when building the same problem to run under MPI.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        A problem on which setup has been called.
+    repeats : int, optional
+        Number of times each phase is evaluated. Defaults to 3.
+
+    Returns
+    -------
+    dict
+        Mean time in seconds of each phase, keyed by phase name. For multi-mission problems, a
+        dictionary of these for each mission, keyed by mission name.
+    """
+    prob.run_model()
+
+    if prob.problem_type == ProblemType.MULTI_MISSION:
+        return {
+            name: _profile_group(group, repeats) for name, group in prob.aviary_groups_dict.items()
+        }
+
+    return _profile_group(prob.model, repeats)
+
+
+def _profile_group(group, repeats):
+    """Return the mean time needed to evaluate and linearize each phase of an AviaryGroup."""
+    costs = {}
+    for name, phase in group.traj._phases.items():
+        start = perf_counter()
+        for _ in range(repeats):
+            phase.run_solve_nonlinear()
+            phase.run_linearize()
+        costs[name] = (perf_counter() - start) / repeats
+
+    return costs
@@ -0,0 +1,250 @@
+"""
+Analytic mission used to size an aircraft without a trajectory optimization.
+
+The mission is split into segments: climb and descent each burn a fixed fraction of the aircraft
+mass, while cruise is integrated with the Breguet range equation at a few mass nodes, using the fuel
+flow and drag from the aircraft's own propulsion and aerodynamics subsystems at constant Mach and
+altitude. The cruise end mass is solved so that the mission flies the design range.
+"""
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.mission.energy_state.ode.energy_state_ODE import EnergyStateODE
+from aviary.mission.two_dof.ode.breguet_cruise_eom import RangeComp
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+
+class QuickSizingMission(om.Group):
+    """
+    Fixed-fraction climb and descent around a Breguet cruise that flies the design range.
+
+    Promotes Mission.GROSS_MASS and Aircraft.Design.RANGE as inputs, and Mission.RANGE,
+    Mission.FINAL_MASS, Mission.FUEL_MASS and Mission.TOTAL_RESERVE_FUEL_MASS as outputs.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', default=5, types=int, desc='number of mass nodes in the cruise segment'
+        )
+        self.options.declare(
+            'aviary_options',
+            types=AviaryValues,
+            desc='collection of Aircraft/Mission specific options',
+        )
+        self.options.declare(
+            'subsystems',
+            desc='list of subsystem builder instances to be added to the cruise ODE',
+        )
+        self.options.declare(
+            'subsystem_options',
+            types=dict,
+            default={},
+            desc='dictionary of optional arguments for the subsystems in the cruise ODE',
+        )
+        self.options.declare(
+            'meta_data',
+            default=CoreMetaData,
+            desc='metadata associated with the variables to be passed into the ODE',
+        )
+        self.options.declare('cruise_mach', types=float, desc='cruise Mach number')
+        self.options.declare(
+            'cruise_altitude', types=tuple, desc='cruise altitude, as a (value, units) tuple'
+        )
+        self.options.declare(
+            'climb_fuel_fraction',
+            default=0.02,
+            types=float,
+            desc='fraction of the gross mass burned in taxi, takeoff and climb',
+        )
+        self.options.declare(
+            'descent_fuel_fraction',
+            default=0.01,
+            types=float,
+            desc='fraction of the mass at the end of cruise burned in descent and landing',
+        )
+        self.options.declare(
+            'climb_range',
+            default=(0.0, 'NM'),
+            types=tuple,
+            desc='distance covered in climb, as a (value, units) tuple',
+        )
+        self.options.declare(
+            'descent_range',
+            default=(0.0, 'NM'),
+            types=tuple,
+            desc='distance covered in descent, as a (value, units) tuple',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        aviary_options = self.options['aviary_options']
+        gross_mass = aviary_options.get_val(Aircraft.Design.GROSS_MASS, 'lbm')
+        altitude, altitude_units = self.options['cruise_altitude']
+        climb_range, climb_range_units = self.options['climb_range']
+        descent_range, descent_range_units = self.options['descent_range']
+
+        cruise_conditions = om.IndepVarComp()
+        cruise_conditions.add_output(
+            Dynamic.Atmosphere.MACH, val=self.options['cruise_mach'] * np.ones(nn), units='unitless'
+        )
+        cruise_conditions.add_output(
+            Dynamic.Mission.ALTITUDE, val=altitude * np.ones(nn), units=altitude_units
+        )
+        cruise_conditions.add_output(Dynamic.Mission.ALTITUDE_RATE, val=np.zeros(nn), units='ft/s')
+        cruise_conditions.add_output(Dynamic.Atmosphere.MACH_RATE, val=np.zeros(nn), units='1/s')
+
+        self.add_subsystem('cruise_conditions', cruise_conditions, promotes_outputs=['*'])
+
+        self.add_subsystem(
+            'climb',
+            om.ExecComp(
+                'cruise_initial_mass = gross_mass * (1.0 - climb_fuel_fraction)',
+                cruise_initial_mass={'units': 'lbm', 'val': gross_mass},
+                gross_mass={'units': 'lbm', 'val': gross_mass},
+                climb_fuel_fraction={
+                    'units': 'unitless',
+                    'val': self.options['climb_fuel_fraction'],
+                },
+            ),
+            promotes_inputs=[('gross_mass', Mission.GROSS_MASS)],
+            promotes_outputs=['cruise_initial_mass'],
+        )
+
+        # mass falls linearly with node index, which only sets where the ODE is evaluated
+        self.add_subsystem(
+            'cruise_mass',
+            om.ExecComp(
+                'mass = initial_mass + (final_mass - initial_mass) * eta',
+                mass={'units': 'lbm', 'shape': nn},
+                initial_mass={'units': 'lbm', 'val': gross_mass},
+                final_mass={'units': 'lbm', 'val': gross_mass},
+                eta={'units': 'unitless', 'val': np.linspace(0.0, 1.0, nn)},
+            ),
+            promotes_inputs=[
+                ('initial_mass', 'cruise_initial_mass'),
+                ('final_mass', 'cruise_final_mass'),
+            ],
+            promotes_outputs=[('mass', Dynamic.Vehicle.MASS)],
+        )
+
+        self.add_subsystem(
+            'cruise',
+            EnergyStateODE(
+                num_nodes=nn,
+                aviary_options=aviary_options,
+                subsystems=self.options['subsystems'],
+                subsystem_options=self.options['subsystem_options'],
+                meta_data=self.options['meta_data'],
+            ),
+            promotes_inputs=[
+                'aircraft:*',
+                'mission:*',
+                Dynamic.Atmosphere.MACH,
+                Dynamic.Mission.ALTITUDE,
+                Dynamic.Mission.ALTITUDE_RATE,
+                Dynamic.Atmosphere.MACH_RATE,
+                Dynamic.Vehicle.MASS,
+            ],
+            promotes_outputs=[
+                Dynamic.Mission.VELOCITY,
+                Dynamic.Vehicle.Propulsion.FUEL_MASS_FLOW_RATE_NEGATIVE_TOTAL,
+            ],
+        )
+
+        self.add_subsystem(
+            'breguet_eom',
+            RangeComp(num_nodes=nn),
+            promotes_inputs=[
+                ('mass', Dynamic.Vehicle.MASS),
+                Dynamic.Vehicle.Propulsion.FUEL_MASS_FLOW_RATE_NEGATIVE_TOTAL,
+                ('TAS_cruise', Dynamic.Mission.VELOCITY),
+            ],
+        )
+
+        self.add_subsystem(
+            'mission_range',
+            om.ExecComp(
+                'range = climb_range + cruise_range + descent_range',
+                range={'units': 'NM'},
+                climb_range={'units': climb_range_units, 'val': climb_range},
+                cruise_range={'units': 'NM'},
+                descent_range={'units': descent_range_units, 'val': descent_range},
+            ),
+            promotes_outputs=[('range', Mission.RANGE)],
+        )
+        self.connect('breguet_eom.cruise_range', 'mission_range.cruise_range', src_indices=[-1])
+
+        self.add_subsystem(
+            'range_balance',
+            om.BalanceComp(
+                name='cruise_final_mass',
+                val=0.8 * gross_mass,
+                units='lbm',
+                lhs_name=Mission.RANGE,
+                rhs_name=Aircraft.Design.RANGE,
+                eq_units='NM',
+                lower=0.0,
+            ),
+            promotes_inputs=[Mission.RANGE, Aircraft.Design.RANGE],
+            promotes_outputs=['cruise_final_mass'],
+        )
+
+        self.add_subsystem(
+            'descent',
+            om.ExecComp(
+                'final_mass = cruise_final_mass * (1.0 - descent_fuel_fraction)',
+                final_mass={'units': 'lbm'},
+                cruise_final_mass={'units': 'lbm'},
+                descent_fuel_fraction={
+                    'units': 'unitless',
+                    'val': self.options['descent_fuel_fraction'],
+                },
+            ),
+            promotes_inputs=['cruise_final_mass'],
+            promotes_outputs=[('final_mass', Mission.FINAL_MASS)],
+        )
+
+        reserve_fuel_margin = aviary_options.get_val(Mission.RESERVE_FUEL_MARGIN, 'unitless')
+        reserve_fuel_mass_additional = aviary_options.get_val(
+            Mission.RESERVE_FUEL_MASS_ADDITIONAL, 'lbm'
+        )
+
+        self.add_subsystem(
+            'fuel_burned',
+            om.ExecComp(
+                [
+                    'fuel_mass = initial_mass - final_mass',
+                    'reserve_fuel_mass = reserve_fuel_margin / 100 * (initial_mass - final_mass)'
+                    ' + reserve_fuel_mass_additional',
+                ],
+                fuel_mass={'units': 'lbm'},
+                reserve_fuel_mass={'units': 'lbm'},
+                initial_mass={'units': 'lbm'},
+                final_mass={'units': 'lbm'},
+                reserve_fuel_margin={'units': 'unitless', 'val': reserve_fuel_margin},
+                reserve_fuel_mass_additional={'units': 'lbm', 'val': reserve_fuel_mass_additional},
+            ),
+            promotes_inputs=[
+                ('initial_mass', Mission.GROSS_MASS),
+                ('final_mass', Mission.FINAL_MASS),
+                ('reserve_fuel_margin', Mission.RESERVE_FUEL_MARGIN),
+                ('reserve_fuel_mass_additional', Mission.RESERVE_FUEL_MASS_ADDITIONAL),
+            ],
+            promotes_outputs=[
+                ('fuel_mass', Mission.FUEL_MASS),
+                ('reserve_fuel_mass', Mission.TOTAL_RESERVE_FUEL_MASS),
+            ],
+        )
+
+        self.nonlinear_solver = om.NewtonSolver(
+            solve_subsystems=True,
+            maxiter=20,
+            atol=1e-10,
+            rtol=1e-10,
+            err_on_non_converge=True,
+        )
+        self.nonlinear_solver.linesearch = om.BoundsEnforceLS()
+        self.linear_solver = om.DirectSolver()
@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.solved_two_dof.ode.unsteady_solved_eom import UnsteadySolvedEOM
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Dynamic
@@ -69,7 +70,8 @@ class UnsteadyControlIterGroup(om.Group):
             if subsystem.name in subsystem_options:
                 kwargs.update(subsystem_options[subsystem.name])
 
-            system = subsystem.build_mission(
+            system = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
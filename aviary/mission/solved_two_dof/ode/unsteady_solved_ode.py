@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.two_dof.ode.two_dof_ode import TwoDOFODE
 from aviary.mission.solved_two_dof.ode.gamma_comp import GammaComp
 from aviary.mission.solved_two_dof.ode.unsteady_solved_eom import UnsteadySolvedEOM
@@ -163,7 +164,8 @@ class UnsteadySolvedODE(TwoDOFODE):
             # check if subsystem_options has entry for a subsystem of this name
             if subsystem.name in subsystem_options:
                 kwargs.update(subsystem_options[subsystem.name])
-            system = subsystem.build_mission(
+            system = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
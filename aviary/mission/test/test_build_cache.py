@@ -0,0 +1,104 @@
+"""Test reuse of subsystem mission systems between ODEs."""
+
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.mission.base_ode import BaseODE
+from aviary.mission.build_cache import mission_build_cache
+from aviary.subsystems.subsystem_builder import SubsystemBuilder
+from aviary.utils.aviary_values import AviaryValues
+
+
+class CountingBuilder(SubsystemBuilder):
+    """Builder that counts how many mission systems it has built."""
+
+    def __init__(self, name='counter', factor=2.0):
+        super().__init__(name)
+        self.factor = factor
+        self.num_builds = 0
+
+    def build_mission(self, num_nodes, aviary_inputs, **kwargs):
+        self.num_builds += 1
+        return om.ExecComp(f'y = {self.factor} * x', x={'shape': num_nodes}, y={'shape': num_nodes})
+
+
+class SimpleODE(BaseODE):
+    def setup(self):
+        self.add_subsystems()
+
+
+def build_problem(builder, num_nodes, aviary_options):
+    prob = om.Problem()
+
+    for i, nn in enumerate(num_nodes):
+        prob.model.add_subsystem(
+            f'ode{i}',
+            SimpleODE(num_nodes=nn, subsystems=[builder], aviary_options=aviary_options),
+        )
+
+    return prob
+
+
+@use_tempdirs
+class MissionBuildCacheTest(unittest.TestCase):
+    def test_reuse(self):
+        builder = CountingBuilder()
+        aviary_options = AviaryValues()
+
+        prob = build_problem(builder, [3, 3, 4], aviary_options)
+
+        with mission_build_cache() as cache:
+            prob.setup()
+
+        # the two ODEs with three nodes share one build
+        self.assertEqual(builder.num_builds, 2)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 1)
+
+        for i, nn in enumerate([3, 3, 4]):
+            prob.set_val(f'ode{i}.x', np.arange(nn) + i)
+
+        prob.run_model()
+
+        for i, nn in enumerate([3, 3, 4]):
+            assert_near_equal(prob.get_val(f'ode{i}.y'), 2.0 * (np.arange(nn) + i))
+
+    def test_builder_state(self):
+        # builders of the same class and name with different state are not shared
+        builders = [CountingBuilder(factor=2.0), CountingBuilder(factor=3.0)]
+        aviary_options = AviaryValues()
+
+        prob = om.Problem()
+        for i, builder in enumerate(builders):
+            prob.model.add_subsystem(
+                f'ode{i}',
+                SimpleODE(num_nodes=2, subsystems=[builder], aviary_options=aviary_options),
+            )
+
+        with mission_build_cache() as cache:
+            prob.setup()
+
+        self.assertEqual(cache.hits, 0)
+
+        prob.set_val('ode0.x', [1.0, 2.0])
+        prob.set_val('ode1.x', [1.0, 2.0])
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('ode0.y'), [2.0, 4.0])
+        assert_near_equal(prob.get_val('ode1.y'), [3.0, 6.0])
+
+    def test_no_cache(self):
+        builder = CountingBuilder()
+
+        prob = build_problem(builder, [3, 3], AviaryValues())
+        prob.setup()
+
+        self.assertEqual(builder.num_builds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Test the assignment of processes to parallel phases."""
+
+import unittest
+
+from aviary.mission.parallel_phases import balance_phase_procs
+
+
+class BalancePhaseProcsTest(unittest.TestCase):
+    def setUp(self):
+        self.costs = {'takeoff': 1.0, 'climb': 4.0, 'cruise': 6.0, 'descent': 3.0, 'landing': 2.0}
+
+    def test_serial(self):
+        self.assertEqual(balance_phase_procs(self.costs, 1), {})
+
+    def test_more_procs_than_phases(self):
+        proc_kwargs = balance_phase_procs(self.costs, 8)
+
+        self.assertEqual(set(proc_kwargs), set(self.costs))
+        for name, kwargs in proc_kwargs.items():
+            self.assertEqual(kwargs['min_procs'], 1)
+            self.assertIsNone(kwargs['max_procs'])
+            self.assertEqual(kwargs['proc_weight'], self.costs[name])
+            self.assertNotIn('proc_group', kwargs)
+
+    def test_fewer_procs_than_phases(self):
+        proc_kwargs = balance_phase_procs(self.costs, 2)
+
+        groups = {}
+        for name, kwargs in proc_kwargs.items():
+            self.assertEqual(kwargs['max_procs'], 1)
+            groups.setdefault(kwargs['proc_group'], []).append(name)
+
+        # longest first: cruise and landing on one process, climb, descent and takeoff on the other
+        self.assertEqual(len(groups), 2)
+        loads = sorted(sum(self.costs[name] for name in names) for names in groups.values())
+        self.assertEqual(loads, [8.0, 8.0])
+
+        # systems in the same processor group request the same processes
+        for names in groups.values():
+            requests = {tuple(sorted(proc_kwargs[name].items())) for name in names}
+            self.assertEqual(len(requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
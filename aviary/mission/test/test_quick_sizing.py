@@ -0,0 +1,61 @@
+"""Test the analytic sizing mission."""
+
+import unittest
+from copy import deepcopy
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+def build_quick_sizing(**kwargs):
+    prob = AviaryProblem(verbosity=0)
+
+    prob.load_inputs(
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        deepcopy(phase_info),
+    )
+
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_quick_sizing_mission(**kwargs)
+
+    prob.setup()
+
+    return prob
+
+
+@use_tempdirs
+class QuickSizingTest(unittest.TestCase):
+    def test_closure(self):
+        prob = build_quick_sizing()
+        prob.run_model()
+
+        gross_mass = prob.get_val(Aircraft.Design.GROSS_MASS, 'lbm')
+        fuel = prob.get_val(Mission.FUEL_MASS, 'lbm') + prob.get_val(
+            Mission.TOTAL_RESERVE_FUEL_MASS, 'lbm'
+        )
+
+        # the mission flies the design range and burns all of the fuel on board
+        assert_near_equal(
+            prob.get_val(Mission.RANGE, 'NM'), prob.get_val(Aircraft.Design.RANGE, 'NM'), 1e-8
+        )
+        assert_near_equal(prob.get_val(Mission.TOTAL_FUEL_MASS, 'lbm'), fuel, 1e-8)
+        assert_near_equal(prob.get_val(Mission.GROSS_MASS, 'lbm'), gross_mass, 1e-12)
+
+    def test_longer_range(self):
+        prob = build_quick_sizing()
+        prob.run_model()
+        gross_mass = prob.get_val(Aircraft.Design.GROSS_MASS, 'lbm')[0]
+
+        prob.set_val(Aircraft.Design.RANGE, 4000.0, 'NM')
+        prob.run_model()
+
+        self.assertGreater(prob.get_val(Aircraft.Design.GROSS_MASS, 'lbm')[0], gross_mass)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.two_dof.ode.breguet_cruise_eom import ElectricRangeComp, RangeComp
 from aviary.mission.two_dof.ode.two_dof_ode import TwoDOFODE
 from aviary.mission.ode.altitude_rate import AltitudeRate
@@ -45,7 +46,8 @@ class BreguetCruiseODE(TwoDOFODE):
                 base_kwargs = {'method': 'cruise', 'output_alpha': True}
                 kwargs.update(base_kwargs)
 
-            system = subsystem.build_mission(
+            system = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
@@ -198,7 +200,8 @@ class ElectricBreguetCruiseODE(TwoDOFODE):
                 base_kwargs = {'method': 'cruise', 'output_alpha': True}
                 kwargs.update(base_kwargs)
 
-            system = subsystem.build_mission(
+            system = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
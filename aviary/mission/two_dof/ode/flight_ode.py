@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.two_dof.ode.constraints.flight_constraints import FlightConstraints
 from aviary.mission.two_dof.ode.constraints.speed_constraints import SpeedConstraints
 from aviary.mission.two_dof.ode.flight_eom import EOMRates
@@ -185,7 +186,8 @@ class FlightODE(TwoDOFODE):
                 }
                 kwargs.update(base_kwargs)
 
-            system = subsystem.build_mission(
+            system = build_mission_system(
+                subsystem,
                 num_nodes=nn,
                 aviary_inputs=aviary_options,
                 user_options=user_options,
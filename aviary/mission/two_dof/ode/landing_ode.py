@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.two_dof.ode.landing_eom import (
     GlideConditionComponent,
     LandingAltitudeComponent,
@@ -83,7 +84,8 @@ class LandingSegment(TwoDOFODE):
                     'retract_gear': False,
                 }
                 aero_builder = subsystem
-                aero_system = subsystem.build_mission(
+                aero_system = build_mission_system(
+                    subsystem,
                     num_nodes=1,
                     aviary_inputs=aviary_options,
                     user_options=user_options,
@@ -117,7 +119,8 @@ class LandingSegment(TwoDOFODE):
                 )
 
             if isinstance(subsystem, PropulsionBuilder):
-                propulsion_system = subsystem.build_mission(
+                propulsion_system = build_mission_system(
+                    subsystem,
                     num_nodes=1,
                     aviary_inputs=aviary_options,
                     user_options=user_options,
@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 
+from aviary.mission.build_cache import build_mission_system
 from aviary.mission.two_dof.ode.taxi_eom import TaxiFuelComponent
 from aviary.mission.two_dof.ode.two_dof_ode import TwoDOFODE
 from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilder
@@ -51,7 +52,8 @@ class TaxiSegment(TwoDOFODE):
 
         for subsystem in subsystems:
             if isinstance(subsystem, PropulsionBuilder):
-                system = subsystem.build_mission(
+                system = build_mission_system(
+                    subsystem,
                     num_nodes=1,
                     aviary_inputs=options,
                     user_options=user_options,
@@ -1,6 +1,7 @@
 import numpy as np
 import openmdao.api as om
 from numpy.polynomial import Polynomial
+from scipy.linalg import solve_triangular
 
 
 class PolynomialFit(om.ImplicitComponent):
@@ -18,6 +19,10 @@ class PolynomialFit(om.ImplicitComponent):
         Compute the outputs, given the inputs using the numpy fitting function.
     apply_nonlinear(self, inputs, outputs, residuals):
         Compute the residuals
+    linearize(self, inputs, outputs, partials):
+        Compute the analytic partials and factor the normal equations.
+    solve_linear(self, d_outputs, d_residuals, mode):
+        Solve the linear system using the factorization from linearize.
     """
 
     def initialize(self):
@@ -39,11 +44,17 @@ class PolynomialFit(om.ImplicitComponent):
         # these are the coefficients of the polynomial function you are fitting
         self.add_output('A', np.zeros(4))  # assuming a 5th order polynomial
 
-        # using CS here will give accurate partials, but will miss the sparsity pattern
-        # issue #497
-        self.declare_partials('*', '*', method='cs')
+        # factorization of the normal equations, computed in linearize
+        self._normal_factor = None
 
-        self.linear_solver = om.DirectSolver()
+    def setup_partials(self):
+        # the fit coefficients only depend on the control points, and each interpolated altitude
+        # only depends on the coefficients and its own time
+        self.declare_partials('A', ['A', 'h_cp', 'time_cp'])
+
+        for name in ('gear', 'flaps'):
+            self.declare_partials(f'h_init_{name}', ['A', f't_init_{name}'])
+            self.declare_partials(f'h_init_{name}', f'h_init_{name}', val=-1.0)
 
     def solve_nonlinear(self, inputs, outputs):
         """Compute the outputs, given the inputs using the numpy fitting function."""
@@ -109,3 +120,69 @@ class PolynomialFit(om.ImplicitComponent):
         x_flaps = inputs['t_init_flaps']
         h_flaps = a0 + a1 * x_flaps + a2 * x_flaps**2 + a3 * x_flaps**3
         residuals['h_init_flaps'] = h_flaps - outputs['h_init_flaps']
+
+    def linearize(self, inputs, outputs, partials):
+        """Compute the analytic partials and factor the normal equations."""
+        X_cp = inputs['time_cp']
+        Y_cp = inputs['h_cp']
+        A = outputs['A']
+
+        # Vandermonde matrix of the control points, so that Y_computed = V @ A
+        V = X_cp[:, np.newaxis] ** np.arange(4)
+        error = V @ A - Y_cp
+        dY_dx = A[1] + 2 * A[2] * X_cp + 3 * A[3] * X_cp**2
+
+        # residuals['A'] = 2 V^T (V A - Y_cp)
+        normal = 2 * V.T @ V
+        partials['A', 'A'] = normal
+        partials['A', 'h_cp'] = -2 * V.T
+
+        dV_dx = np.zeros_like(V)
+        dV_dx[:, 1:] = np.arange(1, 4) * V[:, :-1]
+        partials['A', 'time_cp'] = 2 * (V.T * dY_dx + dV_dx.T * error)
+
+        for name in ('gear', 'flaps'):
+            x = inputs[f't_init_{name}'][0]
+            partials[f'h_init_{name}', 'A'] = x ** np.arange(4)
+            partials[f'h_init_{name}', f't_init_{name}'] = A[1] + 2 * A[2] * x + 3 * A[3] * x**2
+
+        # The normal matrix squares the (poor) conditioning of the Vandermonde matrix, so it is
+        # factored through a QR decomposition of the column-scaled Vandermonde matrix instead:
+        # normal = 2 D^-1 R^T R D^-1, with D = diag(scale)
+        scale = 1.0 / (np.max(np.abs(X_cp.real)) or 1.0) ** np.arange(4)
+        R = np.linalg.qr(V.real * scale, mode='r')
+        self._normal_factor = (R, scale)
+        self._interp_rows = np.array(
+            [
+                inputs['t_init_gear'][0].real ** np.arange(4),
+                inputs['t_init_flaps'][0].real ** np.arange(4),
+            ]
+        )
+
+    def _solve_normal(self, rhs):
+        """Solve the (symmetric) normal equations using the factorization from linearize."""
+        R, scale = self._normal_factor
+        y = solve_triangular(R, scale * rhs, trans='T')
+        return 0.5 * scale * solve_triangular(R, y)
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        """
+        Solve the linear system using the factorization from linearize.
+
+        The jacobian with respect to the outputs is block lower triangular: the coefficients only
+        depend on the normal equations, and each interpolated altitude enters its own residual
+        with a coefficient of -1.
+        """
+        rows = self._interp_rows
+        names = ('h_init_gear', 'h_init_flaps')
+
+        if mode == 'fwd':
+            d_A = self._solve_normal(d_residuals['A'])
+            d_outputs['A'] = d_A
+            for row, name in zip(rows, names):
+                d_outputs[name] = row @ d_A - d_residuals[name]
+        else:
+            rhs = d_outputs['A'] + sum(row * d_outputs[name] for row, name in zip(rows, names))
+            d_residuals['A'] = self._solve_normal(rhs)
+            for name in names:
+                d_residuals[name] = -d_outputs[name]
@@ -1,7 +1,12 @@
 import unittest
 
+import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import (
+    assert_check_partials,
+    assert_check_totals,
+    assert_near_equal,
+)
 
 from aviary.mission.two_dof.polynomial_fit import PolynomialFit
 
@@ -74,15 +79,39 @@ class PolynomialFitTest(unittest.TestCase):
         self.prob.setup(check=False, force_alloc_complex=True)
 
     def test_case1(self):
-        # Checks output values only. It will not check partials
-        # because cs is used to compute partials already.
-
         self.prob.run_model()
 
         tol = 5e-4
         assert_near_equal(self.prob['h_init_gear'], -600, tol)
         assert_near_equal(self.prob['h_init_flaps'], -250, tol)
 
+        # perturb the fit so the residuals are not at their minimum
+        self.prob.set_val('h_cp', np.array(Y_cp) + np.linspace(-5.0, 5.0, 16) ** 2, units='ft')
+
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-4, rtol=1e-10)
+
+    def test_solve_linear(self):
+        # without a parent linear solver, derivatives come from the component's own solve_linear
+        for mode in ('fwd', 'rev'):
+            prob = om.Problem()
+            prob.model.add_subsystem('polyfit', PolynomialFit(N_cp=16), promotes=['*'])
+            prob.model.set_input_defaults('time_cp', val=X_cp, units='s')
+            prob.model.set_input_defaults('h_cp', val=Y_cp, units='ft')
+            prob.model.set_input_defaults('t_init_gear', val=[15.0000001], units='s')
+            prob.model.set_input_defaults('t_init_flaps', val=[32.5000001], units='s')
+            prob.setup(mode=mode)
+            prob.run_model()
+
+            totals = prob.check_totals(
+                of=['h_init_gear', 'h_init_flaps'],
+                wrt=['h_cp', 'time_cp', 't_init_gear', 't_init_flaps'],
+                method='fd',
+                form='central',
+                out_stream=None,
+            )
+            assert_check_totals(totals, atol=1e-5, rtol=1e-5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,11 @@ import openmdao.api as om
 # from dymos.utils.misc import _unspecified
 from aviary.subsystems.aerodynamics.flops_based.computed_aero_group import ComputedAeroGroup
 from aviary.subsystems.aerodynamics.flops_based.premission_aero import TakeoffLoverD
+from aviary.subsystems.aerodynamics.flops_based.surrogate_aero import (
+    AeroSurrogateTraining,
+    get_surrogate_grid,
+    get_surrogate_training_data,
+)
 from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
 from aviary.subsystems.aerodynamics.flops_based.takeoff_aero_group import TakeoffAeroGroup
 from aviary.subsystems.aerodynamics.gasp_based.gaspaero import CruiseAero, LowSpeedAero
@@ -74,20 +79,32 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
         Generate the report for Aviary core aerodynamics analysis.
     """
 
-    def __init__(self, name=None, meta_data=None, code_origin=None, tabular=False):
+    def __init__(
+        self,
+        name=None,
+        meta_data=None,
+        code_origin=None,
+        tabular=False,
+        surrogate=False,
+        surrogate_grid=None,
+        retrain_tolerance=1e-6,
+    ):
         if code_origin not in (FLOPS, GASP):
             raise ValueError('Code origin is not one of the following: (FLOPS, GASP)')
 
+        if surrogate and code_origin is not FLOPS:
+            raise ValueError('Surrogate aerodynamics is only available for FLOPS-based aero.')
+
         self.code_origin = code_origin
         self.tabular = tabular
+        self.surrogate = surrogate
+        # phases and pre-mission must use the same tables
+        self._surrogate_grid = get_surrogate_grid(surrogate_grid)
+        self.retrain_tolerance = retrain_tolerance
 
         super().__init__(name=name, meta_data=meta_data)
 
     def build_pre_mission(self, aviary_inputs, subsystem_options):
-        # pre-mission is not required when exclusively using tabular aero
-        if self.tabular:
-            return TakeoffLoverD()
-
         code_origin = self.code_origin
         try:
             method = subsystem_options['method']
@@ -97,6 +114,25 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
         if method == 'external':
             return None
 
+        if self.surrogate:
+            # sample the computed aero once geometry is known, so phases can use the tables
+            aero_group = om.Group()
+            aero_group.add_subsystem('design', PreMissionAeroFLOPS(), promotes=['*'])
+            aero_group.add_subsystem(
+                'surrogate_training',
+                AeroSurrogateTraining(
+                    aviary_options=aviary_inputs,
+                    grid=self._surrogate_grid,
+                    retrain_tolerance=self.retrain_tolerance,
+                ),
+                promotes=['*'],
+            )
+            return aero_group
+
+        # pre-mission is not required when exclusively using tabular aero
+        if self.tabular:
+            return TakeoffLoverD()
+
         if code_origin is GASP:
             return PreMissionAeroGASP()
 
@@ -140,10 +176,19 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
                     **aero_opts,
                 )
 
+            elif method == 'surrogate':
+                CD0_data, CDI_data = get_surrogate_training_data(self._surrogate_grid)
+                aero_group = TabularAeroGroup(
+                    num_nodes=num_nodes,
+                    CD0_data=CD0_data,
+                    CDI_data=CDI_data,
+                    connect_training_data=True,
+                )
+
             else:
                 raise ValueError(
                     'FLOPS-based aero method is not one of the following: (computed, '
-                    'low_speed, tabular)'
+                    'low_speed, tabular, surrogate)'
                 )
 
         elif self.code_origin is GASP:
@@ -261,7 +306,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
                     Aircraft.Wing.AREA,
                 ]
 
-            elif method == 'tabular':
+            elif method in ('tabular', 'surrogate'):
                 promotes = [
                     Dynamic.Mission.ALTITUDE,
                     Dynamic.Atmosphere.MACH,
@@ -274,7 +319,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
             else:
                 raise ValueError(
                     'FLOPS-based aero method is not one of the following: '
-                    '(computed, low_speed, tabular)'
+                    '(computed, low_speed, tabular, surrogate)'
                 )
 
         elif self.code_origin is GASP:
@@ -581,7 +626,20 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilder):
                         'static_target': True,
                     }
 
-            elif method == 'tabular':
+            elif method in ('tabular', 'surrogate'):
+                if method == 'surrogate':
+                    grid = self._surrogate_grid
+                    num_mach = grid['mach'].size
+
+                    params[Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR] = {
+                        'shape': (grid['altitude'].size, num_mach),
+                        'static_target': True,
+                    }
+                    params[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR] = {
+                        'shape': (num_mach, grid['lift_coefficient'].size),
+                        'static_target': True,
+                    }
+
                 for var in TABULAR_CORE_INPUTS:
                     meta = CoreMetaData[var]
 
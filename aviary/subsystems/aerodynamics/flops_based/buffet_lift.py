@@ -55,66 +55,55 @@ class BuffetLift(om.ExplicitComponent):
 
     def compute(self, inputs, outputs):
         """Computes lift margin before buffet onset."""
-        mach, design_Mach, AR, CAM, SW25, TC = inputs.values()
+        DELCLB, _ = _buffet_lift(*inputs.values())
 
-        del_Mach = mach - design_Mach
-
-        TC23 = TC ** (2.0 / 3.0)
-        TC23 = np.repeat(TC23, len(del_Mach))
-        x = np.transpose(np.array([TC23, del_Mach]))
-        # dFCLB = [dFCLB_dTC23, dFCLB_dDELM]
-        FCLB, dFCLB = BUFTTable.interpolate(x, compute_derivative=True)
-        DELCLB = FCLB * (AR * (1.0 + CAM / 10.0) / np.cos(SW25 / _units.degree))
-
-        self.FCLB = FCLB
-        self.dFCLB = dFCLB
         outputs['DELCLB'] = DELCLB
 
     def compute_partials(self, inputs, partials):
-        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
-        SW25 = inputs[Aircraft.Wing.SWEEP]
-        AR = inputs[Aircraft.Wing.ASPECT_RATIO]
-        CAM = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
+        _, derivs = _buffet_lift(*inputs.values())
 
-        FCLB = self.FCLB
-        dFCLB_dTC23 = self.dFCLB[:, 0]
-        dFCLB_ddel_Mach = self.dFCLB[:, 1]
+        for name, val in derivs.items():
+            partials['DELCLB', name] = val
 
-        a = _units.degree
-        SW25_rad = SW25 / a
-        cos_fact = 1.0 / np.cos(SW25_rad)
 
-        dTC23_dTC = (2.0 / 3.0) * TC ** (-1.0 / 3.0)
-        dDELCLB_dFCLB = AR * (1.0 + CAM / 10.0) * cos_fact
-        ddel_Mach_dMach = 1.0
-        ddel_Mach_ddesign_Mach = -1.0
+def _buffet_lift(mach, design_Mach, AR, CAM, SW25, TC):
+    """
+    Compute the lift margin before buffet onset at the nodes.
 
-        # wrt Mach
-        dCLB_dMach = dDELCLB_dFCLB * dFCLB_ddel_Mach * ddel_Mach_dMach
+    Returns the margin and its derivatives, keyed by input name.
+    """
+    del_Mach = mach - design_Mach
 
-        # wrt design_Mach
-        dCLB_ddesign_Mach = dDELCLB_dFCLB * dFCLB_ddel_Mach * ddel_Mach_ddesign_Mach
+    TC23 = TC ** (2.0 / 3.0)
+    TC23 = np.repeat(TC23, len(del_Mach))
+    x = np.transpose(np.array([TC23, del_Mach]))
 
-        # wrt AR
-        dCLB_dAR = FCLB * (1.0 + CAM / 10.0) * cos_fact
+    # dFCLB = [dFCLB_dTC23, dFCLB_dDELM]
+    FCLB, dFCLB = BUFTTable.interpolate(x, compute_derivative=True)
 
-        # wrt TC
-        dCLB_dTC = dDELCLB_dFCLB * dFCLB_dTC23 * dTC23_dTC
+    a = _units.degree
+    SW25_rad = SW25 / a
+    cos_fact = 1.0 / np.cos(SW25_rad)
 
-        # wrt SW25
-        dCLB_dSW25 = (1.0 / a) * AR * FCLB * (1.0 + CAM / 10.0) * np.sin(SW25_rad) * cos_fact**2
+    DELCLB = FCLB * (AR * (1.0 + CAM / 10.0) * cos_fact)
 
-        # wrt CAM
-        dCLB_dCAM = FCLB * AR / 10.0 * cos_fact
+    dDELCLB_dFCLB = AR * (1.0 + CAM / 10.0) * cos_fact
+    dCLB_dMach = dDELCLB_dFCLB * dFCLB[:, 1]
 
-        partials['DELCLB', Dynamic.Atmosphere.MACH] = dCLB_dMach
-        partials['DELCLB', Aircraft.Design.MACH] = dCLB_ddesign_Mach
-        partials['DELCLB', Aircraft.Wing.ASPECT_RATIO] = dCLB_dAR
-        partials['DELCLB', Aircraft.Wing.THICKNESS_TO_CHORD] = dCLB_dTC
-        partials['DELCLB', Aircraft.Wing.SWEEP] = dCLB_dSW25
-        partials['DELCLB', Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN] = dCLB_dCAM
+    derivs = {
+        Dynamic.Atmosphere.MACH: dCLB_dMach,
+        Aircraft.Design.MACH: -dCLB_dMach,
+        Aircraft.Wing.ASPECT_RATIO: FCLB * (1.0 + CAM / 10.0) * cos_fact,
+        Aircraft.Wing.THICKNESS_TO_CHORD: (
+            dDELCLB_dFCLB * dFCLB[:, 0] * (2.0 / 3.0) * TC ** (-1.0 / 3.0)
+        ),
+        Aircraft.Wing.SWEEP: (
+            (1.0 / a) * AR * FCLB * (1.0 + CAM / 10.0) * np.sin(SW25_rad) * cos_fact**2
+        ),
+        Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN: FCLB * AR / 10.0 * cos_fact,
+    }
 
-        return
+    return DELCLB, derivs
 
 
 BUFT = np.array(
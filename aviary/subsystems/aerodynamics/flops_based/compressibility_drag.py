@@ -7,7 +7,14 @@ from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
 
 class CompressibilityDrag(om.ExplicitComponent):
-    """Computes compressibility drag coefficient."""
+    """
+    Computes compressibility drag coefficient.
+
+    Everything that only depends on the aircraft inputs is computed once per change in those
+    inputs and cached. This includes the wave drag tables, which are reduced to one-dimensional
+    tables over Mach number at the current design, so evaluating the nodes is a vectorized table
+    lookup.
+    """
 
     def initialize(self):
         self.options.declare(
@@ -43,6 +50,8 @@ class CompressibilityDrag(om.ExplicitComponent):
             desc='Drag coefficient due to compressibility.',
         )
 
+        self._kernel = _CompressibilityKernel()
+
     def setup_partials(self):
         nn = self.options['num_nodes']
 
@@ -54,405 +63,354 @@ class CompressibilityDrag(om.ExplicitComponent):
             cols=row_col,
         )
 
-        wrt2 = [
-            Aircraft.Wing.THICKNESS_TO_CHORD,
-            Aircraft.Wing.ASPECT_RATIO,
-            Aircraft.Wing.SWEEP,
-            Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
-            Aircraft.Fuselage.CROSS_SECTION,
-            Aircraft.Wing.AREA,
-            Aircraft.Fuselage.LENGTH_TO_DIAMETER,
-            Aircraft.Wing.TAPER_RATIO,
-            Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
-            Aircraft.Design.BASE_AREA,
-            Aircraft.Design.MACH,
-        ]
-
-        self.declare_partials(of='compress_drag_coeff', wrt=wrt2)
+        self.declare_partials(of='compress_drag_coeff', wrt=_DESIGN_PARTIALS)
 
     def compute(self, inputs, outputs):
         """Calculate compressibility drag."""
-        del_mach = inputs[Dynamic.Atmosphere.MACH] - inputs[Aircraft.Design.MACH]
-
-        idx_super = np.where(del_mach > 0.05)
-        idx_sub = np.where(del_mach <= 0.05)
-
-        if len(idx_super[0]) > 0:
-            cdc_super = self._compute_supersonic(inputs, outputs, idx_super)
-            outputs['compress_drag_coeff'][idx_super] = cdc_super
-        if len(idx_sub[0]) > 0:
-            cdc_sub = self._compute_subsonic(inputs, outputs, idx_sub)
-            outputs['compress_drag_coeff'][idx_sub] = cdc_sub
-
-    def _compute_supersonic(self, inputs, outputs, idx):
-        """Calculate compressibility drag for supersonic speeds."""
-        mach = inputs[Dynamic.Atmosphere.MACH][idx]
-        nn = len(mach)
-        del_mach = mach - inputs[Aircraft.Design.MACH]
-        AR = inputs[Aircraft.Wing.ASPECT_RATIO]
-        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
-        max_camber_70 = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
-        sweep25 = inputs[Aircraft.Wing.SWEEP]
-        wing_taper_ratio = inputs[Aircraft.Wing.TAPER_RATIO]
-        fuse_area = inputs[Aircraft.Fuselage.CROSS_SECTION]
-        base_area = inputs[Aircraft.Design.BASE_AREA]
-        wing_area = inputs[Aircraft.Wing.AREA]
-        fuselage_len_to_diam_ratio = inputs[Aircraft.Fuselage.LENGTH_TO_DIAMETER]
-        diam_to_wing_span_ratio = inputs[Aircraft.Fuselage.DIAMETER_TO_WING_SPAN]
-
-        ART = AR * np.tan(sweep25 / 57.2958) + (1.0 - wing_taper_ratio) / (1.0 + wing_taper_ratio)
-        x = np.empty((nn, 2), dtype=mach.dtype)
-        x[:, 0] = del_mach
-        x[:, 1] = ART
-        CD3, self.dCD3 = PCARtable.interpolate(x, compute_derivative=True)
-
-        # Negative drag sometimes occurs due to overshoot in the table interp.
-        self.clamp_CD3 = np.where(CD3 <= 0)
-        CD3[self.clamp_CD3] = 0.0
-        self.dCD3[self.clamp_CD3] = 0.0
-
-        compress_drag_coeff = CD3 * (TC ** (5.0 / 3.0) * (1.0 + 0.1 * max_camber_70))
-
-        # Contribution of fuselage.
-        if fuse_area > 0.0:
-            SOS = 1.0 + base_area / fuse_area
-            x[:, 0] = mach
-            x[:, 1] = SOS
-            CD4, self.dCD4 = BSUPtable.interpolate(x, compute_derivative=True)
-
-            # Negative drag sometimes occurs due to overshoot in the table interp.
-            self.clamp_CD4 = np.where(CD4 <= 0)
-            CD4[self.clamp_CD4] = 0.0
-            self.dCD4[self.clamp_CD4] = 0.0
-
-            fuselage_compress_drag_coeff = CD4 * (
-                fuse_area / wing_area * (1.0 / fuselage_len_to_diam_ratio**2)
-            )
+        outputs['compress_drag_coeff'] = self._kernel.compute(inputs, self.under_complex_step)
 
-            compress_drag_coeff += fuselage_compress_drag_coeff
-
-            # Wing fuselage interference.
-            idx_mach = np.where(mach >= 1.0)
-            if len(idx_mach[0]) > 0:
-                x[:, 1] = diam_to_wing_span_ratio
-                CD5, self.dCD5 = WFITable.interpolate(x[idx_mach], compute_derivative=True)
-
-                # TODO: is this some kind of override?
-                if wing_taper_ratio == 1.0:
-                    wing_taper_ratio = 0.5
+    def compute_partials(self, inputs, partials):
+        """Calculate partials of compressibility drag."""
+        nn = self.options['num_nodes']
+        derivs = self._kernel.compute_partials(inputs, self.under_complex_step)
 
-                int_compress_drag_coeff = CD5 * (
-                    1.0 / (1.0 - wing_taper_ratio) / np.cos(sweep25 / 57.2958)
-                )
+        partials['compress_drag_coeff', Dynamic.Atmosphere.MACH] = derivs[Dynamic.Atmosphere.MACH]
+        for name in _DESIGN_PARTIALS:
+            partials['compress_drag_coeff', name] = derivs[name].reshape((nn, 1))
 
-                compress_drag_coeff[idx_mach] += int_compress_drag_coeff
 
-            else:
-                CD5 = np.zeros((nn), dtype=mach.dtype)
-                self.dCD5 = np.zeros((nn, 2), dtype=mach.dtype)
+class _CompressibilityKernel:
+    """
+    Compressibility drag at the nodes, with the caches of the design-dependent terms and of the
+    table lookups.
 
-        else:
-            CD4 = np.zeros((nn), dtype=mach.dtype)
-            self.dCD4 = np.zeros((nn, 2), dtype=mach.dtype)
-            CD5 = np.zeros((nn), dtype=mach.dtype)
-            self.dCD5 = np.zeros((nn, 2), dtype=mach.dtype)
+    Used by CompressibilityDrag and FusedComputedAero, which read their inputs by the same names.
+    """
 
-        self.CD3 = CD3
-        self.CD4 = CD4
-        self.CD5 = CD5
-        return compress_drag_coeff
+    def __init__(self):
+        # Design-dependent terms, and the design inputs they were computed for.
+        self._design = None
+        self._design_inputs = None
 
-    def _compute_subsonic(self, inputs, outputs, idx):
-        """Calculate compressibility drag for subsonic speeds."""
-        mach = inputs[Dynamic.Atmosphere.MACH][idx]
-        nn = len(mach)
-        del_mach = mach - inputs[Aircraft.Design.MACH]
-        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
-        max_camber_70 = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
-        fuse_area = inputs[Aircraft.Fuselage.CROSS_SECTION]
-        base_area = inputs[Aircraft.Design.BASE_AREA]
-        wing_area = inputs[Aircraft.Wing.AREA]
-        fuselage_len_to_diam_ratio = inputs[Aircraft.Fuselage.LENGTH_TO_DIAMETER]
-
-        TOC = TC ** (2.0 / 3.0)
-        x = np.empty((nn, 2), dtype=mach.dtype)
-        x[:, 0] = del_mach
-        x[:, 1] = TOC
-        CD1, self.dCD1 = PCWtable.interpolate(x, compute_derivative=True)
+        # Table lookups at the nodes, with the design terms and Mach numbers they were done for.
+        self._lookups = None
 
-        # Negative drag sometimes occurs due to overshoot in the table interp.
-        self.clamp_CD1 = np.where(CD1 <= 0)
-        CD1[self.clamp_CD1] = 0.0
-        self.dCD1[self.clamp_CD1] = 0.0
-
-        compress_drag_coeff = CD1 * (TC ** (5.0 / 3.0) * (1.0 + 0.1 * max_camber_70))
-
-        # Contribution of fuselage.
-        if fuse_area > 0.0:
-            SOS = 1.0 + base_area / fuse_area
-            x[:, 0] = mach
-            x[:, 1] = SOS
-            CD2, self.dCD2 = BSUBtable.interpolate(x, compute_derivative=True)
-
-            # Negative drag sometimes occurs due to overshoot in the table interp.
-            self.clamp_CD2 = np.where(CD2 <= 0)
-            CD2[self.clamp_CD2] = 0.0
-            self.dCD2[self.clamp_CD2] = 0.0
-
-            fuselage_compress_drag_coeff = CD2 * (
-                fuse_area / wing_area * (1.0 / fuselage_len_to_diam_ratio**2)
-            )
+    def compute(self, inputs, complex_step=False):
+        """Return the compressibility drag coefficient at the nodes."""
+        design = self._get_design(inputs, complex_step)
+        mach = inputs[Dynamic.Atmosphere.MACH]
 
-            compress_drag_coeff += fuselage_compress_drag_coeff
+        compress_drag_coeff, lookups = self._evaluate(
+            design, mach, inputs[Aircraft.Design.MACH], complex_step
+        )
 
-        else:
-            CD2 = np.zeros((nn), dtype=mach.dtype)
-            self.dCD2 = np.zeros((nn, 2), dtype=mach.dtype)
+        if not complex_step:
+            self._lookups = (design, mach.copy(), lookups)
 
-        self.CD1 = CD1
-        self.CD2 = CD2
         return compress_drag_coeff
 
-    def compute_partials(self, inputs, partials):
+    def compute_partials(self, inputs, complex_step=False):
         """
-        Calculate partials of compressibility drag.
-
-        :param inputs: _description_
-        :type inputs: _type_
-        :param partials: _description_
-        :type partials: _type_
+        Return the derivatives of the compressibility drag coefficient at the nodes, keyed by
+        input name.
         """
-        del_mach = inputs[Dynamic.Atmosphere.MACH] - inputs[Aircraft.Design.MACH]
-
-        idx_super = np.where(del_mach > 0.05)
-        idx_sub = np.where(del_mach <= 0.05)
-        if len(idx_super[0]) > 0:
-            self._compute_partials_supersonic(inputs, partials, idx_super)
-        if len(idx_sub[0]) > 0:
-            self._compute_partials_subsonic(inputs, partials, idx_sub)
-
-    def _compute_partials_supersonic(self, inputs, partials, idx):
-        mach = inputs[Dynamic.Atmosphere.MACH][idx]
-        AR = inputs[Aircraft.Wing.ASPECT_RATIO]
-        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
-        max_camber_70 = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
-        sweep25 = inputs[Aircraft.Wing.SWEEP]
-        wing_taper_ratio = inputs[Aircraft.Wing.TAPER_RATIO]
-        fuse_area = inputs[Aircraft.Fuselage.CROSS_SECTION]
-        base_area = inputs[Aircraft.Design.BASE_AREA]
-        wing_area = inputs[Aircraft.Wing.AREA]
-        fuselage_len_to_diam_ratio = inputs[Aircraft.Fuselage.LENGTH_TO_DIAMETER]
-
-        CD3 = self.CD3
-        CD4 = self.CD4
-        CD5 = self.CD5
-
-        dCd3_dCD3 = TC ** (5.0 / 3.0) * (1.0 + max_camber_70 / 10.0)
-        dCd4_dCD4 = (fuse_area / wing_area) * (1.0 / fuselage_len_to_diam_ratio**2)
-        dCd5_dCD5 = 1.0 / (1.0 - wing_taper_ratio) / np.cos(sweep25 / 57.2958)
-
-        ddel_mach_ddesign_Mach = -1.0
-        ddel_mach_dMach = 1.0
-
-        # Derivatives from table interpolation
-        dCD3_ddel_mach = self.dCD3[:, 0]
-        dCD3_dART = self.dCD3[:, 1]
-        dCD4_dMach = self.dCD4[:, 0]
-        dCD4_dSOS = self.dCD4[:, 1]
-        dCD5_dMach = self.dCD5[:, 0]
-        dCD5_ddiam_to_wing_span_ratio = self.dCD5[:, 1]
-
-        # wrt Mach
-        dCd3_dMach = dCd3_dCD3 * dCD3_ddel_mach * ddel_mach_dMach
-
-        # wrt design_Mach
-        dCd_ddesign_Mach = dCd3_dCD3 * dCD3_ddel_mach * ddel_mach_ddesign_Mach
-
-        # wrt TC
-        dCd3_dTC = (5.0 / 3.0) * CD3 * TC ** (2.0 / 3.0) * (1.0 + 0.1 * max_camber_70)
-        dCd_dTC = dCd3_dTC
-
-        # wrt max_camber_70
-        dCd3_dmax_camber_70 = 0.1 * CD3 * TC ** (5.0 / 3.0)
-        dCd_dmax_camber_70 = dCd3_dmax_camber_70
-
-        # wrt AR
-        dART_dAR = np.tan(sweep25 / 57.2958)
-        dCd_dAR = dCd3_dCD3 * dCD3_dART * dART_dAR
-
-        dART_dwing_taper_ratio = -(1 - wing_taper_ratio) / (wing_taper_ratio + 1) ** 2 - 1.0 / (
-            wing_taper_ratio + 1
-        )
-
-        dART_dsweep25 = AR * (np.tan(sweep25 / 57.2958) ** 2 + 1) / 57.2958
-        dCd3_dsweep25 = dCd3_dCD3 * dCD3_dART * dART_dsweep25
-
-        dCd_ddiam_to_wing_span_ratio = 0
-
-        if fuse_area > 0.0:
-            # wrt Mach
-            dCd4_dMach = dCd4_dCD4 * dCD4_dMach
-            dCd_dMach = dCd3_dMach + dCd4_dMach
-
-            # wrt fuse_area
-            dSOS_dfuse_area = -base_area / fuse_area**2
-            dCd4_dfuse_area = CD4 / (wing_area * fuselage_len_to_diam_ratio**2)
-            dCd_dfuse_area = dCd4_dfuse_area + dCd4_dCD4 * dCD4_dSOS * dSOS_dfuse_area
-
-            # wrt base_area
-            dSOS_dbase_area = 1.0 / fuse_area
-            dCd_dbase_area = dCd4_dCD4 * dCD4_dSOS * dSOS_dbase_area
-
-            # wrt wing_area
-            dCd_dwing_area = -CD4 * fuse_area / (wing_area * fuselage_len_to_diam_ratio) ** 2
-
-            # wrt fuselage_len_to_diam_ratio
-            dCd_dfuselage_len_to_diam_ratio = (
-                -2.0 * CD4 * fuse_area / (wing_area * fuselage_len_to_diam_ratio**3)
+        mach = inputs[Dynamic.Atmosphere.MACH]
+        nn = mach.size
+        design = self._get_design(inputs, complex_step)
+        idx_super, idx_sub, idx_mach, lookups = self._get_lookups(inputs, design, complex_step)
+
+        derivs = {
+            name: np.zeros(nn, dtype=mach.dtype)
+            for name in [Dynamic.Atmosphere.MACH] + _DESIGN_PARTIALS
+        }
+
+        tc_fact = design['tc_fact']
+
+        if idx_super.size > 0:
+            CD3, dCD3_ddel_mach, dCD3_dART = lookups['PCAR']
+
+            derivs[Dynamic.Atmosphere.MACH][idx_super] = tc_fact * dCD3_ddel_mach
+            derivs[Aircraft.Design.MACH][idx_super] = -tc_fact * dCD3_ddel_mach
+            derivs[Aircraft.Wing.THICKNESS_TO_CHORD][idx_super] = design['dtc_fact_dTC'] * CD3
+            derivs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN][idx_super] = (
+                design['dtc_fact_dcam'] * CD3
             )
 
-            # wrt diam_to_wing_span_ratio
-            dCd_ddiam_to_wing_span_ratio = np.zeros(
-                dCd_dwing_area.shape, dtype=dCd_dwing_area.dtype
+            dCd_dART = tc_fact * dCD3_dART
+            derivs[Aircraft.Wing.ASPECT_RATIO][idx_super] = dCd_dART * design['dART_dAR']
+            derivs[Aircraft.Wing.TAPER_RATIO][idx_super] = dCd_dART * design['dART_dTR']
+            derivs[Aircraft.Wing.SWEEP][idx_super] = dCd_dART * design['dART_dsweep']
+
+            if design['fuselage']:
+                _fuselage_partials(design, derivs, idx_super, *lookups['BSUP'])
+
+                if 'WFI' in lookups:
+                    CD5, dCD5_dMach, dCD5_ddiam_to_wing_span_ratio = lookups['WFI']
+                    idx = idx_super[idx_mach]
+
+                    wing_taper_ratio = inputs[Aircraft.Wing.TAPER_RATIO]
+                    sweep25 = inputs[Aircraft.Wing.SWEEP]
+                    cos_sw = np.cos(sweep25 / 57.2958)
+                    dCd5_dCD5 = 1.0 / (1.0 - wing_taper_ratio) / cos_sw
+
+                    derivs[Dynamic.Atmosphere.MACH][idx] += dCd5_dCD5 * dCD5_dMach
+                    derivs[Aircraft.Wing.TAPER_RATIO][idx] += CD5 / (
+                        (1.0 - wing_taper_ratio) ** 2 * cos_sw
+                    )
+                    derivs[Aircraft.Fuselage.DIAMETER_TO_WING_SPAN][idx] = (
+                        dCd5_dCD5 * dCD5_ddiam_to_wing_span_ratio
+                    )
+                    derivs[Aircraft.Wing.SWEEP][idx] += (
+                        CD5
+                        * np.sin(sweep25 / 57.2958)
+                        / (57.2958 * (1.0 - wing_taper_ratio) * cos_sw**2)
+                    )
+
+        if idx_sub.size > 0:
+            CD1, dCD1_ddel_mach, dCD1_dTOC = lookups['PCW']
+
+            derivs[Dynamic.Atmosphere.MACH][idx_sub] = tc_fact * dCD1_ddel_mach
+            derivs[Aircraft.Design.MACH][idx_sub] = -tc_fact * dCD1_ddel_mach
+            derivs[Aircraft.Wing.THICKNESS_TO_CHORD][idx_sub] = (
+                design['dtc_fact_dTC'] * CD1 + tc_fact * dCD1_dTOC * design['dTOC_dTC']
             )
+            derivs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN][idx_sub] = design['dtc_fact_dcam'] * CD1
 
-            # wrt wing_taper_ratio
-            dCd_dwing_taper_ratio = dCd3_dCD3 * dCD3_dART * dART_dwing_taper_ratio
-
-            # wrt SW25
-            dCd_dsweep25 = dCd3_dsweep25
-
-            # Wing fuselage interference.
-            idx_mach = np.where(mach >= 1.0)
-            if len(idx_mach[0]) > 0:
-                dCd_dMach[idx_mach] += dCd5_dCD5 * dCD5_dMach
-
-                dCd5_dwing_taper_ratio = CD5 / (
-                    (1.0 - wing_taper_ratio) ** 2 * np.cos(sweep25 / 57.2958)
-                )
-                dCd_dwing_taper_ratio[idx_mach] += dCd5_dwing_taper_ratio
-
-                # wrt diam_to_wing_span_ratio
-                dCd_ddiam_to_wing_span_ratio[idx_mach] = dCd5_dCD5 * dCD5_ddiam_to_wing_span_ratio
-
-                dCd5_dsweep25 = (
-                    CD5
-                    * np.sin(sweep25 / 57.2958)
-                    / (57.2958 * (1.0 - wing_taper_ratio) * np.cos(sweep25 / 57.2958) ** 2)
-                )
-                dCd_dsweep25[idx_mach] += dCd5_dsweep25
-
-        else:
-            dCd_dMach = dCd3_dMach
-            dCd_dfuse_area = 0.0
-            dCd_dbase_area = 0.0
-            dCd_dwing_area = 0.0
-            dCd_dfuselage_len_to_diam_ratio = 0.0
-            dCd_dwing_taper_ratio = dCd3_dCD3 * dCD3_dART * dART_dwing_taper_ratio
-            dCd_dsweep25 = dCd3_dsweep25
-
-        partials['compress_drag_coeff', Dynamic.Atmosphere.MACH][idx] = dCd_dMach
-        partials['compress_drag_coeff', Aircraft.Design.MACH][idx, 0] = dCd_ddesign_Mach
-        partials['compress_drag_coeff', Aircraft.Wing.THICKNESS_TO_CHORD][idx, 0] = dCd_dTC
-        partials['compress_drag_coeff', Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN][idx, 0] = (
-            dCd_dmax_camber_70
-        )
-        partials['compress_drag_coeff', Aircraft.Fuselage.CROSS_SECTION][idx, 0] = dCd_dfuse_area
-        partials['compress_drag_coeff', Aircraft.Design.BASE_AREA][idx, 0] = dCd_dbase_area
-        partials['compress_drag_coeff', Aircraft.Wing.AREA][idx, 0] = dCd_dwing_area
-        partials['compress_drag_coeff', Aircraft.Fuselage.LENGTH_TO_DIAMETER][idx, 0] = (
-            dCd_dfuselage_len_to_diam_ratio
-        )
-        partials['compress_drag_coeff', Aircraft.Wing.TAPER_RATIO][idx, 0] = dCd_dwing_taper_ratio
-        partials['compress_drag_coeff', Aircraft.Wing.SWEEP][idx, 0] = dCd_dsweep25
-        partials['compress_drag_coeff', Aircraft.Wing.ASPECT_RATIO][idx, 0] = dCd_dAR
-        partials['compress_drag_coeff', Aircraft.Fuselage.DIAMETER_TO_WING_SPAN][idx, 0] = (
-            dCd_ddiam_to_wing_span_ratio
-        )
+            if design['fuselage']:
+                _fuselage_partials(design, derivs, idx_sub, *lookups['BSUB'])
 
-    def _compute_partials_subsonic(self, inputs, partials, idx):
-        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
-        max_camber_70 = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
-        fuse_area = inputs[Aircraft.Fuselage.CROSS_SECTION]
-        base_area = inputs[Aircraft.Design.BASE_AREA]
-        wing_area = inputs[Aircraft.Wing.AREA]
-        fuselage_len_to_diam_ratio = inputs[Aircraft.Fuselage.LENGTH_TO_DIAMETER]
-
-        CD1 = self.CD1
-        CD2 = self.CD2
-
-        dCd1_dCD1 = TC ** (5.0 / 3.0) * (1.0 + 0.1 * max_camber_70)
-        dCd2_dCD2 = fuse_area / wing_area * (1.0 / fuselage_len_to_diam_ratio**2)
-        dTOC_dTC = (2.0 / 3.0) * TC ** (-1.0 / 3.0)
-
-        ddel_mach_dMach = 1.0
-
-        # Derivatives from table interpolation
-        dCD1_ddel_mach = self.dCD1[:, 0]
-        dCD1_dTOC = self.dCD1[:, 1]
-        dCD2_dMach = self.dCD2[:, 0]
-        dCD2_dSOS = self.dCD2[:, 1]
-
-        # wrt Mach
-        dCd1_dMach = dCd1_dCD1 * dCD1_ddel_mach * ddel_mach_dMach
-        dCd2_dMach = dCd2_dCD2 * dCD2_dMach
-        dCd_dMach = dCd1_dMach + dCd2_dMach
-
-        # wrt design_Mach
-        dCd_ddesign_Mach = -dCd1_dCD1 * dCD1_ddel_mach
-
-        # wrt TC
-        dCd1_dTC = (5.0 / 3.0) * CD1 * (1.0 + 0.1 * max_camber_70) * TC ** (2.0 / 3.0)
-        dCD1_dTC = dCD1_dTOC * dTOC_dTC
-        dCd_dTC = dCd1_dTC + dCd1_dCD1 * dCD1_dTC
-
-        # wrt max_camber_70
-        dCd_dmax_camber_70 = CD1 * (1.0 / 10.0) * TC ** (5.0 / 3.0)
-
-        partials['compress_drag_coeff', Dynamic.Atmosphere.MACH][idx] = dCd_dMach
-        partials['compress_drag_coeff', Aircraft.Design.MACH][idx, 0] = dCd_ddesign_Mach
-        partials['compress_drag_coeff', Aircraft.Wing.THICKNESS_TO_CHORD][idx, 0] = dCd_dTC
-        partials['compress_drag_coeff', Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN][idx, 0] = (
-            dCd_dmax_camber_70
-        )
+        return derivs
 
-        # Contribution of fuselage.
-        if fuse_area > 0.0:
-            dCd2_dfuse_area = CD2 / (wing_area * fuselage_len_to_diam_ratio**2)
-            dSOS_dfuse_area = -base_area / fuse_area**2
-            dCd_dfuse_area = dCd2_dfuse_area + dCd2_dCD2 * dCD2_dSOS * dSOS_dfuse_area
+    def _get_design(self, inputs, complex_step):
+        """Return the design-dependent terms, recomputing them only when a design input changed."""
+        design_inputs = [inputs[name] for name in _DESIGN_INPUTS]
 
-            # wrt base_area
-            dSOS_dbase_area = 1.0 / fuse_area
-            dCd_dbase_area = dCd2_dCD2 * dCD2_dSOS * dSOS_dbase_area
+        if complex_step:
+            return _design_terms(*design_inputs)
 
-            # wrt wing_area
-            dCd_dwing_area = -CD2 * fuse_area / (wing_area * fuselage_len_to_diam_ratio) ** 2
+        if self._design is None or not all(
+            np.array_equal(new, old) for new, old in zip(design_inputs, self._design_inputs)
+        ):
+            self._design = _design_terms(*design_inputs)
+            self._design_inputs = [val.copy() for val in design_inputs]
 
-            # wrt fuselage_len_to_diam_ratio
-            dCd_dfuselage_len_to_diam_ratio = (
-                -2.0 * CD2 * fuse_area / (wing_area * fuselage_len_to_diam_ratio**3)
-            )
+        return self._design
 
-            partials['compress_drag_coeff', Aircraft.Fuselage.CROSS_SECTION][idx, 0] = (
-                dCd_dfuse_area
-            )
-            partials['compress_drag_coeff', Aircraft.Design.BASE_AREA][idx, 0] = dCd_dbase_area
-            partials['compress_drag_coeff', Aircraft.Wing.AREA][idx, 0] = dCd_dwing_area
-            partials['compress_drag_coeff', Aircraft.Fuselage.LENGTH_TO_DIAMETER][idx, 0] = (
-                dCd_dfuselage_len_to_diam_ratio
-            )
+    def _get_lookups(self, inputs, design, complex_step):
+        """
+        Return the table lookups at the nodes, repeating them only when the design or the Mach
+        numbers changed since they were last done.
+        """
+        mach = inputs[Dynamic.Atmosphere.MACH]
+        design_mach = inputs[Aircraft.Design.MACH]
+
+        if complex_step:
+            return self._evaluate(design, mach, design_mach, complex_step)[1]
+
+        cached = self._lookups
+        if cached is None or cached[0] is not design or not np.array_equal(cached[1], mach):
+            lookups = self._evaluate(design, mach, design_mach, complex_step)[1]
+            self._lookups = (design, mach.copy(), lookups)
+            return lookups
+
+        return cached[2]
+
+    def _evaluate(self, design, mach, design_mach, complex_step):
+        """Return the compressibility drag at the nodes, and the table lookups it used."""
+        del_mach = mach - design_mach
+
+        idx_super = np.where(del_mach.real > 0.05)[0]
+        idx_sub = np.where(del_mach.real <= 0.05)[0]
+        idx_mach = None
+
+        compress_drag_coeff = np.zeros(mach.size, dtype=mach.dtype)
+        lookups = {}
+
+        if idx_super.size > 0:
+            mach_super = mach[idx_super]
+
+            CD3 = lookups['PCAR'] = _lookup(design, 'PCAR', del_mach[idx_super], complex_step)
+            compress_drag_coeff[idx_super] = CD3[0] * design['tc_fact']
+
+            # Contribution of fuselage.
+            if design['fuselage']:
+                CD4 = lookups['BSUP'] = _lookup(design, 'BSUP', mach_super, complex_step)
+                compress_drag_coeff[idx_super] += CD4[0] * design['fus_fact']
+
+                # Wing fuselage interference.
+                idx_mach = np.where(mach_super.real >= 1.0)[0]
+                if idx_mach.size > 0:
+                    CD5 = lookups['WFI'] = _lookup(
+                        design, 'WFI', mach_super[idx_mach], complex_step, clamp=False
+                    )
+                    compress_drag_coeff[idx_super[idx_mach]] += CD5[0] * design['wfi_fact']
+
+        if idx_sub.size > 0:
+            CD1 = lookups['PCW'] = _lookup(design, 'PCW', del_mach[idx_sub], complex_step)
+            compress_drag_coeff[idx_sub] = CD1[0] * design['tc_fact']
+
+            # Contribution of fuselage.
+            if design['fuselage']:
+                CD2 = lookups['BSUB'] = _lookup(design, 'BSUB', mach[idx_sub], complex_step)
+                compress_drag_coeff[idx_sub] += CD2[0] * design['fus_fact']
+
+        return compress_drag_coeff, (idx_super, idx_sub, idx_mach, lookups)
+
+
+def _lookup(design, name, x, complex_step, clamp=True):
+    """
+    Interpolate a wave drag table at the nodes.
+
+    Returns the table value and its derivatives with respect to the node variable and the
+    design variable of the table.
+    """
+    table, points, design_var = _TABLES[name]
+    y = design[design_var]
+
+    if complex_step:
+        # The cached one-dimensional tables are real, so go through the full table.
+        xy = np.empty((x.size, 2), dtype=x.dtype)
+        xy[:, 0] = x
+        xy[:, 1] = y
+        CD, dCD = table.interpolate(xy, compute_derivative=True)
+        dCD_dx = dCD[:, 0]
+        dCD_dy = dCD[:, 1]
+
+    else:
+        slices = design['slices']
+        if name not in slices:
+            slices[name] = _slice_table(table, points, y)
+
+        value_table, deriv_table = slices[name]
+        CD, dCD_dx = value_table.interpolate(x, compute_derivative=True)
+        dCD_dx = dCD_dx[:, 0]
+        dCD_dy = deriv_table.interpolate(x)
+
+    if clamp:
+        # Negative drag sometimes occurs due to overshoot in the table interp.
+        idx_clamp = np.where(CD.real <= 0)
+        CD[idx_clamp] = 0.0
+        dCD_dx[idx_clamp] = 0.0
+        dCD_dy[idx_clamp] = 0.0
+
+    return CD, dCD_dx, dCD_dy
+
+
+def _design_terms(
+    design_mach,
+    base_area,
+    wing_area,
+    AR,
+    max_camber_70,
+    sweep25,
+    wing_taper_ratio,
+    TC,
+    fuse_area,
+    diam_to_wing_span_ratio,
+    fuselage_len_to_diam_ratio,
+):
+    """Return the terms of the compressibility drag that only depend on the aircraft inputs."""
+    tan_sw = np.tan(sweep25 / 57.2958)
+
+    terms = {
+        'tc_fact': TC ** (5.0 / 3.0) * (1.0 + 0.1 * max_camber_70),
+        'dtc_fact_dTC': (5.0 / 3.0) * TC ** (2.0 / 3.0) * (1.0 + 0.1 * max_camber_70),
+        'dtc_fact_dcam': 0.1 * TC ** (5.0 / 3.0),
+        'TOC': TC ** (2.0 / 3.0),
+        'dTOC_dTC': (2.0 / 3.0) * TC ** (-1.0 / 3.0),
+        'ART': AR * tan_sw + (1.0 - wing_taper_ratio) / (1.0 + wing_taper_ratio),
+        'dART_dAR': tan_sw,
+        'dART_dTR': -(1 - wing_taper_ratio) / (wing_taper_ratio + 1) ** 2
+        - 1.0 / (wing_taper_ratio + 1),
+        'dART_dsweep': AR * (tan_sw**2 + 1) / 57.2958,
+        'diam_to_wing_span_ratio': diam_to_wing_span_ratio,
+        'fuselage': fuse_area > 0.0,
+        # one-dimensional tables over Mach number, built as needed
+        'slices': {},
+    }
+
+    if terms['fuselage']:
+        terms['SOS'] = 1.0 + base_area / fuse_area
+        terms['dSOS_dfuse_area'] = -base_area / fuse_area**2
+        terms['dSOS_dbase_area'] = 1.0 / fuse_area
+
+        terms['fus_fact'] = fuse_area / wing_area * (1.0 / fuselage_len_to_diam_ratio**2)
+        terms['dfus_fact_dfuse_area'] = 1.0 / (wing_area * fuselage_len_to_diam_ratio**2)
+        terms['dfus_fact_dwing_area'] = -fuse_area / (wing_area * fuselage_len_to_diam_ratio) ** 2
+        terms['dfus_fact_dlen_to_diam'] = (
+            -2.0 * fuse_area / (wing_area * fuselage_len_to_diam_ratio**3)
+        )
 
-        else:
-            partials['compress_drag_coeff', Aircraft.Fuselage.CROSS_SECTION][idx, 0] = 0.0
-            partials['compress_drag_coeff', Aircraft.Design.BASE_AREA][idx, 0] = 0.0
-            partials['compress_drag_coeff', Aircraft.Wing.AREA][idx, 0] = 0.0
-            partials['compress_drag_coeff', Aircraft.Fuselage.LENGTH_TO_DIAMETER][idx, 0] = 0.0
+        taper_ratio = wing_taper_ratio
+        if wing_taper_ratio == 1.0:
+            taper_ratio = 0.5
+
+        terms['wfi_fact'] = 1.0 / (1.0 - taper_ratio) / np.cos(sweep25 / 57.2958)
+
+    return terms
+
+
+def _fuselage_partials(design, derivs, idx, CD, dCD_dMach, dCD_dSOS):
+    """Add the partials of the fuselage compressibility drag at the nodes idx."""
+    fus_fact = design['fus_fact']
+
+    derivs[Dynamic.Atmosphere.MACH][idx] += fus_fact * dCD_dMach
+    derivs[Aircraft.Fuselage.CROSS_SECTION][idx] = (
+        CD * design['dfus_fact_dfuse_area'] + fus_fact * dCD_dSOS * design['dSOS_dfuse_area']
+    )
+    derivs[Aircraft.Design.BASE_AREA][idx] = fus_fact * dCD_dSOS * design['dSOS_dbase_area']
+    derivs[Aircraft.Wing.AREA][idx] = CD * design['dfus_fact_dwing_area']
+    derivs[Aircraft.Fuselage.LENGTH_TO_DIAMETER][idx] = CD * design['dfus_fact_dlen_to_diam']
+
+
+def _slice_table(table, points, y):
+    """
+    Reduce a wave drag table to one-dimensional tables over its first axis at a fixed design.
+
+    The tables use tensor-product Lagrange interpolation, so interpolating the values of the
+    table (and of its derivative with respect to the second axis) at the fixed value y over the
+    first axis gives the same result as interpolating the full table.
+    """
+    xy = np.empty((points.size, 2))
+    xy[:, 0] = points
+    xy[:, 1] = y
+    CD, dCD = table.interpolate(xy, compute_derivative=True)
+
+    value_table = InterpND(method='lagrange2', points=points, values=CD, extrapolate=True)
+    deriv_table = InterpND(
+        method='lagrange2', points=points, values=dCD[:, 1].copy(), extrapolate=True
+    )
+
+    return value_table, deriv_table
+
+
+_DESIGN_INPUTS = (
+    Aircraft.Design.MACH,
+    Aircraft.Design.BASE_AREA,
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.TAPER_RATIO,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+    Aircraft.Fuselage.CROSS_SECTION,
+    Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
+    Aircraft.Fuselage.LENGTH_TO_DIAMETER,
+)
 
-        partials['compress_drag_coeff', Aircraft.Wing.TAPER_RATIO][idx, 0] = 0.0
-        partials['compress_drag_coeff', Aircraft.Wing.SWEEP][idx, 0] = 0.0
-        partials['compress_drag_coeff', Aircraft.Wing.ASPECT_RATIO][idx, 0] = 0.0
-        partials['compress_drag_coeff', Aircraft.Fuselage.DIAMETER_TO_WING_SPAN][idx, 0] = 0.0
+_DESIGN_PARTIALS = [
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Fuselage.CROSS_SECTION,
+    Aircraft.Wing.AREA,
+    Aircraft.Fuselage.LENGTH_TO_DIAMETER,
+    Aircraft.Wing.TAPER_RATIO,
+    Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
+    Aircraft.Design.BASE_AREA,
+    Aircraft.Design.MACH,
+]
 
 
 # Tables
@@ -559,7 +517,7 @@ WFI = np.array(
             -0.00200, -0.00150, -0.00060, 0.00040, 0.00240,
         ],
         [
-            1.200, 0.0, 0.0, 0.00020, -0.00080, -0.00170, 
+            1.200, 0.0, 0.0, 0.00020, -0.00080, -0.00170,
             -0.00180, -0.00140, -0.00060, 0.00030, 0.00200,
         ],
         [
@@ -595,3 +553,13 @@ BSUPtable = InterpND(
 WFITable = InterpND(
     method='lagrange2', points=(WFI[1:, 0], WFI[0, 1:]), values=WFI[1:, 1:], extrapolate=True
 )
+
+# Wave drag tables, the points of their first (per-node) axis and the design term that sets
+# their second axis
+_TABLES = {
+    'PCW': (PCWtable, PCW[1:, 0], 'TOC'),
+    'BSUB': (BSUBtable, BSUB[1:, 0], 'SOS'),
+    'PCAR': (PCARtable, PCAR[1:, 0], 'ART'),
+    'BSUP': (BSUPtable, BSUP[1:, 0], 'SOS'),
+    'WFI': (WFITable, WFI[1:, 0], 'diam_to_wing_span_ratio'),
+}
@@ -7,11 +7,12 @@ from aviary.subsystems.aerodynamics.aero_common import DynamicPressure
 from aviary.subsystems.aerodynamics.flops_based.buffet_lift import BuffetLift
 from aviary.subsystems.aerodynamics.flops_based.compressibility_drag import CompressibilityDrag
 from aviary.subsystems.aerodynamics.flops_based.drag import TotalDrag
+from aviary.subsystems.aerodynamics.flops_based.fused_computed_aero import FusedComputedAero
 from aviary.subsystems.aerodynamics.flops_based.induced_drag import InducedDrag
 from aviary.subsystems.aerodynamics.flops_based.lift import LiftEqualsWeight
 from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import LiftDependentDrag
 from aviary.subsystems.aerodynamics.flops_based.mux_component import MuxComponent
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import ExplicitSkinFriction
 from aviary.subsystems.aerodynamics.flops_based.skin_friction_drag import SkinFrictionDrag
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
@@ -24,11 +25,39 @@ class ComputedAeroGroup(om.Group):
             'num_nodes', default=1, types=int, desc='Number of nodes along mission segment'
         )
         self.options.declare('gamma', default=1.4, desc='Ratio of specific heats for air.')
+        self.options.declare(
+            'fused',
+            default=False,
+            types=bool,
+            desc='If True, compute the drag buildup in a single FusedComputedAero component '
+            'instead of one component per step.',
+        )
 
     def setup(self):
         num_nodes = self.options['num_nodes']
         gamma = self.options['gamma']
 
+        if self.options['fused']:
+            self.add_subsystem(
+                'FusedAero',
+                FusedComputedAero(num_nodes=num_nodes, gamma=gamma),
+                promotes_inputs=['*'],
+                promotes_outputs=[
+                    Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+                    Dynamic.Vehicle.LIFT_COEFFICIENT,
+                    Dynamic.Vehicle.LIFT,
+                    'skin_friction_coeff',
+                    'Re',
+                    'CDI',
+                    'CD0',
+                    Dynamic.Vehicle.DRAG_COEFFICIENT,
+                    Dynamic.Vehicle.DRAG,
+                ],
+            )
+
+            self.set_input_defaults(Aircraft.Wing.AREA, units='ft**2', val=0.0)
+            return
+
         comp = MuxComponent()
         self.add_subsystem(
             'Mux',
@@ -119,7 +148,7 @@ class ComputedAeroGroup(om.Group):
             ],
         )
 
-        comp = SkinFriction(num_nodes=num_nodes)
+        comp = ExplicitSkinFriction(num_nodes=num_nodes)
         self.add_subsystem(
             'SkinFrictionCoef',
             comp,
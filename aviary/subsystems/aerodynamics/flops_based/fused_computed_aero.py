@@ -0,0 +1,594 @@
+"""
+Single-component form of the FLOPS-based computed aero.
+
+FusedComputedAero evaluates the same drag buildup as ComputedAeroGroup (dynamic pressure, lift,
+pressure drag, induced drag, compressibility drag, skin friction, skin friction drag, total drag
+and buffet lift) in one vectorized compute, and assembles the chain rule through all of those
+steps in one compute_partials. The mission model then has a single system and a single sparse
+Jacobian block for the aerodynamics at every phase instead of about a dozen. Each drag term is
+evaluated by the same function as the component that computes it in ComputedAeroGroup.
+"""
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.units import unit_conversion
+
+from aviary.subsystems.aerodynamics.flops_based.buffet_lift import _buffet_lift
+from aviary.subsystems.aerodynamics.flops_based.compressibility_drag import _CompressibilityKernel
+from aviary.subsystems.aerodynamics.flops_based.induced_drag import _induced_drag_coeff
+from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import _pressure_drag_coeff
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFrictionSolver
+from aviary.subsystems.aerodynamics.flops_based.skin_friction_drag import _skin_friction_drag_coeff
+from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+_N_TO_LBF = unit_conversion('N', 'lbf')[0]
+_PSF_TO_PA = unit_conversion('lbf/ft**2', 'N/m**2')[0]
+_FT2_TO_M2 = unit_conversion('ft**2', 'm**2')[0]
+
+# Per-component geometry inputs, in the order used by MuxComponent
+_GEOMETRY_KEYS = (
+    'WETTED_AREA',
+    'FINENESS',
+    'CHARACTERISTIC_LENGTH',
+    'LAMINAR_FLOW_UPPER',
+    'LAMINAR_FLOW_LOWER',
+)
+
+_GEOMETRY_UNITS = {
+    'WETTED_AREA': 'ft**2',
+    'FINENESS': 'unitless',
+    'CHARACTERISTIC_LENGTH': 'ft',
+    'LAMINAR_FLOW_UPPER': 'unitless',
+    'LAMINAR_FLOW_LOWER': 'unitless',
+}
+
+_WING_INPUTS = {
+    Aircraft.Wing.AREA: 'ft**2',
+    Aircraft.Wing.ASPECT_RATIO: 'unitless',
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN: 'unitless',
+    Aircraft.Wing.SPAN_EFFICIENCY_FACTOR: 'unitless',
+    Aircraft.Wing.SWEEP: 'deg',
+    Aircraft.Wing.TAPER_RATIO: 'unitless',
+    Aircraft.Wing.THICKNESS_TO_CHORD: 'unitless',
+}
+
+_DESIGN_INPUTS = {
+    Aircraft.Design.BASE_AREA: 'ft**2',
+    Aircraft.Design.LIFT_COEFFICIENT: 'unitless',
+    Aircraft.Design.MACH: 'unitless',
+    Aircraft.Design.PERCENT_EXCRESCENCE_DRAG: 'unitless',
+    Aircraft.Fuselage.CROSS_SECTION: 'ft**2',
+    Aircraft.Fuselage.DIAMETER_TO_WING_SPAN: 'unitless',
+    Aircraft.Fuselage.LENGTH_TO_DIAMETER: 'unitless',
+}
+
+_FACTOR_INPUTS = (
+    Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+    Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+    Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+    Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+)
+
+_CDI_INPUTS = (
+    Aircraft.Design.LIFT_COEFFICIENT,
+    Aircraft.Design.MACH,
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Wing.SPAN_EFFICIENCY_FACTOR,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.TAPER_RATIO,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+)
+
+_CD0_INPUTS = (
+    Aircraft.Design.BASE_AREA,
+    Aircraft.Design.MACH,
+    Aircraft.Design.PERCENT_EXCRESCENCE_DRAG,
+    Aircraft.Fuselage.CROSS_SECTION,
+    Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
+    Aircraft.Fuselage.LENGTH_TO_DIAMETER,
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.TAPER_RATIO,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+)
+
+_BUFFET_INPUTS = (
+    Aircraft.Design.MACH,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+)
+
+_DYNAMIC_INPUTS = (
+    Dynamic.Atmosphere.MACH,
+    Dynamic.Atmosphere.STATIC_PRESSURE,
+    Dynamic.Atmosphere.TEMPERATURE,
+    Dynamic.Vehicle.MASS,
+)
+
+
+class FusedComputedAero(om.ExplicitComponent):
+    """
+    FLOPS-based computed aero in a single component.
+
+    The results match ComputedAeroGroup; only the number of systems in the model differs.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', default=1, types=int, desc='Number of nodes along mission segment'
+        )
+        self.options.declare('gamma', default=1.4, desc='Ratio of specific heats for air.')
+
+        add_aviary_option(self, Aircraft.Design.TYPE)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Fuselage.NUM_FUSELAGES)
+        add_aviary_option(self, Aircraft.HorizontalTail.NUM_TAILS)
+        add_aviary_option(self, Aircraft.VerticalTail.NUM_TAILS)
+        add_aviary_option(self, Aircraft.Wing.AIRFOIL_TECHNOLOGY)
+        add_aviary_option(self, Aircraft.Wing.SPAN_EFFICIENCY_REDUCTION)
+        add_aviary_option(self, Mission.GRAVITY, units='m/s**2')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        # Simulation inputs
+        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+        add_aviary_input(self, Dynamic.Atmosphere.STATIC_PRESSURE, shape=nn, units='lbf/ft**2')
+        add_aviary_input(self, Dynamic.Atmosphere.TEMPERATURE, shape=nn, units='degR')
+        add_aviary_input(self, Dynamic.Vehicle.MASS, shape=nn, units='kg')
+
+        # Component geometry, assembled into per-component vectors as in MuxComponent. Each
+        # component is identified by the inputs holding its data and the index into them.
+        surfaces = [(Aircraft.Wing, 0)]
+        geometry_classes = [Aircraft.Wing]
+
+        for cls, num in (
+            (Aircraft.HorizontalTail, self.options[Aircraft.HorizontalTail.NUM_TAILS]),
+            (Aircraft.VerticalTail, self.options[Aircraft.VerticalTail.NUM_TAILS]),
+            (Aircraft.Fuselage, self.options[Aircraft.Fuselage.NUM_FUSELAGES]),
+        ):
+            if num > 0:
+                surfaces.extend([(cls, 0)] * num)
+                geometry_classes.append(cls)
+
+        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+        if int(sum(num_engines)) > 0:
+            for i, num in enumerate(num_engines):
+                surfaces.extend([(Aircraft.Nacelle, i)] * num)
+            geometry_classes.append(Aircraft.Nacelle)
+
+        self.nc = len(surfaces)
+        self._surfaces = {
+            key: [(getattr(cls, key), idx) for cls, idx in surfaces] for key in _GEOMETRY_KEYS
+        }
+
+        self._geometry_inputs = {}
+        for cls in geometry_classes:
+            shape = len(num_engines) if cls is Aircraft.Nacelle else 1
+            for key in _GEOMETRY_KEYS:
+                name = getattr(cls, key)
+                add_aviary_input(self, name, shape=shape, units=_GEOMETRY_UNITS[key])
+                self._geometry_inputs[name] = shape
+
+        for name, units in _WING_INPUTS.items():
+            add_aviary_input(self, name, units=units)
+
+        for name, units in _DESIGN_INPUTS.items():
+            add_aviary_input(self, name, units=units)
+
+        for name in _FACTOR_INPUTS:
+            add_aviary_input(self, name, units='unitless')
+
+        add_aviary_output(self, Dynamic.Atmosphere.DYNAMIC_PRESSURE, shape=nn, units='lbf/ft**2')
+        add_aviary_output(self, Dynamic.Vehicle.LIFT_COEFFICIENT, shape=nn, units='unitless')
+        add_aviary_output(self, Dynamic.Vehicle.LIFT, shape=nn, units='N')
+        add_aviary_output(self, Dynamic.Vehicle.DRAG_COEFFICIENT, shape=nn, units='unitless')
+        add_aviary_output(self, Dynamic.Vehicle.DRAG, shape=nn, units='N')
+
+        self.add_output('skin_friction_coeff', np.ones((nn, self.nc)), units='unitless')
+        self.add_output('Re', np.ones((nn, self.nc)), units='unitless')
+        self.add_output(
+            'CDI',
+            np.ones(nn),
+            units='unitless',
+            desc='lift-dependent drag coefficient, including contributions from pressure drag '
+            'coefficient',
+        )
+        self.add_output('CD0', np.ones(nn), units='unitless', desc='zero-lift drag coefficient')
+        self.add_output(
+            'DELCLB',
+            np.zeros(nn),
+            units='unitless',
+            desc='Delta lift coefficient before buffet onset',
+        )
+
+        self._skin_friction = SkinFrictionSolver()
+        self._compressibility = _CompressibilityKernel()
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        nc = self.nc
+        row_col = np.arange(nn)
+        grav_metric = self.options[Mission.GRAVITY][0]
+
+        self.declare_partials(
+            Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+            [Dynamic.Atmosphere.MACH, Dynamic.Atmosphere.STATIC_PRESSURE],
+            rows=row_col,
+            cols=row_col,
+        )
+        self.declare_partials(
+            Dynamic.Vehicle.LIFT, Dynamic.Vehicle.MASS, rows=row_col, cols=row_col, val=grav_metric
+        )
+        self.declare_partials(
+            Dynamic.Vehicle.LIFT_COEFFICIENT,
+            [Dynamic.Atmosphere.MACH, Dynamic.Atmosphere.STATIC_PRESSURE, Dynamic.Vehicle.MASS],
+            rows=row_col,
+            cols=row_col,
+        )
+        self.declare_partials(Dynamic.Vehicle.LIFT_COEFFICIENT, Aircraft.Wing.AREA)
+
+        # Skin friction only depends on the flight condition and the characteristic lengths.
+        rows = np.arange(nn * nc)
+        cols = np.repeat(row_col, nc)
+        self.declare_partials(
+            ['skin_friction_coeff', 'Re'],
+            [
+                Dynamic.Atmosphere.MACH,
+                Dynamic.Atmosphere.STATIC_PRESSURE,
+                Dynamic.Atmosphere.TEMPERATURE,
+            ],
+            rows=rows,
+            cols=cols,
+        )
+
+        self._length_jac = {}
+        for name, idx in dict.fromkeys(self._surfaces['CHARACTERISTIC_LENGTH']):
+            comps = np.array(
+                [
+                    j
+                    for j, surface in enumerate(self._surfaces['CHARACTERISTIC_LENGTH'])
+                    if surface == (name, idx)
+                ]
+            )
+            self._length_jac.setdefault(name, []).append((comps, idx))
+
+        for name, entries in self._length_jac.items():
+            rows = np.concatenate(
+                [np.add.outer(row_col * nc, comps).ravel() for comps, _ in entries]
+            )
+            cols = np.concatenate([np.full(nn * comps.size, idx) for comps, idx in entries])
+            self.declare_partials(['skin_friction_coeff', 'Re'], name, rows=rows, cols=cols)
+
+        self.declare_partials(
+            ['CD0', 'CDI', Dynamic.Vehicle.DRAG_COEFFICIENT, Dynamic.Vehicle.DRAG],
+            list(_DYNAMIC_INPUTS),
+            rows=row_col,
+            cols=row_col,
+        )
+
+        self.declare_partials('CDI', list(_CDI_INPUTS))
+        self.declare_partials('CD0', list(_CD0_INPUTS) + list(self._geometry_inputs))
+
+        aircraft_inputs = sorted(
+            set(_CDI_INPUTS) | set(_CD0_INPUTS) | set(self._geometry_inputs) | set(_FACTOR_INPUTS)
+        )
+        self.declare_partials(
+            [Dynamic.Vehicle.DRAG_COEFFICIENT, Dynamic.Vehicle.DRAG], aircraft_inputs
+        )
+
+        self.declare_partials('DELCLB', Dynamic.Atmosphere.MACH, rows=row_col, cols=row_col)
+        self.declare_partials('DELCLB', list(_BUFFET_INPUTS))
+
+    def _geometry(self, inputs):
+        """Assemble the per-component geometry vectors."""
+        return {
+            key: np.array([inputs[name][idx] for name, idx in self._surfaces[key]])
+            for key in _GEOMETRY_KEYS
+        }
+
+    def _evaluate(self, inputs):
+        """
+        Run the drag buildup.
+
+        Returns a dictionary with the outputs and the local derivatives of every step, which
+        are chained together in compute_partials.
+        """
+        nn = self.options['num_nodes']
+        gamma = self.options['gamma']
+        grav_metric = self.options[Mission.GRAVITY][0]
+
+        mach = inputs[Dynamic.Atmosphere.MACH]
+        P = inputs[Dynamic.Atmosphere.STATIC_PRESSURE]
+        T = inputs[Dynamic.Atmosphere.TEMPERATURE]
+        mass = inputs[Dynamic.Vehicle.MASS]
+        Sref = inputs[Aircraft.Wing.AREA]
+
+        data = {}
+
+        # Dynamic pressure and lift
+        q = 0.5 * gamma * P * mach**2
+        q_metric = q * _PSF_TO_PA
+        S_metric = Sref * _FT2_TO_M2
+        weight = grav_metric * mass
+
+        data['q'] = q
+        data['lift'] = weight
+        data['CL'] = weight / (q_metric * S_metric)
+
+        # Lift coefficient as computed by the drag components from lift in lbf
+        lift = weight * _N_TO_LBF
+        CL = 2.0 * lift / (Sref * gamma * P * mach**2)
+        data['CL_drag'] = CL
+
+        AR = inputs[Aircraft.Wing.ASPECT_RATIO]
+        CAM = inputs[Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN]
+        SW25 = inputs[Aircraft.Wing.SWEEP]
+        TC = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
+        design_mach = inputs[Aircraft.Design.MACH]
+
+        # Lift-dependent drag
+        data['pressure'] = _pressure_drag_coeff(
+            mach, CL, inputs[Aircraft.Design.LIFT_COEFFICIENT], design_mach, AR, CAM, TC
+        )
+        data['induced'] = _induced_drag_coeff(
+            mach,
+            CL,
+            AR,
+            inputs[Aircraft.Wing.SPAN_EFFICIENCY_FACTOR],
+            SW25,
+            inputs[Aircraft.Wing.TAPER_RATIO],
+            self.options[Aircraft.Wing.SPAN_EFFICIENCY_REDUCTION],
+        )
+
+        # Zero-lift drag
+        complex_step = self.under_complex_step
+        data['compress'] = (
+            self._compressibility.compute(inputs, complex_step),
+            self._compressibility.compute_partials(inputs, complex_step),
+        )
+
+        geom = self._geometry(inputs)
+        solver = self._skin_friction
+        cond = solver.flight_condition(T, P, mach, geom['CHARACTERISTIC_LENGTH'])
+        wall_temp, cf = solver.solve(cond, store=not self.under_complex_step)
+
+        data['geometry'] = geom
+        data['skin_friction'] = (cond, wall_temp, cf)
+        data['skin_friction_coeff'] = cf / solver.wall_temp_ratio(cond, wall_temp)
+        data['Re'] = cond['reynolds_num']
+        data['friction'] = _skin_friction_drag_coeff(
+            data['skin_friction_coeff'],
+            data['Re'],
+            geom['FINENESS'],
+            geom['WETTED_AREA'],
+            geom['LAMINAR_FLOW_UPPER'],
+            geom['LAMINAR_FLOW_LOWER'],
+            Sref,
+            inputs[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG],
+            self.options[Aircraft.Wing.AIRFOIL_TECHNOLOGY],
+        )
+
+        CDI = data['pressure'][0] + data['induced'][0]
+        CD0 = data['friction'][0] + data['compress'][0]
+
+        # Total drag
+        FCDI = inputs[Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR]
+        FCD0 = inputs[Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR]
+        FCDSUB = inputs[Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR]
+        FCDSUP = inputs[Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR]
+
+        CD_prescaled = CDI * FCDI + CD0 * FCD0
+
+        idx_sup = np.where(mach.real >= 1.0)
+        scale = np.empty(nn, dtype=CD_prescaled.dtype)
+        scale[:] = FCDSUB
+        scale[idx_sup] = FCDSUP
+
+        data['CDI'] = CDI
+        data['CD0'] = CD0
+        data['CD_prescaled'] = CD_prescaled
+        data['scale'] = scale
+        data['CD'] = CD_prescaled * scale
+        data['drag'] = q_metric * S_metric * data['CD']
+
+        data['buffet'] = _buffet_lift(mach, design_mach, AR, CAM, SW25, TC)
+
+        return data
+
+    def compute(self, inputs, outputs):
+        data = self._evaluate(inputs)
+
+        outputs[Dynamic.Atmosphere.DYNAMIC_PRESSURE] = data['q']
+        outputs[Dynamic.Vehicle.LIFT_COEFFICIENT] = data['CL']
+        outputs[Dynamic.Vehicle.LIFT] = data['lift']
+        outputs['skin_friction_coeff'] = data['skin_friction_coeff']
+        outputs['Re'] = data['Re']
+        outputs['CDI'] = data['CDI']
+        outputs['CD0'] = data['CD0']
+        outputs[Dynamic.Vehicle.DRAG_COEFFICIENT] = data['CD']
+        outputs[Dynamic.Vehicle.DRAG] = data['drag']
+        outputs['DELCLB'] = data['buffet'][0]
+
+    def compute_partials(self, inputs, partials):
+        nn = self.options['num_nodes']
+        gamma = self.options['gamma']
+        grav_metric = self.options[Mission.GRAVITY][0]
+
+        data = self._evaluate(inputs)
+
+        mach = inputs[Dynamic.Atmosphere.MACH]
+        P = inputs[Dynamic.Atmosphere.STATIC_PRESSURE]
+        Sref = inputs[Aircraft.Wing.AREA]
+        q = data['q']
+
+        MACH = Dynamic.Atmosphere.MACH
+        PRESSURE = Dynamic.Atmosphere.STATIC_PRESSURE
+        TEMPERATURE = Dynamic.Atmosphere.TEMPERATURE
+        MASS = Dynamic.Vehicle.MASS
+
+        # Dynamic pressure and lift
+        dq = {MACH: gamma * P * mach, PRESSURE: 0.5 * gamma * mach**2}
+        partials[Dynamic.Atmosphere.DYNAMIC_PRESSURE, MACH] = dq[MACH]
+        partials[Dynamic.Atmosphere.DYNAMIC_PRESSURE, PRESSURE] = dq[PRESSURE]
+
+        CL = data['CL']
+        partials[Dynamic.Vehicle.LIFT_COEFFICIENT, MACH] = -CL / q * dq[MACH]
+        partials[Dynamic.Vehicle.LIFT_COEFFICIENT, PRESSURE] = -CL / q * dq[PRESSURE]
+        partials[Dynamic.Vehicle.LIFT_COEFFICIENT, MASS] = grav_metric / (
+            q * _PSF_TO_PA * Sref * _FT2_TO_M2
+        )
+        partials[Dynamic.Vehicle.LIFT_COEFFICIENT, Aircraft.Wing.AREA] = -CL / Sref
+
+        CL_drag = data['CL_drag']
+        dCL_drag = {
+            MACH: -2.0 * CL_drag / mach,
+            PRESSURE: -CL_drag / P,
+            MASS: 2.0 * grav_metric * _N_TO_LBF / (Sref * gamma * P * mach**2),
+            Aircraft.Wing.AREA: -CL_drag / Sref,
+        }
+
+        # Lift-dependent drag
+        dCDI = {}
+        for _, derivs in (data['pressure'], data['induced']):
+            for name, val in derivs.items():
+                if name == 'CL':
+                    for wrt, dCL in dCL_drag.items():
+                        _accumulate(dCDI, wrt, val * dCL)
+                else:
+                    _accumulate(dCDI, name, val)
+
+        # Zero-lift drag
+        dCD0 = {}
+        for name, val in data['compress'][1].items():
+            _accumulate(dCD0, name, val)
+
+        cond, wall_temp, cf = data['skin_friction']
+        sf_derivs = self._skin_friction.sensitivities(cond, wall_temp, cf)
+
+        names = {'T': TEMPERATURE, 'p': PRESSURE, 'mach': MACH}
+        for var, name in names.items():
+            dskf, dRe = sf_derivs[var]
+            partials['skin_friction_coeff', name] = dskf.ravel()
+            partials['Re', name] = dRe.ravel()
+
+        dskf_dlen, dRe_dlen = sf_derivs['length']
+        for name, entries in self._length_jac.items():
+            partials['skin_friction_coeff', name] = np.concatenate(
+                [dskf_dlen[:, comps].ravel() for comps, _ in entries]
+            )
+            partials['Re', name] = np.concatenate(
+                [dRe_dlen[:, comps].ravel() for comps, _ in entries]
+            )
+
+        _, friction_derivs = data['friction']
+        dCDF_dcf = friction_derivs['skin_friction_coeff']
+        dCDF_dRe = friction_derivs['Re']
+
+        for var, name in names.items():
+            dskf, dRe = sf_derivs[var]
+            _accumulate(dCD0, name, np.sum(dCDF_dcf * dskf + dCDF_dRe * dRe, axis=1))
+
+        geometry_derivs = {
+            name: np.zeros((nn, shape), dtype=cf.dtype)
+            for name, shape in self._geometry_inputs.items()
+        }
+        dCDF_dgeom = {
+            'WETTED_AREA': friction_derivs['wetted_areas'],
+            'FINENESS': friction_derivs['fineness_ratios'],
+            'CHARACTERISTIC_LENGTH': dCDF_dcf * dskf_dlen + dCDF_dRe * dRe_dlen,
+            'LAMINAR_FLOW_UPPER': friction_derivs['laminar_fractions_upper'],
+            'LAMINAR_FLOW_LOWER': friction_derivs['laminar_fractions_lower'],
+        }
+        for key, val in dCDF_dgeom.items():
+            for j, (name, idx) in enumerate(self._surfaces[key]):
+                geometry_derivs[name][:, idx] += val[:, j]
+
+        for name, val in geometry_derivs.items():
+            _accumulate(dCD0, name, val)
+
+        for name in (Aircraft.Wing.AREA, Aircraft.Design.PERCENT_EXCRESCENCE_DRAG):
+            _accumulate(dCD0, name, friction_derivs[name])
+
+        # Total drag
+        FCDI = inputs[Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR]
+        FCD0 = inputs[Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR]
+        scale = data['scale']
+        CD_prescaled = data['CD_prescaled']
+        CD = data['CD']
+
+        q_metric = q * _PSF_TO_PA
+        S_metric = Sref * _FT2_TO_M2
+        qS = q_metric * S_metric
+
+        dCD = {}
+        for name, val in dCDI.items():
+            _accumulate(dCD, name, _times(scale * FCDI, val))
+        for name, val in dCD0.items():
+            _accumulate(dCD, name, _times(scale * FCD0, val))
+
+        idx_sup = np.where(mach.real >= 1.0)
+        sub = np.array(CD_prescaled)
+        sub[idx_sup] = 0.0
+
+        dCD[Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR] = scale * data['CDI']
+        dCD[Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR] = scale * data['CD0']
+        dCD[Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR] = sub
+        dCD[Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR] = CD_prescaled - sub
+
+        dDrag = {name: _times(qS, val) for name, val in dCD.items()}
+        for name, val in dq.items():
+            _accumulate(dDrag, name, val * _PSF_TO_PA * S_metric * CD)
+        _accumulate(dDrag, Aircraft.Wing.AREA, q_metric * _FT2_TO_M2 * CD)
+
+        for of, derivs in (
+            ('CDI', dCDI),
+            ('CD0', dCD0),
+            (Dynamic.Vehicle.DRAG_COEFFICIENT, dCD),
+            (Dynamic.Vehicle.DRAG, dDrag),
+        ):
+            for name in _DYNAMIC_INPUTS:
+                if name in derivs:
+                    partials[of, name] = np.broadcast_to(derivs[name], (nn,))
+                else:
+                    partials[of, name] = 0.0
+
+            for name, val in derivs.items():
+                if name not in _DYNAMIC_INPUTS:
+                    partials[of, name] = _column(val, nn)
+
+        # Buffet lift
+        _, buffet_derivs = data['buffet']
+        partials['DELCLB', MACH] = buffet_derivs[MACH]
+        for name in _BUFFET_INPUTS:
+            partials['DELCLB', name] = _column(buffet_derivs[name], nn)
+
+
+def _accumulate(derivs, name, val):
+    if name in derivs:
+        derivs[name] = derivs[name] + val
+    else:
+        derivs[name] = val
+
+
+def _times(factor, val):
+    """Multiply a node vector into a derivative that may have a column per input entry."""
+    val = np.asarray(val)
+    if val.ndim == 2:
+        return factor[:, np.newaxis] * val
+    return factor * val
+
+
+def _column(val, nn):
+    """Return a derivative w.r.t. an aircraft input as a dense (nn, size) array."""
+    val = np.asarray(val)
+    if val.ndim < 2:
+        val = np.broadcast_to(val, (nn,))[:, np.newaxis]
+    return val
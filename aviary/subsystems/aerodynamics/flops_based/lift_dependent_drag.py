@@ -69,286 +69,201 @@ class LiftDependentDrag(om.ExplicitComponent):
 
         self.declare_partials('pressure_drag_coeff', wrt)
 
-    def edge_interp(self, A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A):
-        den = 1.0 / ((A - A1) * FCDP1 - (A - A2) * FCDP2)
-        FCDP = 2.0 * FCDP1 * FCDP2 * den
-
-        # Derivative of FCDP w.r.t A variable at value of A
-        dFCDP_dA = 2.0 * FCDP1 * FCDP2 * (FCDP2 - FCDP1) * den**2
-
-        dFCDP_dDEL = (
-            2.0
-            * den
-            * (
-                dFCDP1 * (FCDP2 - FCDP1 * FCDP2 * den * (A - A1))
-                + dFCDP2 * (FCDP1 + FCDP1 * FCDP2 * den * (A - A2))
-            )
-        )
-
-        return FCDP[0], dFCDP_dDEL[:, 0][0], dFCDP_dDEL[:, 1][0], dFCDP_dA[0]
-
-    def inner_interp(
-        self, arrA, FCDP1, FCDP2, FCDP3, FCDP4, FCDP5, dFCDP1, dFCDP2, dFCDP3, dFCDP4, dFCDP5, A
-    ):
-        # Derivative of FCDP w.r.t A variable at value of A
-        arrFCDP = np.array([FCDP1, FCDP2, FCDP3, FCDP4, FCDP5])
-        arrFCDP = np.reshape(arrFCDP, (5))
-        interp_arrFCDP = InterpND(method='lagrange2', points=(arrA), values=arrFCDP)
-        FCDP, deriv = interp_arrFCDP.interpolate(A, compute_derivative=True)  # at A
-        dFCDP_dA = deriv[:, 0]  # at A
-
-        # Derivative of FCDP w.r.t DELM variable at value of A
-        arrdFCDP_dDELM = np.array(
-            [dFCDP1[:, 0], dFCDP2[:, 0], dFCDP3[:, 0], dFCDP4[:, 0], dFCDP5[:, 0]]
-        )
-        arrdFCDP_dDELM = np.reshape(arrdFCDP_dDELM, (5))
-        interp_arrdFCDP_dDELM = InterpND(method='lagrange2', points=(arrA), values=arrdFCDP_dDELM)
-        dFCDP_dDELM, deriv = interp_arrdFCDP_dDELM.interpolate(A, compute_derivative=True)  # at A
-
-        # Derivative of FCDP w.r.t DELCL variable at value of A
-        arrdFCDP_dDELCL = np.array(
-            [dFCDP1[:, 1], dFCDP2[:, 1], dFCDP3[:, 1], dFCDP4[:, 1], dFCDP5[:, 1]]
-        )
-        arrdFCDP_dDELCL = np.reshape(arrdFCDP_dDELCL, (5))
-        interp_arrdFCDP_dDELCL = InterpND(method='lagrange2', points=(arrA), values=arrdFCDP_dDELCL)
-        dFCDP_dDELCL, deriv = interp_arrdFCDP_dDELCL.interpolate(A, compute_derivative=True)  # at A
-
-        return FCDP[0], dFCDP_dDELM[0], dFCDP_dDELCL[0], dFCDP_dA[0]
-
     def compute(self, inputs, outputs):
-        """
-        Calculate lift-dependent drag.
-
-        :param inputs: _description_
-        :type inputs: _type_
-        :param outputs: _description_
-        :type outputs: _type_
-        """
-        nn = self.options['num_nodes']
+        """Calculate lift-dependent drag."""
         gamma = self.options['gamma']
         mach, lift, P, CLDES, MDES, Sref, AR, CAM, SW25, TC = inputs.values()
 
-        FCDP = np.empty(nn, dtype=mach.dtype)
-        DCDP = np.empty(nn, dtype=mach.dtype)
-        dFCDP_dDELM = np.empty(nn, dtype=mach.dtype)
-        dFCDP_dDELCL = np.empty(nn, dtype=mach.dtype)
-        dFCDP_dA = np.empty(nn, dtype=mach.dtype)
-
         CL = 2.0 * lift / (Sref * gamma * P * mach**2)
 
-        DELCL = CL - CLDES
-        DELM = mach - MDES
-        A = self.A = AR * TC ** (1.0 / 3.0)
-
-        for i in range(0, nn):
-            x = np.array([DELM[i], DELCL[i]])
-
-            if DELM[i].real <= 0.075:
-                if A.real < 0.5:
-                    FCDP1, dFCDP1 = AR05table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR1table.interpolate(x, compute_derivative=True)
-
-                    A1 = 0.5
-                    A2 = 1.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
-
-                elif 0.5 <= A.real < 6:
-                    FCDP1, dFCDP1 = AR05table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR1table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = AR2table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = AR4table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = AR6table.interpolate(x, compute_derivative=True)
-
-                    arrA = np.array([0.5, 1, 2, 4, 6])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA,
-                        FCDP1,
-                        FCDP2,
-                        FCDP3,
-                        FCDP4,
-                        FCDP5,
-                        dFCDP1,
-                        dFCDP2,
-                        dFCDP3,
-                        dFCDP4,
-                        dFCDP5,
-                        A,
-                    )
-
-                else:
-                    FCDP1, dFCDP1 = AR4table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR6table.interpolate(x, compute_derivative=True)
-
-                    A1 = 4.0
-                    A2 = 6.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
-
-            else:
-                if A.real < 0.7:
-                    FCDP1, dFCDP1 = ARS07table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS08table.interpolate(x, compute_derivative=True)
-
-                    A1 = 0.7
-                    A2 = 0.8
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
-
-                elif 0.7 <= A.real <= 1.4:
-                    FCDP1, dFCDP1 = ARS07table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS08table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = ARS10table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = ARS12table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = ARS14table.interpolate(x, compute_derivative=True)
-
-                    arrA = np.array([0.7, 0.8, 1.0, 1.2, 1.4])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA,
-                        FCDP1,
-                        FCDP2,
-                        FCDP3,
-                        FCDP4,
-                        FCDP5,
-                        dFCDP1,
-                        dFCDP2,
-                        dFCDP3,
-                        dFCDP4,
-                        dFCDP5,
-                        A,
-                    )
-
-                elif 1.4 < A.real <= 2.0:
-                    FCDP1, dFCDP1 = ARS12table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS14table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = ARS16table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = ARS18table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = ARS20table.interpolate(x, compute_derivative=True)
-
-                    arrA = np.array([1.2, 1.4, 1.6, 1.8, 2.0])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA,
-                        FCDP1,
-                        FCDP2,
-                        FCDP3,
-                        FCDP4,
-                        FCDP5,
-                        dFCDP1,
-                        dFCDP2,
-                        dFCDP3,
-                        dFCDP4,
-                        dFCDP5,
-                        A,
-                    )
-
-                else:
-                    FCDP1, dFCDP1 = ARS18table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS20table.interpolate(x, compute_derivative=True)
-
-                    A1 = 1.8
-                    A2 = 2.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
-
-        DCDP = FCDP * (1.0 + CAM / 10.0) * A / AR
-        self.clamp_indices = np.where(DCDP < 0)
-        DCDP[DCDP < 0] = 0.0
-
-        self.FCDP = FCDP
-        self.dFCDP_dA = dFCDP_dA
-        self.dFCDP_dDELM = dFCDP_dDELM
-        self.dFCDP_dDELCL = dFCDP_dDELCL
+        DCDP, _ = _pressure_drag_coeff(mach, CL, CLDES, MDES, AR, CAM, TC)
 
         outputs['pressure_drag_coeff'] = DCDP
 
     def compute_partials(self, inputs, partials):
-        """
-        Calculate partials of lift-dependent drag.
-
-        :param inputs: _description_
-        :type inputs: _type_
-        :param partials: _description_
-        :type partials: _type_
-        """
+        """Calculate partials of lift-dependent drag."""
         gamma = self.options['gamma']
         mach, lift, P, CLDES, MDES, Sref, AR, CAM, SW25, TC = inputs.values()
 
+        CL = 2.0 * lift / (Sref * gamma * P * mach**2)
+
         ddelCL_dL = 2.0 / (Sref * gamma * P * mach**2)
         ddelCL_dP = -2.0 * lift / (Sref * gamma * P * P * mach**2)
         ddelCL_dSref = -2.0 * lift / (Sref * Sref * gamma * P * mach**2)
         ddelCL_dmach = -4.0 * lift / (Sref * gamma * P * mach**3)
 
-        FCDP = self.FCDP
-        dFCDP_dA = self.dFCDP_dA
-        dFCDP_dDELM = self.dFCDP_dDELM
-        dFCDP_dDELCL = self.dFCDP_dDELCL
-
-        # A = AR * TC**(1.0 / 3.0)
-        dA_dAR = TC ** (1.0 / 3.0)
-        dA_dTC = (1.0 / 3.0) * AR * TC ** (-2.0 / 3.0)
-        dA_dCAM = 0.0
-        dA_dSW25 = 0.0
-
-        dDCDP_dFCDP = (1 + CAM / 10.0) * TC ** (1.0 / 3.0)
-
-        ddelCL_dL = 2.0 / (Sref * gamma * P * mach**2)
-
-        # Derivative of lift-dependent drag w.r.t. Mach
-        dCD_dmach = dDCDP_dFCDP * dFCDP_dDELM
-
-        # Derivative of lift-dependent drag w.r.t. CL
-        dCD_dCL = dDCDP_dFCDP * dFCDP_dDELCL
-
-        # Derivative of lift-dependent drag w.r.t. wing aspect ratio
-        dFCDP_dAR = dFCDP_dA * dA_dAR
-        dCD_dAR = dDCDP_dFCDP * dFCDP_dAR
-
-        # Derivative of lift-dependent drag w.r.t. thickness-to-chord ratio
-        dDCDP_dTC = (1.0 / 3.0) * FCDP * (1 + CAM / 10.0) * TC ** (-2.0 / 3.0)
-        dFCDP_dTC = dFCDP_dA * dA_dTC
-        dCD_dTC = dDCDP_dFCDP * dFCDP_dTC + dDCDP_dTC
-
-        # Derivative of lift-dependent drag w.r.t. wing camber
-        dDCDP_dCAM = (FCDP / 10.0) * TC ** (1.0 / 3.0)
-        dFCDP_dCAM = dFCDP_dA * dA_dCAM
-        dCD_dCAM = dDCDP_dFCDP * dFCDP_dCAM + dDCDP_dCAM
-
-        # Derivative of lift-dependent drag w.r.t. wing quarted-chord sweep
-        dFCDP_dSW25 = dFCDP_dA * dA_dSW25
-        dCD_dSW25 = dDCDP_dFCDP * dFCDP_dSW25
+        _, derivs = _pressure_drag_coeff(mach, CL, CLDES, MDES, AR, CAM, TC)
+        dCD_dCL = derivs['CL']
 
         partials['pressure_drag_coeff', Dynamic.Atmosphere.MACH] = (
-            dCD_dmach + dCD_dCL * ddelCL_dmach
+            derivs[Dynamic.Atmosphere.MACH] + dCD_dCL * ddelCL_dmach
         )
         partials['pressure_drag_coeff', Dynamic.Vehicle.LIFT] = dCD_dCL * ddelCL_dL
         partials['pressure_drag_coeff', Dynamic.Atmosphere.STATIC_PRESSURE] = dCD_dCL * ddelCL_dP
         partials['pressure_drag_coeff', Aircraft.Wing.AREA] = dCD_dCL * ddelCL_dSref
-        partials['pressure_drag_coeff', Aircraft.Wing.ASPECT_RATIO] = dCD_dAR
-        partials['pressure_drag_coeff', Aircraft.Wing.THICKNESS_TO_CHORD] = dCD_dTC
-        partials['pressure_drag_coeff', Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN] = dCD_dCAM
-        partials['pressure_drag_coeff', Aircraft.Wing.SWEEP] = dCD_dSW25
-        partials['pressure_drag_coeff', Aircraft.Design.LIFT_COEFFICIENT] = -dCD_dCL
-        partials['pressure_drag_coeff', Aircraft.Design.MACH] = -dCD_dmach
-
-        if self.clamp_indices:
-            wrts = [
-                Dynamic.Atmosphere.MACH,
-                Dynamic.Vehicle.LIFT,
-                Dynamic.Atmosphere.STATIC_PRESSURE,
-                Aircraft.Wing.AREA,
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.THICKNESS_TO_CHORD,
-                Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Design.LIFT_COEFFICIENT,
-                Aircraft.Design.MACH,
-            ]
-            for wrt in wrts:
-                partials['pressure_drag_coeff', wrt][self.clamp_indices] = 0.0
+        partials['pressure_drag_coeff', Aircraft.Wing.SWEEP] = 0.0
+
+        for name in _PRESSURE_DRAG_INPUTS:
+            partials['pressure_drag_coeff', name] = derivs[name]
+
+
+def _pressure_drag_coeff(mach, CL, CLDES, MDES, AR, CAM, TC):
+    """
+    Compute the pressure drag coefficient at the nodes.
+
+    Returns the coefficient and its derivatives, keyed by input name. The derivative with respect
+    to the lift coefficient at the nodes is keyed by 'CL'.
+    """
+    nn = mach.size
+    dtype = mach.dtype
+    FCDP = np.empty(nn, dtype=dtype)
+    dFCDP_dDELM = np.empty(nn, dtype=dtype)
+    dFCDP_dDELCL = np.empty(nn, dtype=dtype)
+    dFCDP_dA = np.empty(nn, dtype=dtype)
+
+    DELCL = CL - CLDES
+    DELM = mach - MDES
+    A = AR * TC ** (1.0 / 3.0)
+
+    x = np.empty((nn, 2), dtype=dtype)
+    x[:, 0] = DELM
+    x[:, 1] = DELCL
+
+    for supersonic in (False, True):
+        if supersonic:
+            idx = np.where(DELM.real > 0.075)[0]
+        else:
+            idx = np.where(DELM.real <= 0.075)[0]
+
+        if idx.size > 0:
+            FCDP[idx], dFCDP_dDELM[idx], dFCDP_dDELCL[idx], dFCDP_dA[idx] = _pressure_drag_factor(
+                x[idx], A, supersonic
+            )
+
+    DCDP = FCDP * (1.0 + CAM / 10.0) * A / AR
+    clamp = np.where(DCDP.real < 0)
+    DCDP[clamp] = 0.0
+
+    dDCDP_dFCDP = (1 + CAM / 10.0) * TC ** (1.0 / 3.0)
+    dA_dAR = TC ** (1.0 / 3.0)
+    dA_dTC = (1.0 / 3.0) * AR * TC ** (-2.0 / 3.0)
+
+    dCD_dmach = dDCDP_dFCDP * dFCDP_dDELM
+    dCD_dCL = dDCDP_dFCDP * dFCDP_dDELCL
+
+    derivs = {
+        Dynamic.Atmosphere.MACH: dCD_dmach,
+        'CL': dCD_dCL,
+        Aircraft.Wing.ASPECT_RATIO: dDCDP_dFCDP * dFCDP_dA * dA_dAR,
+        Aircraft.Wing.THICKNESS_TO_CHORD: (
+            dDCDP_dFCDP * dFCDP_dA * dA_dTC
+            + (1.0 / 3.0) * FCDP * (1 + CAM / 10.0) * TC ** (-2.0 / 3.0)
+        ),
+        Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN: (FCDP / 10.0) * TC ** (1.0 / 3.0),
+        Aircraft.Design.LIFT_COEFFICIENT: -dCD_dCL,
+        Aircraft.Design.MACH: -dCD_dmach,
+    }
+
+    for name, val in derivs.items():
+        val = np.array(np.broadcast_to(val, (nn,)))
+        val[clamp] = 0.0
+        derivs[name] = val
+
+    return DCDP, derivs
+
+
+def _pressure_drag_factor(x, A, supersonic):
+    """
+    Interpolate the pressure drag factor tables.
+
+    Returns the factor and its derivatives with respect to the Mach number and lift
+    coefficient deltas and to A = AR * TC**(1/3).
+    """
+    if not supersonic:
+        if A.real < 0.5:
+            return _edge_interp(0.5, 1.0, AR05table, AR1table, x, A)
+        elif A.real < 6:
+            tables = (AR05table, AR1table, AR2table, AR4table, AR6table)
+            return _inner_interp(_A_SUB, tables, x, A)
+        else:
+            return _edge_interp(4.0, 6.0, AR4table, AR6table, x, A)
+
+    if A.real < 0.7:
+        return _edge_interp(0.7, 0.8, ARS07table, ARS08table, x, A)
+    elif A.real <= 1.4:
+        tables = (ARS07table, ARS08table, ARS10table, ARS12table, ARS14table)
+        return _inner_interp(_A_SUP_LOW, tables, x, A)
+    elif A.real <= 2.0:
+        tables = (ARS12table, ARS14table, ARS16table, ARS18table, ARS20table)
+        return _inner_interp(_A_SUP_HIGH, tables, x, A)
+    else:
+        return _edge_interp(1.8, 2.0, ARS18table, ARS20table, x, A)
+
+
+def _edge_interp(A1, A2, table1, table2, x, A):
+    """Interpolate between the first or last two tables, vectorized over the nodes."""
+    FCDP1, dFCDP1 = table1.interpolate(x, compute_derivative=True)
+    FCDP2, dFCDP2 = table2.interpolate(x, compute_derivative=True)
+
+    den = 1.0 / ((A - A1) * FCDP1 - (A - A2) * FCDP2)
+    FCDP = 2.0 * FCDP1 * FCDP2 * den
+
+    # Derivative of FCDP w.r.t A variable at value of A
+    dFCDP_dA = 2.0 * FCDP1 * FCDP2 * (FCDP2 - FCDP1) * den**2
+
+    dFCDP_dDEL = (
+        2.0
+        * den[:, np.newaxis]
+        * (
+            dFCDP1 * (FCDP2 - FCDP1 * FCDP2 * den * (A - A1))[:, np.newaxis]
+            + dFCDP2 * (FCDP1 + FCDP1 * FCDP2 * den * (A - A2))[:, np.newaxis]
+        )
+    )
+
+    return FCDP, dFCDP_dDEL[:, 0], dFCDP_dDEL[:, 1], dFCDP_dA
+
+
+def _inner_interp(arrA, tables, x, A):
+    """
+    Interpolate across five tables, vectorized over the nodes.
+
+    A is the same at every node, so the quadratic Lagrange interpolation in A reduces to a
+    fixed weighted sum of the five tables.
+    """
+    weights = []
+    dweights = []
+    for k in range(arrA.size):
+        values = np.zeros(arrA.size)
+        values[k] = 1.0
+        interp = InterpND(method='lagrange2', points=(arrA), values=values)
+        w, dw = interp.interpolate(A, compute_derivative=True)
+        weights.append(w[0])
+        dweights.append(dw[0, 0])
+
+    FCDP = dFCDP_dDELM = dFCDP_dDELCL = dFCDP_dA = 0.0
+    for w, dw, table in zip(weights, dweights, tables):
+        val, deriv = table.interpolate(x, compute_derivative=True)
+        FCDP = FCDP + w * val
+        dFCDP_dA = dFCDP_dA + dw * val
+        dFCDP_dDELM = dFCDP_dDELM + w * deriv[:, 0]
+        dFCDP_dDELCL = dFCDP_dDELCL + w * deriv[:, 1]
+
+    return FCDP, dFCDP_dDELM, dFCDP_dDELCL, dFCDP_dA
+
+
+# Inputs with a derivative computed by _pressure_drag_coeff
+_PRESSURE_DRAG_INPUTS = (
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Design.LIFT_COEFFICIENT,
+    Aircraft.Design.MACH,
+)
+
+# Aspect ratio breakpoints of the pressure drag tables
+_A_SUB = np.array([0.5, 1, 2, 4, 6])
+_A_SUP_LOW = np.array([0.7, 0.8, 1.0, 1.2, 1.4])
+_A_SUP_HIGH = np.array([1.2, 1.4, 1.6, 1.8, 2.0])
 
 
 # Tables
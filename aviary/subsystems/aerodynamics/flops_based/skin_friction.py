@@ -309,3 +309,420 @@ class SkinFriction(om.ImplicitComponent):
             'ij,i->ij', dskf_dwtr, dwtr_dwt
         ).ravel()
         partials['skin_friction_coeff', 'cf_iter'] = (-1.0 / wall_temp_ratio).ravel()
+
+
+class SkinFrictionSolver:
+    """
+    Vectorized Newton solver for the wall temperature and skin friction coefficient
+    equations of the Sommer and Short T Prime method.
+
+    Every (node, component) pair is an independent 2x2 system. The solver keeps the
+    converged solution of the last real-valued solve and uses it as the starting point
+    for the next one.
+    """
+
+    def __init__(self, tolerance=1e-12, max_iter=30):
+        self.CONLOG = 2.302585
+        self.sea_level_pressure = 14.6959 * 144  # psi -> psf
+
+        self.tolerance = tolerance
+        self.max_iter = max_iter
+
+        # Converged solution of the previous solve.
+        self.wall_temp = None
+        self.cf = None
+
+    def flight_condition(self, T, pressure, mach, length):
+        """
+        Return the quantities that only depend on the inputs, broadcast to (nn, nc).
+
+        Parameters
+        ----------
+        T : ndarray
+            Static temperature at each node in degR.
+        pressure : ndarray
+            Static pressure at each node in lbf/ft**2.
+        mach : ndarray
+            Mach number at each node.
+        length : ndarray
+            Characteristic length of each component in ft.
+
+        Returns
+        -------
+        dict
+            Flight condition data used by the other methods.
+        """
+        T = T[:, np.newaxis]
+        pressure = pressure[:, np.newaxis]
+        mach = mach[:, np.newaxis]
+        length = length[np.newaxis, :]
+
+        Pratio = pressure / self.sea_level_pressure
+        kelvin = T / 1.8
+        RE = 1.479301e9 * Pratio * (kelvin + 110.4) / kelvin**2
+
+        # SUTHERLAND'S CONSTANT IS 198.72 DEG R FROM 1962 ON
+        suth_const = T + 198.72
+        E = 0.80
+
+        cond = {
+            'T': T,
+            'mach': mach,
+            'length': length,
+            'RE': RE,
+            'dRE_dp': 1.479301e9 * (kelvin + 110.4) / (self.sea_level_pressure * kelvin**2),
+            'dRE_dT': -1.479301e9 / 1.8 * (Pratio * (1.0 / kelvin**2 + 2.0 * 110.4 / kelvin**3)),
+            'reynolds_num': RE * mach * length,
+            'suth_const': suth_const,
+            # COMBINED CONSTANT INCLUDING 1/RHO
+            'combined_const': 4.593153e-6 * E * suth_const / (RE * mach * T**1.5),
+            # ADIABATIC WALL TEMPERATURE
+            'TAW': (1.0 + 0.176 * mach * mach) * T,
+        }
+
+        return cond
+
+    def wall_temp_ratio(self, cond, wall_temp):
+        """Return the wall temperature ratio."""
+        return 1.0 + 0.45 * (wall_temp / cond['T'] - 1.0) + 0.035 * cond['mach'] ** 2
+
+    def residuals(self, cond, wall_temp, cf):
+        """Return the wall temperature and skin friction coefficient residuals."""
+        T = cond['T']
+
+        wall_temp_ratio = self.wall_temp_ratio(cond, wall_temp)
+        CFL = cf / (1.0 + 3.59 * np.sqrt(cf) * wall_temp_ratio)
+
+        res_wt = 0.5 * cond['TAW'] / (1.0 + cond['combined_const'] * wall_temp**3 / CFL)
+        res_wt = res_wt - 0.5 * wall_temp
+
+        RP = (
+            cond['reynolds_num']
+            * (wall_temp_ratio * T + 198.72)
+            / (cond['suth_const'] * wall_temp_ratio**2.5)
+        )
+        res_cf = (0.242 * self.CONLOG / np.log(RP * cf)) ** 2 - cf
+
+        return res_wt, res_cf
+
+    def residual_partials(self, cond, wall_temp, cf):
+        """
+        Return the partials of the wall temperature and skin friction residuals.
+
+        The result is a dictionary keyed by (residual, variable), where the variables are the
+        two unknowns ('wall_temp', 'cf') and the four inputs ('T', 'p', 'mach', 'length').
+        """
+        T = cond['T']
+        mach = cond['mach']
+        length = cond['length']
+        RE = cond['RE']
+        dRE_dp = cond['dRE_dp']
+        dRE_dT = cond['dRE_dT']
+        reynolds_num = cond['reynolds_num']
+        suth_const = cond['suth_const']
+        combined_const = cond['combined_const']
+        TAW = cond['TAW']
+
+        dreyn_dp = dRE_dp * mach * length
+        dreyn_dT = dRE_dT * mach * length
+        dreyn_dmach = RE * length
+        dreyn_dlen = RE * mach
+
+        dcomb_dp = -combined_const * dRE_dp / RE
+        dcomb_dT = combined_const * (1.0 / suth_const - 1.5 / T - dRE_dT / RE)
+        dcomb_dmach = -combined_const / mach
+
+        dTAW_dT = 1.0 + 0.176 * mach * mach
+        dTAW_dmach = 0.352 * mach * T
+
+        wall_temp_ratio = self.wall_temp_ratio(cond, wall_temp)
+        dwtr_dwt = 0.45 / T
+        dwtr_dT = -0.45 * wall_temp / T**2
+        dwtr_dmach = 0.07 * mach
+
+        sqrt_cf = np.sqrt(cf)
+        den = 1.0 + 3.59 * sqrt_cf * wall_temp_ratio
+        CFL = cf / den
+        dCFL_dcf = 1.0 / den - cf * 3.59 * wall_temp_ratio * 0.5 / (sqrt_cf * den**2)
+        dCFL_dwtr = -cf * 3.59 * sqrt_cf / den**2
+
+        # res_wt = 0.5 * TAW / g - 0.5 * wall_temp
+        g = 1.0 + combined_const * wall_temp**3 / CFL
+        dreswt_dg = -0.5 * TAW / g**2
+        dg_dcomb = wall_temp**3 / CFL
+        dg_dwt = 3.0 * combined_const * wall_temp**2 / CFL
+        dg_dCFL = -combined_const * wall_temp**3 / CFL**2
+        dg_dwtr = dg_dCFL * dCFL_dwtr
+
+        # res_cf = (0.242 * CONLOG / log(RP * cf)) ** 2 - cf
+        num = wall_temp_ratio * T + 198.72
+        den = suth_const * wall_temp_ratio**2.5
+        RP = reynolds_num * num / den
+        dRP_dreyn = num / den
+        dRP_dwtr = reynolds_num * (T - 2.5 * num / wall_temp_ratio) / den
+        dRP_dT = reynolds_num * (wall_temp_ratio - num / suth_const) / den
+
+        fact = (0.242 * self.CONLOG) ** 2
+        log_term = np.log(RP * cf) ** 3
+        drescf_dRP = -2.0 * fact / (RP * log_term)
+
+        J = {}
+        J['wt', 'wall_temp'] = dreswt_dg * (dg_dwt + dg_dwtr * dwtr_dwt) - 0.5
+        J['wt', 'cf'] = dreswt_dg * dg_dCFL * dCFL_dcf
+        J['wt', 'T'] = dreswt_dg * (dg_dcomb * dcomb_dT + dg_dwtr * dwtr_dT) + 0.5 * dTAW_dT / g
+        J['wt', 'p'] = dreswt_dg * dg_dcomb * dcomb_dp
+        J['wt', 'mach'] = (
+            dreswt_dg * (dg_dcomb * dcomb_dmach + dg_dwtr * dwtr_dmach) + 0.5 * dTAW_dmach / g
+        )
+        J['wt', 'length'] = np.zeros_like(J['wt', 'cf'])
+
+        J['cf', 'wall_temp'] = drescf_dRP * dRP_dwtr * dwtr_dwt
+        J['cf', 'cf'] = -2.0 * fact / (cf * log_term) - 1.0
+        J['cf', 'T'] = drescf_dRP * (dRP_dreyn * dreyn_dT + dRP_dwtr * dwtr_dT + dRP_dT)
+        J['cf', 'p'] = drescf_dRP * dRP_dreyn * dreyn_dp
+        J['cf', 'mach'] = drescf_dRP * (dRP_dreyn * dreyn_dmach + dRP_dwtr * dwtr_dmach)
+        J['cf', 'length'] = drescf_dRP * dRP_dreyn * dreyn_dlen
+
+        J['wtr', 'wall_temp'] = dwtr_dwt
+        J['wtr', 'T'] = dwtr_dT
+        J['wtr', 'mach'] = dwtr_dmach
+
+        J['Re', 'T'] = dreyn_dT
+        J['Re', 'p'] = dreyn_dp
+        J['Re', 'mach'] = dreyn_dmach
+        J['Re', 'length'] = dreyn_dlen
+
+        return J
+
+    def initial_guess(self, cond):
+        """Return the starting point used when no previous solution is available."""
+        shape = cond['reynolds_num'].shape
+        wall_temp = np.broadcast_to(cond['TAW'], shape).copy()
+        cf = (0.242 / (np.log(cond['reynolds_num'] * 0.0015) / self.CONLOG)) ** 2
+        return wall_temp, cf
+
+    def newton(self, cond, wall_temp, cf):
+        """Converge the wall temperature and skin friction coefficient with Newton's method."""
+        for _ in range(self.max_iter):
+            res_wt, res_cf = self.residuals(cond, wall_temp, cf)
+            J = self.residual_partials(cond, wall_temp, cf)
+
+            a11 = J['wt', 'wall_temp']
+            a12 = J['wt', 'cf']
+            a21 = J['cf', 'wall_temp']
+            a22 = J['cf', 'cf']
+            det = a11 * a22 - a12 * a21
+
+            d_wall_temp = -(a22 * res_wt - a12 * res_cf) / det
+            d_cf = -(a11 * res_cf - a21 * res_wt) / det
+
+            # Keep both unknowns positive.
+            new_wall_temp = wall_temp + d_wall_temp
+            new_cf = cf + d_cf
+            wall_temp = np.where(new_wall_temp.real > 0.0, new_wall_temp, 0.5 * wall_temp)
+            cf = np.where(new_cf.real > 0.0, new_cf, 0.5 * cf)
+
+            if np.all(np.abs(d_wall_temp) <= self.tolerance * np.abs(wall_temp)) and np.all(
+                np.abs(d_cf) <= self.tolerance * np.abs(cf)
+            ):
+                return wall_temp, cf, True
+
+        res_wt, res_cf = self.residuals(cond, wall_temp, cf)
+        converged = np.all(np.abs(res_wt) <= 1e-8 * np.abs(wall_temp)) and np.all(
+            np.abs(res_cf) <= 1e-8 * np.abs(cf)
+        )
+        return wall_temp, cf, converged
+
+    def solve(self, cond, store=True):
+        """
+        Return the converged wall temperature and skin friction coefficient.
+
+        Parameters
+        ----------
+        cond : dict
+            Flight condition, as returned by ``flight_condition``.
+        store : bool
+            If True, keep the solution as the starting point for the next solve. This should
+            be False under complex step.
+
+        Returns
+        -------
+        tuple of ndarray
+            Wall temperature and skin friction coefficient with shape (nn, nc).
+
+        Raises
+        ------
+        AnalysisError
+            If the Newton iteration does not converge, also from a cold start.
+        """
+        shape = cond['reynolds_num'].shape
+        dtype = cond['T'].dtype
+
+        converged = False
+        if self.wall_temp is not None and self.wall_temp.shape == shape:
+            wall_temp, cf, converged = self.newton(
+                cond, self.wall_temp.astype(dtype), self.cf.astype(dtype)
+            )
+
+        if not converged:
+            wall_temp, cf = self.initial_guess(cond)
+            wall_temp, cf, converged = self.newton(cond, wall_temp, cf)
+
+        if not converged:
+            # The previous solution is kept, so a bad point does not spoil later solves.
+            raise om.AnalysisError(
+                f'Skin friction solve did not converge in {self.max_iter} Newton iterations.'
+            )
+
+        if store:
+            self.wall_temp = wall_temp.copy()
+            self.cf = cf.copy()
+
+        return wall_temp, cf
+
+    def sensitivities(self, cond, wall_temp, cf):
+        """
+        Return the derivatives of the skin friction coefficient and Reynolds number.
+
+        The derivatives of the converged unknowns are obtained with the implicit function
+        theorem, so no further iterations are needed.
+
+        Returns
+        -------
+        dict
+            Maps each input ('T', 'p', 'mach', 'length') to a tuple with the derivatives of
+            the skin friction coefficient and the Reynolds number, each with shape (nn, nc).
+        """
+        J = self.residual_partials(cond, wall_temp, cf)
+        shape = wall_temp.shape
+
+        a11 = J['wt', 'wall_temp']
+        a12 = J['wt', 'cf']
+        a21 = J['cf', 'wall_temp']
+        a22 = J['cf', 'cf']
+        det = a11 * a22 - a12 * a21
+
+        wall_temp_ratio = self.wall_temp_ratio(cond, wall_temp)
+
+        derivs = {}
+        for var in ('T', 'p', 'mach', 'length'):
+            # d(unknowns)/d(input) = -inv(dR/du) * dR/d(input)
+            dwt = -(a22 * J['wt', var] - a12 * J['cf', var]) / det
+            dcf = -(a11 * J['cf', var] - a21 * J['wt', var]) / det
+
+            dwtr = J['wtr', 'wall_temp'] * dwt
+            if ('wtr', var) in J:
+                dwtr = dwtr + J['wtr', var]
+
+            dskf = dcf / wall_temp_ratio - cf * dwtr / wall_temp_ratio**2
+
+            derivs[var] = (
+                np.broadcast_to(dskf, shape),
+                np.broadcast_to(J['Re', var], shape),
+            )
+
+        return derivs
+
+
+class ExplicitSkinFriction(om.ExplicitComponent):
+    """
+    Computes skin friction coefficient using the Sommer and Short T Prime method as used
+    in FLOPS AERSCL.
+
+    This is an explicit form of SkinFriction. The wall temperature and skin friction
+    coefficient are converged internally with a vectorized Newton iteration that starts
+    from the solution of the previous call, and their derivatives are obtained with the
+    implicit function theorem, so the model's nonlinear and linear solvers never see
+    them.
+    """
+
+    def initialize(self):
+        """Declare options."""
+        self.options.declare(
+            'num_nodes',
+            types=int,
+            default=1,
+            desc='The number of points at which the cross product is computed.',
+        )
+
+        add_aviary_option(self, Aircraft.Design.TYPE)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Fuselage.NUM_FUSELAGES)
+        add_aviary_option(self, Aircraft.HorizontalTail.NUM_TAILS)
+        add_aviary_option(self, Aircraft.VerticalTail.NUM_TAILS)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+        num_fuselages = self.options[Aircraft.Fuselage.NUM_FUSELAGES]
+        num_h_tails = self.options[Aircraft.HorizontalTail.NUM_TAILS]
+        num_v_tails = self.options[Aircraft.VerticalTail.NUM_TAILS]
+
+        self.nc = nc = 1 + num_h_tails + num_v_tails + num_fuselages + int(sum(num_engines))
+
+        # Simulation inputs
+        add_aviary_input(self, Dynamic.Atmosphere.TEMPERATURE, shape=nn, units='degR')
+        add_aviary_input(self, Dynamic.Atmosphere.STATIC_PRESSURE, shape=nn, units='lbf/ft**2')
+        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+
+        # Aero subsystem inputs
+        self.add_input('characteristic_lengths', np.ones(nc), units='ft')
+
+        self.add_output('skin_friction_coeff', np.ones((nn, nc)), units='unitless')
+        self.add_output('Re', np.ones((nn, nc)), units='unitless')
+
+        self._solver = SkinFrictionSolver()
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        nc = self.nc
+        row_col = np.arange(nn * nc)
+
+        cols = np.repeat(np.arange(nn), nc)
+        self.declare_partials(
+            ['skin_friction_coeff', 'Re'],
+            [
+                Dynamic.Atmosphere.TEMPERATURE,
+                Dynamic.Atmosphere.STATIC_PRESSURE,
+                Dynamic.Atmosphere.MACH,
+            ],
+            rows=row_col,
+            cols=cols,
+        )
+
+        cols = np.tile(np.arange(nc), nn)
+        self.declare_partials(
+            ['skin_friction_coeff', 'Re'], 'characteristic_lengths', rows=row_col, cols=cols
+        )
+
+    def _solve(self, inputs):
+        solver = self._solver
+        cond = solver.flight_condition(
+            inputs[Dynamic.Atmosphere.TEMPERATURE],
+            inputs[Dynamic.Atmosphere.STATIC_PRESSURE],
+            inputs[Dynamic.Atmosphere.MACH],
+            inputs['characteristic_lengths'],
+        )
+        wall_temp, cf = solver.solve(cond, store=not self.under_complex_step)
+        return cond, wall_temp, cf
+
+    def compute(self, inputs, outputs):
+        cond, wall_temp, cf = self._solve(inputs)
+
+        outputs['Re'] = cond['reynolds_num']
+        outputs['skin_friction_coeff'] = cf / self._solver.wall_temp_ratio(cond, wall_temp)
+
+    def compute_partials(self, inputs, partials):
+        cond, wall_temp, cf = self._solve(inputs)
+        derivs = self._solver.sensitivities(cond, wall_temp, cf)
+
+        names = {
+            'T': Dynamic.Atmosphere.TEMPERATURE,
+            'p': Dynamic.Atmosphere.STATIC_PRESSURE,
+            'mach': Dynamic.Atmosphere.MACH,
+            'length': 'characteristic_lengths',
+        }
+        for var, name in names.items():
+            dskf, dRe = derivs[var]
+            partials['skin_friction_coeff', name] = dskf.ravel()
+            partials['Re', name] = dRe.ravel()
@@ -4,6 +4,16 @@ import openmdao.api as om
 from aviary.variable_info.functions import add_aviary_input, add_aviary_option, get_units
 from aviary.variable_info.variables import Aircraft
 
+# Form factor fit coefficients.
+# fmt: off
+FORM_FACTOR_COEFFS = np.array(
+    [
+        4.34255, -1.14281, 0.171203, -0.0138334, 0.621712e-3, 0.137442e-6,
+        -0.145532e-4, 2.94206, 7.16974, 48.8876, -1403.02, 8598.76, -15834.3, 4.275,
+    ]
+)
+# fmt: on
+
 
 class SkinFrictionDrag(om.ExplicitComponent):
     """
@@ -11,19 +21,6 @@ class SkinFrictionDrag(om.ExplicitComponent):
     coefficients of each component surface.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        # Form factor fit coefficients.
-        # fmt: off
-        self.F = np.array(
-            [
-                4.34255, -1.14281, 0.171203, -0.0138334, 0.621712e-3, 0.137442e-6,
-                -0.145532e-4, 2.94206, 7.16974, 48.8876, -1403.02, 8598.76, -15834.3, 4.275,
-            ]
-        )
-        # fmt: on
-
     def initialize(self):
         """Declare options."""
         self.options.declare(
@@ -125,173 +122,137 @@ class SkinFrictionDrag(om.ExplicitComponent):
         )
 
     def compute(self, inputs, outputs):
-        nc = self.nc
-
-        cf = inputs['skin_friction_coeff']
-        Re = inputs['Re']
-
-        fineness = inputs['fineness_ratios']
-        wetted_area = inputs['wetted_areas']
-        lam_up = inputs['laminar_fractions_upper']
-        lam_low = inputs['laminar_fractions_lower']
-        mission_wing_area = inputs[Aircraft.Wing.AREA]
-
-        laminar_flow = np.any(lam_up > 0.0) or np.any(lam_low > 0.0)
-
-        if laminar_flow:
-            laminar_upper = _calc_laminar_flow(lam_up)
-            laminar_lower = _calc_laminar_flow(lam_low)
-            cf = cf - 0.5 * (cf - 1.328 / np.sqrt(Re)) * (laminar_lower + laminar_upper)
-
-        form_factor = np.empty(nc, dtype=cf.dtype)
-
-        F = self.F
-
-        # Form factor for bodies.
-        idx_body = np.where(fineness > 0.5)[0]
-        fine = fineness[idx_body]
-
-        # Note: this equation is implemented exactly as it is in FLOPS. Terms 5 and 6 in the
-        # Horner expansion seem to be out of order (cf. F[5] + fine * F[6]), and the origin
-        # of this equation is not clear.
-        # However, if you swap the terms, you end up with negative skin friction coef.
-        form_factor[idx_body] = F[0] + fine * (
-            F[1] + fine * (F[2] + fine * (F[3] + fine * (F[4] + fine * (F[5] * fine + F[6]))))
+        CDF, _ = _skin_friction_drag_coeff(
+            inputs['skin_friction_coeff'],
+            inputs['Re'],
+            inputs['fineness_ratios'],
+            inputs['wetted_areas'],
+            inputs['laminar_fractions_upper'],
+            inputs['laminar_fractions_lower'],
+            inputs[Aircraft.Wing.AREA],
+            inputs[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG],
+            self.options[Aircraft.Wing.AIRFOIL_TECHNOLOGY],
         )
 
-        idx_max = np.where(fineness >= 20.0)
-        form_factor[idx_max] = 1.0
-
-        # Form factor for surfaces.
-        idx_surf = np.where(fineness <= 0.5)[0]
-        fine = fineness[idx_surf]
-        airfoil = self.options[Aircraft.Wing.AIRFOIL_TECHNOLOGY]
-
-        FF1 = 1.0 + fine * (
-            F[7] + fine * (F[8] + fine * (F[9] + fine * (F[10] + fine * (F[11] + fine * F[12]))))
-        )
-        FF2 = 1.0 + fine * self.F[13]
-
-        form_factor[idx_surf] = FF1 * (2.0 - airfoil) + FF2 * (airfoil - 1.0)
-
-        CDF = np.einsum('j,ij,j->i', wetted_area, cf, form_factor) * (1.0 / mission_wing_area)
-
-        # Add drag for excrescences.
-
-        # See issue #1184 - Per component not completely implemented in aviary 1.0
-        # Var mission_skin_friction_drag_corrections_count is a vector over components and is added
-        # to the drag.
-        # This may be "dead weight" from FLOPS - D.J.
-
-        # An additional percentage of the skin friction drag is added to for excrescences
-        # (miscellaneous).
-        CDF *= 1.0 + inputs[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG]
-
         outputs['skin_friction_drag_coeff'] = CDF
 
     def compute_partials(self, inputs, partials):
-        nc = self.nc
-        nn = self.options['num_nodes']
-
-        cf = inputs['skin_friction_coeff']
-        Re = inputs['Re']
-
-        fineness = inputs['fineness_ratios']
-        wetted_area = inputs['wetted_areas']
-        lam_up = inputs['laminar_fractions_upper']
-        lam_low = inputs['laminar_fractions_lower']
-        mission_wing_area = inputs[Aircraft.Wing.AREA]
-
-        laminar_flow = np.any(lam_up > 0.0) or np.any(lam_low > 0.0)
-
-        den = 1.0 / np.sqrt(Re)
-        lam_lam = -0.5 * (cf - 1.328 * den)
-        if laminar_flow:
-            laminar_upper = _calc_laminar_flow(lam_up)
-            laminar_lower = _calc_laminar_flow(lam_low)
-            lam_sum = laminar_lower + laminar_upper
-            lam_cf = 1.0 - 0.5 * lam_sum
-            lam_Re = -0.25 * 1.328 / Re**1.5 * lam_sum
-
-            cf = cf - 0.5 * (cf - 1.328 * den) * lam_sum
-
-        form_factor = np.empty(nc, dtype=cf.dtype)
-        dform_dfine = np.empty(nc, dtype=cf.dtype)
-
-        F = self.F
-
-        # Form factor for bodies.
-        idx_body = np.where(fineness > 0.5)[0]
-        fine = fineness[idx_body]
-        form_factor[idx_body] = F[0] + fine * (
-            F[1] + fine * (F[2] + fine * (F[3] + fine * (F[4] + fine * (F[5] * fine + F[6]))))
-        )
-        dform_dfine[idx_body] = F[1] + fine * (
-            2.0 * F[2]
-            + fine * (3.0 * F[3] + fine * (4.0 * F[4] + fine * (6.0 * F[5] * fine + 5.0 * F[6])))
-        )
-
-        # When pinned above max fineness, deriv is zero.
-        idx_max = np.where(fineness >= 20.0)
-        form_factor[idx_max] = 1.0
-        dform_dfine[idx_max] = 0.0
-
-        # Form factor for surfaces.
-        idx_surf = np.where(fineness <= 0.5)[0]
-        fine = fineness[idx_surf]
-
-        airfoil = self.options[Aircraft.Wing.AIRFOIL_TECHNOLOGY]
-
-        FF1 = 1.0 + fine * (
-            F[7] + fine * (F[8] + fine * (F[9] + fine * (F[10] + fine * (F[11] + fine * F[12]))))
-        )
-        FF2 = 1.0 + fine * self.F[13]
-        dFF1 = F[7] + fine * (
-            2.0 * F[8]
-            + fine * (3.0 * F[9] + fine * (4.0 * F[10] + fine * (5.0 * F[11] + fine * 6.0 * F[12])))
+        _, derivs = _skin_friction_drag_coeff(
+            inputs['skin_friction_coeff'],
+            inputs['Re'],
+            inputs['fineness_ratios'],
+            inputs['wetted_areas'],
+            inputs['laminar_fractions_upper'],
+            inputs['laminar_fractions_lower'],
+            inputs[Aircraft.Wing.AREA],
+            inputs[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG],
+            self.options[Aircraft.Wing.AIRFOIL_TECHNOLOGY],
         )
-        dFF2 = self.F[13]
 
-        form_factor[idx_surf] = FF1 * (2.0 - airfoil) + FF2 * (airfoil - 1.0)
-        dform_dfine[idx_surf] = dFF1 * (2.0 - airfoil) + dFF2 * (airfoil - 1.0)
+        for name, val in derivs.items():
+            partials['skin_friction_drag_coeff', name] = val.ravel()
 
-        den = 1.0 / mission_wing_area
-        CDF = CDF0 = np.einsum('j,ij,j->i', wetted_area, cf, form_factor) * den
 
-        excr = 1.0 + inputs[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG]
-        CDF = CDF * excr
-        DCDF_dwet = excr * np.einsum('ij,j->ij', cf, form_factor) * den
-        DCDF_dcf = excr * wetted_area * form_factor * den
-        DCDF_dform = excr * np.einsum('j,ij->ij', wetted_area, cf) * den
-        DCDF_dmwa = -excr * np.einsum('j,ij,j->i', wetted_area, cf, form_factor) * den**2
-
-        DCDF_dlamup = DCDF_dcf * lam_lam * _calc_laminar_flow_deriv(lam_up)
-        DCDF_dlamlow = DCDF_dcf * lam_lam * _calc_laminar_flow_deriv(lam_low)
-
-        if laminar_flow:
-            DCDF_dRe = np.einsum('j,ij->ij', DCDF_dcf, lam_Re)
-            DCDF_dcf *= lam_cf
-
-        partials['skin_friction_drag_coeff', 'skin_friction_coeff'] = np.tile(DCDF_dcf, nn)
-
-        if laminar_flow:
-            partials['skin_friction_drag_coeff', 'Re'] = DCDF_dRe.ravel()
-
-        partials['skin_friction_drag_coeff', 'fineness_ratios'] = np.einsum(
-            'ij,j->ij', DCDF_dform, dform_dfine
-        ).ravel()
-
-        partials['skin_friction_drag_coeff', 'wetted_areas'] = DCDF_dwet.ravel()
-
-        partials['skin_friction_drag_coeff', 'laminar_fractions_upper'] = DCDF_dlamup.ravel()
-
-        partials['skin_friction_drag_coeff', 'laminar_fractions_lower'] = DCDF_dlamlow.ravel()
-
-        partials['skin_friction_drag_coeff', Aircraft.Wing.AREA] = DCDF_dmwa.ravel()
+def _skin_friction_drag_coeff(
+    cf, Re, fineness, wetted_area, lam_up, lam_low, wing_area, excrescence_drag, airfoil
+):
+    """
+    Compute the skin friction drag coefficient at the nodes.
 
-        partials['skin_friction_drag_coeff', Aircraft.Design.PERCENT_EXCRESCENCE_DRAG] = (
-            CDF0.ravel()
-        )
+    Returns the coefficient and its derivatives, keyed by input name. The derivatives with respect
+    to the per-component vectors are keyed by the input names used by SkinFrictionDrag.
+    """
+    nc = fineness.size
+    F = FORM_FACTOR_COEFFS
+
+    laminar_flow = np.any(lam_up > 0.0) or np.any(lam_low > 0.0)
+
+    lam_lam = -0.5 * (cf - 1.328 / np.sqrt(Re))
+    if laminar_flow:
+        laminar_upper = _calc_laminar_flow(lam_up)
+        laminar_lower = _calc_laminar_flow(lam_low)
+        lam_sum = laminar_lower + laminar_upper
+        lam_cf = 1.0 - 0.5 * lam_sum
+        lam_Re = -0.25 * 1.328 / Re**1.5 * lam_sum
+
+        cf = cf - 0.5 * (cf - 1.328 / np.sqrt(Re)) * lam_sum
+
+    form_factor = np.empty(nc, dtype=cf.dtype)
+    dform_dfine = np.empty(nc, dtype=cf.dtype)
+
+    # Form factor for bodies.
+    idx_body = np.where(fineness > 0.5)[0]
+    fine = fineness[idx_body]
+
+    # Note: this equation is implemented exactly as it is in FLOPS. Terms 5 and 6 in the
+    # Horner expansion seem to be out of order (cf. F[5] + fine * F[6]), and the origin
+    # of this equation is not clear.
+    # However, if you swap the terms, you end up with negative skin friction coef.
+    form_factor[idx_body] = F[0] + fine * (
+        F[1] + fine * (F[2] + fine * (F[3] + fine * (F[4] + fine * (F[5] * fine + F[6]))))
+    )
+    dform_dfine[idx_body] = F[1] + fine * (
+        2.0 * F[2]
+        + fine * (3.0 * F[3] + fine * (4.0 * F[4] + fine * (6.0 * F[5] * fine + 5.0 * F[6])))
+    )
+
+    # When pinned above max fineness, deriv is zero.
+    idx_max = np.where(fineness >= 20.0)
+    form_factor[idx_max] = 1.0
+    dform_dfine[idx_max] = 0.0
+
+    # Form factor for surfaces.
+    idx_surf = np.where(fineness <= 0.5)[0]
+    fine = fineness[idx_surf]
+
+    FF1 = 1.0 + fine * (
+        F[7] + fine * (F[8] + fine * (F[9] + fine * (F[10] + fine * (F[11] + fine * F[12]))))
+    )
+    FF2 = 1.0 + fine * F[13]
+    dFF1 = F[7] + fine * (
+        2.0 * F[8]
+        + fine * (3.0 * F[9] + fine * (4.0 * F[10] + fine * (5.0 * F[11] + fine * 6.0 * F[12])))
+    )
+    dFF2 = F[13]
+
+    form_factor[idx_surf] = FF1 * (2.0 - airfoil) + FF2 * (airfoil - 1.0)
+    dform_dfine[idx_surf] = dFF1 * (2.0 - airfoil) + dFF2 * (airfoil - 1.0)
+
+    den = 1.0 / wing_area
+    CDF0 = np.einsum('j,ij,j->i', wetted_area, cf, form_factor) * den
+
+    # Add drag for excrescences.
+
+    # See issue #1184 - Per component not completely implemented in aviary 1.0
+    # Var mission_skin_friction_drag_corrections_count is a vector over components and is added
+    # to the drag.
+    # This may be "dead weight" from FLOPS - D.J.
+
+    # An additional percentage of the skin friction drag is added to for excrescences
+    # (miscellaneous).
+    excr = 1.0 + excrescence_drag
+    CDF = CDF0 * excr
+
+    DCDF_dcf = excr * wetted_area * form_factor * den
+    DCDF_dform = excr * np.einsum('j,ij->ij', wetted_area, cf) * den
+
+    derivs = {
+        'wetted_areas': excr * np.einsum('ij,j->ij', cf, form_factor) * den,
+        'fineness_ratios': np.einsum('ij,j->ij', DCDF_dform, dform_dfine),
+        'laminar_fractions_upper': DCDF_dcf * lam_lam * _calc_laminar_flow_deriv(lam_up),
+        'laminar_fractions_lower': DCDF_dcf * lam_lam * _calc_laminar_flow_deriv(lam_low),
+        Aircraft.Wing.AREA: -CDF * den,
+        Aircraft.Design.PERCENT_EXCRESCENCE_DRAG: CDF0,
+    }
+
+    if laminar_flow:
+        derivs['Re'] = np.einsum('j,ij->ij', DCDF_dcf, lam_Re)
+        derivs['skin_friction_coeff'] = DCDF_dcf * lam_cf
+    else:
+        derivs['Re'] = np.zeros_like(cf)
+        derivs['skin_friction_coeff'] = np.broadcast_to(DCDF_dcf, cf.shape)
+
+    return CDF, derivs
 
 
 def _calc_laminar_flow(lam):
@@ -0,0 +1,332 @@
+"""
+Generate drag polars for tabular aero by sampling the FLOPS-based computed aerodynamics.
+
+For a fixed geometry, the computed aero drag polar only depends on flight condition: the zero-lift
+drag coefficient is a function of altitude and Mach number, and the lift-dependent drag
+coefficient is a function of Mach number and lift coefficient. AeroSurrogateTraining evaluates
+ComputedAeroGroup once over a structured grid of these values in pre-mission, and the mission then
+interpolates the resulting tables with TabularAeroGroup instead of running the full computed aero
+at every node.
+"""
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.units import unit_conversion
+
+from aviary.subsystems.aerodynamics.flops_based.computed_aero_group import ComputedAeroGroup
+from aviary.subsystems.atmosphere.atmosphere import AtmosphereComp
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.functions import add_aviary_input, add_aviary_output, setup_model_options
+from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+# Default training grid
+SURROGATE_MACH = np.linspace(0.1, 0.9, 9)
+SURROGATE_ALTITUDE = np.linspace(0.0, 45000.0, 10)  # ft
+SURROGATE_LIFT_COEFFICIENT = np.linspace(0.0, 1.2, 13)
+
+# Lift coefficient used for the zero-lift drag samples (zero-lift drag does not depend on it)
+_CD0_SAMPLE_LIFT_COEFFICIENT = 0.5
+
+
+def get_surrogate_grid(grid=None):
+    """
+    Return the training grid for surrogate aero, filling in defaults for missing entries.
+
+    Parameters
+    ----------
+    grid : dict, optional
+        Dictionary that may contain 'mach', 'altitude' (in ft) and 'lift_coefficient' arrays.
+
+    Returns
+    -------
+    dict
+        Dictionary with sorted 'mach', 'altitude' and 'lift_coefficient' arrays.
+    """
+    if grid is None:
+        grid = {}
+
+    defaults = {
+        'mach': SURROGATE_MACH,
+        'altitude': SURROGATE_ALTITUDE,
+        'lift_coefficient': SURROGATE_LIFT_COEFFICIENT,
+    }
+
+    for key in grid:
+        if key not in defaults:
+            raise ValueError(
+                f'Unknown surrogate aero grid entry "{key}". Valid entries are: '
+                f'{", ".join(defaults)}.'
+            )
+
+    result = {}
+    for key, default in defaults.items():
+        val = np.unique(np.asarray(grid.get(key, default), dtype=float))
+        if val.size < 4:
+            raise ValueError(f'Surrogate aero grid "{key}" needs at least 4 unique values.')
+        result[key] = val
+
+    return result
+
+
+def get_surrogate_training_data(grid):
+    """
+    Return the CD0 and CDI table definitions used by TabularAeroGroup for surrogate aero.
+
+    The drag coefficients are placeholders; their values are connected from pre-mission.
+
+    Parameters
+    ----------
+    grid : dict
+        Training grid, as returned by ``get_surrogate_grid``.
+
+    Returns
+    -------
+    tuple of NamedValues
+        The CD0 and CDI table definitions.
+    """
+    mach = grid['mach']
+    altitude = grid['altitude']
+    cl = grid['lift_coefficient']
+
+    CD0_data = NamedValues()
+    CD0_data.set_val(Dynamic.Mission.ALTITUDE, altitude, 'ft')
+    CD0_data.set_val(Dynamic.Atmosphere.MACH, mach, 'unitless')
+    CD0_data.set_val('zero_lift_drag_coefficient', np.zeros((altitude.size, mach.size)))
+
+    CDI_data = NamedValues()
+    CDI_data.set_val(Dynamic.Atmosphere.MACH, mach, 'unitless')
+    CDI_data.set_val(Dynamic.Vehicle.LIFT_COEFFICIENT, cl, 'unitless')
+    CDI_data.set_val('lift_dependent_drag_coefficient', np.zeros((mach.size, cl.size)))
+
+    return CD0_data, CDI_data
+
+
+class AeroSurrogateTraining(om.ExplicitComponent):
+    """
+    Sample the FLOPS-based computed aero over a grid and output the resulting drag polars.
+
+    The computed aero is evaluated in an internal problem. Training only happens again when a
+    geometry input changes by more than ``retrain_tolerance`` (relative) since the last training;
+    otherwise the drag polars are extrapolated to first order from the last training, using the
+    same derivatives that are returned as partials.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'aviary_options',
+            types=AviaryValues,
+            desc='Aircraft options used to configure the computed aero.',
+        )
+        self.options.declare(
+            'grid',
+            types=dict,
+            default=None,
+            allow_none=True,
+            desc='Training grid with "mach", "altitude" (ft) and "lift_coefficient" entries. '
+            'Missing entries use the default grid.',
+        )
+        self.options.declare(
+            'retrain_tolerance',
+            types=float,
+            default=1e-6,
+            lower=0.0,
+            desc='Relative change in any geometry input above which the drag polars are '
+            'recomputed.',
+        )
+
+    def setup(self):
+        grid = self._grid = get_surrogate_grid(self.options['grid'])
+        mach = grid['mach']
+        altitude = grid['altitude']
+        cl = grid['lift_coefficient']
+
+        self._num_cd0 = num_cd0 = altitude.size * mach.size
+        num_cdi = mach.size * cl.size
+        nn = num_cd0 + num_cdi
+
+        # zero-lift drag samples (altitude-major), then lift-dependent drag samples (mach-major)
+        sample_altitude = np.concatenate(
+            (np.repeat(altitude, mach.size), np.full(num_cdi, altitude[0]))
+        )
+        sample_mach = np.concatenate((np.tile(mach, altitude.size), np.repeat(mach, cl.size)))
+        sample_cl = np.concatenate(
+            (np.full(num_cd0, _CD0_SAMPLE_LIFT_COEFFICIENT), np.tile(cl, mach.size))
+        )
+
+        aviary_options = self.options['aviary_options']
+        if Mission.GRAVITY in aviary_options:
+            gravity = aviary_options.get_val(Mission.GRAVITY, 'm/s**2')
+        else:
+            gravity = CoreMetaData[Mission.GRAVITY]['default_value']
+
+        prob = self._prob = om.Problem(reports=False)
+        model = prob.model
+
+        ivc = om.IndepVarComp()
+        ivc.add_output(Dynamic.Mission.ALTITUDE, sample_altitude, units='ft')
+        ivc.add_output(Dynamic.Atmosphere.MACH, sample_mach, units='unitless')
+        ivc.add_output('lift_coefficient_sample', sample_cl, units='unitless')
+        model.add_subsystem('grid', ivc, promotes=['*'])
+
+        model.add_subsystem(
+            'atmosphere',
+            AtmosphereComp(num_nodes=nn, h_def='geometric'),
+            promotes_inputs=[Dynamic.Mission.ALTITUDE],
+            promotes_outputs=[Dynamic.Atmosphere.TEMPERATURE, Dynamic.Atmosphere.STATIC_PRESSURE],
+        )
+
+        # Mass that produces the sampled lift coefficient in level flight
+        model.add_subsystem(
+            'sample_mass',
+            om.ExecComp(
+                f'mass = CL * 0.7 * P * M**2 * S / {float(np.ravel(gravity)[0])}',
+                mass={'units': 'kg', 'shape': nn},
+                CL={'units': 'unitless', 'shape': nn},
+                P={'units': 'Pa', 'shape': nn},
+                M={'units': 'unitless', 'shape': nn},
+                S={'units': 'm**2'},
+                has_diag_partials=True,
+            ),
+            promotes_inputs=[
+                ('CL', 'lift_coefficient_sample'),
+                ('P', Dynamic.Atmosphere.STATIC_PRESSURE),
+                ('M', Dynamic.Atmosphere.MACH),
+                ('S', Aircraft.Wing.AREA),
+            ],
+            promotes_outputs=[('mass', Dynamic.Vehicle.MASS)],
+        )
+
+        model.add_subsystem('aero', ComputedAeroGroup(num_nodes=nn), promotes=['*'])
+
+        model.set_input_defaults(Aircraft.Wing.AREA, val=1.0, units='ft**2')
+
+        setup_model_options(prob, aviary_options)
+        prob.setup()
+
+        # Every aircraft input of the computed aero becomes an input of this component.
+        input_meta = model.get_io_metadata(
+            iotypes='input', metadata_keys=['shape'], return_rel_names=False
+        )
+        geometry_inputs = {}
+        for meta in input_meta.values():
+            name = meta['prom_name']
+            if name.startswith('aircraft:') and name not in geometry_inputs:
+                geometry_inputs[name] = meta['shape']
+
+        self._geometry_inputs = list(geometry_inputs)
+        for name, shape in geometry_inputs.items():
+            add_aviary_input(self, name, shape=shape)
+
+        add_aviary_output(
+            self, Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR, shape=(altitude.size, mach.size)
+        )
+        add_aviary_output(
+            self, Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR, shape=(mach.size, cl.size)
+        )
+
+        self._trained_inputs = None
+        self._CD0 = None
+        self._CDI = None
+        self._totals = None
+        self._deriv_scalers = None
+
+    def setup_partials(self):
+        self.declare_partials('*', '*')
+
+    def _needs_training(self, inputs):
+        if self._trained_inputs is None:
+            return True
+
+        tol = self.options['retrain_tolerance']
+        for name, old in zip(self._geometry_inputs, self._trained_inputs):
+            new = inputs[name]
+            if np.any(np.abs(new - old) > tol * (1.0 + np.abs(old))):
+                return True
+
+        return False
+
+    def _train(self, inputs):
+        prob = self._prob
+
+        for name in self._geometry_inputs:
+            prob.set_val(name, inputs[name], units=CoreMetaData[name]['units'])
+
+        prob.run_model()
+
+        num_cd0 = self._num_cd0
+        grid = self._grid
+        CD0 = prob.get_val('CD0')
+        CDI = prob.get_val('CDI')
+
+        self._CD0 = CD0[:num_cd0].reshape(grid['altitude'].size, grid['mach'].size)
+        self._CDI = CDI[num_cd0:].reshape(grid['mach'].size, grid['lift_coefficient'].size)
+        self._trained_inputs = [inputs[name].copy() for name in self._geometry_inputs]
+        self._totals = None
+
+    def compute(self, inputs, outputs):
+        if self._needs_training(inputs):
+            self._train(inputs)
+
+        CD0 = self._CD0.copy()
+        CDI = self._CDI.copy()
+
+        num_cd0 = self._num_cd0
+        for name, old in zip(self._geometry_inputs, self._trained_inputs):
+            delta = (inputs[name] - old).ravel()
+            if not np.any(delta):
+                continue
+
+            # keep the outputs consistent with the partials between trainings
+            totals = self._get_totals()
+            scaler = self._deriv_scalers[name]
+            CD0 += (totals['CD0', name][:num_cd0] @ delta * scaler).reshape(CD0.shape)
+            CDI += (totals['CDI', name][num_cd0:] @ delta * scaler).reshape(CDI.shape)
+
+        outputs[Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR] = CD0
+        outputs[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR] = CDI
+
+    def _get_deriv_scalers(self):
+        """Return factors converting derivatives from source units to this component's units."""
+        model = self._prob.model
+        output_meta = model.get_io_metadata(
+            iotypes='output', metadata_keys=['units'], return_rel_names=False
+        )
+
+        scalers = {}
+        for name in self._geometry_inputs:
+            src_units = output_meta[model.get_source(name)]['units']
+            units = CoreMetaData[name]['units']
+            if src_units is None or units is None or src_units == units:
+                scalers[name] = 1.0
+            else:
+                scalers[name] = unit_conversion(units, src_units)[0]
+
+        return scalers
+
+    def _get_totals(self):
+        """Return the derivatives of the drag polars at the last training."""
+        if self._totals is None:
+            self._totals = self._prob.compute_totals(
+                of=['CD0', 'CDI'], wrt=self._geometry_inputs, return_format='flat_dict'
+            )
+            if self._deriv_scalers is None:
+                self._deriv_scalers = self._get_deriv_scalers()
+
+        return self._totals
+
+    def compute_partials(self, inputs, partials):
+        if self._needs_training(inputs):
+            self._train(inputs)
+
+        num_cd0 = self._num_cd0
+        totals = self._get_totals()
+        for name in self._geometry_inputs:
+            scaler = self._deriv_scalers[name]
+            partials[Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR, name] = (
+                totals['CD0', name][:num_cd0] * scaler
+            )
+            partials[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR, name] = (
+                totals['CDI', name][num_cd0:] * scaler
+            )
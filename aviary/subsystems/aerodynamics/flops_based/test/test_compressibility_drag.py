@@ -75,6 +75,63 @@ class CompressibilityDragTest(unittest.TestCase):
         derivs = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
 
+    def test_design_change(self):
+        # The design-dependent terms are cached, so make sure that they are updated when a design
+        # input changes.
+        mach = np.array([0.5, 0.75, 0.85, 0.95, 1.05, 1.2])
+        nn = len(mach)
+
+        def build():
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', CompressibilityDrag(num_nodes=nn), promotes=['*'])
+            prob.setup(force_alloc_complex=True)
+
+            prob.set_val('mach', mach)
+            prob.set_val(Aircraft.Design.MACH, 0.8)
+            prob.set_val(Aircraft.Wing.THICKNESS_TO_CHORD, 0.13)
+            prob.set_val(Aircraft.Fuselage.CROSS_SECTION, 128.2)
+            prob.set_val(Aircraft.Design.BASE_AREA, 0.01)
+            prob.set_val(Aircraft.Wing.AREA, 1370.0)
+            prob.set_val(Aircraft.Wing.TAPER_RATIO, 0.432)
+            prob.set_val(Aircraft.Wing.ASPECT_RATIO, 11.5)
+            prob.set_val(Aircraft.Wing.SWEEP, 25.07)
+            prob.set_val(Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, 0.15)
+            prob.set_val(Aircraft.Fuselage.LENGTH_TO_DIAMETER, 10.12345)
+            prob.set_val(Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN, 0.0)
+            return prob
+
+        prob = build()
+        prob.run_model()
+
+        prob.set_val(Aircraft.Wing.THICKNESS_TO_CHORD, 0.11)
+        prob.set_val(Aircraft.Wing.ASPECT_RATIO, 9.5)
+        prob.run_model()
+
+        expected = build()
+        expected.set_val(Aircraft.Wing.THICKNESS_TO_CHORD, 0.11)
+        expected.set_val(Aircraft.Wing.ASPECT_RATIO, 9.5)
+        expected.run_model()
+
+        assert_near_equal(
+            prob.get_val('compress_drag_coeff'), expected.get_val('compress_drag_coeff'), 1e-15
+        )
+
+        derivs = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
+
+        # The partials are computed at the current Mach numbers, even if compute has not been run
+        # at them.
+        J = prob.compute_totals('compress_drag_coeff', 'mach', return_format='array')
+        prob.set_val('mach', mach + 0.02)
+        expected.set_val('mach', mach + 0.02)
+        expected.run_model()
+
+        fresh = expected.compute_totals('compress_drag_coeff', 'mach', return_format='array')
+        assert_near_equal(
+            prob.compute_totals('compress_drag_coeff', 'mach', return_format='array'), fresh, 1e-15
+        )
+        self.assertFalse(np.allclose(J, fresh))
+
 
 if __name__ == '__main__':
     unittest.main()
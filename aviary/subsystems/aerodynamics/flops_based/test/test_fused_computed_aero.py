@@ -0,0 +1,131 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import set_aviary_initial_values, set_aviary_input_defaults
+from aviary.utils.preprocessors import preprocess_options
+from aviary.utils.test_utils.default_subsystems import get_default_premission_subsystems
+from aviary.validation_cases.validation_tests import get_flops_inputs, get_flops_outputs
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Aircraft, Dynamic, Settings
+
+
+def _build_problem(case_name):
+    flops_inputs = get_flops_inputs(case_name)
+    flops_outputs = get_flops_outputs(case_name)
+
+    key = Aircraft.Propulsion.TOTAL_SCALED_SLS_THRUST
+    flops_inputs.set_val(key, *(flops_outputs.get_item(key)))
+    flops_inputs.set_val(Settings.VERBOSITY, 0)
+
+    engines = [build_engine_deck(flops_inputs)]
+    preprocess_options(flops_inputs, engine_models=engines)
+
+    # don't need mass subsystem, so we skip it
+    default_premission_subsystems = get_default_premission_subsystems('FLOPS', engines)[:-1]
+    aero = default_premission_subsystems[-1]
+
+    # cover subsonic, transonic and supersonic nodes
+    mach = np.array([0.2, 0.5, 0.75, 0.8, 0.85, 0.9, 1.05, 1.2])
+    CL = np.array([0.2, 0.4, 0.5, 0.6, 0.7, 0.5, 0.3, 0.2])
+    P = 374.74437747
+    T = 389.97
+    Sref = 1370.0
+    nn = len(mach)
+
+    mass = CL * Sref * 0.5 * 1.4 * P * mach**2
+
+    prob = om.Problem()
+    model = prob.model
+
+    model.add_subsystem(
+        'pre_mission',
+        CorePreMission(
+            aviary_options=flops_inputs,
+            subsystems=default_premission_subsystems,
+            subsystem_options={},
+        ),
+        promotes_inputs=['aircraft:*'],
+        promotes_outputs=['aircraft:*'],
+    )
+
+    for name, fused in (('group', False), ('fused', True)):
+        model.add_subsystem(
+            name,
+            aero.build_mission(
+                num_nodes=nn,
+                aviary_inputs=flops_inputs,
+                user_options={},
+                subsystem_options={'method': 'computed', 'fused': fused},
+            ),
+            promotes_inputs=['*'],
+        )
+
+    varnames = [
+        Aircraft.Fuselage.WETTED_AREA,
+        Aircraft.HorizontalTail.WETTED_AREA,
+        Aircraft.VerticalTail.WETTED_AREA,
+        Aircraft.Wing.AREA,
+        Aircraft.Wing.ASPECT_RATIO,
+        Aircraft.Wing.WETTED_AREA,
+    ]
+    set_aviary_input_defaults(model, varnames, flops_inputs)
+
+    setup_model_options(prob, flops_inputs)
+    model.set_input_defaults(Aircraft.Engine.SCALE_FACTOR, np.ones(1))
+
+    prob.setup(force_alloc_complex=True)
+
+    prob.set_val(Dynamic.Atmosphere.MACH, val=mach)
+    prob.set_val(Dynamic.Atmosphere.STATIC_PRESSURE, val=P, units='lbf/ft**2')
+    prob.set_val(Dynamic.Atmosphere.TEMPERATURE, val=T, units='degR')
+    prob.set_val(Dynamic.Vehicle.MASS, val=mass, units='lbm')
+
+    set_aviary_initial_values(prob, flops_inputs)
+
+    return prob
+
+
+@use_tempdirs
+class FusedComputedAeroTest(unittest.TestCase):
+    def _check(self, case_name):
+        prob = _build_problem(case_name)
+        prob.run_model()
+
+        for name in (
+            Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+            Dynamic.Vehicle.LIFT_COEFFICIENT,
+            Dynamic.Vehicle.LIFT,
+            'skin_friction_coeff',
+            'Re',
+            'CDI',
+            'CD0',
+            Dynamic.Vehicle.DRAG_COEFFICIENT,
+            Dynamic.Vehicle.DRAG,
+        ):
+            with self.subTest(name=name):
+                assert_near_equal(
+                    prob.get_val(f'fused.{name}'), prob.get_val(f'group.{name}'), 1e-12
+                )
+
+        assert_near_equal(
+            prob.get_val('fused.FusedAero.DELCLB'), prob.get_val('group.Buffet.DELCLB'), 1e-12
+        )
+
+        data = prob.check_partials(out_stream=None, method='cs', includes=['*FusedAero*'])
+        assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+    def test_large_single_aisle(self):
+        self._check('LargeSingleAisle1FLOPS')
+
+    def test_n3cc(self):
+        self._check('AdvancedSingleAisle')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,10 @@ import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import (
+    ExplicitSkinFriction,
+    SkinFriction,
+)
 from aviary.variable_info.variables import Aircraft
 
 
@@ -442,5 +445,105 @@ class SkinFrictionCoeffTest(unittest.TestCase):
         assert_near_equal(np.max(Re_diff), 0.0, 1e-4)
 
 
+@use_tempdirs
+class ExplicitSkinFrictionTest(unittest.TestCase):
+    def _build(self, component, n, nc, options):
+        machs = np.array([0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.775, 0.8, 0.825, 0.85, 0.875])
+        lens = np.linspace(1, 2, nc)
+        temp = np.ones(n) * 389.97
+        pres = np.ones(n) * 374.74437747
+
+        prob = om.Problem()
+        prob.model.add_subsystem('cf', component(num_nodes=n, **options))
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('cf.temperature', temp[:n])
+        prob.set_val('cf.static_pressure', pres[:n])
+        prob.set_val('cf.mach', machs[:n])
+        prob.set_val('cf.characteristic_lengths', lens[:nc])
+
+        return prob
+
+    def test_matches_implicit(self):
+        n = 12
+        nc = 9
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 0
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [2, 4]
+
+        implicit = self._build(SkinFriction, n, nc, options)
+        implicit.run_model()
+
+        prob = self._build(ExplicitSkinFriction, n, nc, options)
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val('cf.skin_friction_coeff'),
+            implicit.get_val('cf.skin_friction_coeff'),
+            1e-10,
+        )
+        assert_near_equal(prob.get_val('cf.Re'), implicit.get_val('cf.Re'), 1e-12)
+
+        derivs = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(derivs, atol=1e-08, rtol=1e-10)
+
+    def test_warm_start(self):
+        n = 12
+        nc = 3
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 0
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [0]
+
+        prob = self._build(ExplicitSkinFriction, n, nc, options)
+        prob.run_model()
+        cf = prob.get_val('cf.skin_friction_coeff').copy()
+
+        solver = prob.model.cf._solver
+        wall_temp = solver.wall_temp.copy()
+
+        # A nearby point starts from the stored solution and converges to the same answer
+        # as a cold start.
+        prob.set_val('cf.mach', prob.get_val('cf.mach') * 1.01)
+        prob.run_model()
+        warm_cf = prob.get_val('cf.skin_friction_coeff').copy()
+        self.assertFalse(np.allclose(solver.wall_temp, wall_temp, rtol=1e-8, atol=0.0))
+
+        solver.wall_temp = None
+        solver.cf = None
+        prob.run_model()
+        assert_near_equal(prob.get_val('cf.skin_friction_coeff'), warm_cf, 1e-12)
+        self.assertFalse(np.allclose(warm_cf, cf, rtol=1e-8, atol=0.0))
+
+    def test_not_converged(self):
+        n = 12
+        nc = 3
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 0
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [0]
+
+        prob = self._build(ExplicitSkinFriction, n, nc, options)
+        prob.run_model()
+
+        solver = prob.model.cf._solver
+        wall_temp = solver.wall_temp.copy()
+        cf = solver.cf.copy()
+
+        # One Newton iteration is not enough, from the stored solution or from a cold start.
+        solver.max_iter = 1
+        prob.set_val('cf.mach', prob.get_val('cf.mach') * 1.5)
+        with self.assertRaises(om.AnalysisError):
+            prob.run_model()
+
+        # The unconverged point is not used as the starting point of later solves.
+        np.testing.assert_array_equal(solver.wall_temp, wall_temp)
+        np.testing.assert_array_equal(solver.cf, cf)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
+from aviary.subsystems.aerodynamics.flops_based.surrogate_aero import (
+    AeroSurrogateTraining,
+    get_surrogate_grid,
+)
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.utils.preprocessors import preprocess_options
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import LegacyCode
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Aircraft, Settings
+
+grid = {
+    'mach': [0.3, 0.5, 0.7, 0.8],
+    'altitude': [0.0, 10000.0, 25000.0, 40000.0],
+    'lift_coefficient': [0.1, 0.3, 0.5, 0.7],
+}
+
+
+def _build_problem(retrain_tolerance):
+    flops_inputs = get_flops_inputs('LargeSingleAisle1FLOPS')
+    flops_inputs.set_val(Settings.VERBOSITY, 0)
+    engines = [build_engine_deck(flops_inputs)]
+    preprocess_options(flops_inputs, engine_models=engines)
+
+    prob = om.Problem()
+    prob.model.add_subsystem(
+        'training',
+        AeroSurrogateTraining(
+            aviary_options=flops_inputs, grid=grid, retrain_tolerance=retrain_tolerance
+        ),
+        promotes=['*'],
+    )
+
+    setup_model_options(prob, flops_inputs)
+    prob.setup(force_alloc_complex=False)
+    set_aviary_initial_values(prob, flops_inputs)
+
+    return prob
+
+
+@use_tempdirs
+class AeroSurrogateTrainingTest(unittest.TestCase):
+    def test_polars(self):
+        prob = _build_problem(retrain_tolerance=0.0)
+        prob.run_model()
+
+        CD0 = prob.get_val(Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR)
+        CDI = prob.get_val(Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR)
+
+        self.assertEqual(CD0.shape, (4, 4))
+        self.assertEqual(CDI.shape, (4, 4))
+        self.assertTrue(np.all(CD0 > 0.0))
+
+        # lift-dependent drag grows with lift coefficient
+        self.assertTrue(np.all(np.diff(CDI, axis=1) > 0.0))
+
+        partial_data = prob.check_partials(out_stream=None, method='fd', form='central')
+        assert_check_partials(partial_data, atol=1e-7, rtol=1e-4)
+
+    def test_retrain_tolerance(self):
+        prob = _build_problem(retrain_tolerance=1e-3)
+        prob.run_model()
+        CD0 = prob.get_val(Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR).copy()
+
+        area = prob.get_val(Aircraft.Wing.AREA, units='ft**2')
+
+        # small change: tables are not recomputed, but follow the partials
+        training = prob.model.training
+        trained_inputs = training._trained_inputs
+        prob.set_val(Aircraft.Wing.AREA, area * (1.0 + 1e-5), units='ft**2')
+        prob.run_model()
+        self.assertIs(training._trained_inputs, trained_inputs)
+
+        J = prob.compute_totals(
+            Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR, Aircraft.Wing.AREA, return_format='array'
+        )
+        assert_near_equal(
+            prob.get_val(Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR).ravel(),
+            CD0.ravel() + J[:, 0] * area[0] * 1e-5,
+            tolerance=1e-12,
+        )
+
+        # large change: tables are recomputed
+        prob.set_val(Aircraft.Wing.AREA, area * 1.1, units='ft**2')
+        prob.run_model()
+        self.assertFalse(
+            np.allclose(prob.get_val(Aircraft.Design.LIFT_INDEPENDENT_DRAG_POLAR), CD0)
+        )
+
+
+class SurrogateBuilderTest(unittest.TestCase):
+    def test_grid(self):
+        default = get_surrogate_grid()
+        self.assertEqual(set(default), {'mach', 'altitude', 'lift_coefficient'})
+
+        with self.assertRaises(ValueError):
+            get_surrogate_grid({'mach': [0.3, 0.5]})
+
+        with self.assertRaises(ValueError):
+            get_surrogate_grid({'reynolds': [1.0, 2.0, 3.0, 4.0]})
+
+    def test_gasp_not_supported(self):
+        with self.assertRaises(ValueError):
+            CoreAerodynamicsBuilder(code_origin=LegacyCode.GASP, surrogate=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ import openmdao.api as om
 from packaging import version
 
 from aviary.utils.aviary_values import AviaryValues
-from aviary.variable_info.functions import override_aviary_vars
+from aviary.variable_info.functions import VariableIndex, override_aviary_vars
 from aviary.variable_info.variable_meta_data import CoreMetaData
 
 
@@ -69,9 +69,14 @@ class CorePreMission(om.Group):
             except:
                 continue
 
+        # Index the variables once; the StaticGroup that holds this group reuses it for its own
+        # overrides when process_overrides is False.
+        self.var_index = VariableIndex(self)
+
         if self.options['process_overrides']:
             override_aviary_vars(
                 self,
                 self.options['aviary_options'],
                 code_origin_overrides=self.code_origin_overrides,
+                var_index=self.var_index,
             )
@@ -0,0 +1,235 @@
+"""
+Evaluation of many variants of one aircraft through the pre-mission systems.
+
+Variants that only differ in their inputs share a single set-up model, so a design-of-experiments
+table costs one OpenMDAO setup per distinct combination of options rather than one per row.
+"""
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+
+from aviary.subsystems.geometry.geometry_builder import CoreGeometryBuilder
+from aviary.subsystems.mass.mass_builder import CoreMassBuilder
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.utils.preprocessors import preprocess_options
+from aviary.variable_info.enums import LegacyCode
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variable_meta_data import CoreMetaData
+
+
+def _default_subsystems(engine_models, meta_data):
+    """Return the FLOPS-based geometry and mass builders, with propulsion if engines are given."""
+    subsystems = []
+    if engine_models is not None:
+        subsystems.append(
+            CorePropulsionBuilder('propulsion', meta_data, engine_models=engine_models)
+        )
+
+    subsystems.append(CoreGeometryBuilder('geometry', meta_data, LegacyCode.FLOPS))
+    subsystems.append(CoreMassBuilder('mass', meta_data, LegacyCode.FLOPS))
+
+    return subsystems
+
+
+def _setup_premission(aviary_inputs, subsystems, engine_models, meta_data):
+    """Return a set-up problem containing only the pre-mission systems."""
+    prob = om.Problem(reports=False)
+
+    prob.model.add_subsystem(
+        'pre_mission',
+        CorePreMission(aviary_options=aviary_inputs, subsystems=subsystems, subsystem_options={}),
+        promotes_inputs=['*'],
+        promotes_outputs=['*'],
+    )
+
+    setup_model_options(prob, aviary_inputs, meta_data, engine_models=engine_models)
+
+    prob.setup(check=False)
+    prob.set_solver_print(level=-1)
+
+    set_aviary_initial_values(prob, aviary_inputs)
+    prob.final_setup()
+
+    return prob
+
+
+def _list_aircraft_outputs(prob):
+    """Return the promoted names and units of all aircraft and mission outputs of the model."""
+    outputs = prob.model.list_outputs(
+        prom_name=True, val=False, units=True, return_format='dict', out_stream=None
+    )
+
+    units = {}
+    for meta in outputs.values():
+        name = meta['prom_name']
+        if name.startswith(('aircraft:', 'mission:')):
+            units[name] = meta['units']
+
+    return units
+
+
+def evaluate_premission_batch(
+    aviary_inputs,
+    variants,
+    units=None,
+    outputs=None,
+    subsystems=None,
+    engine_models=None,
+    meta_data=CoreMetaData,
+):
+    """
+    Evaluate the pre-mission systems for every row of a table of aircraft variants.
+
+    Each column of variants is an Aircraft or Mission variable that overrides the value in
+    aviary_inputs, and each row is one variant. Rows are grouped by the values of any option
+    columns. One model is set up for each group, then run once per row of the group. Every row
+    starts from the initial values of the model, so the results do not depend on the order of
+    the rows.
+
+    By default, the FLOPS-based geometry and mass subsystems are evaluated, preceded by core
+    propulsion if engine_models are given.
+
+    Parameters
+    ----------
+    aviary_inputs : AviaryValues
+        Baseline aircraft, preprocessed as it would be for an AviaryProblem.
+    variants : pandas.DataFrame or dict
+        Table of variants, with one column per variable. A dict maps variable names to sequences
+        of equal length.
+    units : dict, optional
+        Units of the variant columns. Columns not listed use the default units in meta_data.
+    outputs : list of str, optional
+        Outputs to collect. Defaults to all 'aircraft:' and 'mission:' outputs of the model.
+    subsystems : list of SubsystemBuilder, optional
+        Builders of the pre-mission systems to evaluate.
+    engine_models : list of EngineModel, optional
+        Engine models used to preprocess the inputs, and for the default propulsion subsystem.
+    meta_data : dict, optional
+        Variable metadata. Defaults to CoreMetaData.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The variant columns followed by one column per output, with the same index as variants.
+        Outputs with more than one value are split into one column per entry, named
+        '<variable>[<index>]'. Rows whose evaluation failed, or whose model does not have an
+        output, are filled with NaN.
+    dict
+        Units of each column.
+
+    Raises
+    ------
+    ValueError
+        If a requested output is missing from the model of a group, or if an output does not
+        have the same size for every row.
+    """
+    variants = pd.DataFrame(variants)
+
+    if units is None:
+        units = {}
+    units = {name: units.get(name, meta_data[name]['units']) for name in variants.columns}
+
+    if subsystems is None:
+        subsystems = _default_subsystems(engine_models, meta_data)
+
+    option_columns = [name for name in variants.columns if meta_data[name]['option']]
+    input_columns = [name for name in variants.columns if name not in option_columns]
+
+    if option_columns:
+        groups = variants.groupby(option_columns, sort=False, dropna=False)
+    else:
+        groups = [((), variants)]
+
+    # units of each output, from the first group whose model has it
+    output_units = {}
+    results = {}
+
+    for option_values, rows in groups:
+        group_inputs = aviary_inputs
+        if option_columns:
+            if not isinstance(option_values, tuple):
+                option_values = (option_values,)
+
+            group_inputs = aviary_inputs.copy()
+            for name, val in zip(option_columns, option_values):
+                if isinstance(val, np.generic):
+                    val = val.item()
+                group_inputs.set_val(name, val, units[name])
+
+            preprocess_options(group_inputs, meta_data=meta_data, engine_models=engine_models)
+
+        prob = _setup_premission(group_inputs, subsystems, engine_models, meta_data)
+
+        group_units = _list_aircraft_outputs(prob)
+        if outputs is not None:
+            missing = [name for name in outputs if name not in group_units]
+            if missing:
+                raise ValueError(
+                    f'Outputs {missing} are not computed for the variants with options '
+                    f'{dict(zip(option_columns, option_values))}.'
+                )
+            group_units = {name: group_units[name] for name in outputs}
+
+        for name, out_units in group_units.items():
+            output_units.setdefault(name, out_units)
+
+        # initial values of the model, restored before each row so rows do not warm start
+        # from each other, or from a failed evaluation
+        initial_outputs = prob.model._outputs.asarray().copy()
+
+        for index, row in rows.iterrows():
+            prob.model._outputs.set_val(initial_outputs)
+
+            for name in input_columns:
+                prob.set_val(name, row[name], units=units[name])
+
+            try:
+                prob.run_model()
+            except om.AnalysisError:
+                results[index] = None
+                continue
+
+            results[index] = {
+                name: np.atleast_1d(prob.get_val(name, units=output_units[name])).ravel()
+                for name in group_units
+            }
+
+    if outputs is None:
+        outputs = list(output_units)
+
+    # every row must give each output with the same size, so it fits in the same columns
+    sizes = {}
+    for name in outputs:
+        row_sizes = {
+            index: values[name].size
+            for index, values in results.items()
+            if values is not None and name in values
+        }
+        if len(set(row_sizes.values())) > 1:
+            raise ValueError(
+                f'Output "{name}" does not have the same size for every variant: {row_sizes}.'
+            )
+        sizes[name] = next(iter(row_sizes.values()), 1)
+
+    columns = {name: variants[name].to_numpy() for name in variants.columns}
+    column_units = dict(units)
+
+    for name, size in sizes.items():
+        data = np.full((len(variants), size), np.nan)
+        for i, index in enumerate(variants.index):
+            values = results[index]
+            if values is not None and name in values:
+                data[i] = values[name]
+
+        if size == 1:
+            columns[name] = data[:, 0]
+            column_units[name] = output_units[name]
+        else:
+            for j in range(size):
+                columns[f'{name}[{j}]'] = data[:, j]
+                column_units[f'{name}[{j}]'] = output_units[name]
+
+    return pd.DataFrame(columns, index=variants.index), column_units
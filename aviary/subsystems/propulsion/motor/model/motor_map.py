@@ -1,9 +1,103 @@
 import numpy as np
 import openmdao.api as om
-from aviary.utils.csv_data_file import read_data_file
+
+from aviary.utils.structured_table import StructuredTable, load_structured_table
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic
-from aviary.utils.functions import get_path
+
+
+class MotorMapComp(om.ExplicitComponent):
+    """
+    Converts throttle to motor torque and interpolates motor efficiency from a structured motor
+    map in a single vectorized component.
+
+    The table must have inputs 'rotations_per_minute' and 'torque_unscaled' and output
+    'efficiency'. Unscaled torque is the throttle times the largest torque in the table, and the
+    output torque is the unscaled torque multiplied by the engine scale factor.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('table', types=StructuredTable, desc='structured motor efficiency map')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        table = self.options['table']
+
+        self._axes = [
+            table.inputs.index(name) for name in ('rotations_per_minute', 'torque_unscaled')
+        ]
+        self._torque_max = table.grids[self._axes[1]][-1]
+        torque_units = table.units['torque_unscaled']
+
+        self.add_input(Dynamic.Vehicle.Propulsion.THROTTLE, val=np.ones(nn), units='unitless')
+        self.add_input(
+            Dynamic.Vehicle.Propulsion.RPM,
+            val=np.ones(nn),
+            units=table.units['rotations_per_minute'],
+        )
+        self.add_input(
+            Aircraft.Engine.SCALE_FACTOR,
+            val=1.0,
+            units='unitless',
+            desc='Scales the motor by increasing or decreasing the maximum torque value.',
+        )
+
+        self.add_output(Dynamic.Vehicle.Propulsion.TORQUE, val=np.ones(nn), units=torque_units)
+        self.add_output('efficiency', val=np.ones(nn), units=table.units['efficiency'])
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+
+        self.declare_partials(
+            Dynamic.Vehicle.Propulsion.TORQUE,
+            Dynamic.Vehicle.Propulsion.THROTTLE,
+            rows=ar,
+            cols=ar,
+        )
+        self.declare_partials(
+            Dynamic.Vehicle.Propulsion.TORQUE,
+            Aircraft.Engine.SCALE_FACTOR,
+            rows=ar,
+            cols=np.zeros(nn, dtype=int),
+        )
+        self.declare_partials(
+            'efficiency',
+            [Dynamic.Vehicle.Propulsion.THROTTLE, Dynamic.Vehicle.Propulsion.RPM],
+            rows=ar,
+            cols=ar,
+        )
+
+    def _efficiency(self, inputs):
+        points = [None, None]
+        points[self._axes[0]] = inputs[Dynamic.Vehicle.Propulsion.RPM]
+        points[self._axes[1]] = self._torque_max * inputs[Dynamic.Vehicle.Propulsion.THROTTLE]
+
+        eff, derivs = self.options['table'].interpolate('efficiency', *points)
+
+        return eff, derivs[self._axes[0]], derivs[self._axes[1]]
+
+    def compute(self, inputs, outputs):
+        throttle = inputs[Dynamic.Vehicle.Propulsion.THROTTLE]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+
+        outputs[Dynamic.Vehicle.Propulsion.TORQUE] = self._torque_max * throttle * scale_factor
+        outputs['efficiency'] = self._efficiency(inputs)[0]
+
+    def compute_partials(self, inputs, J):
+        throttle = inputs[Dynamic.Vehicle.Propulsion.THROTTLE]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+        torque_max = self._torque_max
+
+        _, deff_drpm, deff_dtorque = self._efficiency(inputs)
+
+        J[Dynamic.Vehicle.Propulsion.TORQUE, Dynamic.Vehicle.Propulsion.THROTTLE] = (
+            torque_max * scale_factor
+        )
+        J[Dynamic.Vehicle.Propulsion.TORQUE, Aircraft.Engine.SCALE_FACTOR] = torque_max * throttle
+        J['efficiency', Dynamic.Vehicle.Propulsion.THROTTLE] = deff_dtorque * torque_max
+        J['efficiency', Dynamic.Vehicle.Propulsion.RPM] = deff_drpm
 
 
 class MotorMap(om.Group):
@@ -28,100 +122,13 @@ class MotorMap(om.Group):
 
     def setup(self):
         n = self.options['num_nodes']
-        motor_model = get_path(self.options[Aircraft.Engine.Motor.DATA_FILE])
-
-        # Read the CSV file
-        # Data must be on a regular, structured, grid
-        (
-            read_data,
-            _,
-            _,
-        ) = read_data_file(motor_model)
-
-        # Extract data with units using items
-        data_dict = {}
-        units_dict = {}
-        for name, (values, units) in read_data.items():
-            data_dict[name] = values
-            units_dict[name] = units
-
-        # Reshape to 2D array
-        rotations_per_minute = np.unique(data_dict['rotations_per_minute'])
-        rpm_units = units_dict['rotations_per_minute']
-        torque_unscaled = np.unique(data_dict['torque_unscaled'])
-        torque_max = np.max(torque_unscaled)
-        torque_units = units_dict['torque_unscaled']
-        efficiency = (
-            data_dict['efficiency'].reshape(len(torque_unscaled), len(rotations_per_minute)).T
-        )
-        efficiency_units = units_dict['efficiency']
+        motor_model = self.options[Aircraft.Engine.Motor.DATA_FILE]
 
-        motor = om.MetaModelStructuredComp(method='slinear', vec_size=n, extrapolate=True)
-        motor.add_input(
-            Dynamic.Vehicle.Propulsion.RPM,
-            val=np.ones(n),
-            training_data=rotations_per_minute,
-            units=rpm_units,
-        )
-        motor.add_input(
-            'torque_unscaled',
-            val=np.ones(n),  # unscaled torque
-            training_data=torque_unscaled,
-            units=torque_units,
-        )
-        motor.add_output(
-            'efficiency',
-            val=np.ones(n),
-            training_data=efficiency,
-            units=efficiency_units,
-        )
+        # Data must be on a regular, structured, grid. The table is read once and shared between
+        # every motor map built from the same file.
+        table = load_structured_table(motor_model)
 
-        self.add_subsystem(
-            'throttle_to_torque',
-            om.ExecComp(
-                'torque_unscaled = torque_max * throttle',
-                torque_unscaled={'val': np.ones(n), 'units': 'N*m'},
-                torque_max={
-                    'val': torque_max,
-                    'units': 'N*m',
-                },  # only used as input because we need to dynamically assign the last value of torque as the max torque
-                throttle={'val': np.ones(n), 'units': 'unitless'},
-                has_diag_partials=True,
-            ),
-            promotes=[('throttle', Dynamic.Vehicle.Propulsion.THROTTLE)],
-        )
+        if table is None:
+            raise ValueError(f'Motor map <{motor_model}> is not on a structured grid.')
 
-        self.add_subsystem(
-            name='motor_efficiency',
-            subsys=motor,
-            promotes_inputs=[Dynamic.Vehicle.Propulsion.RPM],
-            promotes_outputs=['efficiency'],
-        )
-
-        # Now that we know the efficiency, scale up the torque correctly for the engine
-        #   size selected
-        # Note: This allows the optimizer to optimize the motor size if desired
-        self.add_subsystem(
-            'scale_motor_torque',
-            om.ExecComp(
-                'torque = torque_unscaled * scale_factor',
-                torque={'val': np.ones(n), 'units': 'N*m'},
-                torque_unscaled={'val': np.ones(n), 'units': 'N*m'},
-                scale_factor={
-                    'val': 1.0,
-                    'units': 'unitless',
-                    'desc': 'Scales the motor by increasing or decreasing the maximum torque value.',
-                },
-                has_diag_partials=True,
-            ),
-            promotes=[
-                ('torque', Dynamic.Vehicle.Propulsion.TORQUE),
-                ('scale_factor', Aircraft.Engine.SCALE_FACTOR),
-            ],
-        )
-
-        # Connect Torque
-        self.connect(
-            'throttle_to_torque.torque_unscaled',
-            ['motor_efficiency.torque_unscaled', 'scale_motor_torque.torque_unscaled'],
-        )
+        self.add_subsystem('motor_map_comp', MotorMapComp(num_nodes=n, table=table), promotes=['*'])
@@ -6,6 +6,11 @@ import openmdao.api as om
 
 from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.data_interpolator_builder import build_data_interpolator
+from aviary.utils.structured_table import (
+    StructuredTable,
+    load_structured_table,
+    structured_table_from_data,
+)
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
@@ -29,11 +34,90 @@ aliases = {
 }
 
 
+class PropellerMapComp(om.ExplicitComponent):
+    """
+    Vectorized interpolation of a structured propeller map, with analytic partials. If the map
+    is a function of helical Mach number, it is computed internally from Mach and tip Mach.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int)
+        self.options.declare(
+            'table', types=StructuredTable, desc='structured propeller performance map'
+        )
+        self.options.declare(
+            'helical_mach',
+            default=False,
+            types=bool,
+            desc='if True, compute helical Mach from Mach and tip Mach',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        table = self.options['table']
+
+        for name in table.inputs:
+            if name == 'helical_mach' and self.options['helical_mach']:
+                self.add_input(Dynamic.Atmosphere.MACH, val=np.ones(nn), units='unitless')
+                self.add_input('tip_mach', val=np.ones(nn), units='unitless')
+            else:
+                self.add_input(name, val=np.ones(nn), units=table.units[name])
+
+        for name in table.outputs:
+            self.add_output(name, val=np.ones(nn), units=table.units[name])
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+
+        self.declare_partials('*', '*', rows=ar, cols=ar)
+
+    def _points(self, inputs):
+        points = []
+        for name in self.options['table'].inputs:
+            if name == 'helical_mach' and self.options['helical_mach']:
+                mach = inputs[Dynamic.Atmosphere.MACH]
+                tip_mach = inputs['tip_mach']
+                points.append((mach**2 + tip_mach**2) ** 0.5)
+            else:
+                points.append(inputs[name])
+
+        return points
+
+    def compute(self, inputs, outputs):
+        table = self.options['table']
+        points = self._points(inputs)
+
+        for name in table.outputs:
+            outputs[name] = table.interpolate(name, *points)[0]
+
+    def compute_partials(self, inputs, J):
+        table = self.options['table']
+        points = self._points(inputs)
+
+        for name in table.outputs:
+            derivs = table.interpolate(name, *points)[1]
+
+            for input_name, point, deriv in zip(table.inputs, points, derivs):
+                if input_name == 'helical_mach' and self.options['helical_mach']:
+                    # helical Mach is not differentiable where Mach and tip Mach are both zero
+                    # (static points), use a zero derivative there instead of dividing by zero
+                    point = np.where(point.real > 0.0, point, 1.0)
+                    mach = inputs[Dynamic.Atmosphere.MACH]
+                    J[name, Dynamic.Atmosphere.MACH] = deriv * mach / point
+                    J[name, 'tip_mach'] = deriv * inputs['tip_mach'] / point
+                else:
+                    J[name, input_name] = deriv
+
+
 class PropellerMap(om.Group):
     """
     An OpenMDAO group that contains a metamodel comp for given propeller performance data as well as
     optional conversion component if required Mach number for data is helical. Used in
     PropellerPerformance.
+
+    Maps on a full structured grid are instead evaluated by a single PropellerMapComp, using a
+    table that is read once and shared between every map built from the same file.
     """
 
     def initialize(self):
@@ -53,11 +137,22 @@ class PropellerMap(om.Group):
         data_file = self.options[Aircraft.Engine.Propeller.DATA_FILE]
         verbosity = self.options[Settings.VERBOSITY]
 
+        table = None
         if data is None:
-            data, inputs, outputs = read_data_file(data_file, aliases=aliases, verbosity=verbosity)
+            table = load_structured_table(data_file, aliases=aliases, verbosity=verbosity)
+            if table is None:
+                data, inputs, outputs = read_data_file(
+                    data_file, aliases=aliases, verbosity=verbosity
+                )
+            else:
+                inputs = table.inputs
+                outputs = table.outputs
             if verbosity > Verbosity.BRIEF:
                 print(f'Reading propeller performance data from {data_file}')
         else:
+            outputs = ['thrust_coefficient']
+            inputs = [key for key in data.keys() if key not in outputs]
+            table = structured_table_from_data(data, inputs, outputs)
             if verbosity > Verbosity.BRIEF:
                 if data_file is not None:
                     warnings.warn(
@@ -67,7 +162,7 @@ class PropellerMap(om.Group):
                 print(f'Reading propeller performance data from {data_file}')
 
         # determine the mach type from data
-        mach_types = [key for key in ['mach', 'helical_mach'] if key in data]
+        mach_types = [key for key in ['mach', 'helical_mach'] if key in inputs]
 
         # Both machs being present is fine. Default to Mach number
         if len(mach_types) > 1:
@@ -83,6 +178,16 @@ class PropellerMap(om.Group):
                 f'<{data_file}>. At least one Mach input is required.'
             )
 
+        if table is not None:
+            self.add_subsystem(
+                'propeller_map',
+                PropellerMapComp(
+                    num_nodes=nn, table=table, helical_mach=mach_types == ['helical_mach']
+                ),
+                promotes=['*'],
+            )
+            return
+
         # if propeller map requires helical mach, add a component to compute it
         if mach_types == ['helical_mach']:
             helical_mach = om.ExecComp(
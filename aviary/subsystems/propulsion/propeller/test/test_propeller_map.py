@@ -1,9 +1,17 @@
 import unittest
 
+import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.propulsion.propeller.propeller_map import PropellerMap
+from aviary.subsystems.propulsion.propeller.propeller_map import (
+    PropellerMap,
+    PropellerMapComp,
+    aliases,
+)
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.data_interpolator_builder import build_data_interpolator
+from aviary.utils.structured_table import load_structured_table
 from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variables import Aircraft
 from aviary.utils.aviary_values import AviaryValues
@@ -58,6 +66,104 @@ class PropellerMapTest(unittest.TestCase):
         ct = prob.get_val('thrust_coefficient')
         assert_near_equal(ct, 0.095985, tolerance=tol)
 
+    def test_structured_map(self):
+        # general_aviation is a full grid, so it is evaluated by the fused component
+        prop_file_path = 'models/engines/propellers/general_aviation.csv'
+        nn = 4
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem(
+            'fused',
+            PropellerMapComp(
+                num_nodes=nn,
+                table=load_structured_table(prop_file_path, aliases=aliases),
+                helical_mach=True,
+            ),
+            promotes_inputs=['*'],
+        )
+
+        data, _, outputs = read_data_file(prop_file_path, aliases=aliases)
+        model.add_subsystem(
+            'helical_mach_calc',
+            om.ExecComp(
+                'helical_mach=(mach**2 + tip_mach**2)**0.5',
+                helical_mach={'val': np.ones(nn), 'units': 'unitless'},
+                mach={'val': np.ones(nn), 'units': 'unitless'},
+                tip_mach={'val': np.ones(nn), 'units': 'unitless'},
+            ),
+            promotes=['*'],
+        )
+        model.add_subsystem(
+            'metamodel',
+            build_data_interpolator(
+                interpolator_data=data, interpolator_outputs=outputs, num_nodes=nn
+            ),
+            promotes_inputs=['*'],
+        )
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('mach', [0.3, 0.45, 0.5, 0.6])
+        prob.set_val('tip_mach', [0.7, 0.65, 0.7, 0.62])
+        prob.set_val('power_coefficient', [0.03, 0.1, 0.17, 0.22])
+        prob.set_val('advance_ratio', [0.2, 0.75, 1.1, 1.45])
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val('fused.thrust_coefficient'),
+            prob.get_val('metamodel.thrust_coefficient'),
+            1e-12,
+        )
+
+        partial_data = prob.check_partials(out_stream=None, method='cs', includes=['fused'])
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+    def test_structured_map_static(self):
+        # helical Mach is zero at static points where Mach and tip Mach are both zero
+        prop_file_path = 'models/engines/propellers/general_aviation.csv'
+        nn = 3
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'fused',
+            PropellerMapComp(
+                num_nodes=nn,
+                table=load_structured_table(prop_file_path, aliases=aliases),
+                helical_mach=True,
+            ),
+            promotes_inputs=['*'],
+        )
+
+        prob.setup()
+        prob.set_val('mach', [0.0, 0.0, 0.3])
+        prob.set_val('tip_mach', [0.0, 0.65, 0.7])
+        prob.set_val('power_coefficient', [0.03, 0.1, 0.17])
+        prob.set_val('advance_ratio', [0.0, 0.0, 1.1])
+        prob.run_model()
+
+        totals = prob.compute_totals(
+            of=['fused.thrust_coefficient'], wrt=['mach', 'tip_mach'], return_format='array'
+        )
+        self.assertTrue(np.all(np.isfinite(totals)))
+        np.testing.assert_array_equal(totals[0], np.zeros(2 * nn))
+
+    def test_map_selection(self):
+        # semistructured maps keep the metamodel, structured maps use the fused component
+        for prop_file_path, comp_type in (
+            ('models/engines/propellers/general_aviation.csv', PropellerMapComp),
+            ('models/engines/propellers/PropFan.csv', om.MetaModelSemiStructuredComp),
+        ):
+            aviary_options = AviaryValues()
+            aviary_options.set_val(Aircraft.Engine.Propeller.DATA_FILE, prop_file_path)
+
+            prob = om.Problem()
+            prob.model.add_subsystem('propeller_map', PropellerMap(), promotes=['*'])
+            setup_model_options(prob, aviary_options)
+            prob.setup()
+
+            comp = prob.model._get_subsystem('propeller_map.propeller_map')
+            self.assertIsInstance(comp, comp_type)
+
 
 if __name__ == '__main__':
     unittest.main()
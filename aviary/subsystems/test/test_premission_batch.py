@@ -0,0 +1,92 @@
+import unittest
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.premission_batch import evaluate_premission_batch
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.preprocessors import preprocess_options
+from aviary.validation_cases.validation_tests import get_flops_inputs, get_flops_outputs
+from aviary.variable_info.variables import Aircraft, Settings
+
+
+@use_tempdirs
+class PreMissionBatchTest(unittest.TestCase):
+    def setUp(self):
+        case_name = 'LargeSingleAisle1FLOPS'
+        flops_inputs = get_flops_inputs(case_name)
+        flops_outputs = get_flops_outputs(case_name)
+        flops_inputs.set_val(
+            Aircraft.Propulsion.TOTAL_NUM_WING_ENGINES,
+            flops_outputs.get_val(Aircraft.Propulsion.TOTAL_NUM_WING_ENGINES),
+        )
+        flops_inputs.set_val(Settings.VERBOSITY, 0)
+
+        self.engines = [build_engine_deck(flops_inputs)]
+        preprocess_options(flops_inputs, engine_models=self.engines)
+
+        self.flops_inputs = flops_inputs
+
+    def test_batch(self):
+        area = self.flops_inputs.get_val(Aircraft.Wing.AREA, 'ft**2')
+        variants = {
+            Aircraft.Wing.AREA: [area, 1.1 * area, 1.1 * area],
+            Aircraft.Fuselage.MILITARY_CARGO_FLOOR: [False, False, True],
+        }
+        outputs = [Aircraft.Design.EMPTY_MASS, Aircraft.Furnishings.MASS]
+
+        table, units = evaluate_premission_batch(
+            self.flops_inputs,
+            variants,
+            units={Aircraft.Wing.AREA: 'ft**2'},
+            outputs=outputs,
+            engine_models=self.engines,
+        )
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(units[Aircraft.Wing.AREA], 'ft**2')
+        self.assertEqual(units[Aircraft.Design.EMPTY_MASS], 'lbm')
+
+        # a larger wing is heavier, and the cargo floor option changes the furnishings
+        empty_mass = table[Aircraft.Design.EMPTY_MASS]
+        self.assertGreater(empty_mass[1], empty_mass[0])
+        self.assertNotAlmostEqual(
+            table[Aircraft.Furnishings.MASS][1], table[Aircraft.Furnishings.MASS][2]
+        )
+
+        # every row matches the same variant evaluated on its own
+        for i in range(3):
+            inputs = self.flops_inputs.deepcopy()
+            inputs.set_val(
+                Aircraft.Fuselage.MILITARY_CARGO_FLOOR,
+                variants[Aircraft.Fuselage.MILITARY_CARGO_FLOOR][i],
+            )
+
+            single, _ = evaluate_premission_batch(
+                inputs,
+                {Aircraft.Wing.AREA: [variants[Aircraft.Wing.AREA][i]]},
+                units={Aircraft.Wing.AREA: 'ft**2'},
+                outputs=outputs,
+                engine_models=self.engines,
+            )
+
+            for name in outputs:
+                assert_near_equal(table[name][i], single[name][0], tolerance=1e-10)
+
+        # rows do not warm start from each other, so their order does not change the results
+        reversed_table, _ = evaluate_premission_batch(
+            self.flops_inputs,
+            {name: values[::-1] for name, values in variants.items()},
+            units={Aircraft.Wing.AREA: 'ft**2'},
+            outputs=outputs,
+            engine_models=self.engines,
+        )
+
+        for name in outputs:
+            assert_near_equal(
+                reversed_table[name].to_numpy()[::-1], table[name].to_numpy(), tolerance=1e-12
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,15 @@
 #!/usr/bin/python
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
 from openmdao.components.interp_util.interp import InterpND
+from openmdao.utils.units import convert_units
 
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.atmosphere.utils.get_atmosphere_data import get_atmosphere_data
 from aviary.subsystems.propulsion.engine_deck import normalize
 from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
 from aviary.utils.conversion_utils import _parse, _read_map, _rep
@@ -15,7 +17,7 @@ from aviary.utils.csv_data_file import write_data_file
 from aviary.utils.functions import get_aviary_resource_path
 from aviary.utils.named_values import NamedValues
 from aviary.utils.utils import round_it
-from aviary.variable_info.enums import EngineDeckType
+from aviary.variable_info.enums import AtmosphereModel, EngineDeckType
 from aviary.variable_info.functions import add_aviary_input
 from aviary.variable_info.variables import Dynamic
 
@@ -145,7 +147,7 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
     comments.append(f'# {legacy_code}-derived {engine_type} deck converted from {data_file.name}')
 
     if data_format == EngineDeckType.FLOPS:
-        data = {key: np.array([]) for key in _flops_keys}
+        rows = []
 
         with open(data_file, newline='', encoding='utf-8-sig') as file:
             reader = _read_flops_engine(file)
@@ -159,14 +161,11 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
                         continue
                     data_starts = True
 
-                data[MACH] = np.append(data[MACH], line[0])
-                data[ALTITUDE] = np.append(data[ALTITUDE], line[1])
-                data[THROTTLE] = np.append(data[THROTTLE], line[2])
-                data[GROSS_THRUST] = np.append(data[GROSS_THRUST], line[3])
-                data[RAM_DRAG] = np.append(data[RAM_DRAG], line[4])
-                data[FUEL_FLOW] = np.append(data[FUEL_FLOW], line[5])
-                data[NOX_RATE] = np.append(data[NOX_RATE], line[6])
-                # data[EXIT_AREA].append(line[7])
+                # exit area (line[7]) is not used
+                rows.append(line[:7])
+
+        columns = np.array(rows, dtype=float).reshape(-1, 7).T
+        data = dict(zip(_flops_keys, columns))
 
     elif data_format in (EngineDeckType.GASP, EngineDeckType.GASP_TS):
         # prevent modifications to gasp_keys from overwriting base _gasp_keys, to avoid
@@ -247,45 +246,8 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
 
         if compute_T4:
             # compute T4 using atmospheric model
-            prob = om.Problem()
-
-            prob.model.add_subsystem(
-                'T4T2', om.IndepVarComp('T4:T2', T4T2, units='unitless'), promotes=['*']
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Atmosphere.MACH,
-                om.IndepVarComp(Dynamic.Atmosphere.MACH, data[MACH], units='unitless'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Mission.ALTITUDE,
-                om.IndepVarComp(Dynamic.Mission.ALTITUDE, data[ALTITUDE], units='ft'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                name='atmosphere',
-                subsys=Atmosphere(num_nodes=len(data[MACH])),
-                promotes_inputs=[Dynamic.Mission.ALTITUDE],
-                promotes_outputs=[Dynamic.Atmosphere.TEMPERATURE],
-            )
-
-            prob.model.add_subsystem(
-                name='conversion',
-                subsys=AtmosCalc(num_nodes=len(data[MACH])),
-                promotes_inputs=[
-                    Dynamic.Atmosphere.MACH,
-                    Dynamic.Atmosphere.TEMPERATURE,
-                ],
-                promotes_outputs=['t2'],
-            )
-
-            prob.setup()
-            prob.run_model()
-
-            T2 = prob.get_val('t2')
+            temperature, pressure = _standard_atmosphere(data[ALTITUDE])
+            T2, _ = _total_conditions(data[MACH], temperature, pressure)
             T4 = T2 * T4T2
             data[TEMPERATURE] = T4
             # Throttle is T4 normalized from 0 to 1 (T4max)
@@ -324,10 +286,6 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
             for key in data:
                 data[key] = np.array([round_it(val, sig_figs[key]) for val in data[key]])
 
-        # data needs to be string so column length can be easily found later
-        for var in data:
-            data[var] = np.array([str(item) for item in data[var]])
-
     else:
         quit('Invalid engine deck format provided')
 
@@ -363,6 +321,74 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
     write_data_file(output_file, write_data, outputs, comments, include_timestamp=True)
 
 
+def convert_engine_decks(
+    input_files, output_dir=None, data_format=EngineDeckType.FLOPS, round_data=False, jobs=1
+):
+    """
+    Converts several engine decks of the same format into Aviary csv format.
+
+    Each deck is converted with convert_engine_deck(), optionally in parallel processes. A failure
+    to convert one deck does not stop the others.
+
+    Parameters
+    ----------
+    input_files : list of (str, Path)
+        paths to engine deck files to be converted
+    output_dir : (str, Path), optional
+        directory where the converted decks are written, named after the input files. Defaults to
+        the current working directory.
+    data_format : (EngineDeckType)
+        data format used by all input_files (FLOPS or GASP)
+    round_data : bool, optional
+        Sets if any generated data should be rounded. Defaults to False.
+    jobs : int, optional
+        number of decks converted in parallel. Defaults to 1.
+
+    Returns
+    -------
+    list of Path
+        paths to the converted decks, in the order of input_files
+    """
+    if jobs < 1:
+        raise ValueError(f'The number of jobs must be at least 1, not {jobs}.')
+
+    output_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    for input_file in input_files:
+        input_file = Path(input_file)
+        ext = '_aviary.csv' if input_file.suffix == '.csv' else '.csv'
+        tasks.append((input_file, output_dir / (input_file.stem + ext), data_format, round_data))
+
+    if jobs == 1 or len(tasks) < 2:
+        results = [_convert_engine_deck_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = list(executor.map(_convert_engine_deck_task, tasks))
+
+    failures = [f'{task[0]}: {error}' for task, error in zip(tasks, results) if error]
+    if failures:
+        raise RuntimeError(
+            f'Failed to convert {len(failures)} of {len(tasks)} engine decks:\n'
+            + '\n'.join(failures)
+        )
+
+    return [task[1] for task in tasks]
+
+
+def _convert_engine_deck_task(task):
+    """Convert one engine deck of a batch, returning the error message if it fails."""
+    input_file, output_file, data_format, round_data = task
+
+    try:
+        convert_engine_deck(input_file, output_file, data_format, round_data=round_data)
+    except Exception as err:
+        return f'{type(err).__name__}: {err}'
+
+    return None
+
+
 def _read_flops_engine(input_file):
     """
     Read engine data file using FLOPS standard, which is column delimited data
@@ -482,7 +508,7 @@ def _read_table(f, is_turbo_prop=False):
     the table field (one of thrust, fuelflow, or airflow for turbofans or
     shaft_power_corrected, fuelflow, or tailpipe_thrust for turboshafts).
     """
-    tab_data = None
+    tab_data = []
 
     # strip out table title, not used
     f.readline().strip()
@@ -498,12 +524,9 @@ def _read_table(f, is_turbo_prop=False):
         if i < nmaps - 1:
             f.readline()
 
-        if tab_data is None:
-            tab_data = map_data
-        else:
-            tab_data = np.r_[tab_data, map_data]
+        tab_data.append(map_data)
 
-    return tab_data
+    return np.concatenate(tab_data)
 
 
 def _make_structured_grid(
@@ -583,57 +606,14 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
     nn = len(mach_list)
 
-    prob = om.Problem()
-
-    prob.model.add_subsystem(
-        Dynamic.Atmosphere.MACH,
-        om.IndepVarComp(Dynamic.Atmosphere.MACH, mach_list, units='unitless'),
-        promotes=['*'],
-    )
+    temperature, pressure = _standard_atmosphere(alt_list)
+    t2, p2 = _total_conditions(mach_list, temperature, pressure)
 
-    prob.model.add_subsystem(
-        Dynamic.Mission.ALTITUDE,
-        om.IndepVarComp(Dynamic.Mission.ALTITUDE, alt_list, units='ft'),
-        promotes=['*'],
+    # default idle airflow and sfc of CalculateIdle
+    idle_thrust, idle_fuelflow = _idle_conditions(
+        t2, p2, 0.5, 1.0, ref_sls_airflow=ref_sls_airflow, ref_sfn_idle=ref_sfn_idle
     )
 
-    prob.model.add_subsystem(
-        name='atmosphere',
-        subsys=Atmosphere(num_nodes=nn),
-        promotes_inputs=[Dynamic.Mission.ALTITUDE],
-        promotes_outputs=[
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-    )
-
-    prob.model.add_subsystem(
-        name='conversion',
-        subsys=AtmosCalc(num_nodes=nn),
-        promotes_inputs=[
-            Dynamic.Atmosphere.MACH,
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-        promotes_outputs=['t2', 'p2'],
-    )
-
-    prob.model.add_subsystem(
-        name='flight_idle',
-        subsys=CalculateIdle(
-            num_nodes=nn, ref_sfn_idle=ref_sfn_idle, ref_sls_airflow=ref_sls_airflow
-        ),
-        promotes_inputs=['t2', 'p2', 'pct_corr_airflow_idle', 'sfc_idle'],
-        promotes_outputs=['idle_thrust', 'idle_fuelflow'],
-    )
-
-    prob.setup()
-
-    prob.run_model()
-
-    idle_thrust = prob.get_val('idle_thrust')
-    idle_fuelflow = prob.get_val('idle_fuelflow')
-
     data[MACH] = np.append(data[MACH], mach_list)
     data[ALTITUDE] = np.append(data[ALTITUDE], alt_list)
     data[THRUST] = np.append(data[THRUST], idle_thrust)
@@ -647,6 +627,53 @@ _PSLS_PSF = 2116.22  # SLS pressure in psf
 _TSLS_DEGR = 518.67  # SLS temperature in deg R
 
 
+def _standard_atmosphere(altitude):
+    """
+    Return the static temperature (degR) and pressure (psf) of the standard atmosphere at the
+    given geometric altitudes (ft), as computed by Atmosphere.
+    """
+    source_data, _, planet_radius, _, _ = get_atmosphere_data(AtmosphereModel.STANDARD)
+    R0 = planet_radius[0]
+
+    # convert geometric into geopotential altitude
+    h = convert_units(np.asarray(altitude, dtype=float), 'ft', 'm')
+    h = h / (R0 + h) * R0
+
+    table_points = source_data.alt
+    idx = np.searchsorted(table_points, h, side='left')
+    h_bin_left = np.hstack((table_points[0], table_points))
+    dx = h - h_bin_left[idx]
+
+    coeffs = source_data.akima_T[idx]
+    temperature = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+
+    coeffs = source_data.akima_P[idx]
+    pressure = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+
+    return convert_units(temperature, 'degK', 'degR'), convert_units(pressure, 'Pa', 'psf')
+
+
+def _total_conditions(mach, T, P):
+    """Return the engine inlet total temperature and pressure, in the units of T and P."""
+    gamma = 1.4
+    t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
+    p2 = P * (t2 / T) ** (gamma / (gamma - 1))
+
+    return t2, p2
+
+
+def _idle_conditions(t2, p2, pct_corr_airflow_idle, sfc_idle, ref_sls_airflow, ref_sfn_idle):
+    """Return the idle thrust (lbf) and fuel flow (lbm/h) of a GASP engine."""
+    rthet2 = np.sqrt(t2 / _TSLS_DEGR)
+    delta2 = p2 / _PSLS_PSF
+
+    airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
+    thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
+    fuelflow_ref = thrust_ref * sfc_idle
+
+    return thrust_ref, fuelflow_ref
+
+
 class CalculateIdle(om.ExplicitComponent):
     """
     Calculates idle conditions of a GASP engine at a specified flight condition
@@ -690,19 +717,14 @@ class CalculateIdle(om.ExplicitComponent):
             sfc_idle,
         ) = inputs.values()
 
-        ref_sls_airflow = self.options['ref_sls_airflow']
-        ref_sfn_idle = self.options['ref_sfn_idle']
-
-        rthet2 = np.sqrt(t2 / _TSLS_DEGR)
-        delta2 = p2 / _PSLS_PSF
-
-        airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
-        thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
-        fuelflow_ref = thrust_ref * sfc_idle
-
-        outputs['idle_thrust'] = thrust_ref
-        # outputs["idle_airflow"] = airflow_ref
-        outputs['idle_fuelflow'] = fuelflow_ref
+        outputs['idle_thrust'], outputs['idle_fuelflow'] = _idle_conditions(
+            t2,
+            p2,
+            pct_corr_airflow_idle,
+            sfc_idle,
+            ref_sls_airflow=self.options['ref_sls_airflow'],
+            ref_sfn_idle=self.options['ref_sfn_idle'],
+        )
 
 
 class AtmosCalc(om.ExplicitComponent):
@@ -738,12 +760,7 @@ class AtmosCalc(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         mach, T, P = inputs.values()
 
-        gamma = 1.4
-        t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
-        p2 = P * (t2 / T) ** (gamma / (gamma - 1))
-
-        outputs['t2'] = t2
-        outputs['p2'] = p2
+        outputs['t2'], outputs['p2'] = _total_conditions(mach, T, P)
 
 
 if __name__ == '__main__':
@@ -7,7 +7,12 @@ from aviary.variable_info.enums import EngineDeckType
 
 
 def _setup_EDC_parser(parser):
-    parser.add_argument('input_file', type=str, help='path to engine deck file to be converted')
+    parser.add_argument(
+        'input_file',
+        type=str,
+        nargs='?',
+        help='path to engine deck file to be converted',
+    )
     parser.add_argument(
         'output_file',
         type=str,
@@ -22,9 +27,56 @@ def _setup_EDC_parser(parser):
         help='data format used by input_file',
     )
     parser.add_argument('--round', action='store_true', help='round data to improve readability')
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='DIR',
+        help='convert every engine deck in this directory instead of a single input_file',
+    )
+    parser.add_argument(
+        '--pattern',
+        type=str,
+        default='*',
+        help='glob pattern selecting the engine decks in the batch directory',
+    )
+    parser.add_argument(
+        '--output_dir',
+        type=str,
+        help='directory where batch converted decks are written, defaults to the current directory',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of engine decks converted in parallel in batch mode',
+    )
 
 
 def _exec_EDC(args, user_args):
+    if args.batch is not None:
+        from pathlib import Path
+
+        from aviary.utils.engine_deck_conversion import convert_engine_decks
+
+        input_files = sorted(path for path in Path(args.batch).glob(args.pattern) if path.is_file())
+        if not input_files:
+            raise FileNotFoundError(
+                f'No engine deck files matching "{args.pattern}" found in {args.batch}.'
+            )
+
+        convert_engine_decks(
+            input_files,
+            output_dir=args.output_dir,
+            data_format=args.format,
+            round_data=args.round,
+            jobs=args.jobs,
+        )
+        return
+
+    if args.input_file is None:
+        raise ValueError('An input_file must be given when not converting a batch directory.')
+
     from aviary.utils.engine_deck_conversion import convert_engine_deck
 
     convert_engine_deck(
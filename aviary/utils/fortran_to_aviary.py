@@ -20,7 +20,9 @@ import csv
 import getpass
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from openmdao.utils.units import valid_units
@@ -52,6 +54,7 @@ def fortran_to_aviary(
     assumes certain values for any unspecified variables
     If an invalid filepath is given, pre-packaged resources will be checked for
     input decks with a matching name.
+    Returns the values that could not be converted to Aviary variables.
     """
     # compatibility with being passed int for verbosity
     verbosity = Verbosity(verbosity)
@@ -61,7 +64,8 @@ def fortran_to_aviary(
     vehicle_data = {
         'input_values': NamedValues(),
         'unused_values': NamedValues(),
-        'initialization_guesses': initialization_guesses,
+        # copy, so guesses from one deck are not carried over to the next
+        'initialization_guesses': dict(initialization_guesses),
     }
 
     fortran_deck: Path = get_path(fortran_deck, verbosity=verbosity)
@@ -83,7 +87,7 @@ def fortran_to_aviary(
 
     # create dictionary to convert legacy code variables to Aviary variables
     # key: variable name, value: either None or relevant historical_name
-    aviary_variable_dict = generate_aviary_names(legacy_code.value)
+    aviary_variable_dict = _cached_aviary_names(legacy_code.value)
 
     # Get legacy-code based depreciated variable list and set vehicle data to defaults
     if legacy_code is GASP:
@@ -183,6 +187,71 @@ def fortran_to_aviary(
         for var, (val, _) in sorted(vehicle_data['unused_values']):
             writer.writerow([var] + val)
 
+    return vehicle_data['unused_values']
+
+
+def fortran_to_aviary_batch(
+    fortran_decks,
+    legacy_code,
+    output_dir=None,
+    force=False,
+    verbosity=Verbosity.BRIEF,
+    jobs=1,
+):
+    """
+    Create Aviary CSV files from several Fortran input decks of the same legacy code.
+    The decks are converted with fortran_to_aviary, in parallel processes if jobs is
+    greater than one, and each converted file is named after its input deck. If no
+    output_dir is given, each file is written next to its input deck. A deck that fails
+    to convert does not stop the others.
+    Returns a dictionary of the decks that use each variable that could not be
+    converted, keyed by variable name, and a dictionary of the error message of each
+    deck that failed, keyed by deck.
+    """
+    if jobs < 1:
+        raise ValueError(f'The number of jobs must be at least 1, not {jobs}.')
+
+    tasks = []
+    for fortran_deck in fortran_decks:
+        if output_dir is None:
+            output_file = None
+        else:
+            # relative output files are placed next to the input deck, so resolve output_dir
+            output_file = Path(output_dir).resolve() / (Path(fortran_deck).stem + '_converted.csv')
+        tasks.append((fortran_deck, legacy_code, output_file, force, verbosity))
+
+    if jobs == 1 or len(tasks) < 2:
+        results = [_fortran_to_aviary_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = list(executor.map(_fortran_to_aviary_task, tasks))
+
+    unmapped_vars = {}
+    failures = {}
+    for task, (unused_names, error) in zip(tasks, results):
+        fortran_deck = str(task[0])
+        if error is not None:
+            failures[fortran_deck] = error
+            continue
+
+        for name in unused_names:
+            unmapped_vars.setdefault(name, []).append(fortran_deck)
+
+    return unmapped_vars, failures
+
+
+def _fortran_to_aviary_task(task):
+    """
+    Convert one deck of a batch. Returns the names of the unconverted values and the
+    error message if the conversion failed.
+    """
+    try:
+        unused_values = fortran_to_aviary(*task)
+    except Exception as err:
+        return [], f'{type(err).__name__}: {err}'
+
+    return [name for name, _ in unused_values], None
+
 
 def parse_input_file(
     fortran_deck,
@@ -446,6 +515,15 @@ def generate_aviary_names(legacy_code):
     return alternate_names
 
 
+@lru_cache(maxsize=None)
+def _cached_aviary_names(legacy_code):
+    """
+    Return the map of Aviary variable names to Fortran names, generated once per process.
+    The returned dictionary is shared and must not be modified.
+    """
+    return generate_aviary_names(legacy_code)
+
+
 def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
     """update_name will convert a Fortran name to a list of equivalent Aviary names."""
     if '(' in var_name:  # some GASP lists are given as individual elements
@@ -1464,7 +1542,7 @@ def _setup_F2A_parser(parser):
     parser.add_argument(
         'input_deck',
         type=str,
-        nargs=1,
+        nargs='?',
         help='Filename of vehicle input deck, including partial or complete path.',
     )
     parser.add_argument(
@@ -1494,15 +1572,81 @@ def _setup_F2A_parser(parser):
         default=1,
         help='Set level of print statements',
     )
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='DIR',
+        help='Convert every input deck in this directory instead of a single input_deck',
+    )
+    parser.add_argument(
+        '--pattern',
+        type=str,
+        default='*',
+        help='Glob pattern selecting the input decks in the batch directory',
+    )
+    parser.add_argument(
+        '--output_dir',
+        type=str,
+        help='Directory for batch converted decks, defaults to the directory of each input deck',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of input decks converted in parallel in batch mode',
+    )
+    parser.add_argument(
+        '--summary',
+        type=str,
+        help='Filename of a csv file listing the unconverted variables of the batch',
+    )
 
 
 def _exec_F2A(args, user_args):
-    # check if args.input_deck is a list, if so, use the first element
-    if isinstance(args.input_deck, list):
-        args.input_deck = args.input_deck[0]
-    filepath = args.input_deck
-
     # convert verbosity from int to enum
     verbosity = Verbosity(args.verbosity)
 
-    fortran_to_aviary(filepath, args.format, args.output_file, args.force, verbosity)
+    if args.batch is not None:
+        _exec_F2A_batch(args, verbosity)
+        return
+
+    if args.input_deck is None:
+        raise ValueError('An input_deck must be given when not converting a batch directory.')
+
+    fortran_to_aviary(args.input_deck, args.format, args.output_file, args.force, verbosity)
+
+
+def _exec_F2A_batch(args, verbosity):
+    """Convert a directory of input decks and report the unconverted variables."""
+    fortran_decks = sorted(path for path in Path(args.batch).glob(args.pattern) if path.is_file())
+    if not fortran_decks:
+        raise FileNotFoundError(f'No input decks matching "{args.pattern}" found in {args.batch}.')
+
+    unmapped_vars, failures = fortran_to_aviary_batch(
+        fortran_decks, args.format, args.output_dir, args.force, verbosity, args.jobs
+    )
+
+    # most widely used variables first
+    summary = sorted(unmapped_vars.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    if args.summary:
+        with open(args.summary, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['variable', 'num_decks', 'decks'])
+            for name, decks in summary:
+                writer.writerow([name, len(decks), ';'.join(decks)])
+
+    num_converted = len(fortran_decks) - len(failures)
+    if verbosity >= Verbosity.BRIEF:
+        print(f'Converted {num_converted} of {len(fortran_decks)} input decks.')
+        if summary:
+            print(f'{len(summary)} variables could not be converted:')
+            for name, decks in summary:
+                print(f'  {name}: {len(decks)} of {num_converted} decks')
+
+    if failures:
+        raise RuntimeError(
+            f'Failed to convert {len(failures)} of {len(fortran_decks)} input decks:\n'
+            + '\n'.join(f'{deck}: {error}' for deck, error in failures.items())
+        )
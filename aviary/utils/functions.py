@@ -129,42 +129,67 @@ def convert_strings_to_data(input_string):
     return value_list
 
 
-def promote_aircraft_and_mission_vars(group):
-    """Promotes inputs and outputs in Aircraft and Mission hierarchy categories for provided group."""
+def _promoted_names(system):
+    """Return the input and output names of a system, promoted to the level of the system."""
+    try:
+        resolver = system._resolver
+        in_names = list(resolver.prom_iter(iotype='input'))
+        out_names = list(resolver.prom_iter(iotype='output'))
+
+    except AttributeError:
+        # This is an older version of OpenMDAO
+        in_names = list(system._var_allprocs_prom2abs_list['input'])
+        out_names = list(system._var_allprocs_prom2abs_list['output'])
+
+    return in_names, out_names
+
+
+def _promoted_stems(names, stems):
+    """Return the promotion patterns of the stems that start any of the names."""
+    found = {name.partition(':')[0] + ':' for name in names}
+    return [f'{stem}*' for stem in stems if stem in found]
+
+
+def promote_aircraft_and_mission_vars(group, var_index=None):
+    """
+    Promotes inputs and outputs in Aircraft and Mission hierarchy categories for provided group.
+
+    Parameters
+    ----------
+    group : om.Group
+        Group whose subsystems are promoted.
+    var_index : VariableIndex or None
+        Index of the variables in group. If not provided, the promoted names of each subsystem
+        are queried here.
+
+    Returns
+    -------
+    list of str
+        Promoted names of the outputs of the promoted subsystems.
+    """
+    if var_index is None:
+        subsystems = [
+            (subsystem, *_promoted_names(subsystem))
+            for subsystem in group.system_iter(recurse=False)
+        ]
+    else:
+        subsystems = var_index.subsystems
+
+    stems = ('mission:', 'aircraft:', 'dynamic:')
     external_outputs = []
-    for comp in group.system_iter(recurse=False):
+    for comp, in_names, out_names in subsystems:
         # Skip all aviary systems.
         if comp.name == 'core_subsystems':
             continue
 
-        try:
-            resolver = comp._resolver
-            out_names = [item for item in resolver.prom_iter(iotype='output')]
-            in_names = [item for item in resolver.prom_iter(iotype='input')]
-
-        except AttributeError:
-            # This is an older version of OpenMDAO
-            out_names = [item for item in comp._var_allprocs_prom2abs_list['output']]
-            in_names = [item for item in comp._var_allprocs_prom2abs_list['input']]
-
         external_outputs.extend(out_names)
 
         # Locally promote aircraft:* and mission:* only.
-        promote_in = []
-        promote_out = []
-
-        for stem in ['mission:', 'aircraft:', 'dynamic:']:
-            for name in out_names:
-                if name.startswith(stem):
-                    promote_out.append(f'{stem}*')
-                    break
-
-            for name in in_names:
-                if name.startswith(stem):
-                    promote_in.append(f'{stem}*')
-                    break
-
-        group.promotes(comp.name, outputs=promote_out, inputs=promote_in)
+        group.promotes(
+            comp.name,
+            outputs=_promoted_stems(out_names, stems),
+            inputs=_promoted_stems(in_names, stems),
+        )
 
     return external_outputs
 
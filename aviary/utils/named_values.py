@@ -28,11 +28,38 @@ Units = str
 ValueAndUnits = Tuple[Any, Units]
 OptionalValueAndUnits = Union[ValueAndUnits, Any]
 
+# number of shared layers a collection may read through before they are merged into one
+_MAX_LAYERS = 8
+
+
+class _Deleted:
+    """Marks an item removed from a collection that is still present in its shared layers."""
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_DELETED'
+
+
+_DELETED = _Deleted()
+
 
 class NamedValues(Collection):
-    """Define a collection of named values with associated units."""
+    """
+    Define a collection of named values with associated units.
+
+    Copies share the items of the original collection instead of duplicating them: items that
+    were set before a copy was made are frozen into read-only layers that the original and its
+    copies read through, and each collection stores only the items set or removed afterward.
+    Making a copy, and changing it, therefore costs time and memory proportional to the number of
+    changes rather than to the size of the collection.
+    """
 
-    __slots__ = ('_mapping',)
+    __slots__ = ('_mapping', '_layers', '_flat')
 
     def __init__(self, other=None, **kwargs):
         """
@@ -50,6 +77,8 @@ class NamedValues(Collection):
         `ValueAndUnits`.
         """
         self._mapping = {}
+        self._layers = ()
+        self._flat = None
 
         self.update(other, **kwargs)
 
@@ -76,7 +105,7 @@ class NamedValues(Collection):
         get_val
         set_val
         """
-        item = self._mapping.get(key, _UNDEFINED)
+        item = self._lookup(key)
 
         if item is _UNDEFINED:
             raise KeyError(f'key not found: {key}')
@@ -87,6 +116,10 @@ class NamedValues(Collection):
         """
         Return a copy of the instance of this class.
 
+        The copy shares the values stored in this collection, so later calls to `set_val()` or
+        `delete()` on either collection do not affect the other, but values modified in place
+        (such as the elements of an array) are seen by both.
+
         Parameters
         ----------
         None
@@ -138,7 +171,7 @@ class NamedValues(Collection):
         """
         self._check_units('get_val', key, units)
 
-        item = self._mapping.get(key, _UNDEFINED)
+        item = self._lookup(key)
 
         if item is _UNDEFINED:
             raise KeyError(f'key not found: {key}')
@@ -176,26 +209,29 @@ class NamedValues(Collection):
         self._check_units('set_val', key, units)
 
         self._mapping[key] = (val, units)
+        self._flat = None
 
     def keys(self):
         """Return a new view of the collection's names."""
-        return self._mapping.keys()
+        return self._flatten().keys()
 
     def items(self):
         """Return a new view of the collection's `(key, (val, units))`."""
-        return self._mapping.items()
+        return self._flatten().items()
 
     def values(self):
         """Return a new view of the collection's `(val, units)`."""
-        return self._mapping.values()
+        return self._flatten().values()
 
     def __repr__(self):
         """Return a string containing a printable representation of the collection."""
-        return repr(self._mapping)
+        return repr(self._flatten())
 
     def clear(self):
         """Remove all items from the collection."""
         self._mapping.clear()
+        self._layers = ()
+        self._flat = None
 
     def update(self, other=None, **kwargs):
         """
@@ -230,7 +266,7 @@ class NamedValues(Collection):
 
         if isinstance(other, type(self)):
             # NamedValues
-            other = other._mapping
+            other = other._flatten()
 
         if other is not None:
             # check for dictionary
@@ -259,34 +295,120 @@ class NamedValues(Collection):
         KeyError
             if the named value does not exist
         """
-        try:
+        if self._lookup(key) is _UNDEFINED:
+            raise KeyError(f'key not found: {key}')
+
+        if any(key in layer for layer in self._layers):
+            # the item is shared with other collections, so hide it instead
+            self._mapping[key] = _DELETED
+        else:
             del self._mapping[key]
 
-        except KeyError:
-            raise KeyError(f'key not found: {key}')
+        self._flat = None
 
     def __eq__(self, other):
         """Return whether or not this collection is equivalent to another."""
-        collection = self._mapping
+        collection = self._flatten()
 
         if isinstance(other, type(self)):
-            return collection == other._mapping
+            return collection == other._flatten()
 
         return collection == other
 
     def __contains__(self, key):
         """Return whether or not the named value exists."""
-        return key in self._mapping
+        return self._lookup(key) is not _UNDEFINED
 
     def __iter__(self):
         """Return an iterator over the `(key, (val, units))` data stored in this collection."""
-        items = self._mapping.items()
+        items = self._flatten().items()
 
         yield from items
 
     def __len__(self):
         """Return the number of items in this collection."""
-        return len(self._mapping)
+        return len(self._flatten())
+
+    def __copy__(self):
+        """Return a copy that shares the items of this collection."""
+        result = self.__class__.__new__(self.__class__)
+        result._mapping = {}
+        result._layers = self._freeze()
+        # both collections hold the same items, so the merged view can be shared too
+        result._flat = self._flat
+
+        if hasattr(self, '__dict__'):
+            result.__dict__.update(self.__dict__)
+
+        return result
+
+    def __deepcopy__(self, memo):
+        """Return an independent copy of this collection and its values."""
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        result._mapping = copy.deepcopy(self._flatten(), memo)
+        result._layers = ()
+        result._flat = None
+
+        if hasattr(self, '__dict__'):
+            result.__dict__.update(copy.deepcopy(self.__dict__, memo))
+
+        return result
+
+    def _lookup(self, key):
+        """Return the named value and its associated units, or `_UNDEFINED` if not found."""
+        item = self._mapping.get(key, _UNDEFINED)
+
+        if item is _UNDEFINED:
+            for layer in self._layers:
+                item = layer.get(key, _UNDEFINED)
+
+                if item is not _UNDEFINED:
+                    break
+
+        if item is _DELETED:
+            return _UNDEFINED
+
+        return item
+
+    def _flatten(self):
+        """Return a dictionary of all items in this collection, which must not be modified."""
+        if not self._layers:
+            return self._mapping
+
+        if not self._mapping and len(self._layers) == 1:
+            # the deepest layer never holds removed items
+            return self._layers[0]
+
+        # the merged view is kept until the next change, since the layers themselves never change
+        if self._flat is None:
+            mapping = {}
+
+            for layer in (*reversed(self._layers), self._mapping):
+                for key, item in layer.items():
+                    if item is _DELETED:
+                        mapping.pop(key, None)
+                    else:
+                        mapping[key] = item
+
+            self._flat = mapping
+
+        return self._flat
+
+    def _freeze(self):
+        """
+        Move the items stored in this collection into a read-only layer that copies can share, and
+        return the layers of this collection.
+        """
+        if self._mapping:
+            if len(self._layers) < _MAX_LAYERS:
+                self._layers = (self._mapping, *self._layers)
+            else:
+                self._layers = (self._flatten(),)
+
+            self._mapping = {}
+
+        return self._layers
 
     def _check_units(self, funcname, key, units):
         """
@@ -801,18 +801,22 @@ def preprocess_propulsion(
     # Input/Option Consistency Checks #
     ###################################
     # Make sure number of engines based on mount location match expected total
+    # The engine counts are corrected below, so work on copies and store them with set_val: the
+    # stored arrays may be shared with copies of aviary_options.
     sum_engines_provided = False
     try:
-        num_engines_all = aviary_options.get_val(Aircraft.Engine.NUM_ENGINES)
+        num_engines_all = np.array(aviary_options.get_val(Aircraft.Engine.NUM_ENGINES))
         sum_engines_provided = True
     except KeyError:
         num_engines_all = np.zeros(num_engine_type).astype(int)
     try:
-        num_fuse_engines_all = aviary_options.get_val(Aircraft.Engine.NUM_FUSELAGE_ENGINES)
+        num_fuse_engines_all = np.array(
+            aviary_options.get_val(Aircraft.Engine.NUM_FUSELAGE_ENGINES)
+        )
     except KeyError:
         num_fuse_engines_all = np.zeros(num_engine_type).astype(int)
     try:
-        num_wing_engines_all = aviary_options.get_val(Aircraft.Engine.NUM_WING_ENGINES)
+        num_wing_engines_all = np.array(aviary_options.get_val(Aircraft.Engine.NUM_WING_ENGINES))
     except KeyError:
         num_wing_engines_all = np.zeros(num_engine_type).astype(int)
 
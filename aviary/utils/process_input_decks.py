@@ -10,14 +10,18 @@ parameters.
 
 Functions:
     create_vehicle(vehicle_deck=''): Create and initialize a vehicle with default or specified parameters.
+    clear_input_deck_cache(): Forget the vehicle decks parsed by create_vehicle.
     parse_inputs(vehicle_deck, aircraft_values): Parse input files and update aircraft values and initial guesses.
     update_options(aircraft_values, initialization_guesses): Update dependent options based on current aircraft values.
     update_dependent_options(aircraft_values, dependent_options): Update options that depend on the value of an input variable.
     initialization_guessing(aircraft_values): Set initial guesses for aircraft parameters based on problem type and other factors.
 """
 
+import hashlib
 import warnings
-from operator import eq, ge, gt, le, lt, ne
+from collections import OrderedDict
+from copy import deepcopy
+from operator import eq, ge, gt, itemgetter, le, lt, ne
 
 import numpy as np
 from openmdao.utils.units import valid_units
@@ -43,12 +47,25 @@ problem_types = {
     'off_design_max_range': ProblemType.OFF_DESIGN_MAX_RANGE,
 }
 
+# parsed vehicle decks, keyed by the hashes of the file contents and of the metadata used, with the
+# most recently used last
+_input_deck_cache = OrderedDict()
 
-def create_vehicle(vehicle_deck='', meta_data=CoreMetaData, verbosity=Verbosity.BRIEF):
+# number of parsed vehicle decks kept in the cache
+_INPUT_DECK_CACHE_SIZE = 16
+
+
+def create_vehicle(
+    vehicle_deck='', meta_data=CoreMetaData, verbosity=Verbosity.BRIEF, use_cache=True
+):
     """
     Creates and initializes a vehicle with default or specified parameters. It sets up the aircraft values
     and initial guesses based on the input from the vehicle deck.
 
+    Vehicle deck files are only parsed the first time their contents are seen with metadata of the
+    same contents; after that, a copy of the parsed values is returned. Warnings raised while
+    parsing, such as for unknown variables, are therefore only raised the first time.
+
     Parameters
     ----------
     vehicle_deck (str, AviaryValues):
@@ -61,6 +78,9 @@ def create_vehicle(vehicle_deck='', meta_data=CoreMetaData, verbosity=Verbosity.
         Verbosity level for the AviaryProblem. If provided, this overrides verbosity
         specified in the aircraft data. Default is None, and verbosity will be taken
         from aircraft data or defaulted to Verbosity.BRIEF if not found.
+    use_cache (bool):
+        If True, reuse the values of a vehicle deck file with the same contents that was parsed
+        before. Default is True.
 
     Returns
     -------
@@ -105,15 +125,46 @@ def create_vehicle(vehicle_deck='', meta_data=CoreMetaData, verbosity=Verbosity.
         for key, (val, units) in vehicle_deck:
             if key.startswith('initialization_guesses:'):
                 initialization_guesses[key.removeprefix('initialization_guesses:')] = val
-        aircraft_values.update(vehicle_deck)
+
+        # share the values of vehicle_deck, only adding the defaults it does not set
+        default_values = aircraft_values
+        aircraft_values = vehicle_deck.copy()
+        for key, (val, units) in default_values:
+            if key not in aircraft_values:
+                aircraft_values.set_val(key, val, units)
     else:
         vehicle_deck = get_path(vehicle_deck, verbosity)
-        aircraft_values, initialization_guesses = parse_inputs(
-            vehicle_deck=vehicle_deck,
-            aircraft_values=aircraft_values,
-            initialization_guesses=initialization_guesses,
-            meta_data=meta_data,
-        )
+
+        if use_cache:
+            # metadata is keyed by contents, as each problem merges its own copy of it
+            cache_key = (
+                hashlib.sha256(vehicle_deck.read_bytes()).hexdigest(),
+                _meta_data_fingerprint(meta_data),
+            )
+            cached = _input_deck_cache.get(cache_key)
+        else:
+            cached = None
+
+        if cached is None:
+            aircraft_values, initialization_guesses = parse_inputs(
+                vehicle_deck=vehicle_deck,
+                aircraft_values=aircraft_values,
+                initialization_guesses=initialization_guesses,
+                meta_data=meta_data,
+            )
+
+            if use_cache:
+                _input_deck_cache[cache_key] = (
+                    aircraft_values.copy(),
+                    deepcopy(initialization_guesses),
+                )
+                if len(_input_deck_cache) > _INPUT_DECK_CACHE_SIZE:
+                    _input_deck_cache.popitem(last=False)
+
+        else:
+            _input_deck_cache.move_to_end(cache_key)
+            aircraft_values = cached[0].copy()
+            initialization_guesses = deepcopy(cached[1])
 
     # make sure verbosity is always set
     # if verbosity set via parameter, use that - override what is in the file
@@ -129,6 +180,19 @@ def create_vehicle(vehicle_deck='', meta_data=CoreMetaData, verbosity=Verbosity.
     return aircraft_values, initialization_guesses
 
 
+def clear_input_deck_cache():
+    """Forget all vehicle decks parsed by create_vehicle, so they are read again on next use."""
+    _input_deck_cache.clear()
+
+
+def _meta_data_fingerprint(meta_data):
+    """Return a hash of the contents of a metadata dictionary."""
+    # Entries whose representation contains an object address only ever match themselves, which
+    # can cause a cache miss but never a wrong hit.
+    contents = repr(sorted(meta_data.items(), key=itemgetter(0)))
+    return hashlib.sha256(contents.encode()).hexdigest()
+
+
 def parse_inputs(
     vehicle_deck,
     aircraft_values: AviaryValues = None,
@@ -0,0 +1,190 @@
+"""
+Structured-grid tables read from Aviary data files, shared between every component built from the
+same file.
+"""
+
+from itertools import product
+
+import numpy as np
+
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.functions import get_path
+from aviary.variable_info.enums import Verbosity
+
+# cached tables, keyed by resolved file path, file modification time and aliases
+_TABLE_CACHE = {}
+
+
+class StructuredTable:
+    """
+    Tabular data defined on a full tensor-product grid, evaluated with multilinear interpolation.
+
+    Values outside the grid are linearly extrapolated from the nearest grid cell, matching the
+    behavior of om.MetaModelStructuredComp with method='slinear' and extrapolate=True.
+
+    Parameters
+    ----------
+    inputs : list of str
+        Names of the independent variables, in the order of the table axes.
+    grids : list of ndarray
+        Sorted, unique breakpoints of each independent variable.
+    values : dict
+        Dependent variable names mapped to arrays with shape matching the grids.
+    units : dict
+        Units of every independent and dependent variable.
+    """
+
+    def __init__(self, inputs, grids, values, units):
+        self.inputs = list(inputs)
+        self.outputs = list(values)
+        self.grids = [np.asarray(grid, dtype=float) for grid in grids]
+        self.values = {name: np.asarray(val, dtype=float) for name, val in values.items()}
+        self.units = dict(units)
+        self.shape = tuple(len(grid) for grid in self.grids)
+
+        for grid in self.grids:
+            if len(grid) < 2:
+                raise ValueError('Structured tables require at least two points along each axis.')
+
+        for name, val in self.values.items():
+            if val.shape != self.shape:
+                raise ValueError(
+                    f'shape of output <{name}>, {val.shape}, does not match expected shape '
+                    f'{self.shape}'
+                )
+
+    def interpolate(self, name, *points):
+        """
+        Interpolate a dependent variable and its derivatives at a vector of points.
+
+        Parameters
+        ----------
+        name : str
+            Name of the dependent variable.
+        *points : ndarray
+            Values of each independent variable, in table order. Complex values are supported for
+            complex step.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        list of ndarray
+            Derivatives of the interpolated values with respect to each independent variable.
+        """
+        table = self.values[name]
+        ndim = len(self.grids)
+
+        idx = []
+        frac = []
+        dfrac = []
+        for grid, x in zip(self.grids, points):
+            i = np.clip(np.searchsorted(grid, np.real(x), side='right') - 1, 0, len(grid) - 2)
+            width = grid[i + 1] - grid[i]
+            idx.append(i)
+            frac.append((x - grid[i]) / width)
+            dfrac.append(1.0 / width)
+
+        value = 0.0
+        derivs = [0.0] * ndim
+        for corner in product((0, 1), repeat=ndim):
+            corner_val = table[tuple(i + c for i, c in zip(idx, corner))]
+            weights = [t if c else 1.0 - t for t, c in zip(frac, corner)]
+
+            value = value + corner_val * np.prod(weights, axis=0)
+
+            for axis in range(ndim):
+                dweight = dfrac[axis] if corner[axis] else -dfrac[axis]
+                others = [weights[j] for j in range(ndim) if j != axis]
+                derivs[axis] = derivs[axis] + corner_val * dweight * np.prod(others, axis=0)
+
+        return value, derivs
+
+
+def structured_table_from_data(data, inputs, outputs):
+    """
+    Build a StructuredTable from data if it lies on a full tensor-product grid.
+
+    Data may already be in structured format (unique breakpoints for inputs, n-dimensional arrays
+    for outputs) or given as columns in any order.
+
+    Parameters
+    ----------
+    data : NamedValues
+        Data containing every input and output.
+    inputs : list of str
+        Names of the independent variables.
+    outputs : list of str
+        Names of the dependent variables.
+
+    Returns
+    -------
+    StructuredTable or None
+        The table, or None if the data does not form a full structured grid.
+    """
+    units = {name: data.get_item(name)[1] for name in inputs + outputs}
+    columns = [np.asarray(data.get_item(name)[0], dtype=float) for name in inputs]
+    results = [np.asarray(data.get_item(name)[0], dtype=float) for name in outputs]
+    grids = [np.unique(column) for column in columns]
+    shape = tuple(len(grid) for grid in grids)
+
+    # already structured
+    if all(np.array_equal(grid, column) for grid, column in zip(grids, columns)) and all(
+        np.shape(result) == shape for result in results
+    ):
+        return StructuredTable(inputs, grids, dict(zip(outputs, results)), units)
+
+    num_points = len(columns[0])
+    if num_points != np.prod(shape) or any(np.shape(result) != (num_points,) for result in results):
+        return None
+
+    # sort with the first input as the slowest-varying index, then check every grid point appears
+    # exactly once
+    order = np.lexsort(columns[::-1])
+    mesh = np.meshgrid(*grids, indexing='ij')
+    for column, points in zip(columns, mesh):
+        if not np.array_equal(column[order], points.ravel()):
+            return None
+
+    values = {name: result[order].reshape(shape) for name, result in zip(outputs, results)}
+
+    return StructuredTable(inputs, grids, values, units)
+
+
+def load_structured_table(filename, aliases=None, verbosity=Verbosity.BRIEF):
+    """
+    Read a data file and return it as a StructuredTable shared by every caller.
+
+    Tables are cached by file path and modification time, so a file is only read and checked for
+    structure once no matter how many phases or components are built from it.
+
+    Parameters
+    ----------
+    filename : (str, Path)
+        Filename or filepath of the data file to be read.
+    aliases : dict, optional
+        Mapping of variable names to allowable aliases in the data file header.
+    verbosity : (int, Verbosity), optional
+        Controls level of printouts when reading the file. Default is BRIEF (1).
+
+    Returns
+    -------
+    StructuredTable or None
+        The table, or None if the file data does not form a full structured grid.
+    """
+    filepath = get_path(filename, verbosity).resolve()
+
+    alias_key = None
+    if aliases:
+        alias_key = tuple(
+            (name, (alias,) if isinstance(alias, str) else tuple(alias))
+            for name, alias in aliases.items()
+        )
+
+    key = (str(filepath), filepath.stat().st_mtime_ns, alias_key)
+
+    if key not in _TABLE_CACHE:
+        data, inputs, outputs = read_data_file(filepath, aliases=aliases, verbosity=verbosity)
+        _TABLE_CACHE[key] = structured_table_from_data(data, inputs, outputs)
+
+    return _TABLE_CACHE[key]
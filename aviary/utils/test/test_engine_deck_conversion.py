@@ -1,10 +1,15 @@
+import shutil
 import unittest
 from pathlib import Path
 
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.engine_deck_conversion import EngineDeckType, convert_engine_deck
+from aviary.utils.engine_deck_conversion import (
+    EngineDeckType,
+    convert_engine_deck,
+    convert_engine_decks,
+)
 from aviary.utils.functions import get_path
 
 
@@ -81,6 +86,41 @@ class TestEngineDeckConversion(unittest.TestCase):
         self.prepare_and_run(filename, data_format=EngineDeckType.GASP_TS)
         self.compare_files(filename)
 
+    def test_batch_conversion(self):
+        filename = 'turbofan_23k_1.eng'
+        input_file = get_path('validation_cases/validation_data/legacy_files/' + filename)
+
+        batch_dir = Path.cwd() / 'decks'
+        batch_dir.mkdir()
+        shutil.copy(input_file, batch_dir / ('TEST_' + filename))
+        shutil.copy(input_file, batch_dir / 'copy.eng')
+
+        output_files = convert_engine_decks(
+            sorted(batch_dir.iterdir()),
+            data_format=EngineDeckType.GASP,
+            round_data=True,
+            jobs=2,
+        )
+
+        self.assertEqual(
+            [path.name for path in output_files], ['TEST_turbofan_23k_1.csv', 'copy.csv']
+        )
+        self.assertTrue(output_files[1].exists())
+        self.compare_files(filename)
+
+        # a deck that fails to convert is reported without stopping the others
+        Path('copy.csv').unlink()
+        with self.assertRaises(RuntimeError) as cm:
+            convert_engine_decks(
+                [batch_dir / 'missing.eng', batch_dir / 'copy.eng'],
+                data_format=EngineDeckType.GASP,
+                jobs=2,
+            )
+
+        self.assertIn('Failed to convert 1 of 2 engine decks', str(cm.exception))
+        self.assertIn('missing.eng', str(cm.exception))
+        self.assertTrue(Path('copy.csv').exists())
+
     def test_bad_filenames(self):
         with self.subTest('give_bad_filename'):
             input_file = 'fake_engine_20k.txt'
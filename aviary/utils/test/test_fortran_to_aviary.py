@@ -3,7 +3,7 @@ from pathlib import Path
 
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.fortran_to_aviary import fortran_to_aviary
+from aviary.utils.fortran_to_aviary import fortran_to_aviary, fortran_to_aviary_batch
 from aviary.utils.functions import get_path
 from aviary.variable_info.enums import LegacyCode
 
@@ -132,6 +132,31 @@ class TestFortranToAviary(unittest.TestCase):
         )
         self.compare_files(comparison_filepath)
 
+    def test_batch(self):
+        legacy_path = 'validation_cases/validation_data/legacy_files/'
+        filepaths = [
+            legacy_path + 'large_single_aisle_1_GASP.dat',
+            legacy_path + 'small_single_aisle_GASP.dat',
+            legacy_path + 'missing_GASP.dat',
+        ]
+
+        unmapped_vars, failures = fortran_to_aviary_batch(
+            filepaths, LegacyCode.GASP, output_dir='batch', verbosity=0, jobs=2
+        )
+
+        # a deck that fails to convert is reported without stopping the others
+        self.assertEqual(list(failures), [filepaths[2]])
+        self.assertEqual(unmapped_vars['INGASP.ALR'], filepaths[:2])
+
+        # batch converted decks match decks converted one at a time
+        for filepath in filepaths[:2]:
+            name = Path(filepath).stem
+            output_file = Path.cwd() / (name + '.csv')
+            fortran_to_aviary(filepath, LegacyCode.GASP, output_file, force=True, verbosity=0)
+
+            with open(output_file) as single, open(f'batch/{name}_converted.csv') as batch:
+                self.assertEqual(single.readlines()[1:], batch.readlines()[1:])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 """Unit test cases for class NamedValues."""
 
+import copy
+import pickle
 import unittest
 
 from aviary.utils.named_values import NamedValues
@@ -241,6 +243,62 @@ class NamedValuesTest(unittest.TestCase):
             a.delete(key)
         self._do_test_full_equal(a, _empty, ())
 
+    def test_copy(self):
+        base = NamedValues(_data1)
+        variant = base.copy()
+
+        # changes to the copy do not affect the original
+        variant.set_val('NUM_ENGINES', 4)
+        variant.delete('NUM_FUSELAGES')
+        variant.update(_data2)
+        self.assertEqual(base, _data1)
+        self.assertEqual(variant, dict(_data1, **_data2))
+        self.assertEqual(len(variant), len(_data3))
+
+        # changes to the original do not affect the copy
+        base.set_val(Aircraft.Design.RANGE, 3000, 'NM')
+        base.delete(Aircraft.CrewPayload.BAGGAGE_MASS)
+        self.assertEqual(variant.get_val(Aircraft.Design.RANGE, 'NM'), 3500)
+        self.assertIn(Aircraft.CrewPayload.BAGGAGE_MASS, variant)
+        self.assertNotIn(Aircraft.CrewPayload.BAGGAGE_MASS, base)
+
+        # an item removed from a copy of a copy
+        nested = variant.copy()
+        nested.delete('PASSENGER_MASS_TOTAL')
+        self.assertNotIn('PASSENGER_MASS_TOTAL', nested)
+        self.assertIn('PASSENGER_MASS_TOTAL', variant)
+        with self.assertRaises(KeyError):
+            nested.delete('PASSENGER_MASS_TOTAL')
+
+        # the merged view of the layers is reused until the next change
+        keys = set(nested.keys())
+        self.assertIs(nested._flatten(), nested._flatten())
+        nested.set_val('NEW_ITEM', 1)
+        self.assertEqual(set(nested.keys()), keys | {'NEW_ITEM'})
+        nested.delete('NEW_ITEM')
+        self.assertEqual(set(nested.keys()), keys)
+
+        # copies only store their own changes
+        self.assertEqual(len(variant._mapping), 0)
+        self.assertEqual(len(nested._mapping), 1)
+
+        # many generations of copies are merged into a limited number of layers
+        for i in range(20):
+            nested = nested.copy()
+            nested.set_val(f'ITEM_{i}', i)
+        self.assertLessEqual(len(nested._layers), 8)
+        self.assertEqual(nested.get_val('ITEM_0'), 0)
+        self.assertNotIn('PASSENGER_MASS_TOTAL', nested)
+
+        # deep copies and pickled copies hold the same items
+        for other in (copy.deepcopy(nested), pickle.loads(pickle.dumps(nested))):
+            self.assertEqual(other, nested)
+            self.assertNotIn('PASSENGER_MASS_TOTAL', other)
+
+        nested.clear()
+        self.assertEqual(len(nested), 0)
+        self.assertEqual(variant.get_val('NUM_ENGINES'), 4)
+
     def _do_test_full_equal(self, d, eq, ne):
         self.assertEqual(d._mapping, eq)
         self.assertEqual(d, eq)
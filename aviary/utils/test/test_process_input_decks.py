@@ -1,9 +1,18 @@
+import shutil
 import unittest
 
 from openmdao.utils.testing_utils import use_tempdirs
 
 from aviary.utils.functions import get_path
-from aviary.utils.process_input_decks import create_vehicle, parse_inputs
+from aviary.utils.process_input_decks import (
+    _INPUT_DECK_CACHE_SIZE,
+    _input_deck_cache,
+    clear_input_deck_cache,
+    create_vehicle,
+    parse_inputs,
+)
+from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft
 
 
 @use_tempdirs
@@ -62,6 +71,61 @@ class TestCreateVehicle(unittest.TestCase):
         for i, item in enumerate(data):
             self.assertEqual(item, expected_data[i])
 
+    def test_cache(self):
+        file_path = 'aircraft.csv'
+        shutil.copy(
+            get_path('validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv'),
+            file_path,
+        )
+        clear_input_deck_cache()
+
+        aircraft_values, initialization_guesses = create_vehicle(file_path)
+        uncached_values, uncached_guesses = create_vehicle(file_path, use_cache=False)
+        # values include arrays, so compare their representations
+        self.assertEqual(repr(aircraft_values), repr(uncached_values))
+        self.assertEqual(initialization_guesses, uncached_guesses)
+
+        # changes to returned values do not affect later calls
+        aircraft_values.set_val(Aircraft.Wing.SPAN, 1.0, 'ft')
+        initialization_guesses['rotation_mass'] = -1.0
+        cached_values, cached_guesses = create_vehicle(file_path)
+        self.assertEqual(repr(cached_values), repr(uncached_values))
+        self.assertEqual(cached_guesses, uncached_guesses)
+
+        # a changed file is parsed again
+        with open(file_path, 'a') as f:
+            f.write('aircraft:wing:span,2.0,ft\n')
+
+        aircraft_values, _ = create_vehicle(file_path)
+        self.assertEqual(aircraft_values.get_val(Aircraft.Wing.SPAN, 'ft'), 2.0)
+
+    def test_cache_key(self):
+        file_path = 'aircraft.csv'
+        shutil.copy(
+            get_path('validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv'),
+            file_path,
+        )
+        clear_input_deck_cache()
+
+        # metadata with the same contents reuses the parsed deck, even when it is a new dictionary
+        create_vehicle(file_path, meta_data=CoreMetaData.copy())
+        create_vehicle(file_path, meta_data=CoreMetaData.copy())
+        self.assertEqual(len(_input_deck_cache), 1)
+
+        # different metadata parses the deck again
+        meta_data = CoreMetaData.copy()
+        meta_data[Aircraft.Wing.SPAN] = {**meta_data[Aircraft.Wing.SPAN], 'desc': 'changed'}
+        create_vehicle(file_path, meta_data=meta_data)
+        self.assertEqual(len(_input_deck_cache), 2)
+
+        # only the most recently used decks are kept
+        for i in range(_INPUT_DECK_CACHE_SIZE):
+            with open(file_path, 'a') as f:
+                f.write(f'aircraft:wing:span,{i + 100.0},ft\n')
+            create_vehicle(file_path)
+
+        self.assertEqual(len(_input_deck_cache), _INPUT_DECK_CACHE_SIZE)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.utils.named_values import NamedValues
+from aviary.utils.structured_table import load_structured_table, structured_table_from_data
+
+
+class StructuredTableTest(unittest.TestCase):
+    """Test detection and interpolation of structured grid data."""
+
+    def setUp(self):
+        # f(x, y) = 2x + 3y + xy on a 3x2 grid, given in shuffled column format
+        x = np.array([1.0, 0.0, 2.0, 0.0, 2.0, 1.0])
+        y = np.array([0.0, 1.0, 1.0, 0.0, 0.0, 1.0])
+        self.data = NamedValues(
+            {
+                'x': (x, 'unitless'),
+                'y': (y, 'ft'),
+                'f': (2 * x + 3 * y + x * y, 'lbf'),
+            }
+        )
+
+    def test_column_data(self):
+        table = structured_table_from_data(self.data, ['x', 'y'], ['f'])
+
+        assert_near_equal(table.grids[0], [0.0, 1.0, 2.0])
+        assert_near_equal(table.grids[1], [0.0, 1.0])
+        self.assertEqual(table.shape, (3, 2))
+        self.assertEqual(table.units['y'], 'ft')
+
+        # bilinear functions are reproduced exactly, including when extrapolating
+        x = np.array([0.5, 1.7, 2.5, -0.5])
+        y = np.array([0.25, 0.9, 0.5, 1.5])
+        f, (df_dx, df_dy) = table.interpolate('f', x, y)
+
+        assert_near_equal(f, 2 * x + 3 * y + x * y, 1e-12)
+        assert_near_equal(df_dx, 2 + y, 1e-12)
+        assert_near_equal(df_dy, 3 + x, 1e-12)
+
+    def test_structured_data(self):
+        data = NamedValues(
+            {
+                'x': (np.array([0.0, 1.0]), 'unitless'),
+                'y': (np.array([0.0, 1.0, 2.0]), 'unitless'),
+                'f': (np.arange(6.0).reshape(2, 3), 'unitless'),
+            }
+        )
+        table = structured_table_from_data(data, ['x', 'y'], ['f'])
+
+        f, _ = table.interpolate('f', np.array([0.5]), np.array([1.5]))
+        assert_near_equal(f, [3.0], 1e-12)
+
+    def test_unstructured_data(self):
+        # remove one grid point
+        data = NamedValues()
+        for key, (val, units) in self.data.items():
+            data.set_val(key, val[:-1], units)
+
+        self.assertIsNone(structured_table_from_data(data, ['x', 'y'], ['f']))
+
+    def test_cache(self):
+        filename = 'models/engines/motors/electric_motor_1800Nm_6000rpm.csv'
+        table = load_structured_table(filename)
+
+        self.assertIs(load_structured_table(filename), table)
+        self.assertEqual(table.inputs, ['rotations_per_minute', 'torque_unscaled'])
+        self.assertEqual(table.shape, (13, 17))
+
+        self.assertIsNone(load_structured_table('models/engines/propellers/PropFan.csv'))
+
+
+if __name__ == '__main__':
+    unittest.main()
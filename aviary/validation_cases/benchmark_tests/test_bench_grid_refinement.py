@@ -0,0 +1,74 @@
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.variable_info.variables import Mission
+
+
+def run_FwFm(grid_refinement_levels):
+    """Optimize the FwFm mission, returning the problem."""
+    prob = AviaryProblem(verbosity=0)
+
+    prob.load_inputs(
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        deepcopy(phase_info),
+    )
+
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+
+    prob.add_driver('IPOPT', max_iter=100)
+    prob.add_design_variables()
+    prob.add_objective()
+
+    prob.setup()
+
+    prob.run_aviary_problem(
+        make_plots=False,
+        grid_refinement_levels=grid_refinement_levels,
+        grid_refinement_tol=1e-3,
+    )
+
+    return prob
+
+
+@use_tempdirs
+class GridRefinementBenchmark(unittest.TestCase):
+    """Solving on coarse grids first should reach the same optimum as solving on the fine grid."""
+
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    @require_pyoptsparse(optimizer='IPOPT')
+    def bench_test_grid_refinement_FwFm(self):
+        direct = run_FwFm(grid_refinement_levels=1)
+        self.assertTrue(direct.result.success)
+
+        _clear_problem_names()
+        refined = run_FwFm(grid_refinement_levels=3)
+        self.assertTrue(refined.result.success)
+
+        assert_near_equal(
+            refined.get_val(Mission.FUEL_MASS, units='lbm'),
+            direct.get_val(Mission.FUEL_MASS, units='lbm'),
+            tolerance=2e-3,
+        )
+        assert_near_equal(
+            refined.get_val(Mission.RANGE, units='NM'),
+            direct.get_val(Mission.RANGE, units='NM'),
+            tolerance=2e-3,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
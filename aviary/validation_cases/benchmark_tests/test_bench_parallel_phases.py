@@ -0,0 +1,103 @@
+import time
+import unittest
+from copy import deepcopy
+
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.variable_info.variables import Aircraft, Mission
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
+
+
+def build_FwFm(parallel_phases):
+    """Set up the FwFm sizing problem."""
+    prob = AviaryProblem(verbosity=0)
+
+    prob.load_inputs(
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        deepcopy(phase_info),
+    )
+
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases(parallel_phases=parallel_phases)
+    prob.add_post_mission_systems()
+    prob.link_phases()
+
+    prob.add_driver('SLSQP', max_iter=0)
+    prob.add_design_variables()
+    prob.add_objective()
+
+    prob.setup()
+
+    return prob
+
+
+def time_evaluation(prob, repeats=3):
+    """Return the mean wall time of one model evaluation and one total derivative computation."""
+    prob.run_model()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        prob.run_model()
+        prob.compute_totals()
+
+    return (time.perf_counter() - start) / repeats
+
+
+@use_tempdirs
+class ParallelPhasesBenchmark(unittest.TestCase):
+    """
+    Evaluate the FwFm mission with its phases balanced over 1, 2, 4 and 8 processes.
+
+    Each run checks that the parallel results match a serial evaluation and prints the time per
+    evaluation, so the scaling can be read from the output of ``testflo -s``.
+    """
+
+    N_PROCS = 1
+
+    def setUp(self):
+        _clear_problem_names()
+
+    def bench_test_parallel_phases(self):
+        serial = build_FwFm(parallel_phases=False)
+        serial.run_model()
+
+        _clear_problem_names()
+        prob = build_FwFm(parallel_phases=True)
+        elapsed = time_evaluation(prob)
+
+        for name, units in ((Mission.FUEL_MASS, 'lbm'), (Aircraft.Design.GROSS_MASS, 'lbm')):
+            assert_near_equal(
+                prob.get_val(name, units=units), serial.get_val(name, units=units), tolerance=1e-8
+            )
+
+        if prob.comm.rank == 0:
+            print(f'{prob.comm.size} process(es): {elapsed:.3f} s per evaluation')
+
+
+@unittest.skipUnless(MPI and PETScVector, 'MPI and PETSc are required.')
+class ParallelPhasesBenchmark2(ParallelPhasesBenchmark):
+    N_PROCS = 2
+
+
+@unittest.skipUnless(MPI and PETScVector, 'MPI and PETSc are required.')
+class ParallelPhasesBenchmark4(ParallelPhasesBenchmark):
+    N_PROCS = 4
+
+
+@unittest.skipUnless(MPI and PETScVector, 'MPI and PETSc are required.')
+class ParallelPhasesBenchmark8(ParallelPhasesBenchmark):
+    N_PROCS = 8
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.variable_info.variables import Aircraft, Mission
+
+csv_path = 'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv'
+
+
+@use_tempdirs
+class QuickSizingBenchmark(unittest.TestCase):
+    """The analytic sizing mission should land close to the optimized full mission."""
+
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    @require_pyoptsparse(optimizer='IPOPT')
+    def bench_test_quick_sizing_FwFm(self):
+        full = AviaryProblem(verbosity=0)
+        full.load_inputs(csv_path, deepcopy(phase_info))
+        full.check_and_preprocess_inputs()
+        full.add_pre_mission_systems()
+        full.add_phases()
+        full.add_post_mission_systems()
+        full.link_phases()
+        full.add_driver('IPOPT', max_iter=100)
+        full.add_design_variables()
+        full.add_objective()
+        full.setup()
+        full.run_aviary_problem(make_plots=False)
+        self.assertTrue(full.result.success)
+
+        _clear_problem_names()
+        quick = AviaryProblem(verbosity=0)
+        quick.load_inputs(csv_path, deepcopy(phase_info))
+        quick.check_and_preprocess_inputs()
+        quick.add_pre_mission_systems()
+        quick.add_quick_sizing_mission()
+        quick.setup()
+        quick.run_model()
+
+        assert_near_equal(
+            quick.get_val(Aircraft.Design.GROSS_MASS, 'lbm'),
+            full.get_val(Aircraft.Design.GROSS_MASS, 'lbm'),
+            tolerance=0.03,
+        )
+        assert_near_equal(
+            quick.get_val(Mission.FUEL_MASS, 'lbm'),
+            full.get_val(Mission.FUEL_MASS, 'lbm'),
+            tolerance=0.1,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import copy as copy
+import time
+import unittest
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.testing_utils import use_tempdirs
+
+import aviary.api as av
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import ProblemType
+from aviary.variable_info.variables import Aircraft, Mission, Settings
+
+
+def multi_mission_setup_time(num_missions):
+    """Return the time needed to set up a multi-mission problem with num_missions missions."""
+    aviary_inputs = get_flops_inputs('LargeSingleAisle2FLOPS')
+    aviary_inputs.set_val(Settings.VERBOSITY, 0)
+
+    prob = av.AviaryProblem(problem_type=ProblemType.MULTI_MISSION, verbosity=0)
+
+    names = [f'mission{i + 1}' for i in range(num_missions)]
+    for name in names:
+        prob.add_aviary_group(
+            name, aircraft=copy.deepcopy(aviary_inputs), phase_info=copy.deepcopy(phase_info)
+        )
+
+    prob.build_model()
+
+    prob.promote_inputs(
+        names,
+        [
+            (Aircraft.Design.GROSS_MASS, 'Aircraft1:GROSS_MASS'),
+            (Aircraft.Design.RANGE, 'Aircraft1:RANGE'),
+        ],
+    )
+
+    prob.add_composite_objective(*[(name, Mission.FUEL_MASS, 1) for name in names], ref=1)
+
+    start = time.perf_counter()
+    prob.setup()
+    return time.perf_counter() - start
+
+
+@use_tempdirs
+class SetupTimeBenchmark(unittest.TestCase):
+    """Setup time of multi-mission problems should grow about linearly with the missions."""
+
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    def bench_test_setup_time(self):
+        times = {}
+        for num_missions in (1, 4, 16):
+            _clear_problem_names()
+            times[num_missions] = multi_mission_setup_time(num_missions)
+
+        # Allow generous headroom over linear scaling; superlinear setup logic (e.g. scanning
+        # every variable of the model once per component) shows up well above this.
+        per_mission = times[1]
+        self.assertLess(times[16] / 16, 3.0 * per_mission)
+
+
+if __name__ == '__main__':
+    unittest.main()
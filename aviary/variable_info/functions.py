@@ -1,5 +1,6 @@
 import warnings
 from enum import Enum
+from functools import cached_property
 
 import dymos as dm
 import numpy as np
@@ -9,6 +10,7 @@ from openmdao.core.component import Component
 
 from aviary.utils.aviary_options_dict import units_setter
 from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import _promoted_names
 from aviary.utils.utils import cast_type, check_type, enum_setter, wrapped_convert_units
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variable_meta_data import CoreMetaData
@@ -277,11 +279,70 @@ def add_aviary_option(
         comp.options.declare(name, default=val, types=types, desc=desc, **kwargs)
 
 
+class VariableIndex:
+    """
+    Promoted names of the inputs and outputs of the subsystems and components in a group.
+
+    The index is built in a single pass over the subsystems, and over the components the first
+    time they are needed, so that the override and promotion logic run during configure does not
+    need to query the metadata of each system repeatedly.
+
+    Parameters
+    ----------
+    group : om.Group
+        Group whose subsystems and components are indexed.
+
+    Attributes
+    ----------
+    group : om.Group
+        Group whose subsystems and components are indexed.
+    subsystems : list
+        For each direct subsystem of the group, a tuple with the subsystem and the names of its
+        inputs and outputs, promoted to the level of the subsystem.
+    components : list
+        For each component, a tuple with the component, the names of its inputs and a list of
+        (absolute name, promoted name) pairs for its outputs.
+    inputs : set
+        Names of all inputs of the components.
+    """
+
+    def __init__(self, group: om.Group):
+        self.group = group
+        self.subsystems = [
+            (subsystem, *_promoted_names(subsystem))
+            for subsystem in group.system_iter(recurse=False)
+        ]
+
+    @cached_property
+    def components(self):
+        components = []
+
+        for comp in self.group.system_iter(typ=Component):
+            in_meta = comp.get_io_metadata(
+                iotypes='input', metadata_keys=['units'], return_rel_names=False
+            )
+            out_meta = comp.get_io_metadata(
+                iotypes='output', metadata_keys=['units'], return_rel_names=False
+            )
+
+            in_names = [meta['prom_name'] for meta in in_meta.values()]
+            out_names = [(abs_name, meta['prom_name']) for abs_name, meta in out_meta.items()]
+
+            components.append((comp, in_names, out_names))
+
+        return components
+
+    @cached_property
+    def inputs(self):
+        return {name for _, in_names, _ in self.components for name in in_names}
+
+
 def override_aviary_vars(
     group: om.Group,
     aviary_inputs: AviaryValues,
     code_origin_overrides=None,
     external_overrides=None,
+    var_index=None,
 ):
     """
     This function gives Aviary the capability to override output variables with variables from the
@@ -299,44 +360,32 @@ def override_aviary_vars(
         List of Aviary variables names to prioritize when GASP and FLOPS both compute it.
     external_overrides : list or None
         List of Aviary variables names to override that are computed in external subsystems.
+    var_index : VariableIndex or None
+        Index of the variables in group. If not provided, it is built here.
     """
 
     def name_filter(name):
         return 'aircraft:' in name or 'mission:' in name
 
-    if not code_origin_overrides:
-        code_origin_overrides = []
+    code_origin_overrides = set(code_origin_overrides or ())
+    external_overrides = set(external_overrides or ())
 
-    if not external_overrides:
-        external_overrides = []
+    if var_index is None:
+        var_index = VariableIndex(group)
 
-    # first need to make a list of all the inputs that anyone needs
-    # so that we can keep track of any unclaimed inputs
-    all_inputs = set()  # use a set to avoid duplicates
-    for system in group.system_iter():
-        meta = system.get_io_metadata(iotypes=('input',))
-        in_var_names = meta.keys()
-        for name in in_var_names:
-            all_inputs.add(name)
+    # all the inputs that anyone needs, so that we can keep track of any unclaimed inputs
+    all_inputs = var_index.inputs
 
     overridden_outputs = []
     external_overridden_outputs = []
-    for comp in group.system_iter(typ=Component):
-        # get a list of the variables to use
-        out_var_names = list(
-            filter(
-                name_filter,
-                comp.get_io_metadata(iotypes=('output',), return_rel_names=False),
-            )
-        )
-        # get a list of the metadata associated with each variable
-        out_var_metadata = comp.get_io_metadata(iotypes=('output',), return_rel_names=False)
-        in_var_names = filter(name_filter, comp.get_io_metadata(iotypes=('input',)))
+    for comp, comp_inputs, comp_outputs in var_index.components:
+        in_var_names = [name for name in comp_inputs if name_filter(name)]
 
         comp_promoted_outputs = []
 
-        for abs_name in out_var_names:
-            name = out_var_metadata[abs_name]['prom_name']
+        for abs_name, name in comp_outputs:
+            if not name_filter(abs_name):
+                continue
 
             if abs_name in code_origin_overrides:
                 # These variables are ones that are computed in both GASP and FLOPS when both
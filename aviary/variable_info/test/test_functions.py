@@ -4,7 +4,14 @@ import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.utils.develop_metadata import add_meta_data
-from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
+from aviary.utils.functions import promote_aircraft_and_mission_vars
+from aviary.variable_info.functions import (
+    VariableIndex,
+    add_aviary_input,
+    add_aviary_option,
+    add_aviary_output,
+)
+from aviary.variable_info.variables import Aircraft
 
 
 class InputOutputOptionTest(unittest.TestCase):
@@ -27,6 +34,89 @@ class InputOutputOptionTest(unittest.TestCase):
         self.assertEqual(prob.model.comp._valid_name_map['mass'], 'zz')
 
 
+class VariableIndexTest(unittest.TestCase):
+    """Test the index of component variables used when overriding Aviary variables."""
+
+    def test_index(self):
+        prob = om.Problem()
+        sub = prob.model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('area', AreaComp())
+        prob.model.add_subsystem('span', om.ExecComp('span = 2.0 * half_span'))
+        prob.setup()
+
+        index = VariableIndex(prob.model)
+
+        components = {
+            comp.pathname: (inputs, outputs) for comp, inputs, outputs in index.components
+        }
+        self.assertEqual(
+            components,
+            {
+                'sub.area': (
+                    [Aircraft.Wing.SPAN, Aircraft.Wing.ASPECT_RATIO],
+                    [('sub.area.' + Aircraft.Wing.AREA, Aircraft.Wing.AREA)],
+                ),
+                'span': (['half_span'], [('span.span', 'span')]),
+            },
+        )
+        self.assertEqual(
+            index.inputs, {Aircraft.Wing.SPAN, Aircraft.Wing.ASPECT_RATIO, 'half_span'}
+        )
+
+        subsystems = {
+            subsystem.name: (set(inputs), set(outputs))
+            for subsystem, inputs, outputs in index.subsystems
+        }
+        self.assertEqual(
+            subsystems,
+            {
+                'sub': (
+                    {'area.' + Aircraft.Wing.SPAN, 'area.' + Aircraft.Wing.ASPECT_RATIO},
+                    {'area.' + Aircraft.Wing.AREA},
+                ),
+                'span': ({'half_span'}, {'span'}),
+            },
+        )
+
+    def test_promote(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('external', ExternalGroup(), promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        # Only the aircraft variables are promoted out of the subsystems.
+        assert_near_equal(prob.get_val(Aircraft.Wing.AREA, units='ft**2'), 1000.0)
+        assert_near_equal(prob.get_val('span.span'), 2.0)
+        self.assertEqual(prob.model.external.external_outputs, [Aircraft.Wing.AREA, 'span'])
+
+
+class AreaComp(om.ExplicitComponent):
+    """Wing area from span and aspect ratio."""
+
+    def setup(self):
+        self.add_input(Aircraft.Wing.SPAN, val=100.0, units='ft')
+        self.add_input(Aircraft.Wing.ASPECT_RATIO, val=10.0)
+        self.add_output(Aircraft.Wing.AREA, val=1000.0, units='ft**2')
+
+    def compute(self, inputs, outputs):
+        outputs[Aircraft.Wing.AREA] = (
+            inputs[Aircraft.Wing.SPAN] ** 2 / inputs[Aircraft.Wing.ASPECT_RATIO]
+        )
+
+
+class ExternalGroup(om.Group):
+    """Group that promotes the aircraft variables of its subsystems from an index."""
+
+    def setup(self):
+        self.add_subsystem('area', AreaComp())
+        self.add_subsystem('span', om.ExecComp('span = 2.0 * half_span'))
+
+    def configure(self):
+        self.external_outputs = promote_aircraft_and_mission_vars(
+            self, var_index=VariableIndex(self)
+        )
+
+
 class DummyComp(om.ExplicitComponent):
     """Simple component to test unit conversion."""
 
@@ -42,6 +42,7 @@ from openmdao.utils.om_warnings import issue_warning
 
 from aviary.variable_info.variable_meta_data import CoreMetaData
 from aviary.visualization.aircraft_3d_model import Aircraft3DModel
+from aviary.visualization.live_feed import LIVE_FEED_FILENAME, LiveFeedSubscriber
 
 # support getting this function from OpenMDAO post movement of the function to utils
 #    but also support its old location
@@ -758,6 +759,115 @@ def create_optimization_history_plot(case_recorder, df):
     return layout
 
 
+@_handle_pane_creation_errors()
+def create_live_optimization_history_pane(documentation, subscriber, period=1000):
+    """
+    Create a pane that plots the optimization progress as it arrives from a live feed.
+
+    Only the iterations received since the previous refresh are streamed into the plots, so the
+    cost of a refresh does not grow with the length of the run.
+
+    Parameters
+    ----------
+    documentation : str
+        Explanation of what this tab is showing.
+    subscriber : LiveFeedSubscriber
+        Subscriber connected to the LiveFeedPublisher of the running problem.
+    period : int
+        Refresh period in milliseconds.
+    """
+    palette = Category20[20]
+
+    history_source = ColumnDataSource(data={'iteration': []})
+    history_figure = figure(title='Optimization History', width=1000, height=400)
+    history_figure.title.align = 'center'
+    history_figure.xaxis.axis_label = 'Iterations'
+    history_figure.yaxis.formatter = PrintfTickFormatter(format='%5.2e')
+
+    timeseries_source = ColumnDataSource(data={})
+    timeseries_figures = pn.Column()
+
+    status = pn.pane.Markdown('Waiting for the first iteration...')
+    history_columns = []
+
+    def _history_row(record):
+        row = {f'obj: {name}': val for name, val in record.get('objectives', {}).items()}
+        for name, val in record.get('constraint_norms', {}).items():
+            row[f'con: {name}'] = val
+        return row
+
+    def _timeseries_data(record):
+        # Concatenate each variable over the phases so the whole trajectory is a single line.
+        data = defaultdict(list)
+        for prom_name, val in record.get('timeseries', {}).items():
+            data[prom_name.split('.')[-1]].extend(val)
+        if 'time' not in data:
+            return {}
+        num_points = len(data['time'])
+        return {name: val for name, val in data.items() if len(val) == num_points}
+
+    def _initialize(record):
+        history_columns.extend(_history_row(record))
+        history_source.data = {'iteration': [], **{col: [] for col in history_columns}}
+        for i, col in enumerate(history_columns):
+            history_figure.line(
+                x='iteration',
+                y=col,
+                source=history_source,
+                color=palette[i % 20],
+                line_width=2,
+                legend_label=col,
+            )
+        history_figure.legend.click_policy = 'hide'
+
+        data = _timeseries_data(record)
+        timeseries_source.data = data
+        for name in data:
+            if name == 'time':
+                continue
+            ts_figure = figure(title=name, width=1000, height=300)
+            ts_figure.xaxis.axis_label = 'time'
+            ts_figure.line(x='time', y=name, source=timeseries_source, line_width=2)
+            timeseries_figures.append(ts_figure)
+
+    def _update():
+        records = subscriber.get_new_records()
+
+        if records:
+            if not history_columns:
+                _initialize(records[0])
+
+            new_rows = {'iteration': [record['iteration'] for record in records]}
+            for col in history_columns:
+                new_rows[col] = [_history_row(record).get(col, np.nan) for record in records]
+            history_source.stream(new_rows)
+
+            # Only the latest trajectory is shown, so its update cost is independent of the
+            # number of iterations.
+            data = _timeseries_data(records[-1])
+            if data:
+                timeseries_source.data = data
+
+            status.object = f'Iteration {records[-1]["iteration"]}'
+
+        elif subscriber.finished:
+            status.object = f'{status.object} (run finished)'
+            callback.stop()
+
+    callback = pn.state.add_periodic_callback(_update, period=period)
+
+    return pn.Column(
+        pn.pane.HTML(
+            f'<p class="pane_doc">{documentation}</p>',
+            stylesheets=['assets/aviary_styles.css'],
+            styles={'text-align': 'left'},
+        ),
+        status,
+        history_figure,
+        timeseries_figures,
+    )
+
+
 @_handle_pane_creation_errors()
 def _create_interactive_xy_plot_mission_variables(documentation, problem_recorder_path):
     """
@@ -998,7 +1108,7 @@ def create_payload_range_frame(title, results_tabs_list, documentation, csv_file
 
 
 # The main script that generates all the tabs in the dashboard
-def dashboard(script_name, port=0, run_in_background=False):
+def dashboard(script_name, port=0, run_in_background=False, live=False):
     """
     Generate the dashboard app display.
 
@@ -1008,6 +1118,11 @@ def dashboard(script_name, port=0, run_in_background=False):
         Name of the script file whose results will be displayed by this dashboard.
     port : int
         HTTP port used for the dashboard webapp. If 0, use any free port
+    run_in_background : bool
+        If True, do not open the dashboard in a browser.
+    live : bool
+        If True, connect to the live feed of a running problem (see ``AviaryProblem.setup``) and
+        update the optimization progress as iterations complete.
     """
     out_dir = Path(f'{script_name}')
     if not out_dir.exists():
@@ -1157,6 +1272,34 @@ def dashboard(script_name, port=0, run_in_background=False):
         opt_history_pane = create_optimization_history_plot(cr, df)
         optimization_tabs_list.append(('Optimization History', opt_history_pane))
 
+    # Live optimization progress from a running problem
+    if live:
+        live_feed_file = reports_dir / LIVE_FEED_FILENAME
+        if live_feed_file.is_file():
+            try:
+                subscriber = LiveFeedSubscriber.from_connection_file(live_feed_file)
+            except (OSError, EOFError, ValueError) as e:
+                pane = _create_message_pane(
+                    'Live optimization progress',
+                    f'Unable to connect to the live feed described in {live_feed_file}: {e}',
+                )
+                optimization_tabs_list.append(('Live Progress', pane))
+            else:
+                create_live_optimization_history_pane(
+                    'Live Progress',
+                    optimization_tabs_list,
+                    """
+                    Objective values, constraint norms and the latest trajectory of a running
+                    optimization, updated as each driver iteration completes.
+                    """,
+                    subscriber,
+                )
+        else:
+            issue_warning(
+                f'Live feed file {live_feed_file} does not exist. Set up the problem with '
+                'live_feed=True to use the live dashboard.'
+            )
+
     # IPOPT report
     if os.path.isfile(reports_dir / 'IPOPT.out'):
         ipopt_pane = create_report_frame(
@@ -1309,16 +1452,28 @@ def dashboard(script_name, port=0, run_in_background=False):
     run_status_pane_tab_number = len(results_tabs_list) - 1
 
     # Timeseries Mission Output Report
-    create_csv_frame(
-        'Timeseries Mission Output',
-        results_tabs_list,
-        """
-        The outputs of the aircraft trajectory.
-        Any value that is included in the timeseries data is included in this report.
-        This data is useful for post-processing, especially those used for acoustic analysis.
-        """,
-        reports_dir / 'mission_timeseries_data.csv',
-    )
+    # Multi-mission results have one file per mission, named after the mission.
+    timeseries_files = {'Timeseries Mission Output': reports_dir / 'mission_timeseries_data.csv'}
+    if not timeseries_files['Timeseries Mission Output'].is_file():
+        prefix = 'mission_timeseries_data_'
+        mission_files = sorted(reports_dir.glob(f'{prefix}*.csv'), key=str)
+        if mission_files:
+            timeseries_files = {
+                f'Timeseries Mission Output ({csv_file.stem[len(prefix) :]})': csv_file
+                for csv_file in mission_files
+            }
+
+    for title, csv_file in timeseries_files.items():
+        create_csv_frame(
+            title,
+            results_tabs_list,
+            """
+            The outputs of the aircraft trajectory.
+            Any value that is included in the timeseries data is included in this report.
+            This data is useful for post-processing, especially those used for acoustic analysis.
+            """,
+            csv_file,
+        )
 
     # Paylaod Range Output Pane
     create_payload_range_frame(
@@ -39,6 +39,13 @@ def _dashboard_setup_parser(parser):
         help="Run the server in the background (don't automatically open the browser)",
     )
 
+    parser.add_argument(
+        '--live',
+        action='store_true',
+        help='Connect to the live feed of a running problem and update the optimization progress '
+        'as iterations complete',
+    )
+
     # For future use
     parser.add_argument(
         '-d',
@@ -129,4 +136,5 @@ def _dashboard_cmd(options, user_args):
         # options.driver_recorder,
         options.port,
         options.run_in_background,
+        options.live,
     )
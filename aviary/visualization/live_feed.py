@@ -0,0 +1,419 @@
+"""
+Live, per-iteration data feed between a running Aviary optimization and the dashboard.
+
+The LiveFeedPublisher is attached to the driver like a case recorder. After every driver iteration
+it pushes a small JSON message containing only that iteration's data (objective values, constraint
+norms and a few selected timeseries) to every connected subscriber over a local socket. Messages
+are sent from one background thread per subscriber, so a slow dashboard cannot stall the run. The
+LiveFeedSubscriber used by the dashboard keeps incoming messages in a ring buffer, so the dashboard
+can refresh in constant time per iteration instead of re-reading the recorder files.
+
+This module intentionally does not import the visualization stack (bokeh/panel).
+"""
+
+import json
+import queue
+import secrets
+import threading
+import time
+from collections import deque
+from fnmatch import fnmatchcase
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.variable_info.variables import Dynamic
+
+LIVE_FEED_FILENAME = 'live_feed.json'
+
+_default_timeseries = ('time', Dynamic.Mission.ALTITUDE, Dynamic.Vehicle.MASS)
+
+
+def _to_float(value):
+    """Reduce a value to a JSON friendly float, using the norm for arrays."""
+    value = np.asarray(value)
+    if value.size == 1:
+        return float(value.ravel()[0])
+    return float(np.linalg.norm(value))
+
+
+def _norm(value):
+    """Return the norm of a value as a JSON friendly float, also for scalars."""
+    return float(np.linalg.norm(np.asarray(value).ravel()))
+
+
+class _Subscription:
+    """
+    Connection to one subscriber, with the messages waiting to be sent to it.
+
+    Messages are sent on a background thread so that a slow subscriber never holds up the
+    optimization. A subscriber that falls more than ``max_backlog`` messages behind is dropped.
+    """
+
+    def __init__(self, conn, max_backlog):
+        self.conn = conn
+        self.dropped = False
+        self._queue = queue.Queue(maxsize=max_backlog)
+        self._thread = threading.Thread(
+            target=self._send, name='aviary-live-feed-sender', daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def put(self, message):
+        """Queue a message, returning False if the subscriber has fallen too far behind."""
+        if self.dropped:
+            return False
+
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.drop()
+            return False
+
+        return True
+
+    def drop(self):
+        """Stop sending; the connection is closed by the sender thread."""
+        self.dropped = True
+        try:
+            # Wake up the sender thread if it is waiting for a message.
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def finish(self, timeout):
+        """Send the remaining messages, then close the connection."""
+        if self.dropped:
+            return
+
+        try:
+            # Wait for room rather than drop, so the final message gets sent.
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.dropped = True
+            return
+
+        self._thread.join(timeout)
+
+    def _send(self):
+        try:
+            while not self.dropped:
+                message = self._queue.get()
+                if message is None:
+                    return
+                self.conn.send_bytes(message)
+        except OSError:
+            # Subscriber went away.
+            self.dropped = True
+        finally:
+            self.conn.close()
+
+
+class LiveFeedPublisher(om.CaseRecorder):
+    """
+    Publish per-iteration driver data to live subscribers over a local socket.
+
+    Parameters
+    ----------
+    port : int, optional
+        Port used by the publisher on ``localhost``. If 0, any free port is used. Defaults to 0.
+    timeseries : list of str, optional
+        Timeseries variables sent with each iteration. Short names (e.g. ``'altitude'``) select
+        that timeseries output in every phase, while names containing a wildcard are matched
+        against promoted output names. Defaults to time, altitude and mass.
+    history_size : int, optional
+        Number of most recent messages kept for subscribers that connect after the run started.
+        Defaults to 1000.
+    max_backlog : int, optional
+        Maximum number of messages waiting to be sent to one subscriber. Subscribers that fall
+        further behind are disconnected. Defaults to 1000.
+    connection_file : str or Path, optional
+        If given, the address and authentication key of the publisher are written to this JSON
+        file at startup so that the dashboard can find the feed.
+    """
+
+    def __init__(
+        self, port=0, timeseries=None, history_size=1000, max_backlog=1000, connection_file=None
+    ):
+        super().__init__(record_viewer_data=False)
+
+        self.port = port
+        if timeseries is None:
+            timeseries = _default_timeseries
+        self.timeseries = list(timeseries)
+        self.max_backlog = max_backlog
+        self.connection_file = connection_file
+
+        self.address = None
+        self._authkey = secrets.token_bytes(16)
+        self._history = deque(maxlen=history_size)
+        self._clients = []
+        self._lock = threading.Lock()
+        self._listener = None
+        self._accept_thread = None
+        self._enabled = True
+        self._timeseries_names = None
+        self._iteration = 0
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Open the socket and start accepting subscribers.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or None
+            The MPI communicator for the recorder.
+        """
+        super().startup(recording_requester, comm)
+
+        # Only publish from the root process.
+        if comm is not None and comm.rank != 0:
+            self._enabled = False
+            return
+
+        if self._listener is not None:
+            return
+
+        self._listener = Listener(('localhost', self.port), authkey=self._authkey)
+        self.address = self._listener.address
+
+        self._accept_thread = threading.Thread(
+            target=self._accept_clients, name='aviary-live-feed', daemon=True
+        )
+        self._accept_thread.start()
+
+        if self.connection_file is not None:
+            self.write_connection_file(self.connection_file)
+
+    def write_connection_file(self, filepath):
+        """
+        Write the publisher address and authentication key to a JSON file.
+
+        Parameters
+        ----------
+        filepath : str or Path
+            Path of the file to write.
+        """
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        host, port = self.address
+        with open(filepath, 'w') as f:
+            json.dump({'host': host, 'port': port, 'authkey': self._authkey.hex()}, f)
+
+    def _accept_clients(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                # Listener was closed, or a client failed the handshake.
+                if self._listener is None:
+                    return
+                continue
+
+            client = _Subscription(conn, self.max_backlog)
+
+            with self._lock:
+                # Bring late subscribers up to date before they get new iterations.
+                for message in list(self._history)[-self.max_backlog :]:
+                    client.put(message)
+                self._clients.append(client)
+
+            client.start()
+
+    def _publish(self, record):
+        message = json.dumps(record).encode('utf-8')
+
+        # Only queue the message here; the optimization never waits on a subscriber.
+        with self._lock:
+            self._history.append(message)
+            self._clients = [client for client in self._clients if client.put(message)]
+
+    def _resolve_timeseries(self, model):
+        patterns = [
+            name if '*' in name else f'*traj.*.timeseries.{name}' for name in self.timeseries
+        ]
+        return [
+            prom_name
+            for prom_name in model._resolver.prom_iter(iotype='output')
+            if any(fnmatchcase(prom_name, pattern) for pattern in patterns)
+        ]
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Publish the data of the current driver iteration.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and system vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._enabled:
+            return
+
+        problem = driver._problem()
+
+        if self._timeseries_names is None:
+            self._timeseries_names = self._resolve_timeseries(problem.model)
+
+        objectives = driver.get_objective_values(driver_scaling=False)
+        constraints = driver.get_constraint_values(driver_scaling=False)
+
+        timeseries = {}
+        for name in self._timeseries_names:
+            try:
+                timeseries[name] = problem.get_val(name).ravel().tolist()
+            except (KeyError, RuntimeError):
+                continue
+
+        self._publish(
+            {
+                'iteration': self._iteration,
+                'wall_time': time.time(),
+                'success': bool(metadata.get('success', True)),
+                'objectives': {name: _to_float(val) for name, val in objectives.items()},
+                'constraint_norms': {name: _norm(val) for name, val in constraints.items()},
+                'timeseries': timeseries,
+            }
+        )
+        self._iteration += 1
+
+    def record_metadata_system(self, system, run_number=None):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_iteration_system(self, system, data, metadata):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        """Do nothing; the live feed only publishes driver iterations."""
+        pass
+
+    def shutdown(self):
+        """Notify subscribers that the run is finished and close all connections."""
+        if self._listener is None:
+            return
+
+        self._publish({'iteration': self._iteration, 'finished': True})
+
+        listener, self._listener = self._listener, None
+        listener.close()
+
+        with self._lock:
+            clients, self._clients = self._clients, []
+
+        for client in clients:
+            client.finish(timeout=5.0)
+
+
+class LiveFeedSubscriber:
+    """
+    Receive live iteration data from a LiveFeedPublisher.
+
+    Messages are received on a background thread and kept in a ring buffer, so the consumer only
+    ever processes the iterations it has not seen yet.
+
+    Parameters
+    ----------
+    address : tuple of (str, int)
+        Host and port of the publisher.
+    authkey : bytes
+        Authentication key of the publisher.
+    buffer_size : int, optional
+        Maximum number of unread messages that are kept. Defaults to 1000.
+    """
+
+    def __init__(self, address, authkey, buffer_size=1000):
+        self._conn = Client(tuple(address), authkey=authkey)
+        self._buffer = deque(maxlen=buffer_size)
+        self.finished = False
+
+        self._thread = threading.Thread(
+            target=self._receive, name='aviary-live-feed-subscriber', daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def from_connection_file(cls, filepath, buffer_size=1000):
+        """
+        Connect to the publisher described in a connection file.
+
+        Parameters
+        ----------
+        filepath : str or Path
+            JSON file written by ``LiveFeedPublisher.write_connection_file``.
+        buffer_size : int, optional
+            Maximum number of unread messages that are kept. Defaults to 1000.
+
+        Returns
+        -------
+        LiveFeedSubscriber
+            The connected subscriber.
+        """
+        with open(filepath) as f:
+            info = json.load(f)
+
+        return cls(
+            (info['host'], info['port']), bytes.fromhex(info['authkey']), buffer_size=buffer_size
+        )
+
+    def _receive(self):
+        while True:
+            try:
+                message = self._conn.recv_bytes()
+            except (EOFError, OSError):
+                self.finished = True
+                return
+
+            record = json.loads(message)
+            if record.get('finished'):
+                self.finished = True
+                self._conn.close()
+                return
+
+            self._buffer.append(record)
+
+    def get_new_records(self):
+        """
+        Return the iteration records received since the last call.
+
+        Returns
+        -------
+        list of dict
+            The new records, oldest first.
+        """
+        records = []
+        buffer = self._buffer
+        while buffer:
+            records.append(buffer.popleft())
+        return records
+
+    def close(self):
+        """Close the connection to the publisher."""
+        self._conn.close()
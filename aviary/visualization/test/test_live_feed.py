@@ -0,0 +1,72 @@
+import time
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.visualization.live_feed import LiveFeedPublisher, LiveFeedSubscriber
+
+
+@use_tempdirs
+class LiveFeedTest(unittest.TestCase):
+    def test_publish_iterations(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.zeros(5)), promotes=['*'])
+        model.add_subsystem(
+            'obj_comp', om.ExecComp('f = sum((x - 3.0)**2)', x=np.zeros(5)), promotes=['*']
+        )
+        model.add_subsystem(
+            'con_comp', om.ExecComp('g = x[0] + x[1] - 8.0', x=np.zeros(5)), promotes=['*']
+        )
+        model.add_subsystem(
+            'timeseries',
+            om.ExecComp('y = 2.0 * x', x=np.zeros(5), y=np.zeros(5)),
+            promotes_inputs=['x'],
+        )
+
+        model.add_design_var('x', lower=-10.0, upper=10.0)
+        model.add_objective('f')
+        model.add_constraint('g', upper=-4.0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+
+        publisher = LiveFeedPublisher(timeseries=['*timeseries.y'], connection_file='live.json')
+        prob.driver.add_recorder(publisher)
+
+        prob.setup()
+        prob.final_setup()
+
+        subscriber = LiveFeedSubscriber.from_connection_file('live.json')
+
+        prob.run_driver()
+        prob.cleanup()
+
+        for _ in range(100):
+            if subscriber.finished:
+                break
+            time.sleep(0.05)
+        self.assertTrue(subscriber.finished)
+
+        records = subscriber.get_new_records()
+        self.assertEqual([rec['iteration'] for rec in records], list(range(len(records))))
+        self.assertGreater(len(records), 1)
+
+        final = records[-1]
+        assert_near_equal(final['objectives']['f'], prob.get_val('f')[0], tolerance=1e-10)
+        # The active constraint is negative, but its norm is sent.
+        self.assertLess(prob.get_val('g')[0], 0.0)
+        assert_near_equal(final['constraint_norms']['g'], -prob.get_val('g')[0], tolerance=1e-10)
+        assert_near_equal(
+            np.array(final['timeseries']['timeseries.y']), prob.get_val('timeseries.y'), 1e-10
+        )
+
+        # Records are only delivered once.
+        self.assertEqual(subscriber.get_new_records(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()